@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the registry call path.
+
+Measures ``zabbix_get`` throughput against a local fake Zabbix endpoint at
+1, 16 and 64 concurrent clients. The ``async`` mode uses the registry helpers
+as the tools do; the ``blocking`` mode reproduces the previous behaviour of
+calling the synchronous ``ZabbixAPI`` directly on the event loop.
+
+Usage:
+    uv run python benchmarks/bench_concurrency.py [--latency 0.02] [--calls 256]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.fake_zabbix import FakeZabbixServer  # noqa: E402
+
+CONCURRENCY_LEVELS = [1, 16, 64]
+PARAMS = {"output": "extend", "limit": 10}
+
+
+async def run_workers(call: Callable[[], Awaitable[str]], clients: int, calls: int) -> float:
+    """Run ``calls`` requests spread over ``clients`` workers, return elapsed seconds."""
+    remaining = calls
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    return time.perf_counter() - start
+
+
+async def bench_async(clients: int, calls: int) -> float:
+    from src._core import close_zabbix_client
+    from src.tools._registry import zabbix_get
+
+    # Log in once outside the timed section
+    await zabbix_get("host", "get", PARAMS)
+    try:
+        return await run_workers(lambda: zabbix_get("host", "get", PARAMS), clients, calls)
+    finally:
+        await close_zabbix_client()
+
+
+async def bench_blocking(clients: int, calls: int) -> float:
+    from zabbix_utils import ZabbixAPI
+    from src._core import format_response
+
+    client = ZabbixAPI(url=os.environ["ZABBIX_URL"])
+    client.login(token=os.environ["ZABBIX_TOKEN"])
+
+    async def call() -> str:
+        return format_response(client.host.get(**PARAMS))
+
+    return await run_workers(call, clients, calls)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="Simulated Zabbix frontend latency in seconds")
+    parser.add_argument("--calls", type=int, default=256,
+                        help="Tool calls issued per concurrency level")
+    parser.add_argument("--mode", choices=["async", "blocking", "both"], default="both")
+    args = parser.parse_args()
+
+    modes: List[str] = ["blocking", "async"] if args.mode == "both" else [args.mode]
+    runners = {"async": bench_async, "blocking": bench_blocking}
+
+    with FakeZabbixServer(latency=args.latency) as fake:
+        os.environ["ZABBIX_URL"] = fake.url
+        os.environ["ZABBIX_TOKEN"] = "benchmark-token"
+        # Every call must reach the fake endpoint, not the response cache
+        os.environ["ZABBIX_CACHE_ENABLED"] = "false"
+
+        print(f"Fake Zabbix latency: {args.latency * 1000:.0f} ms, {args.calls} calls per level")
+        print(f"{'mode':<10}{'clients':>8}{'seconds':>10}{'calls/s':>10}")
+        for mode in modes:
+            for clients in CONCURRENCY_LEVELS:
+                elapsed = asyncio.run(runners[mode](clients, args.calls))
+                print(f"{mode:<10}{clients:>8}{elapsed:>10.2f}{args.calls / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for ``format_response``.
+
+Times the pretty and compact response formats with the standard library
+and orjson encoders over representative ``item.get`` and ``history.get``
+payloads of 1k, 10k and 100k rows, and reports the encoded size.
+
+Usage:
+    uv run python benchmarks/bench_format_response.py [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.fake_zabbix import generate_history, generate_items  # noqa: E402
+from src._core import format_response, orjson  # noqa: E402
+
+ROW_COUNTS = [1_000, 10_000, 100_000]
+PAYLOADS = {"item.get": generate_items, "history.get": generate_history}
+
+
+def best_time(data, fmt: str, repeat: int) -> float:
+    """Return the fastest of ``repeat`` encodings in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        format_response(data, fmt)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    backends = ["json"] + (["orjson"] if orjson is not None else [])
+    if orjson is None:
+        print("orjson is not installed; only the json backend is measured")
+
+    print(f"{'payload':<13}{'rows':>8}{'backend':>8}{'format':>9}{'ms':>10}{'MiB':>9}")
+    for name, generate in PAYLOADS.items():
+        for rows in ROW_COUNTS:
+            data = generate(rows)
+            for backend in backends:
+                os.environ["ZABBIX_MCP_JSON_BACKEND"] = backend
+                for fmt in ("pretty", "compact"):
+                    seconds = best_time(data, fmt, args.repeat)
+                    size = len(format_response(data, fmt).encode()) / 2 ** 20
+                    print(f"{name:<13}{rows:>8}{backend:>8}{fmt:>9}{seconds * 1000:>10.1f}{size:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
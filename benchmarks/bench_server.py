@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the MCP server against a local fake Zabbix.
+
+Starts the fake ``api_jsonrpc.php`` with a generated dataset, launches the
+server as a subprocess over stdio and/or streamable-http and drives it with
+an MCP client. For each tool category it reports p50/p99 latency,
+throughput and the server's resident memory after the category. Save the
+results with ``--json`` and pass them as ``--baseline`` on a later run to
+see the change of every figure.
+
+Usage:
+    uv run python benchmarks/bench_server.py [--transports stdio,http] [--calls 200]
+        [--concurrency 8] [--latency 0.02] [--hosts 50] [--json results.json]
+        [--baseline results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from fastmcp import Client  # noqa: E402
+from fastmcp.client.transports import StdioTransport, StreamableHttpTransport  # noqa: E402
+
+from benchmarks.fake_zabbix import ENDPOINT_REVISION, HISTORY_END, FakeZabbixServer  # noqa: E402
+
+SERVER_COMMAND = [sys.executable, "-c", "from src.zabbix_mcp_server import main; main()"]
+
+Call = Tuple[str, Dict[str, Any]]
+
+
+def _host(fake: FakeZabbixServer, i: int) -> Dict[str, Any]:
+    return fake.hosts[i % len(fake.hosts)]
+
+
+def _itemids(fake: FakeZabbixServer, i: int, count: int) -> List[str]:
+    items = fake.dataset.items
+    return [items[(i * count + n) % len(items)]["itemid"] for n in range(count)]
+
+
+# Tool category -> function of (fake server, call index) returning the call to make
+WORKLOADS: Dict[str, Callable[[FakeZabbixServer, int], Call]] = {
+    "introspection": lambda fake, i: ("server_cache_stats", {}),
+    "inventory": lambda fake, i: [
+        ("host_get", {"hostids": [_host(fake, i)["hostid"]]}),
+        ("hostgroup_get", {"output": ["groupid", "name"]}),
+        ("item_get", {"hostids": [_host(fake, i)["hostid"]]}),
+        ("trigger_get", {"hostids": [_host(fake, i)["hostid"]]}),
+    ][i % 4],
+    "monitoring": lambda fake, i: [
+        ("problem_get", {"hostids": [_host(fake, i)["hostid"]]}),
+        ("event_get", {"limit": 50 + i % 10}),
+    ][i % 2],
+    "history": lambda fake, i: [
+        ("history_get", {"itemids": _itemids(fake, i, 4), "time_from": HISTORY_END - 3600,
+                         "time_till": HISTORY_END}),
+        ("trend_get", {"itemids": _itemids(fake, i, 4), "time_from": HISTORY_END - 7 * 86400,
+                       "time_till": HISTORY_END}),
+    ][i % 2],
+    "batch": lambda fake, i: ("batch_get", {"calls": [
+        {"object": "host", "params": {"hostids": [_host(fake, i)["hostid"]]}},
+        {"object": "problem", "params": {"hostids": [_host(fake, i)["hostid"]]}},
+        {"object": "trigger", "params": {"hostids": [_host(fake, i)["hostid"]]}},
+        {"object": "item", "params": {"hostids": [_host(fake, i)["hostid"]], "limit": 20}},
+    ]}),
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values``."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))]
+
+
+def server_rss_mb(pid: Optional[int] = None) -> Optional[float]:
+    """Resident memory of the server process in MB (Linux only).
+
+    Without ``pid`` the server is looked up among this process's children.
+    """
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+    if pid is None:
+        for status in proc.glob("[0-9]*/status"):
+            try:
+                text = status.read_text()
+            except OSError:
+                continue
+            if f"PPid:\t{os.getpid()}\n" in text and "python" in text.split("\n", 1)[0]:
+                pid = int(status.parent.name)
+                break
+        else:
+            return None
+    for line in (proc / str(pid) / "status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    return None
+
+
+async def run_category(client: Client, fake: FakeZabbixServer, workload: Callable, calls: int,
+                       concurrency: int) -> Tuple[List[float], float, int]:
+    """Issue ``calls`` tool calls from ``concurrency`` workers.
+
+    Returns:
+        Latencies in seconds, elapsed seconds and the number of failed calls
+    """
+    latencies: List[float] = []
+    errors = 0
+    next_call = 0
+
+    async def worker() -> None:
+        nonlocal next_call, errors
+        while next_call < calls:
+            index = next_call
+            next_call += 1
+            tool, arguments = workload(fake, index)
+            start = time.perf_counter()
+            result = await client.call_tool(tool, arguments, raise_on_error=False)
+            latencies.append(time.perf_counter() - start)
+            errors += bool(result.is_error)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start, errors
+
+
+async def run_transport(client: Client, fake: FakeZabbixServer, args: argparse.Namespace,
+                        pid: Optional[int]) -> Dict[str, Dict[str, Any]]:
+    """Run every selected category over one client session."""
+    results = {}
+    async with client:
+        for category in args.categories:
+            workload = WORKLOADS[category]
+            # Untimed calls: log in, import lazily registered tool modules
+            await run_category(client, fake, workload, args.warmup, 1)
+            latencies, elapsed, errors = await run_category(
+                client, fake, workload, args.calls, args.concurrency)
+            results[category] = {
+                "calls": len(latencies),
+                "errors": errors,
+                "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+                "calls_per_s": round(len(latencies) / elapsed, 1),
+                "rss_mb": server_rss_mb(pid),
+            }
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server not ready at {url} after {timeout:.0f}s")
+
+
+def bench_stdio(fake: FakeZabbixServer, env: Dict[str, str],
+                args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    transport = StdioTransport(SERVER_COMMAND[0], SERVER_COMMAND[1:] + ["--transport", "stdio"],
+                               env=env, cwd=str(ROOT))
+    return asyncio.run(run_transport(Client(transport), fake, args, None))
+
+
+def bench_http(fake: FakeZabbixServer, env: Dict[str, str],
+               args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    port = _free_port()
+    process = subprocess.Popen(
+        SERVER_COMMAND + ["--transport", "streamable-http", "--host", "127.0.0.1", "--port", str(port)],
+        env={**env, "AUTH_TYPE": "no-auth"}, cwd=str(ROOT),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_ready(f"http://127.0.0.1:{port}/ready", process)
+        client = Client(StreamableHttpTransport(f"http://127.0.0.1:{port}/mcp"))
+        return asyncio.run(run_transport(client, fake, args, process.pid))
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def _change(current: float, baseline: Optional[float]) -> str:
+    if not baseline:
+        return ""
+    return f"{(current - baseline) / baseline * 100:+.0f}%"
+
+
+def print_results(results: Dict[str, Dict[str, Dict[str, Any]]],
+                  baseline: Optional[Dict[str, Any]]) -> None:
+    header = f"{'transport':<10}{'category':<15}{'calls':>7}{'errors':>7}{'p50 ms':>9}" \
+             f"{'p99 ms':>9}{'calls/s':>9}{'RSS MB':>8}"
+    print(header + ("   vs baseline (p50 / p99 / calls/s)" if baseline else ""))
+    for transport, categories in results.items():
+        for category, row in categories.items():
+            rss = f"{row['rss_mb']:.0f}" if row["rss_mb"] is not None else "n/a"
+            line = f"{transport:<10}{category:<15}{row['calls']:>7}{row['errors']:>7}" \
+                   f"{row['p50_ms']:>9.2f}{row['p99_ms']:>9.2f}{row['calls_per_s']:>9.1f}{rss:>8}"
+            before = (baseline or {}).get(transport, {}).get(category)
+            if before:
+                line += "   " + " / ".join(_change(row[key], before.get(key))
+                                           for key in ("p50_ms", "p99_ms", "calls_per_s"))
+            print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--transports", default="stdio,http",
+                        help="Comma-separated transports to drive (stdio, http)")
+    parser.add_argument("--categories", default=",".join(WORKLOADS),
+                        help=f"Comma-separated tool categories ({', '.join(WORKLOADS)})")
+    parser.add_argument("--calls", type=int, default=200, help="Timed calls per category")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed calls per category")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent calls per session")
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="Simulated Zabbix frontend latency in seconds")
+    parser.add_argument("--row-latency", type=float, default=0.0,
+                        help="Additional simulated latency in seconds per 1000 returned rows")
+    parser.add_argument("--hosts", type=int, default=50, help="Hosts in the fake dataset")
+    parser.add_argument("--items-per-host", type=int, default=20, help="Items per fake host")
+    parser.add_argument("--cache", action="store_true",
+                        help="Keep the response cache on (off by default to measure every call)")
+    parser.add_argument("--json", type=Path, help="Write the results to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare with results saved by --json")
+    args = parser.parse_args()
+    args.categories = [c.strip() for c in args.categories.split(",") if c.strip()]
+    unknown = set(args.categories) - set(WORKLOADS)
+    if unknown:
+        parser.error(f"Unknown categories: {', '.join(sorted(unknown))}")
+    runners = {"stdio": bench_stdio, "http": bench_http}
+    transports = [t.strip() for t in args.transports.split(",") if t.strip()]
+    if set(transports) - set(runners):
+        parser.error(f"Transports must be among: {', '.join(runners)}")
+
+    # Everything that shifts the timings; a baseline is only comparable with the same setup
+    setup = {"endpoint_revision": ENDPOINT_REVISION, "latency": args.latency,
+             "row_latency": args.row_latency, "hosts": args.hosts,
+             "items_per_host": args.items_per_host, "concurrency": args.concurrency,
+             "cache": args.cache}
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    if baseline is not None and baseline.get("setup") != setup:
+        parser.error(f"{args.baseline} was recorded with a different setup or fake endpoint "
+                     f"revision; record it again with --json")
+
+    with FakeZabbixServer(latency=args.latency, hosts=args.hosts,
+                          items_per_host=args.items_per_host, row_latency=args.row_latency) as fake:
+        env = {**os.environ, "PYTHONPATH": str(ROOT), "ZABBIX_URL": fake.url,
+               "ZABBIX_TOKEN": "benchmark-token", "ZABBIX_CACHE_ENABLED": str(args.cache).lower()}
+        print(f"Fake Zabbix: {args.hosts} hosts, {len(fake.dataset.items)} items, "
+              f"{args.latency * 1000:.0f} ms latency; {args.calls} calls per category "
+              f"at concurrency {args.concurrency}, cache {'on' if args.cache else 'off'}")
+        results = {transport: runners[transport](fake, env, args) for transport in transports}
+
+    print_results(results, baseline and baseline["results"])
+    if args.json:
+        args.json.write_text(json.dumps({"setup": setup, "results": results}, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark for ``tools/list`` across many client sessions.
+
+Opens ``--sessions`` in-memory MCP sessions one after another and times the
+``tools/list`` request of each, with FastMCP's own handler (the list is
+rebuilt on every request) and with the cached handler. The in-memory
+transport skips the final JSON encoding, which is the same in both modes;
+its cost is reported separately.
+
+Usage:
+    uv run python benchmarks/bench_tools_list.py [--sessions 200] [--profile full]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import mcp.types as types  # noqa: E402
+from fastmcp import Client  # noqa: E402
+
+from src._core import mcp  # noqa: E402
+from src.tools import register_tools  # noqa: E402
+from src.tools._listing import install_tool_list_cache  # noqa: E402
+
+
+async def time_sessions(sessions: int) -> List[float]:
+    """Open ``sessions`` sessions, return the seconds each ``tools/list`` took."""
+    timings = []
+    for _ in range(sessions):
+        async with Client(mcp) as client:
+            start = time.perf_counter()
+            await client.list_tools()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def encode_seconds(repeat: int = 20) -> tuple:
+    """Time the transport's JSON encoding of one tools/list response."""
+    async def dumped():
+        result = await mcp._mcp_server.request_handlers[types.ListToolsRequest](
+            types.ListToolsRequest(method="tools/list"))
+        return result.model_dump(by_alias=True, mode="json", exclude_none=True)
+
+    message = types.JSONRPCMessage(types.JSONRPCResponse(
+        jsonrpc="2.0", id=1, result=asyncio.run(dumped())))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encoded = message.model_dump_json(by_alias=True, exclude_none=True)
+    return (time.perf_counter() - start) / repeat, len(encoded)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200, help="Sessions per mode")
+    parser.add_argument("--profile", default="full", help="Tool profile to register")
+    args = parser.parse_args()
+
+    register_tools(lazy=True, tool_profile=args.profile)
+    cache = install_tool_list_cache()
+    if cache is None:
+        sys.exit("tools/list cache not supported by the installed FastMCP/mcp release")
+    handlers = mcp._mcp_server.request_handlers
+
+    print(f"{len(mcp._tool_manager._tools)} tools, {args.sessions} sessions per mode")
+    print(f"{'mode':<10}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for mode, handler in (("uncached", cache.handler), ("cached", cache)):
+        handlers[types.ListToolsRequest] = handler
+        timings = sorted(t * 1000 for t in asyncio.run(time_sessions(args.sessions)))
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(f"{mode:<10}{statistics.mean(timings):>10.2f}{statistics.median(timings):>10.2f}"
+              f"{p99:>10.2f}")
+    seconds, size = encode_seconds()
+    print(f"JSON encoding by the transport: {seconds * 1000:.2f} ms for {size / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
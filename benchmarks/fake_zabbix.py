@@ -0,0 +1,315 @@
+"""
+Fake Zabbix JSON-RPC endpoint for benchmarks.
+
+Serves ``api_jsonrpc.php`` on a local port with a configurable per-request
+latency so that client-side concurrency can be measured without a real
+Zabbix frontend. A generated dataset of host groups, hosts, items,
+triggers and problems answers ``*.get`` calls with the common ID filters,
+``output``, ``limit`` and ``countOutput``; history and trends are generated
+on the fly for the requested items and time range. Authentication is
+accepted but never checked.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+API_VERSION = "7.0.0"
+
+# Seconds between generated history samples, and the clock of the newest one
+HISTORY_STEP = 60
+HISTORY_END = 1718000000
+
+# Bumped whenever a change to the endpoint shifts the timings it produces, so
+# benchmark results recorded against an older endpoint are not compared
+ENDPOINT_REVISION = 2
+
+
+def generate_hosts(count: int) -> List[Dict[str, Any]]:
+    """Generate a list of host objects shaped like ``host.get`` output."""
+    return [
+        {"hostid": str(10000 + i), "host": f"host-{i:05d}", "name": f"Host {i:05d}",
+         "status": "0", "description": ""}
+        for i in range(count)
+    ]
+
+
+def generate_items(count: int, hosts: int = 100) -> List[Dict[str, Any]]:
+    """Generate a list of item objects shaped like ``item.get`` output."""
+    return [
+        {"itemid": str(100000 + i), "type": "0", "snmp_oid": "", "hostid": str(10000 + i % hosts),
+         "name": f"CPU utilization {i}", "key_": f"system.cpu.util[,{i}]", "delay": "1m",
+         "history": "31d", "trends": "365d", "status": "0", "value_type": "0",
+         "trapper_hosts": "", "units": "%", "logtimefmt": "", "templateid": "0",
+         "valuemapid": "0", "params": "", "ipmi_sensor": "", "authtype": "0",
+         "username": "", "password": "", "publickey": "", "privatekey": "", "flags": "0",
+         "interfaceid": "1", "description": "CPU utilization in %", "inventory_link": "0",
+         "lifetime": "30d", "evaltype": "0", "jmx_endpoint": "", "master_itemid": "0",
+         "timeout": "3s", "url": "", "query_fields": [], "posts": "", "status_codes": "200",
+         "follow_redirects": "1", "post_type": "0", "http_proxy": "", "headers": [],
+         "retrieve_mode": "0", "request_method": "0", "output_format": "0",
+         "ssl_cert_file": "", "ssl_key_file": "", "ssl_key_password": "",
+         "verify_peer": "0", "verify_host": "0", "allow_traps": "0", "uuid": "",
+         "state": "0", "error": "", "parameters": [], "lastclock": "1718000000",
+         "lastns": "0", "lastvalue": "12.5", "prevvalue": "11.9"}
+        for i in range(count)
+    ]
+
+
+def generate_groups(count: int) -> List[Dict[str, Any]]:
+    """Generate a list of host group objects shaped like ``hostgroup.get`` output."""
+    return [{"groupid": str(100 + i), "name": f"Group {i:03d}", "flags": "0", "uuid": ""}
+            for i in range(count)]
+
+
+def generate_triggers(hosts: int, per_host: int) -> List[Dict[str, Any]]:
+    """Generate trigger objects shaped like ``trigger.get`` output, every tenth one in problem state."""
+    return [
+        {"triggerid": str(500000 + i), "hostid": str(10000 + i % hosts),
+         "description": f"High CPU utilization on host-{i % hosts:05d} ({i // hosts})",
+         "expression": f"{{{600000 + i}}}>90", "priority": str(i % 6), "status": "0",
+         "value": "1" if i % 10 == 0 else "0", "state": "0", "lastchange": str(HISTORY_END - i),
+         "comments": "", "templateid": "0", "flags": "0"}
+        for i in range(hosts * per_host)
+    ]
+
+
+def generate_problems(triggers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Generate the problem (and event) objects of triggers in problem state."""
+    return [
+        {"eventid": str(900000 + i), "source": "0", "object": "0",
+         "objectid": trigger["triggerid"], "hostid": trigger["hostid"],
+         "clock": trigger["lastchange"], "ns": "0", "r_eventid": "0", "acknowledged": "0",
+         "severity": trigger["priority"], "name": trigger["description"], "suppressed": "0"}
+        for i, trigger in enumerate(t for t in triggers if t["value"] == "1")
+    ]
+
+
+def generate_history(count: int, items: int = 10, start: int = 1718000000,
+                     step: int = 10) -> List[Dict[str, Any]]:
+    """Generate float history rows shaped like ``history.get`` output."""
+    return [
+        {"itemid": str(100000 + i % items), "clock": str(start + (i // items) * step),
+         "value": f"{(i * 7919) % 10000 / 100:.4f}", "ns": str((i * 104729) % 1000000000)}
+        for i in range(count)
+    ]
+
+
+def history_rows(itemids: List[str], time_from: int, time_till: int,
+                 trends: bool = False) -> List[Dict[str, Any]]:
+    """Generate history (or hourly trend) rows of ``itemids`` between two clocks."""
+    step = 3600 if trends else HISTORY_STEP
+    first = time_from + (-time_from) % step
+    rows = []
+    for itemid in itemids:
+        seed = int(itemid) if itemid.isdigit() else 0
+        for clock in range(first, time_till + 1, step):
+            value = f"{(clock // step * 7919 + seed) % 10000 / 100:.4f}"
+            if trends:
+                rows.append({"itemid": itemid, "clock": str(clock), "num": "60",
+                             "value_min": value, "value_avg": value, "value_max": value})
+            else:
+                rows.append({"itemid": itemid, "clock": str(clock), "value": value,
+                             "ns": str(seed * 104729 % 1000000000)})
+    return rows
+
+
+class FakeDataset:
+    """Objects served by the fake endpoint.
+
+    Args:
+        hosts: Number of hosts
+        items_per_host: Items generated per host
+        groups: Host groups the hosts are spread over
+        triggers_per_host: Triggers generated per host
+    """
+
+    # API object -> (dataset attribute, {ID list parameter: row field})
+    TABLES: Dict[str, Tuple[str, Dict[str, str]]] = {
+        "hostgroup": ("groups", {"groupids": "groupid"}),
+        "host": ("hosts", {"hostids": "hostid", "groupids": "groupid"}),
+        "item": ("items", {"itemids": "itemid", "hostids": "hostid"}),
+        "trigger": ("triggers", {"triggerids": "triggerid", "hostids": "hostid"}),
+        "problem": ("problems", {"eventids": "eventid", "objectids": "objectid", "hostids": "hostid"}),
+        "event": ("problems", {"eventids": "eventid", "objectids": "objectid", "hostids": "hostid"}),
+    }
+
+    def __init__(self, hosts: int = 50, items_per_host: int = 20, groups: int = 5,
+                 triggers_per_host: int = 2):
+        self.groups = generate_groups(groups)
+        self.hosts = generate_hosts(hosts)
+        for i, host in enumerate(self.hosts):
+            host["groupid"] = str(100 + i % max(groups, 1))
+        self.items = generate_items(hosts * items_per_host, max(hosts, 1))
+        self.triggers = generate_triggers(hosts, triggers_per_host)
+        self.problems = generate_problems(self.triggers)
+        self.templates: List[Dict[str, Any]] = []
+
+    def get(self, api_object: str, params: Dict[str, Any]) -> Any:
+        """Answer ``<api_object>.get`` with ID filters, filter, output, limit and countOutput."""
+        if api_object in ("history", "trend"):
+            rows = self.history(api_object == "trend", params)
+        elif api_object in self.TABLES:
+            attribute, id_params = self.TABLES[api_object]
+            rows = getattr(self, attribute)
+            for param, field in id_params.items():
+                if params.get(param) is not None:
+                    wanted = {str(v) for v in _as_list(params[param])}
+                    rows = [row for row in rows if row.get(field) in wanted]
+            for field, value in (params.get("filter") or {}).items():
+                wanted = {str(v) for v in _as_list(value)}
+                rows = [row for row in rows if str(row.get(field)) in wanted]
+        else:
+            rows = []
+        if params.get("countOutput"):
+            return str(len(rows))
+        if params.get("limit"):
+            rows = rows[:int(params["limit"])]
+        output = params.get("output")
+        if isinstance(output, list):
+            rows = [{field: row.get(field) for field in output if field in row} for row in rows]
+        return rows
+
+    def history(self, trends: bool, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Generate the rows of a ``history.get`` or ``trend.get`` call."""
+        itemids = [str(v) for v in _as_list(params.get("itemids") or [])]
+        time_till = int(params.get("time_till", HISTORY_END))
+        time_from = int(params.get("time_from", time_till - 3600))
+        rows = history_rows(itemids, time_from, time_till, trends)
+        if params.get("sortfield") == "clock":
+            rows.sort(key=lambda row: int(row["clock"]),
+                      reverse=params.get("sortorder") == "DESC")
+        return rows
+
+
+def _as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections of a burst of concurrent
+    # clients, which then retry after about a second
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FakeZabbixServer:
+    """Threaded HTTP server answering Zabbix JSON-RPC requests.
+
+    Args:
+        latency: Seconds to sleep before answering each request.
+        hosts: Number of hosts in the generated dataset.
+        port: Port to bind on 127.0.0.1 (0 picks a free port).
+        items_per_host: Items generated per host.
+        row_latency: Additional seconds per 1000 returned rows, imitating
+            the frontend's cost of larger results.
+    """
+
+    def __init__(self, latency: float = 0.02, hosts: int = 50, port: int = 0,
+                 items_per_host: int = 20, row_latency: float = 0.0):
+        self.latency = latency
+        self.row_latency = row_latency
+        self.dataset = FakeDataset(hosts, items_per_host)
+        self.hosts = self.dataset.hosts
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._httpd = _HTTPServer(("127.0.0.1", port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Full URL of the fake ``api_jsonrpc.php`` endpoint."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api_jsonrpc.php"
+
+    def dispatch(self, method: str, params: Any) -> Any:
+        """Return the result payload for a JSON-RPC method."""
+        if method == "apiinfo.version":
+            return API_VERSION
+        if method == "user.login":
+            return "0424bd59b807674191e7d77572075f33"
+        if method == "user.logout":
+            return True
+        if method == "user.checkAuthentication":
+            return {"userid": "1", "username": "Admin"}
+        api_object, _, api_method = method.partition(".")
+        if api_method == "get":
+            return self.dataset.get(api_object, params if isinstance(params, dict) else {})
+        return []
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; with Nagle on, the
+            # body waits for the client's delayed ACK of the headers.
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                request = json.loads(body)
+                with server._lock:
+                    server.request_count += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                result = server.dispatch(request.get("method", ""), request.get("params", {}))
+                if server.row_latency and isinstance(result, list):
+                    time.sleep(server.row_latency * len(result) / 1000)
+                payload = json.dumps(
+                    {"jsonrpc": "2.0", "result": result, "id": request.get("id")}
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json-rpc")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def start(self) -> "FakeZabbixServer":
+        """Start serving in a background daemon thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeZabbixServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Tuple[Any, ...]) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a fake Zabbix JSON-RPC endpoint")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--hosts", type=int, default=50)
+    parser.add_argument("--items-per-host", type=int, default=20)
+    parser.add_argument("--row-latency", type=float, default=0.0,
+                        help="Additional seconds per 1000 returned rows")
+    args = parser.parse_args()
+
+    fake = FakeZabbixServer(latency=args.latency, hosts=args.hosts, port=args.port,
+                            items_per_host=args.items_per_host, row_latency=args.row_latency)
+    print(f"Serving fake Zabbix API at {fake.url}")
+    try:
+        fake.serve_forever()
+    except KeyboardInterrupt:
+        fake.stop()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Build the tool manifest used for lazy tool registration
+
+Imports every tool module, records the tools each one registers (name,
+description, input and output schema) with a hash of the module source,
+and writes src/tools/_manifest.json. Re-run it after changing a tool
+module; modules whose source no longer matches the manifest are imported
+at startup instead of lazily.
+
+Usage:
+    python scripts/build_tool_manifest.py [--check]
+
+Author: Zabbix MCP Server Contributors
+License: MIT
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add the repository root to the path so the src package is importable
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools import TOOL_MODULES  # noqa: E402
+from src.tools._lazy import MANIFEST_PATH, build_manifest  # noqa: E402
+
+
+def main() -> int:
+    """Write the manifest, or with --check report whether it is up to date.
+
+    Returns:
+        int: Exit code
+    """
+    manifest = json.dumps(build_manifest(TOOL_MODULES), indent=1, sort_keys=True) + "\n"
+    if "--check" in sys.argv[1:]:
+        current = MANIFEST_PATH.read_text() if MANIFEST_PATH.exists() else ""
+        if current != manifest:
+            print(f"{MANIFEST_PATH} is out of date; run scripts/build_tool_manifest.py")
+            return 1
+        print(f"{MANIFEST_PATH} is up to date")
+        return 0
+    MANIFEST_PATH.write_text(manifest)
+    tools = sum(len(m["tools"]) for m in json.loads(manifest)["modules"].values())
+    print(f"Wrote {MANIFEST_PATH} ({len(TOOL_MODULES)} modules, {tools} tools)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,7 @@ License: MIT
 import os
 import sys
 import json
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -105,8 +106,11 @@ def test_connection() -> bool:
         from zabbix_mcp_server import get_zabbix_client
         
         # Test getting client and API version
-        client = get_zabbix_client()
-        version_info = client.apiinfo.version()
+        async def get_version():
+            client = await get_zabbix_client()
+            return await client.apiinfo.version()
+
+        version_info = asyncio.run(get_version())
         
         print(f"✅ Connected to Zabbix API version: {version_info}")
         return True
@@ -133,31 +137,34 @@ def test_basic_operations() -> bool:
     
     try:
         from zabbix_mcp_server import get_zabbix_client
-        client = get_zabbix_client()
-        
-        # Test host groups (usually always present)
-        print("  - Testing host group retrieval...")
-        groups = client.hostgroup.get(limit=1)
-        if groups:
-            print(f"    ✅ Retrieved {len(groups)} host group(s)")
-        else:
-            print("    ⚠️  No host groups found (this might be normal)")
-        
-        # Test hosts
-        print("  - Testing host retrieval...")
-        hosts = client.host.get(limit=1)
-        if hosts:
-            print(f"    ✅ Retrieved {len(hosts)} host(s)")
-        else:
-            print("    ⚠️  No hosts found (this might be normal)")
+        async def run_reads():
+            client = await get_zabbix_client()
+            
+            # Test host groups (usually always present)
+            print("  - Testing host group retrieval...")
+            groups = await client.hostgroup.get(limit=1)
+            if groups:
+                print(f"    ✅ Retrieved {len(groups)} host group(s)")
+            else:
+                print("    ⚠️  No host groups found (this might be normal)")
+            
+            # Test hosts
+            print("  - Testing host retrieval...")
+            hosts = await client.host.get(limit=1)
+            if hosts:
+                print(f"    ✅ Retrieved {len(hosts)} host(s)")
+            else:
+                print("    ⚠️  No hosts found (this might be normal)")
+            
+            # Test items
+            print("  - Testing item retrieval...")
+            items = await client.item.get(limit=1)
+            if items:
+                print(f"    ✅ Retrieved {len(items)} item(s)")
+            else:
+                print("    ⚠️  No items found (this might be normal)")
         
-        # Test items
-        print("  - Testing item retrieval...")
-        items = client.item.get(limit=1)
-        if items:
-            print(f"    ✅ Retrieved {len(items)} item(s)")
-        else:
-            print("    ⚠️  No items found (this might be normal)")
+        asyncio.run(run_reads())
         
         print("✅ Basic operations successful")
         return True
@@ -176,7 +183,7 @@ def test_transport_config() -> bool:
     print("\n🔍 Testing transport configuration...")
     
     try:
-        from zabbix_mcp_server import get_transport_config
+        from src._core import get_transport_config
         
         config = get_transport_config()
         transport = config["transport"]
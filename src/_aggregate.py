@@ -0,0 +1,205 @@
+"""
+Statistical aggregation of history and trend samples.
+
+Computes per-item (and optionally per-time-bucket) statistics so that a
+question like "p95 CPU over the last 24h for 300 hosts" returns one small
+row per item instead of every raw value. Supported functions:
+
+- ``min``, ``max``, ``avg``, ``count``, ``stddev``
+- ``pNN`` percentiles, e.g. ``p50``, ``p95``, ``p99.9``
+- ``rate``: change per second between the first and last sample
+
+Trend samples are hourly rollups: ``min``/``max`` use the hourly extremes,
+``avg``/``count`` are weighted by the number of values per hour, and
+``stddev``, percentiles and ``rate`` are computed over the hourly averages.
+
+NumPy is used when installed; otherwise a pure-Python implementation with
+the same results is used.
+"""
+
+import bisect
+import math
+import re
+from array import array
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on installed extras
+    np = None
+
+AGGREGATE_FUNCTIONS = ("min", "max", "avg", "count", "stddev", "rate")
+
+_PERCENTILE = re.compile(r"^p(\d{1,2}(\.\d+)?|100)$")
+
+
+def validate_functions(functions: List[str]) -> List[str]:
+    """Check aggregation function names.
+
+    Raises:
+        ValueError: If the list is empty or a name is unknown
+    """
+    if not functions:
+        raise ValueError("At least one aggregation function is required")
+    for name in functions:
+        if name not in AGGREGATE_FUNCTIONS and not _PERCENTILE.match(name):
+            raise ValueError(f"Invalid aggregation function: {name} "
+                             f"(expected one of {', '.join(AGGREGATE_FUNCTIONS)} or pNN)")
+    return list(functions)
+
+
+class Samples:
+    """Samples of one item accumulated page by page in compact arrays.
+
+    History samples only fill ``clocks`` and ``values``; trend samples also
+    carry the hourly ``lows``, ``highs`` and value counts (``weights``).
+    """
+
+    __slots__ = ("clocks", "values", "weights", "lows", "highs", "ordered")
+
+    def __init__(self, rollup: bool = False) -> None:
+        self.ordered = True
+        self.clocks = array("d")
+        self.values = array("d")
+        self.weights = array("d") if rollup else None
+        self.lows = array("d") if rollup else None
+        self.highs = array("d") if rollup else None
+
+    def append(self, clock: float, value: float) -> None:
+        if self.clocks and clock < self.clocks[-1]:
+            self.ordered = False
+        self.clocks.append(clock)
+        self.values.append(value)
+
+    def append_rollup(self, clock: float, avg: float, low: float, high: float, count: float) -> None:
+        self.append(clock, avg)
+        self.weights.append(count)
+        self.lows.append(low)
+        self.highs.append(high)
+
+    def __len__(self) -> int:
+        return len(self.clocks)
+
+    def sort(self) -> None:
+        """Put samples in ascending clock order if they were appended out of order."""
+        if self.ordered:
+            return
+        order = sorted(range(len(self.clocks)), key=self.clocks.__getitem__)
+        for name in ("clocks", "values", "weights", "lows", "highs"):
+            column = getattr(self, name)
+            if column is not None:
+                setattr(self, name, array("d", (column[i] for i in order)))
+        self.ordered = True
+
+
+def aggregate(samples: Samples, functions: List[str],
+              bucket: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Aggregate samples overall or per time bucket.
+
+    Args:
+        samples: Samples to aggregate (sorted by clock first if needed)
+        functions: Function names accepted by ``validate_functions``
+        bucket: Bucket width in seconds (buckets are aligned to the epoch);
+            None aggregates the whole range into one row
+
+    Returns:
+        One dict per non-empty bucket mapping function names to results
+        (plus ``clock``, the bucket start, when bucketing)
+    """
+    if not len(samples):
+        return [] if bucket else [{name: (0 if name == "count" else None) for name in functions}]
+
+    samples.sort()
+    stats = _stats_numpy if np is not None else _stats
+    columns = _columns(samples)
+    if not bucket:
+        return [stats(columns, 0, len(samples), functions)]
+
+    rows = []
+    start = 0
+    clocks = samples.clocks
+    while start < len(clocks):
+        bucket_start = int(clocks[start]) - int(clocks[start]) % bucket
+        end = bisect.bisect_left(clocks, bucket_start + bucket, start)
+        rows.append({"clock": bucket_start, **stats(columns, start, end, functions)})
+        start = end
+    return rows
+
+
+def _columns(samples: Samples) -> Dict[str, Any]:
+    columns = {"clocks": samples.clocks, "values": samples.values,
+               "weights": samples.weights, "lows": samples.lows, "highs": samples.highs}
+    if np is not None:
+        columns = {name: None if column is None else np.frombuffer(column, dtype=np.float64)
+                   for name, column in columns.items()}
+    return columns
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Percentile with linear interpolation between closest ranks (NumPy's default)."""
+    rank = q / 100 * (len(ordered) - 1)
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _rate(clocks, values, start: int, end: int) -> Optional[float]:
+    span = clocks[end - 1] - clocks[start]
+    return (values[end - 1] - values[start]) / span if span > 0 else None
+
+
+def _stats(columns: Dict[str, Any], start: int, end: int, functions: List[str]) -> Dict[str, Any]:
+    values = columns["values"][start:end]
+    weights = columns["weights"][start:end] if columns["weights"] is not None else [1.0] * len(values)
+    lows = columns["lows"][start:end] if columns["lows"] is not None else values
+    highs = columns["highs"][start:end] if columns["highs"] is not None else values
+    total = sum(weights)
+    avg = sum(v * w for v, w in zip(values, weights)) / total if total else None
+    ordered = None
+    result: Dict[str, Any] = {}
+    for name in functions:
+        if name == "min":
+            result[name] = min(lows)
+        elif name == "max":
+            result[name] = max(highs)
+        elif name == "avg":
+            result[name] = avg
+        elif name == "count":
+            result[name] = int(total)
+        elif name == "stddev":
+            result[name] = None if avg is None else math.sqrt(
+                sum(w * (v - avg) ** 2 for v, w in zip(values, weights)) / total)
+        elif name == "rate":
+            result[name] = _rate(columns["clocks"], columns["values"], start, end)
+        else:
+            ordered = ordered or sorted(values)
+            result[name] = _percentile(ordered, float(name[1:]))
+    return result
+
+
+def _stats_numpy(columns: Dict[str, Any], start: int, end: int, functions: List[str]) -> Dict[str, Any]:
+    values = columns["values"][start:end]
+    weights = columns["weights"][start:end] if columns["weights"] is not None else None
+    lows = columns["lows"][start:end] if columns["lows"] is not None else values
+    highs = columns["highs"][start:end] if columns["highs"] is not None else values
+    total = float(weights.sum()) if weights is not None else float(len(values))
+    avg = float(np.average(values, weights=weights)) if total else None
+    result: Dict[str, Any] = {}
+    for name in functions:
+        if name == "min":
+            result[name] = float(lows.min())
+        elif name == "max":
+            result[name] = float(highs.max())
+        elif name == "avg":
+            result[name] = avg
+        elif name == "count":
+            result[name] = int(total)
+        elif name == "stddev":
+            result[name] = None if avg is None else float(
+                np.sqrt(np.average((values - avg) ** 2, weights=weights)))
+        elif name == "rate":
+            rate = _rate(columns["clocks"], columns["values"], start, end)
+            result[name] = None if rate is None else float(rate)
+        else:
+            result[name] = float(np.percentile(values, float(name[1:])))
+    return result
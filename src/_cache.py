@@ -0,0 +1,284 @@
+"""
+Read-through response cache for Zabbix API reads.
+
+Caches the already-serialized JSON response of ``*.get`` calls keyed on
+(api_object, api_method, canonicalized params), with a TTL chosen per API
+object and LRU eviction bounded by entry count and total size. Writes
+invalidate every cached read whose result they can change, following the
+``INVALIDATES`` dependency map.
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+CacheKey = Tuple[str, str, str]
+
+# Per-object TTLs in seconds; objects not listed use ZABBIX_CACHE_TTL.
+# Slow-changing configuration is cached for minutes, live state (including
+# the status fields of hosts, items and triggers) only long enough to absorb
+# bursts of identical queries.
+DEFAULT_TTLS: Dict[str, float] = {
+    "template": 300,
+    "templategroup": 300,
+    "hostgroup": 300,
+    "valuemap": 300,
+    "mediatype": 300,
+    "role": 300,
+    "usergroup": 300,
+    "regexp": 300,
+    "iconmap": 300,
+    "image": 300,
+    "module": 300,
+    "settings": 300,
+    "authentication": 300,
+    "housekeeping": 300,
+    "autoregistration": 300,
+    "trend": 60,
+    "host": 2,
+    "hostinterface": 2,
+    "item": 2,
+    "trigger": 2,
+    "httptest": 2,
+    "proxy": 2,
+    "dhost": 2,
+    "dservice": 2,
+    "service": 2,
+    "problem": 2,
+    "event": 2,
+    "history": 2,
+    "alert": 2,
+    "auditlog": 2,
+    "task": 0,
+    "hanode": 0,
+}
+
+
+# Objects whose cached reads a write to the key object can change. Every
+# object also invalidates itself; "*" drops the whole cache.
+INVALIDATES: Dict[str, Tuple[str, ...]] = {
+    "host": ("hostgroup", "hostinterface", "template", "item", "trigger", "graph",
+             "discoveryrule", "httptest", "usermacro", "hostprototype", "maintenance"),
+    "hostgroup": ("host", "template", "maintenance"),
+    "hostinterface": ("host", "item"),
+    "template": ("host", "templategroup", "item", "trigger", "graph", "discoveryrule",
+                 "itemprototype", "triggerprototype", "graphprototype", "hostprototype",
+                 "httptest", "usermacro", "templatedashboard", "valuemap"),
+    "templategroup": ("template",),
+    "item": ("host", "trigger", "graph", "graphitem", "history", "trend"),
+    "trigger": ("host", "item"),
+    "graph": ("graphitem",),
+    "discoveryrule": ("item", "itemprototype", "triggerprototype", "graphprototype",
+                      "hostprototype"),
+    "itemprototype": ("discoveryrule", "triggerprototype", "graphprototype"),
+    "triggerprototype": ("discoveryrule", "itemprototype"),
+    "graphprototype": ("discoveryrule",),
+    "hostprototype": ("discoveryrule", "host"),
+    "httptest": ("host", "item"),
+    "usermacro": ("host", "template"),
+    "valuemap": ("item", "template", "host"),
+    "maintenance": ("host",),
+    "proxy": ("host", "proxygroup"),
+    "proxygroup": ("proxy", "host"),
+    "user": ("usergroup",),
+    "usergroup": ("user",),
+    "role": ("user",),
+    "drule": ("dcheck", "dhost", "dservice"),
+    "event": ("problem",),
+    "history": ("trend",),
+    "service": ("sla",),
+    "sla": ("service",),
+    "configuration": ("*",),
+}
+
+
+def invalidated_objects(api_object: str) -> Tuple[str, ...]:
+    """Return the API objects whose cached reads a write to ``api_object`` affects."""
+    return (api_object,) + INVALIDATES.get(api_object, ())
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: str, expires_at: float):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = len(value)
+
+
+class ResponseCache:
+    """TTL + LRU cache of serialized API responses.
+
+    Args:
+        default_ttl: TTL in seconds for objects without an explicit policy.
+        ttls: Per-object TTL overrides in seconds (0 disables caching).
+        max_entries: Maximum number of cached responses.
+        max_bytes: Maximum total size of cached responses in characters.
+    """
+
+    def __init__(self, default_ttl: float = 30, ttls: Optional[Dict[str, float]] = None,
+                 max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.default_ttl = default_ttl
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._generations: Dict[str, int] = {}
+        self._global_generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(api_object: str, api_method: str, params: Dict[str, Any]) -> CacheKey:
+        """Build a cache key with params canonicalized (sorted keys, compact)."""
+        canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        return (api_object, api_method, canonical)
+
+    def ttl_for(self, api_object: str) -> float:
+        """Return the TTL in seconds for an API object."""
+        return self.ttls.get(api_object, self.default_ttl)
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """Return a cached response, or None on miss or expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def generation(self, api_object: str) -> Tuple[int, int]:
+        """Return a token that changes whenever ``api_object`` is invalidated.
+
+        Take it before issuing a read and pass it to ``set`` so a response
+        fetched across a concurrent write is not stored.
+        """
+        return (self._global_generation, self._generations.get(api_object, 0))
+
+    def set(self, key: CacheKey, value: str, ttl: float,
+            generation: Optional[Tuple[int, int]] = None) -> None:
+        """Store a response for ``ttl`` seconds, evicting LRU entries as needed.
+
+        Args:
+            key: Key from ``make_key``.
+            value: Serialized response.
+            ttl: Time to live in seconds; 0 skips caching.
+            generation: Token from ``generation`` taken before the read; the
+                value is dropped if the object was invalidated since.
+        """
+        if ttl <= 0 or len(value) > self.max_bytes:
+            return
+        if generation is not None and generation != self.generation(key[0]):
+            return
+        if key in self._entries:
+            self._remove(key)
+        entry = _Entry(value, time.monotonic() + ttl)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self) -> int:
+        """Drop all cached responses (counters are kept).
+
+        Returns:
+            Number of entries dropped
+        """
+        dropped = len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+        return dropped
+
+    def invalidate(self, api_object: str) -> int:
+        """Drop cached reads affected by a write to ``api_object``.
+
+        Args:
+            api_object: Zabbix API object that was written to.
+
+        Returns:
+            Number of entries dropped
+        """
+        affected = invalidated_objects(api_object)
+        self.invalidations += 1
+        if "*" in affected:
+            self._global_generation += 1
+            return self.clear()
+        for name in affected:
+            self._generations[name] = self._generations.get(name, 0) + 1
+        stale = [key for key in self._entries if key[0] in affected]
+        for key in stale:
+            self._remove(key)
+        return len(stale)
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "default_ttl": self.default_ttl,
+            "ttls": self.ttls,
+        }
+
+
+def _parse_ttls(value: str) -> Dict[str, float]:
+    """Parse ``object=seconds`` pairs separated by commas."""
+    ttls: Dict[str, float] = {}
+    for pair in value.split(","):
+        if not pair.strip():
+            continue
+        name, _, seconds = pair.partition("=")
+        ttls[name.strip()] = float(seconds)
+    return ttls
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get or create the response cache from environment settings.
+
+    Returns:
+        ResponseCache, or None when ZABBIX_CACHE_ENABLED is false
+    """
+    global _response_cache
+
+    if os.getenv("ZABBIX_CACHE_ENABLED", "true").lower() not in ("true", "1", "yes"):
+        return None
+
+    if _response_cache is None:
+        ttls = dict(DEFAULT_TTLS)
+        ttls.update(_parse_ttls(os.getenv("ZABBIX_CACHE_TTLS", "")))
+        _response_cache = ResponseCache(
+            default_ttl=float(os.getenv("ZABBIX_CACHE_TTL", "30")),
+            ttls=ttls,
+            max_entries=int(os.getenv("ZABBIX_CACHE_MAX_ENTRIES", "1024")),
+            max_bytes=int(os.getenv("ZABBIX_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+        )
+    return _response_cache
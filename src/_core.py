@@ -7,12 +7,25 @@ and shared utility functions used by all tool modules.
 
 import os
 import json
+import asyncio
 import logging
-from typing import Any, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
 from fastmcp import FastMCP
-from zabbix_utils import ZabbixAPI
 from dotenv import load_dotenv
 
+from src._metrics import SERIALIZATION_SECONDS, MetricsMiddleware
+from src._pool import create_client_session, get_pool_settings
+from src._tracing import TracingMiddleware, row_count, span
+
+if TYPE_CHECKING:
+    from zabbix_utils import AsyncZabbixAPI
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -25,55 +38,142 @@ logger = logging.getLogger(__name__)
 
 # Initialize FastMCP
 mcp = FastMCP("Zabbix MCP Server")
+mcp.add_middleware(MetricsMiddleware())
+mcp.add_middleware(TracingMiddleware())
 
-# Global Zabbix API client
-zabbix_api: Optional[ZabbixAPI] = None
+# Global Zabbix API client and the event loop it is bound to
+zabbix_api: Optional["AsyncZabbixAPI"] = None
+_zabbix_api_loop: Optional[asyncio.AbstractEventLoop] = None
+_zabbix_api_lock: Optional[asyncio.Lock] = None
 
 
-def get_zabbix_client() -> ZabbixAPI:
-    """Get or create Zabbix API client with proper authentication.
+async def _create_zabbix_client() -> "AsyncZabbixAPI":
+    """Create and authenticate a new async Zabbix API client.
 
     Returns:
-        ZabbixAPI: Authenticated Zabbix API client
+        AsyncZabbixAPI: Authenticated Zabbix API client
 
     Raises:
         ValueError: If required environment variables are missing
         Exception: If authentication fails
     """
-    global zabbix_api
-
-    if zabbix_api is None:
-        url = os.getenv("ZABBIX_URL")
-        if not url:
-            raise ValueError("ZABBIX_URL environment variable is required")
-
-        logger.info(f"Initializing Zabbix API client for {url}")
-
-        # Configure SSL verification
-        verify_ssl = os.getenv("VERIFY_SSL", "true").lower() in ("true", "1", "yes")
-        logger.info(f"SSL certificate verification: {'enabled' if verify_ssl else 'disabled'}")
-
-        # Initialize client
-        zabbix_api = ZabbixAPI(url=url, validate_certs=verify_ssl)
+    url = os.getenv("ZABBIX_URL")
+    if not url:
+        raise ValueError("ZABBIX_URL environment variable is required")
+
+    logger.info(f"Initializing Zabbix API client for {url}")
+
+    # Configure SSL verification
+    verify_ssl = os.getenv("VERIFY_SSL", "true").lower() in ("true", "1", "yes")
+    logger.info(f"SSL certificate verification: {'enabled' if verify_ssl else 'disabled'}")
+
+    token = os.getenv("ZABBIX_TOKEN")
+    user = os.getenv("ZABBIX_USER")
+    password = os.getenv("ZABBIX_PASSWORD")
+    if not token and (not user or not password):
+        raise ValueError("Either ZABBIX_TOKEN or ZABBIX_USER/ZABBIX_PASSWORD must be set")
+
+    # zabbix_utils (and aiohttp below it) is only imported once a client is needed
+    from zabbix_utils import AsyncZabbixAPI
+
+    # Initialize client on a pooled keep-alive HTTP session
+    logger.info(f"Connection pool settings: {get_pool_settings()}")
+    session = create_client_session(verify_ssl)
+    try:
+        # The constructor fetches apiinfo.version with a blocking urllib request
+        # (even with skip_version_check), so it runs off the event loop
+        client = await asyncio.to_thread(AsyncZabbixAPI, url=url, validate_certs=verify_ssl,
+                                         client_session=session)
 
         # Authenticate using token or username/password
-        token = os.getenv("ZABBIX_TOKEN")
         if token:
             logger.info("Authenticating with API token")
-            zabbix_api.login(token=token)
+            await client.login(token=token)
         else:
-            user = os.getenv("ZABBIX_USER")
-            password = os.getenv("ZABBIX_PASSWORD")
-            if not user or not password:
-                raise ValueError("Either ZABBIX_TOKEN or ZABBIX_USER/ZABBIX_PASSWORD must be set")
             logger.info(f"Authenticating with username: {user}")
-            zabbix_api.login(user=user, password=password)
+            await client.login(user=user, password=password)
+    except Exception:
+        await session.close()
+        raise
+
+    logger.info("Successfully authenticated with Zabbix API")
+    return client
+
+
+async def _close_client_session(client: "AsyncZabbixAPI",
+                                loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close the HTTP session of a client created on ``loop``.
+
+    The session's connections belong to ``loop``, so they are closed on it:
+    directly when it is the running loop, scheduled there while it runs in
+    another thread, or by running it in a worker thread while it is idle.
+    Once ``loop`` is closed aiohttp only marks the session closed, as its
+    connections went away with the loop.
+    """
+    session = getattr(client, "client_session", None)
+    if session is None or session.closed:
+        return
+    try:
+        if loop is None or loop is asyncio.get_running_loop() or loop.is_closed():
+            await session.close()
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            await asyncio.to_thread(loop.run_until_complete, session.close())
+    except Exception as e:
+        logger.debug(f"Could not close the Zabbix API session: {e}")
+
 
-        logger.info("Successfully authenticated with Zabbix API")
+def _session_closed(client: "AsyncZabbixAPI") -> bool:
+    session = getattr(client, "client_session", None)
+    return session is not None and session.closed
+
+
+async def get_zabbix_client() -> "AsyncZabbixAPI":
+    """Get or create Zabbix API client with proper authentication.
+
+    The client's HTTP session belongs to the event loop it was created on,
+    so a fresh client is built when called from a different loop and the
+    previous client's session is closed. A client whose session was closed
+    is replaced as well: zabbix_utils closes a session it created itself on
+    the first API error. Concurrent first callers share a single login.
+
+    Returns:
+        AsyncZabbixAPI: Authenticated Zabbix API client
+
+    Raises:
+        ValueError: If required environment variables are missing
+        Exception: If authentication fails
+    """
+    global zabbix_api, _zabbix_api_loop, _zabbix_api_lock
+
+    loop = asyncio.get_running_loop()
+    if _zabbix_api_loop is not loop:
+        stale, stale_loop = zabbix_api, _zabbix_api_loop
+        zabbix_api = None
+        _zabbix_api_loop = loop
+        _zabbix_api_lock = asyncio.Lock()
+        if stale is not None:
+            await _close_client_session(stale, stale_loop)
+
+    if zabbix_api is None or _session_closed(zabbix_api):
+        async with _zabbix_api_lock:
+            if zabbix_api is None or _session_closed(zabbix_api):
+                zabbix_api = await _create_zabbix_client()
 
     return zabbix_api
 
 
+async def close_zabbix_client() -> None:
+    """Close the shared client's HTTP session; the next call logs in again."""
+    global zabbix_api, _zabbix_api_loop
+    client, loop = zabbix_api, _zabbix_api_loop
+    zabbix_api = None
+    _zabbix_api_loop = None
+    if client is not None:
+        await _close_client_session(client, loop)
+
+
 _read_only: Optional[bool] = None
 
 
@@ -94,15 +194,123 @@ def is_read_only() -> bool:
     return os.getenv("READ_ONLY", "true").lower() in ("true", "1", "yes")
 
 
-def format_response(data: Any) -> str:
+def get_transport_config() -> Dict[str, Any]:
+    """Get transport settings from environment variables.
+
+    Returns:
+        dict: ``transport`` plus ``host``, ``port`` and ``stateless_http`` for HTTP
+
+    Raises:
+        ValueError: If the transport is unknown or AUTH_TYPE is not set for HTTP
+    """
+    transport = os.getenv("ZABBIX_MCP_TRANSPORT", "stdio").lower()
+    if transport not in ("stdio", "streamable-http"):
+        raise ValueError(f"Invalid ZABBIX_MCP_TRANSPORT: {transport} (expected stdio or streamable-http)")
+
+    config: Dict[str, Any] = {"transport": transport}
+    if transport == "streamable-http":
+        if os.getenv("AUTH_TYPE", "").lower() != "no-auth":
+            raise ValueError("AUTH_TYPE must be set to 'no-auth' for streamable-http transport")
+        config["host"] = os.getenv("ZABBIX_MCP_HOST", "127.0.0.1")
+        config["port"] = int(os.getenv("ZABBIX_MCP_PORT", "8000"))
+        config["stateless_http"] = os.getenv("ZABBIX_MCP_STATELESS_HTTP", "false").lower() in ("true", "1", "yes")
+    return config
+
+
+RESPONSE_FORMATS = ("pretty", "compact", "columnar")
+
+
+def get_response_format() -> str:
+    """Get the default response format.
+
+    Returns:
+        str: Value of ZABBIX_MCP_RESPONSE_FORMAT (default "pretty")
+    """
+    return os.getenv("ZABBIX_MCP_RESPONSE_FORMAT", "pretty").lower()
+
+
+def to_columnar(data: Any) -> Any:
+    """Convert a list of objects into ``{"columns": [...], "rows": [[...], ...]}``.
+
+    Columns are the union of keys in first-seen order; keys missing from a
+    row become null. Anything other than a list of objects is returned as is.
+
+    Args:
+        data: API result to convert
+
+    Returns:
+        Columnar table, or the unchanged data
+    """
+    if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+        return data
+    columns: dict = {}
+    for row in data:
+        for key in row:
+            columns.setdefault(key, None)
+    names = list(columns)
+    return {"columns": names, "rows": [[row.get(name) for name in names] for row in data]}
+
+
+def _use_orjson() -> bool:
+    """Check whether responses should be encoded with orjson.
+
+    Raises:
+        ValueError: If ZABBIX_MCP_JSON_BACKEND=orjson but orjson is not installed
+    """
+    backend = os.getenv("ZABBIX_MCP_JSON_BACKEND", "auto").lower()
+    if backend == "json":
+        return False
+    if backend == "orjson" and orjson is None:
+        raise ValueError("ZABBIX_MCP_JSON_BACKEND=orjson but orjson is not installed")
+    return orjson is not None
+
+
+def format_response(data: Any, fmt: Optional[str] = None) -> str:
     """Format response data as JSON string.
 
+    Uses orjson when installed (see ZABBIX_MCP_JSON_BACKEND) and falls back
+    to the standard library for data orjson cannot encode.
+
     Args:
         data: Data to format
+        fmt: "pretty" (indented), "compact" (no whitespace) or "columnar"
+            (compact, lists of objects as a column/row table); defaults to
+            ZABBIX_MCP_RESPONSE_FORMAT
 
     Returns:
         str: JSON formatted string
+
+    Raises:
+        ValueError: If the format is unknown
     """
+    fmt = fmt or get_response_format()
+    if fmt not in RESPONSE_FORMATS:
+        raise ValueError(f"Invalid response format: {fmt} (expected one of {', '.join(RESPONSE_FORMATS)})")
+    start = time.perf_counter()
+    with span("format_response") as current:
+        text = _encode(data, fmt)
+        if current is not None:
+            current.set_attributes({"response.format": fmt, "response.rows": row_count(data),
+                                    "response.size": len(text)})
+    SERIALIZATION_SECONDS.observe(time.perf_counter() - start, fmt)
+    return text
+
+
+def _encode(data: Any, fmt: str) -> str:
+    """Encode data as JSON in the given (validated) format."""
+    if fmt == "columnar":
+        data = to_columnar(data)
+    compact = fmt != "pretty"
+
+    if _use_orjson():
+        option = orjson.OPT_NON_STR_KEYS | (0 if compact else orjson.OPT_INDENT_2)
+        try:
+            return orjson.dumps(data, default=str, option=option).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits
+
+    if compact:
+        return json.dumps(data, separators=(",", ":"), default=str)
     return json.dumps(data, indent=2, default=str)
 
 
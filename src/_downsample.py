@@ -0,0 +1,187 @@
+"""
+Downsampling of numeric time series for long-range history views.
+
+Reduces a series of (clock, value) samples to at most ``max_points`` points
+with one of three methods:
+
+- ``lttb``: Largest-Triangle-Three-Buckets, keeps the points that preserve
+  the visual shape of the series
+- ``minmax``: the lowest and highest sample of each time bucket, keeps spikes
+- ``avg``: the mean clock and value of each time bucket
+
+NumPy is used when installed; otherwise a pure-Python implementation with
+the same results is used.
+"""
+
+from array import array
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on installed extras
+    np = None
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax", "avg")
+
+Point = Tuple[int, float]
+
+
+class Series:
+    """Samples of one item accumulated page by page in compact arrays."""
+
+    __slots__ = ("clocks", "values")
+
+    def __init__(self) -> None:
+        self.clocks = array("d")
+        self.values = array("d")
+
+    def append(self, clock: float, value: float) -> None:
+        self.clocks.append(clock)
+        self.values.append(value)
+
+    def __len__(self) -> int:
+        return len(self.clocks)
+
+
+def downsample(series: Series, max_points: int, method: str = "lttb") -> List[Point]:
+    """Reduce a series sorted by clock to at most ``max_points`` points.
+
+    Args:
+        series: Samples in ascending clock order
+        max_points: Maximum number of points to return
+        method: One of ``DOWNSAMPLE_METHODS``
+
+    Returns:
+        List of ``(clock, value)`` points in ascending clock order
+
+    Raises:
+        ValueError: If the method is unknown, max_points is not positive or
+            below 2 for ``minmax``, which keeps two points per bucket
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Invalid downsampling method: {method} "
+                         f"(expected one of {', '.join(DOWNSAMPLE_METHODS)})")
+    if max_points < 1:
+        raise ValueError("max_points must be at least 1")
+    if method == "minmax" and max_points < 2:
+        raise ValueError("max_points must be at least 2 for minmax")
+    if len(series) <= max_points:
+        return [(int(c), v) for c, v in zip(series.clocks, series.values)]
+
+    if np is not None:
+        clocks = np.frombuffer(series.clocks, dtype=np.float64)
+        values = np.frombuffer(series.values, dtype=np.float64)
+        reducer = {"lttb": _lttb_numpy, "minmax": _minmax_numpy, "avg": _avg_numpy}[method]
+    else:
+        clocks, values = series.clocks, series.values
+        reducer = {"lttb": _lttb, "minmax": _minmax, "avg": _avg}[method]
+    return reducer(clocks, values, max_points)
+
+
+def _time_buckets(clocks, buckets: int) -> Tuple[float, float]:
+    """Return (start, width) of ``buckets`` equal time buckets spanning the series."""
+    start = clocks[0]
+    width = (clocks[-1] - start) / buckets or 1.0
+    return start, width
+
+
+def _lttb(clocks, values, threshold: int) -> List[Point]:
+    n = len(clocks)
+    if threshold < 3:
+        picked = [0, n - 1][:threshold]
+    else:
+        every = (n - 2) / (threshold - 2)
+        picked = [0]
+        a = 0
+        for i in range(threshold - 2):
+            start = int(i * every) + 1
+            end = int((i + 1) * every) + 1
+            next_start = end
+            next_end = min(int((i + 2) * every) + 1, n)
+            count = next_end - next_start
+            avg_clock = sum(clocks[next_start:next_end]) / count
+            avg_value = sum(values[next_start:next_end]) / count
+            ax, ay = clocks[a], values[a]
+            best, best_area = start, -1.0
+            for j in range(start, end):
+                area = abs((ax - avg_clock) * (values[j] - ay) - (ax - clocks[j]) * (avg_value - ay))
+                if area > best_area:
+                    best, best_area = j, area
+            picked.append(best)
+            a = best
+        picked.append(n - 1)
+    return [(int(clocks[i]), values[i]) for i in picked]
+
+
+def _lttb_numpy(clocks, values, threshold: int) -> List[Point]:
+    n = len(clocks)
+    if threshold < 3:
+        picked = [0, n - 1][:threshold]
+    else:
+        every = (n - 2) / (threshold - 2)
+        picked = [0]
+        a = 0
+        for i in range(threshold - 2):
+            start = int(i * every) + 1
+            end = int((i + 1) * every) + 1
+            next_end = min(int((i + 2) * every) + 1, n)
+            avg_clock = clocks[end:next_end].mean()
+            avg_value = values[end:next_end].mean()
+            ax, ay = clocks[a], values[a]
+            areas = np.abs((ax - avg_clock) * (values[start:end] - ay)
+                           - (ax - clocks[start:end]) * (avg_value - ay))
+            a = start + int(areas.argmax())
+            picked.append(a)
+        picked.append(n - 1)
+    return [(int(clocks[i]), float(values[i])) for i in picked]
+
+
+def _minmax(clocks, values, max_points: int) -> List[Point]:
+    buckets = max(1, max_points // 2)
+    start, width = _time_buckets(clocks, buckets)
+    lows: dict = {}
+    highs: dict = {}
+    for i, (clock, value) in enumerate(zip(clocks, values)):
+        bucket = min(int((clock - start) / width), buckets - 1)
+        if bucket not in lows or value < values[lows[bucket]]:
+            lows[bucket] = i
+        if bucket not in highs or value > values[highs[bucket]]:
+            highs[bucket] = i
+    picked = sorted(set(lows.values()) | set(highs.values()))
+    return [(int(clocks[i]), values[i]) for i in picked]
+
+
+def _minmax_numpy(clocks, values, max_points: int) -> List[Point]:
+    buckets = max(1, max_points // 2)
+    start, width = _time_buckets(clocks, buckets)
+    ids = np.minimum(((clocks - start) / width).astype(np.int64), buckets - 1)
+    # Sort by bucket then value: the first and last index of each bucket are its min and max
+    order = np.lexsort((values, ids))
+    sorted_ids = ids[order]
+    firsts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    lasts = np.r_[firsts[1:] - 1, len(order) - 1]
+    picked = np.unique(np.concatenate((order[firsts], order[lasts])))
+    return [(int(clocks[i]), float(values[i])) for i in picked]
+
+
+def _avg(clocks, values, max_points: int) -> List[Point]:
+    start, width = _time_buckets(clocks, max_points)
+    sums: dict = {}
+    for clock, value in zip(clocks, values):
+        bucket = min(int((clock - start) / width), max_points - 1)
+        total = sums.setdefault(bucket, [0.0, 0.0, 0])
+        total[0] += clock
+        total[1] += value
+        total[2] += 1
+    return [(int(round(c / n)), v / n) for c, v, n in (sums[b] for b in sorted(sums))]
+
+
+def _avg_numpy(clocks, values, max_points: int) -> List[Point]:
+    start, width = _time_buckets(clocks, max_points)
+    ids = np.minimum(((clocks - start) / width).astype(np.int64), max_points - 1)
+    # Clocks are sorted, so bucket ids are non-decreasing and each bucket is contiguous
+    firsts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    counts = np.diff(np.r_[firsts, len(ids)])
+    mean_clocks = np.add.reduceat(clocks, firsts) / counts
+    mean_values = np.add.reduceat(values, firsts) / counts
+    return [(int(round(c)), float(v)) for c, v in zip(mean_clocks, mean_values)]
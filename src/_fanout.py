@@ -0,0 +1,179 @@
+"""
+Parallel fan-out of ``*.get`` calls with huge ID lists.
+
+A ``get`` whose ID-list parameter (``itemids``, ``hostids``, ...) holds more
+IDs than the configured chunk size is split into several requests, run
+concurrently under a bounded worker limit, and merged back into one result
+honouring ``sortfield``/``sortorder``, ``limit`` and ``preservekeys``.
+Counting calls (``countOutput``, ``groupCount``) are never split, as an
+object matching IDs in several chunks would be counted once per chunk.
+Splitting keeps each JSON-RPC request well under the frontend's
+``post_max_size`` and lets Zabbix work on the chunks in parallel.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Timings of the most recent chunked calls kept for introspection
+_RECENT_FANOUTS = 20
+
+fanout_stats: Dict[str, Any] = {"fanouts": 0, "chunks": 0, "recent": deque(maxlen=_RECENT_FANOUTS)}
+
+
+def get_fanout_settings() -> Dict[str, int]:
+    """Read fan-out settings from the environment.
+
+    Returns:
+        dict: ``chunk_size`` (IDs per request, 0 disables chunking) and
+        ``concurrency`` (chunks in flight at once)
+    """
+    return {
+        "chunk_size": int(os.getenv("ZABBIX_CHUNK_SIZE", "1000")),
+        "concurrency": max(1, int(os.getenv("ZABBIX_CHUNK_CONCURRENCY", "4"))),
+    }
+
+
+def get_fanout_stats() -> Dict[str, Any]:
+    """Return fan-out settings, counters and per-chunk timings of recent calls."""
+    return {
+        "settings": get_fanout_settings(),
+        "fanouts": fanout_stats["fanouts"],
+        "chunks": fanout_stats["chunks"],
+        "recent": list(fanout_stats["recent"]),
+    }
+
+
+def split_ids(params: Dict[str, Any], chunk_size: int) -> Optional[Tuple[str, List[List[Any]]]]:
+    """Pick the ID-list parameter to split and cut it into chunks.
+
+    The longest ``*ids`` list is split; other parameters are sent unchanged
+    with every chunk.
+
+    Returns:
+        (param name, chunks), or None when no list exceeds ``chunk_size``
+        or the call cannot be merged (``countOutput``, ``groupCount``)
+    """
+    if chunk_size <= 0 or params.get("countOutput") or params.get("groupCount"):
+        return None
+    name, ids = None, []
+    for key, value in params.items():
+        if key.endswith("ids") and isinstance(value, list) and len(value) > len(ids):
+            name, ids = key, value
+    if name is None or len(ids) <= chunk_size:
+        return None
+    return name, [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+
+
+def _sort_value(value: Any) -> Tuple[int, Any]:
+    """Sort key treating numeric strings (IDs, clocks, values) as numbers."""
+    try:
+        return (0, float(value))
+    except (TypeError, ValueError):
+        return (1, str(value))
+
+
+def _sort_rows(rows: List[Any], params: Dict[str, Any],
+               row_of: Callable[[Any], Dict[str, Any]] = lambda row: row) -> List[Any]:
+    """Sort merged rows as Zabbix would for ``sortfield``/``sortorder``."""
+    fields = params.get("sortfield")
+    if not fields:
+        return rows
+    if isinstance(fields, str):
+        fields = [fields]
+    orders = params.get("sortorder") or "ASC"
+    if isinstance(orders, str):
+        orders = [orders] * len(fields)
+    # Stable sorts from the least to the most significant field
+    for index in reversed(range(len(fields))):
+        order = orders[index] if index < len(orders) else "ASC"
+        rows.sort(key=lambda row: _sort_value(row_of(row).get(fields[index])),
+                  reverse=str(order).upper() == "DESC")
+    return rows
+
+
+def merge_results(results: List[Any], params: Dict[str, Any], id_field: Optional[str]) -> Any:
+    """Merge per-chunk results into the result of a single call.
+
+    Args:
+        results: Chunk results in chunk order.
+        params: Original call parameters.
+        id_field: Primary key used to drop rows returned by several chunks.
+
+    Returns:
+        Merged result
+    """
+    limit = int(params["limit"]) if params.get("limit") else None
+
+    if params.get("preservekeys"):
+        merged_map: Dict[str, Any] = {}
+        for result in results:
+            merged_map.update(result)
+        items = _sort_rows(list(merged_map.items()), params, row_of=lambda item: item[1])
+        return dict(items[:limit])
+
+    merged: List[Any] = []
+    seen = set()
+    for result in results:
+        for row in result:
+            if id_field and isinstance(row, dict) and id_field in row:
+                if row[id_field] in seen:
+                    continue
+                seen.add(row[id_field])
+            merged.append(row)
+    return _sort_rows(merged, params)[:limit]
+
+
+async def fan_out(call: Callable[[Dict[str, Any]], Awaitable[Any]], api_object: str,
+                  params: Dict[str, Any], id_field: Optional[str] = None) -> Any:
+    """Run ``call(params)``, splitting a huge ID list into concurrent chunks.
+
+    Args:
+        call: Coroutine function performing one ``get`` request.
+        api_object: Zabbix API object name, for logging and stats.
+        params: Parameters of the ``get`` call.
+        id_field: Primary key of the object, used to de-duplicate rows.
+
+    Returns:
+        The API result, merged across chunks when the call was split
+    """
+    settings = get_fanout_settings()
+    split = split_ids(params, settings["chunk_size"])
+    if split is None:
+        return await call(params)
+
+    name, chunks = split
+    semaphore = asyncio.Semaphore(settings["concurrency"])
+    timings: List[Dict[str, Any]] = [{} for _ in chunks]
+
+    async def run_chunk(index: int, ids: List[Any]) -> Any:
+        async with semaphore:
+            start = time.perf_counter()
+            result = await call(dict(params, **{name: ids}))
+            seconds = time.perf_counter() - start
+        timings[index] = {"ids": len(ids), "seconds": round(seconds, 6)}
+        logger.debug(f"{api_object}.get chunk {index + 1}/{len(chunks)}: "
+                     f"{len(ids)} {name} in {seconds:.3f}s")
+        return result
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run_chunk(i, ids) for i, ids in enumerate(chunks)))
+    elapsed = time.perf_counter() - start
+
+    fanout_stats["fanouts"] += 1
+    fanout_stats["chunks"] += len(chunks)
+    fanout_stats["recent"].append({
+        "object": api_object,
+        "param": name,
+        "ids": sum(len(ids) for ids in chunks),
+        "seconds": round(elapsed, 6),
+        "chunks": timings,
+    })
+    logger.info(f"{api_object}.get split {name} into {len(chunks)} chunks, "
+                f"finished in {elapsed:.3f}s")
+    return merge_results(list(results), params, id_field)
@@ -0,0 +1,311 @@
+"""
+Persistent on-disk cache of history and trend rows.
+
+Rows returned by ``history.get`` and ``trend.get`` are kept in a SQLite
+database together with the clock range each item is known to be complete
+for. A read over a window that is already covered is answered from disk;
+otherwise only the missing head or tail of the window is fetched from Zabbix
+and merged in. Data newer than ``ZABBIX_HISTORY_CACHE_LAG`` seconds (or the
+current hour, for trends) is never marked complete, since late values from
+proxies may still arrive.
+
+The store is disabled unless ``ZABBIX_HISTORY_CACHE_PATH`` is set.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+TimeRange = Tuple[int, int]
+
+# Parameters a read may use to be answered from the store
+_SUPPORTED_PARAMS = {"itemids", "history", "time_from", "time_till",
+                     "sortfield", "sortorder", "limit", "output"}
+
+_COLUMNS = {
+    "history": ("itemid", "clock", "value", "ns"),
+    "trend": ("itemid", "clock", "num", "value_min", "value_avg", "value_max"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    itemid TEXT NOT NULL, value_type INTEGER NOT NULL, clock INTEGER NOT NULL,
+    ns INTEGER NOT NULL, value TEXT NOT NULL,
+    PRIMARY KEY (itemid, value_type, clock, ns)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trend (
+    itemid TEXT NOT NULL, value_type INTEGER NOT NULL, clock INTEGER NOT NULL,
+    num TEXT NOT NULL, value_min TEXT NOT NULL, value_avg TEXT NOT NULL, value_max TEXT NOT NULL,
+    PRIMARY KEY (itemid, value_type, clock)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    source TEXT NOT NULL, itemid TEXT NOT NULL, value_type INTEGER NOT NULL,
+    time_from INTEGER NOT NULL, time_till INTEGER NOT NULL,
+    PRIMARY KEY (source, itemid, value_type)
+) WITHOUT ROWID;
+"""
+
+# Item IDs of the statement being run; bound parameters are capped at 32766
+# per statement, so ID lists are passed through this table instead
+_TEMP_SCHEMA = "CREATE TEMP TABLE IF NOT EXISTS selected (itemid TEXT PRIMARY KEY) WITHOUT ROWID"
+
+# Seconds between purges of rows older than the retention
+_PURGE_INTERVAL = 300
+
+
+class SyncPlan:
+    """Gaps to fetch from Zabbix for one read and the coverage to record afterwards."""
+
+    __slots__ = ("fetch", "coverage", "reset", "generation")
+
+    def __init__(self, generation: int = 0) -> None:
+        self.fetch: Dict[TimeRange, List[str]] = {}
+        self.coverage: Dict[str, Optional[TimeRange]] = {}
+        self.reset: List[str] = []
+        # Store generation the plan was made in; rows of an outdated plan are not saved
+        self.generation = generation
+
+
+class HistoryStore:
+    """SQLite-backed cache of history/trend rows with per-item coverage ranges.
+
+    Methods are blocking and thread-safe; call them through
+    ``asyncio.to_thread`` from the event loop.
+
+    Args:
+        path: Database file path.
+        retention: Seconds of data to keep; older rows are purged.
+        lag: Seconds before now that history is not yet considered complete.
+    """
+
+    def __init__(self, path: str, retention: int = 7 * 86400, lag: int = 60):
+        self.path = path
+        self.retention = retention
+        self.lag = lag
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._db.execute(_TEMP_SCHEMA)
+        self._last_purge = 0.0
+        # Bumped whenever stored history is dropped because it changed in Zabbix
+        self.generation = 0
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.rows_fetched = 0
+
+    @staticmethod
+    def supports(api_object: str, params: Dict[str, Any]) -> bool:
+        """Return whether a ``get`` can be answered from the store.
+
+        Only bounded per-item windows sorted by clock qualify.
+        """
+        if api_object not in _COLUMNS or not set(params) <= _SUPPORTED_PARAMS:
+            return False
+        if not isinstance(params.get("itemids"), list) or not params["itemids"]:
+            return False
+        if params.get("time_from") is None:
+            return False
+        return params.get("sortfield") in (None, "clock", ["clock"])
+
+    def _select(self, itemids: List[Any]) -> None:
+        """Fill the ``selected`` table; call with the lock held inside a transaction."""
+        self._db.execute("DELETE FROM selected")
+        self._db.executemany("INSERT OR IGNORE INTO selected VALUES (?)",
+                             ((str(itemid),) for itemid in itemids))
+
+    @staticmethod
+    def value_type(api_object: str, params: Dict[str, Any]) -> int:
+        """Return the value type rows of a read are stored under (Zabbix defaults to 3)."""
+        return int(params.get("history", 3)) if api_object == "history" else 0
+
+    def _settled(self, api_object: str, now: int) -> int:
+        """Return the newest clock that is considered complete."""
+        if api_object == "trend":
+            return now - now % 3600 - 1
+        return now - self.lag
+
+    def plan(self, api_object: str, value_type: int, itemids: List[str],
+             time_from: int, time_till: int, now: int) -> SyncPlan:
+        """Work out which parts of a window are missing for each item."""
+        plan = SyncPlan(self.generation)
+        settled = self._settled(api_object, now)
+        with self._lock, self._db:
+            self._select(itemids)
+            covered = {itemid: (start, end) for itemid, start, end in self._db.execute(
+                "SELECT itemid, time_from, time_till FROM coverage "
+                "WHERE source = ? AND value_type = ? AND itemid IN (SELECT itemid FROM selected)",
+                (api_object, value_type))}
+
+        for itemid in itemids:
+            have = covered.get(itemid)
+            if have is None or time_from > have[1] + 1 or time_till < have[0] - 1:
+                # Disjoint from what is stored: start over rather than keep a hole
+                if have is not None:
+                    plan.reset.append(itemid)
+                    have = None
+                gaps = [(time_from, time_till)]
+                start, end = time_from, min(time_till, settled)
+            else:
+                gaps = []
+                if time_from < have[0]:
+                    gaps.append((time_from, have[0] - 1))
+                if time_till > have[1]:
+                    gaps.append((have[1] + 1, time_till))
+                start, end = min(time_from, have[0]), max(have[1], min(time_till, settled))
+            for gap in gaps:
+                plan.fetch.setdefault(gap, []).append(itemid)
+            plan.coverage[itemid] = (start, end) if end >= start else have
+
+        if not plan.fetch:
+            self.hits += 1
+        elif len(plan.reset) + sum(1 for i in itemids if i not in covered) == len(itemids):
+            self.misses += 1
+        else:
+            self.partial_hits += 1
+        return plan
+
+    def save(self, api_object: str, value_type: int, rows: List[Dict[str, Any]],
+             plan: SyncPlan, now: int) -> None:
+        """Store fetched rows and record the coverage from ``plan``."""
+        self.reset(api_object, value_type, plan)
+        self.save_rows(api_object, value_type, rows, plan)
+        self.cover(api_object, value_type, plan, now)
+
+    def reset(self, api_object: str, value_type: int, plan: SyncPlan) -> None:
+        """Drop the rows and coverage of the items ``plan`` starts over; call before saving rows."""
+        with self._lock, self._db:
+            if plan.generation != self.generation:
+                return
+            for itemid in plan.reset:
+                self._db.execute(f"DELETE FROM {api_object} WHERE itemid = ? AND value_type = ?",
+                                 (itemid, value_type))
+                self._db.execute("DELETE FROM coverage WHERE source = ? AND itemid = ? AND value_type = ?",
+                                 (api_object, itemid, value_type))
+
+    def save_rows(self, api_object: str, value_type: int, rows: List[Dict[str, Any]],
+                  plan: SyncPlan) -> None:
+        """Store one batch of rows fetched for ``plan``; rows already stored are replaced."""
+        columns = _COLUMNS[api_object]
+        with self._lock, self._db:
+            if plan.generation != self.generation:
+                return
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO {api_object} (value_type, {', '.join(columns)}) "
+                f"VALUES (?, {', '.join('?' * len(columns))})",
+                ((value_type, *(row.get(c, 0) for c in columns)) for row in rows))
+            self.rows_fetched += len(rows)
+
+    def cover(self, api_object: str, value_type: int, plan: SyncPlan, now: int) -> None:
+        """Record the coverage from ``plan`` once all of its gaps are stored."""
+        with self._lock, self._db:
+            if plan.generation != self.generation:
+                return
+            for itemid, covered in plan.coverage.items():
+                if covered is None:
+                    continue
+                self._db.execute(
+                    "INSERT OR REPLACE INTO coverage VALUES (?, ?, ?, ?, ?)",
+                    (api_object, itemid, value_type, covered[0], covered[1]))
+            if time.monotonic() - self._last_purge > _PURGE_INTERVAL:
+                self._purge(now)
+
+    def query(self, api_object: str, value_type: int, params: Dict[str, Any],
+              time_till: int) -> List[Dict[str, Any]]:
+        """Read stored rows for a window in the shape Zabbix returns them."""
+        columns = _COLUMNS[api_object]
+        itemids = params["itemids"]
+        order = "DESC" if str(params.get("sortorder", "")).upper() == "DESC" else "ASC"
+        order_by = f"clock {order}, ns {order}" if api_object == "history" else f"clock {order}"
+        sql = (f"SELECT {', '.join(columns)} FROM {api_object} "
+               f"WHERE value_type = ? AND itemid IN (SELECT itemid FROM selected) "
+               f"AND clock BETWEEN ? AND ? ORDER BY {order_by}")
+        args: List[Any] = [value_type, int(params["time_from"]), time_till]
+        if params.get("limit"):
+            sql += " LIMIT ?"
+            args.append(int(params["limit"]))
+        output = params.get("output")
+        wanted = columns if not isinstance(output, list) else [c for c in columns if c in output]
+        with self._lock, self._db:
+            self._select(itemids)
+            rows = self._db.execute(sql, args).fetchall()
+        return [{c: str(v) for c, v in zip(columns, row) if c in wanted} for row in rows]
+
+    def _purge(self, now: int) -> None:
+        oldest = now - self.retention
+        for table in _COLUMNS:
+            self._db.execute(f"DELETE FROM {table} WHERE clock < ?", (oldest,))
+        self._db.execute("UPDATE coverage SET time_from = ? WHERE time_from < ?", (oldest, oldest))
+        self._db.execute("DELETE FROM coverage WHERE time_till < time_from")
+        self._last_purge = time.monotonic()
+
+    def clear(self) -> None:
+        """Drop all stored rows and coverage."""
+        with self._lock, self._db:
+            self.generation += 1
+            for table in (*_COLUMNS, "coverage"):
+                self._db.execute(f"DELETE FROM {table}")
+
+    def forget(self, itemids: Optional[List[str]] = None) -> None:
+        """Drop the history and trends of items whose data changed in Zabbix.
+
+        Syncs already in flight do not save what they fetched before.
+
+        Args:
+            itemids: Items to drop; every item when None
+        """
+        if itemids is None:
+            self.clear()
+            return
+        with self._lock, self._db:
+            self.generation += 1
+            self._select(itemids)
+            for table in (*_COLUMNS, "coverage"):
+                self._db.execute(f"DELETE FROM {table} "
+                                 f"WHERE itemid IN (SELECT itemid FROM selected)")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return row counts, file size and hit counters."""
+        with self._lock:
+            counts = {table: self._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                      for table in (*_COLUMNS, "coverage")}
+        return {
+            "path": self.path,
+            "bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+            "history_rows": counts["history"],
+            "trend_rows": counts["trend"],
+            "covered_items": counts["coverage"],
+            "hits": self.hits,
+            "partial_hits": self.partial_hits,
+            "misses": self.misses,
+            "rows_fetched": self.rows_fetched,
+            "retention": self.retention,
+            "lag": self.lag,
+        }
+
+
+_history_store: Optional[HistoryStore] = None
+
+
+def get_history_store() -> Optional[HistoryStore]:
+    """Get or open the history store from environment settings.
+
+    Returns:
+        HistoryStore, or None when ZABBIX_HISTORY_CACHE_PATH is not set
+    """
+    global _history_store
+
+    path = os.getenv("ZABBIX_HISTORY_CACHE_PATH")
+    if not path:
+        return None
+
+    if _history_store is None or _history_store.path != path:
+        _history_store = HistoryStore(
+            path,
+            retention=int(os.getenv("ZABBIX_HISTORY_CACHE_RETENTION", str(7 * 86400))),
+            lag=int(os.getenv("ZABBIX_HISTORY_CACHE_LAG", "60")),
+        )
+    return _history_store
@@ -0,0 +1,400 @@
+"""
+Memory-mapped ring buffers for hot item time series.
+
+A configured set of "golden signal" items (explicit item IDs and/or an
+``item.get`` filter) is polled from ``history.get`` in the background, and
+each item's latest samples are kept in a fixed-size ring of ``(clock,
+value)`` pairs in a memory-mapped file, so the buffers survive restarts.
+History reads that only touch tracked items and a window the buffers cover
+are answered from memory without calling Zabbix; the data is as fresh as
+the last poll. Each poll re-reads the last ``lag`` seconds before the
+previous one, so values that reach Zabbix late are still added.
+
+Tracking is disabled unless ``ZABBIX_HOT_ITEMIDS`` or ``ZABBIX_HOT_ITEMS_FILTER``
+is set.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Numeric value types a ring can hold: float as float64, unsigned as uint64
+HOT_VALUE_TYPES = (0, 3)
+
+_MAGIC = b"ZBXRING2"
+# magic, value type, capacity, samples written, samples held, covered from, synced at
+_HEADER = struct.Struct("<8sIIQQdd")
+_HEADER_SIZE = 64
+
+# Parameters a read may use to be answered from the buffers
+_SUPPORTED_PARAMS = {"itemids", "history", "time_from", "time_till",
+                     "sortfield", "sortorder", "limit", "output"}
+
+Fetch = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+
+
+class RingBuffer:
+    """Fixed-size ring of (clock, value) pairs backed by a memory-mapped file.
+
+    Clocks are float64 and carry the nanosecond part as a fraction. Values
+    are float64 for float items and uint64 for unsigned items, which a
+    float64 cannot hold exactly above 2**53. The header records how many
+    samples were ever written and how many are held, the clock from which
+    the buffer holds every sample (``covered_from``) and when it was last
+    polled.
+
+    Args:
+        path: File to map; created or resized as needed.
+        capacity: Number of samples kept.
+        value_type: Zabbix value type of the item (0=float, 3=unsigned).
+    """
+
+    __slots__ = ("path", "capacity", "value_type", "written", "_count", "_covered_from",
+                 "synced_at", "_file", "_map", "_data", "_values")
+
+    def __init__(self, path: str, capacity: int, value_type: int):
+        self.path = path
+        self.capacity = capacity
+        self.value_type = value_type
+        size = _HEADER_SIZE + capacity * 16
+        self._file = open(path, "a+b")
+        self._file.seek(0)
+        header = self._file.read(_HEADER.size)
+        fresh = True
+        if len(header) == _HEADER.size:
+            magic, stored_type, stored_capacity, written, count, covered_from, synced_at = \
+                _HEADER.unpack(header)
+            fresh = (magic != _MAGIC or stored_type != value_type or stored_capacity != capacity)
+        if fresh:
+            self._file.truncate(0)
+            written, count, covered_from, synced_at = 0, 0, 0.0, 0.0
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        # Clocks are read through the float64 view, values through the view of their type
+        self._data = memoryview(self._map)[_HEADER_SIZE:].cast("d")
+        self._values = (self._data if value_type == 0
+                        else memoryview(self._map)[_HEADER_SIZE:].cast("Q"))
+        self.written = written
+        self._count = count
+        self._covered_from = covered_from
+        self.synced_at = synced_at
+        self._write_header()
+
+    def _write_header(self) -> None:
+        _HEADER.pack_into(self._map, 0, _MAGIC, self.value_type, self.capacity,
+                          self.written, self._count, self._covered_from, self.synced_at)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _clock(self, k: int) -> float:
+        """Clock of the k-th oldest sample."""
+        return self._data[2 * ((self.written - len(self) + k) % self.capacity)]
+
+    @property
+    def last_clock(self) -> float:
+        return self._clock(len(self) - 1) if self.written else 0.0
+
+    @property
+    def covered_from(self) -> float:
+        """Clock from which the buffer holds every sample (0 before the first poll)."""
+        if self.written > self._count:
+            # Older samples were overwritten
+            return max(self._covered_from, self._clock(0))
+        return self._covered_from
+
+    def restart_coverage(self, covered_from: float) -> None:
+        """Record that samples are complete only from ``covered_from`` (first poll or after a gap)."""
+        self._covered_from = covered_from
+
+    def mark_synced(self, synced_at: float) -> None:
+        self.synced_at = synced_at
+        self.flush()
+
+    def reset(self) -> None:
+        """Drop every sample; the next poll backfills the buffer as if it were new."""
+        self.written = 0
+        self._count = 0
+        self._covered_from = 0.0
+        self.synced_at = 0.0
+        self.flush()
+
+    def append(self, clock: float, value: Union[float, int]) -> None:
+        """Add a sample newer than every stored one (an int for unsigned items)."""
+        slot = 2 * (self.written % self.capacity)
+        self._data[slot] = clock
+        self._values[slot + 1] = value
+        self.written += 1
+        self._count = min(self._count + 1, self.capacity)
+
+    def truncate(self, clock: float) -> None:
+        """Drop the samples with a clock >= ``clock`` so they can be appended again."""
+        dropped = len(self) - self._bisect(clock)
+        self.written -= dropped
+        self._count -= dropped
+
+    def _bisect(self, clock: float) -> int:
+        """Index of the first (oldest-first) sample with a clock >= ``clock``."""
+        low, high = 0, len(self)
+        while low < high:
+            mid = (low + high) // 2
+            if self._clock(mid) < clock:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def range(self, time_from: float = -math.inf,
+              time_till: float = math.inf) -> List[Tuple[float, Union[float, int]]]:
+        """Return samples with ``time_from <= clock < time_till + 1``, oldest first."""
+        start, end = self._bisect(time_from), self._bisect(time_till + 1)
+        base = self.written - len(self)
+        pairs = []
+        for k in range(start, end):
+            slot = 2 * ((base + k) % self.capacity)
+            pairs.append((self._data[slot], self._values[slot + 1]))
+        return pairs
+
+    def flush(self) -> None:
+        self._write_header()
+        self._map.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._values is not self._data:
+            self._values.release()
+        self._data.release()
+        self._map.close()
+        self._file.close()
+
+
+class HotItems:
+    """Background-polled ring buffers for a configured set of items.
+
+    Args:
+        directory: Directory holding one ring file per item.
+        capacity: Samples kept per item.
+        interval: Seconds between polls.
+        backfill: Seconds of history loaded for an item seen for the first time.
+        refresh: Seconds between re-resolving the tracked item set.
+        lag: Seconds before a poll that are read again by the next poll, for
+            values that reach Zabbix late.
+        itemids: Item IDs to track.
+        item_filter: ``item.get`` parameters selecting more items to track.
+    """
+
+    def __init__(self, directory: str, capacity: int = 4096, interval: float = 30,
+                 backfill: int = 3600, refresh: float = 600, lag: int = 60,
+                 itemids: Optional[List[str]] = None,
+                 item_filter: Optional[Dict[str, Any]] = None):
+        self.directory = directory
+        self.capacity = capacity
+        self.interval = interval
+        self.backfill = backfill
+        self.refresh = refresh
+        self.lag = lag
+        self.itemids = list(itemids or [])
+        self.item_filter = item_filter
+        self.buffers: Dict[str, RingBuffer] = {}
+        self._resolved_at: Optional[float] = None
+        self.polls = 0
+        self.poll_errors = 0
+        self.last_poll_seconds = 0.0
+        self.samples_added = 0
+        self.hits = 0
+        # Bumped by forget(); a poll started before it does not append what it fetched
+        self.generation = 0
+        os.makedirs(directory, exist_ok=True)
+
+    async def resolve(self, fetch: Fetch) -> None:
+        """Look up the tracked items and open (or drop) their buffers."""
+        found: Dict[str, int] = {}
+        if self.itemids:
+            for item in await fetch("item", {"itemids": self.itemids, "output": ["itemid", "value_type"]}):
+                found[item["itemid"]] = int(item["value_type"])
+        if self.item_filter:
+            for item in await fetch("item", dict(self.item_filter, output=["itemid", "value_type"])):
+                found[item["itemid"]] = int(item["value_type"])
+        tracked = {itemid: vt for itemid, vt in found.items() if vt in HOT_VALUE_TYPES}
+
+        for itemid in set(self.buffers) - set(tracked):
+            self.buffers.pop(itemid).close()
+        for itemid, value_type in tracked.items():
+            if itemid not in self.buffers:
+                path = os.path.join(self.directory, f"{itemid}.ring")
+                self.buffers[itemid] = RingBuffer(path, self.capacity, value_type)
+        self._resolved_at = time.monotonic()
+
+    def _resume_from(self, ring: RingBuffer, oldest: float) -> float:
+        """Clock from which a buffer's samples may still be incomplete."""
+        if not ring.last_clock:
+            return oldest
+        return min(ring.last_clock, ring.synced_at - self.lag)
+
+    async def poll(self, fetch: Fetch) -> None:
+        """Fetch each buffer's samples from the last ``lag`` seconds before its last poll on.
+
+        Buffered samples of that window are replaced by the fetched ones, so
+        values Zabbix received late are added in clock order.
+        """
+        start = time.perf_counter()
+        now = time.time()
+        generation = self.generation
+        groups: Dict[int, List[str]] = {}
+        for itemid, ring in self.buffers.items():
+            groups.setdefault(ring.value_type, []).append(itemid)
+
+        for value_type, itemids in groups.items():
+            oldest = now - self.backfill
+            since = int(max(oldest, min(self._resume_from(self.buffers[i], oldest) for i in itemids)))
+            for itemid in itemids:
+                ring = self.buffers[itemid]
+                if not ring.covered_from or ring.last_clock < since:
+                    # New buffer, or the server was down longer than the backfill
+                    ring.restart_coverage(since)
+            rows = await fetch("history", {
+                "itemids": itemids, "history": value_type, "time_from": since,
+                "sortfield": "clock", "sortorder": "ASC",
+                "output": ["itemid", "clock", "ns", "value"]})
+            if self.generation != generation:
+                break
+            for itemid in itemids:
+                self.buffers[itemid].truncate(since)
+            for row in rows:
+                ring = self.buffers.get(row["itemid"])
+                clock = int(row["clock"]) + int(row.get("ns", 0)) / 1e9
+                if ring is not None and clock > ring.last_clock:
+                    ring.append(clock, int(row["value"]) if value_type == 3 else float(row["value"]))
+                    self.samples_added += 1
+            for itemid in itemids:
+                self.buffers[itemid].mark_synced(now)
+
+        self.polls += 1
+        self.last_poll_seconds = time.perf_counter() - start
+
+    async def run(self, fetch: Fetch) -> None:
+        """Resolve and poll forever; errors are logged and retried next interval."""
+        while True:
+            try:
+                if self._resolved_at is None or time.monotonic() - self._resolved_at > self.refresh:
+                    await self.resolve(fetch)
+                await self.poll(fetch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.poll_errors += 1
+                logger.warning(f"Hot item poll failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def forget(self, itemids: Optional[List[str]] = None) -> None:
+        """Reset the buffers of items whose history changed in Zabbix (every buffer when None)."""
+        self.generation += 1
+        for itemid in (self.buffers if itemids is None else [str(i) for i in itemids]):
+            ring = self.buffers.get(itemid)
+            if ring is not None:
+                ring.reset()
+
+    def answer(self, params: Dict[str, Any]) -> Optional[List[Dict[str, str]]]:
+        """Answer a ``history.get`` from the buffers, or return None if they cannot.
+
+        Reads qualify when every item is tracked with the requested value type
+        and either the window starts within the buffered range, or no window
+        is given, the read asks for the newest samples (``sortorder`` DESC)
+        and each buffer holds at least ``limit`` samples. Without a window an
+        ascending read wants the oldest samples in all of history, which the
+        buffers do not hold.
+        """
+        if not set(params) <= _SUPPORTED_PARAMS or params.get("sortfield") not in (None, "clock", ["clock"]):
+            return None
+        itemids = params.get("itemids")
+        if not isinstance(itemids, list) or not itemids:
+            return None
+        value_type = int(params.get("history", 3))
+        rings = [self.buffers.get(itemid) for itemid in itemids]
+        if any(r is None or r.value_type != value_type or not r.synced_at for r in rings):
+            return None
+
+        limit = int(params["limit"]) if params.get("limit") else None
+        descending = str(params.get("sortorder", "")).upper() == "DESC"
+        time_from = params.get("time_from")
+        if time_from is None:
+            if not descending or limit is None or any(len(r) < limit for r in rings):
+                return None
+            time_from = -math.inf
+        elif any(int(time_from) < r.covered_from for r in rings):
+            return None
+        time_till = params.get("time_till")
+        time_till = math.inf if time_till is None else int(time_till)
+
+        samples = [(clock, value, itemid) for itemid, ring in zip(itemids, rings)
+                   for clock, value in ring.range(float(time_from), time_till)]
+        samples.sort(reverse=descending)
+        if limit is not None:
+            samples = samples[:limit]
+
+        output = params.get("output")
+        rows = []
+        for clock, value, itemid in samples:
+            seconds = int(clock)
+            row = {"itemid": itemid, "clock": str(seconds),
+                   "value": repr(value),
+                   "ns": str(int(round((clock - seconds) * 1e9)))}
+            if isinstance(output, list):
+                row = {k: v for k, v in row.items() if k in output}
+            rows.append(row)
+        self.hits += 1
+        return rows
+
+    def stats(self) -> Dict[str, Any]:
+        """Return tracked item count, poll counters and buffer fill."""
+        return {
+            "directory": self.directory,
+            "items": len(self.buffers),
+            "capacity": self.capacity,
+            "interval": self.interval,
+            "samples": sum(len(r) for r in self.buffers.values()),
+            "samples_added": self.samples_added,
+            "polls": self.polls,
+            "poll_errors": self.poll_errors,
+            "last_poll_seconds": round(self.last_poll_seconds, 6),
+            "hits": self.hits,
+        }
+
+
+_hot_items: Optional[HotItems] = None
+
+
+def get_hot_items() -> Optional[HotItems]:
+    """Get or create the hot item tracker from environment settings.
+
+    Returns:
+        HotItems, or None when neither ZABBIX_HOT_ITEMIDS nor ZABBIX_HOT_ITEMS_FILTER is set
+    """
+    global _hot_items
+
+    itemids = [i.strip() for i in os.getenv("ZABBIX_HOT_ITEMIDS", "").split(",") if i.strip()]
+    item_filter = os.getenv("ZABBIX_HOT_ITEMS_FILTER")
+    if not itemids and not item_filter:
+        return None
+
+    if _hot_items is None:
+        _hot_items = HotItems(
+            directory=os.path.expanduser(os.getenv(
+                "ZABBIX_HOT_ITEMS_DIR", "~/.cache/zabbix-mcp-server/hot-items")),
+            capacity=int(os.getenv("ZABBIX_HOT_ITEMS_CAPACITY", "4096")),
+            interval=float(os.getenv("ZABBIX_HOT_ITEMS_INTERVAL", "30")),
+            backfill=int(os.getenv("ZABBIX_HOT_ITEMS_BACKFILL", "3600")),
+            refresh=float(os.getenv("ZABBIX_HOT_ITEMS_REFRESH", "600")),
+            lag=int(os.getenv("ZABBIX_HOT_ITEMS_LAG", "60")),
+            itemids=itemids,
+            item_filter=json.loads(item_filter) if item_filter else None,
+        )
+    return _hot_items
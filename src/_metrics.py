@@ -0,0 +1,235 @@
+"""
+Prometheus metrics for Zabbix MCP Server.
+
+Counters and histograms are kept in process and rendered in the Prometheus
+text exposition format by ``render()``, which the HTTP transports serve on
+``/metrics``. Tool calls are timed by ``MetricsMiddleware``, upstream API
+calls by the registry's ``_call_api`` and JSON encoding by
+``format_response``; cache, request sharing and connection pool counters
+are read from their own statistics at scrape time.
+"""
+
+import bisect
+import time
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default histogram buckets: seconds for latencies, bytes for sizes
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+Sample = Tuple[str, Dict[str, str], float]
+
+_metrics: List["_Metric"] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    """A named metric family with fixed label names."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        _metrics.append(self)
+
+    def samples(self) -> Iterator[Sample]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self.samples():
+            label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+            lines.append(f"{self.name}{suffix}{{{label_text}}} {_format_value(value)}"
+                         if label_text else f"{self.name}{suffix} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonic counter per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        for values, total in sorted(self._values.items()):
+            yield "", dict(zip(self.labels, values)), total
+
+
+class Histogram(_Metric):
+    """Bucketed observations per label combination."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = buckets
+        # label values -> [per-bucket counts (last is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return sum(series[0]) if series is not None else 0
+
+    def samples(self) -> Iterator[Sample]:
+        for values, (counts, total) in sorted(self._series.items()):
+            labels = dict(zip(self.labels, values))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                yield "_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield "_sum", labels, total
+            yield "_count", labels, cumulative
+
+
+class Collected(_Metric):
+    """Counter or gauge whose values are read from a callback at scrape time."""
+
+    def __init__(self, name: str, documentation: str, kind: str,
+                 collect: Callable[[], Dict[Tuple[str, ...], float]],
+                 labels: Tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self.kind = kind
+        self.collect = collect
+
+    def samples(self) -> Iterator[Sample]:
+        for values, value in sorted(self.collect().items()):
+            yield "", dict(zip(self.labels, values)), value
+
+
+TOOL_SECONDS = Histogram("zabbix_mcp_tool_duration_seconds",
+                         "Time to run an MCP tool call.", ("tool",))
+TOOL_ERRORS = Counter("zabbix_mcp_tool_errors_total",
+                      "MCP tool calls that raised an error.", ("tool",))
+TOOL_RESPONSE_BYTES = Histogram("zabbix_mcp_tool_response_bytes",
+                                "Size of MCP tool responses, counting each character as one byte.",
+                                ("tool",), SIZE_BUCKETS)
+UPSTREAM_SECONDS = Histogram("zabbix_mcp_upstream_duration_seconds",
+                             "Time of Zabbix API calls by object and method.", ("object", "method"))
+UPSTREAM_ERRORS = Counter("zabbix_mcp_upstream_errors_total",
+                          "Zabbix API calls that failed.", ("object", "method"))
+SERIALIZATION_SECONDS = Histogram("zabbix_mcp_serialization_duration_seconds",
+                                  "Time to encode a response as JSON.", ("format",))
+
+
+def _cache_stats() -> Dict[str, Any]:
+    from src._cache import get_response_cache
+    cache = get_response_cache()
+    return cache.stats() if cache is not None else {}
+
+
+def _from_cache(field: str) -> Callable[[], Dict[Tuple[str, ...], float]]:
+    def collect() -> Dict[Tuple[str, ...], float]:
+        stats = _cache_stats()
+        return {(): stats[field]} if field in stats else {}
+    return collect
+
+
+def _coalescing() -> Dict[Tuple[str, ...], float]:
+    from src.tools._registry import coalesce_stats
+    return {(kind,): count for kind, count in coalesce_stats.items()}
+
+
+def _from_pool(field: str) -> Callable[[], Dict[Tuple[str, ...], float]]:
+    def collect() -> Dict[Tuple[str, ...], float]:
+        from src._pool import pool_stats
+        return {(): getattr(pool_stats, field)}
+    return collect
+
+
+Collected("zabbix_mcp_cache_hits_total", "Reads served from the response cache.",
+          "counter", _from_cache("hits"))
+Collected("zabbix_mcp_cache_misses_total", "Cacheable reads not found in the response cache.",
+          "counter", _from_cache("misses"))
+Collected("zabbix_mcp_cache_hit_ratio", "Share of cacheable reads served from the response cache.",
+          "gauge", _from_cache("hit_ratio"))
+Collected("zabbix_mcp_cache_evictions_total", "Responses evicted to stay within the cache limits.",
+          "counter", _from_cache("evictions"))
+Collected("zabbix_mcp_cache_entries", "Responses held in the response cache.",
+          "gauge", _from_cache("entries"))
+Collected("zabbix_mcp_cache_size_bytes", "Size of the responses held in the response cache.",
+          "gauge", _from_cache("bytes"))
+Collected("zabbix_mcp_read_requests_total",
+          "Reads sent upstream or coalesced onto an identical in-flight read.",
+          "counter", _coalescing, ("result",))
+Collected("zabbix_mcp_pool_requests_total", "HTTP requests sent to the Zabbix API.",
+          "counter", _from_pool("requests"))
+Collected("zabbix_mcp_pool_requests_in_flight", "HTTP requests to the Zabbix API awaiting a response.",
+          "gauge", _from_pool("in_flight"))
+Collected("zabbix_mcp_pool_connections_reused_total", "Requests sent on a kept-alive connection.",
+          "counter", _from_pool("connections_reused"))
+Collected("zabbix_mcp_pool_connections_created_total", "Connections opened to the Zabbix API.",
+          "counter", _from_pool("connections_created"))
+
+
+def render() -> str:
+    """Render every metric in the Prometheus text exposition format."""
+    lines: List[str] = []
+    for metric in _metrics:
+        lines += metric.render()
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware(Middleware):
+    """Record the duration, errors and response size of every tool call.
+
+    Calls of names that are not registered tools are labelled
+    ``tool="unknown"``, so clients cannot add label values at will.
+    """
+
+    @staticmethod
+    async def _is_registered(server: Any, name: str) -> bool:
+        # A lookup in FastMCP's tool registry; ``get_tools`` would build the
+        # map of every tool on each call
+        tools = getattr(getattr(server, "_tool_manager", None), "_tools", None)
+        if isinstance(tools, dict):
+            return name in tools
+        return name in await server.get_tools()
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        tool = context.message.name
+        server = context.fastmcp_context.fastmcp if context.fastmcp_context is not None else None
+        if server is None or not await self._is_registered(server, tool):
+            tool = "unknown"
+        start = time.perf_counter()
+        try:
+            result = await call_next(context)
+        except Exception:
+            TOOL_ERRORS.inc(tool)
+            raise
+        finally:
+            TOOL_SECONDS.observe(time.perf_counter() - start, tool)
+        TOOL_RESPONSE_BYTES.observe(
+            sum(len(getattr(block, "text", "")) for block in result.content), tool)
+        return result
@@ -0,0 +1,130 @@
+"""
+HTTP connection pool for the Zabbix API client.
+
+Builds the keep-alive aiohttp session shared by all Zabbix API calls, sized
+from environment settings, and collects connection reuse counters through
+aiohttp request tracing so the pool can be sized against real traffic.
+"""
+
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class PoolStats:
+    """Counters collected from aiohttp connection tracing."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        self.requests = 0
+        self.in_flight = 0
+        self.errors = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.queued = 0
+        self.queue_wait_seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return counters plus derived ratios."""
+        connections = self.connections_created + self.connections_reused
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "errors": self.errors,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": round(self.connections_reused / connections, 4) if connections else 0.0,
+            "queued": self.queued,
+            "queue_wait_seconds": round(self.queue_wait_seconds, 6),
+        }
+
+
+pool_stats = PoolStats()
+
+
+def get_pool_settings() -> Dict[str, Any]:
+    """Read connection pool settings from the environment.
+
+    Returns:
+        dict: ``pool_size`` (total connections, 0 = unlimited),
+        ``max_per_host`` (0 = unlimited) and ``keepalive_timeout`` in seconds
+    """
+    return {
+        "pool_size": int(os.getenv("ZABBIX_POOL_SIZE", "100")),
+        "max_per_host": int(os.getenv("ZABBIX_POOL_MAX_PER_HOST", "0")),
+        "keepalive_timeout": float(os.getenv("ZABBIX_POOL_KEEPALIVE", "30")),
+    }
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Return pool settings together with the current counters."""
+    return {"settings": get_pool_settings(), **pool_stats.as_dict()}
+
+
+def _trace_config() -> "aiohttp.TraceConfig":
+    """Build a TraceConfig that feeds the module-level ``pool_stats``."""
+    import aiohttp
+
+    trace = aiohttp.TraceConfig()
+
+    async def on_request_start(session, ctx, params):
+        pool_stats.requests += 1
+        pool_stats.in_flight += 1
+
+    async def on_request_end(session, ctx, params):
+        pool_stats.in_flight -= 1
+
+    async def on_request_exception(session, ctx, params):
+        pool_stats.in_flight -= 1
+        pool_stats.errors += 1
+
+    async def on_connection_queued_start(session, ctx, params):
+        pool_stats.queued += 1
+        ctx.queued_at = time.perf_counter()
+
+    async def on_connection_queued_end(session, ctx, params):
+        pool_stats.queue_wait_seconds += time.perf_counter() - ctx.queued_at
+
+    async def on_connection_create_end(session, ctx, params):
+        pool_stats.connections_created += 1
+
+    async def on_connection_reuseconn(session, ctx, params):
+        pool_stats.connections_reused += 1
+
+    trace.on_request_start.append(on_request_start)
+    trace.on_request_end.append(on_request_end)
+    trace.on_request_exception.append(on_request_exception)
+    trace.on_connection_queued_start.append(on_connection_queued_start)
+    trace.on_connection_queued_end.append(on_connection_queued_end)
+    trace.on_connection_create_end.append(on_connection_create_end)
+    trace.on_connection_reuseconn.append(on_connection_reuseconn)
+    return trace
+
+
+def create_client_session(verify_ssl: bool) -> "aiohttp.ClientSession":
+    """Create the pooled keep-alive session used by the Zabbix API client.
+
+    Must be called from a running event loop.
+
+    Args:
+        verify_ssl: Whether to verify TLS certificates
+
+    Returns:
+        aiohttp.ClientSession: Session backed by a sized TCP connection pool
+    """
+    import aiohttp
+
+    settings = get_pool_settings()
+    connector = aiohttp.TCPConnector(
+        limit=settings["pool_size"],
+        limit_per_host=settings["max_per_host"],
+        keepalive_timeout=settings["keepalive_timeout"],
+        ssl=verify_ssl,
+    )
+    return aiohttp.ClientSession(connector=connector, trace_configs=[_trace_config()])
@@ -0,0 +1,276 @@
+"""
+Trigram search index over host, item and trigger names.
+
+Built from the topology index (host groups, hosts, templates, items and
+triggers) so name lookups that would otherwise be ``LIKE '%x%'`` queries on
+the Zabbix database are answered in-process. Each distinct lower-cased
+name is indexed once with the IDs of its trigrams, so the many items
+sharing a name ("CPU utilization") cost one entry.
+
+A query is split into tokens on whitespace and ``*`` wildcards. Names
+containing every token rank first (exact match, then prefix, then word
+start, then anywhere; shorter names first); when there are fewer than
+``limit`` of them, names sharing most of the query's trigrams are added as
+fuzzy matches, so small typos still find their target.
+"""
+
+import asyncio
+import os
+import re
+import time
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src._topology import TOPOLOGY_TARGETS, TopologyIndex
+
+# Fields indexed for each object type
+SEARCH_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "hostgroup": ("name",),
+    "host": ("host", "name"),
+    "template": ("host", "name"),
+    "item": ("key_", "name"),
+    "trigger": ("description",),
+}
+
+# Share of the query's trigrams a name needs for a fuzzy match
+_FUZZY_THRESHOLD = 0.6
+
+_SEPARATORS = re.compile(r"[\s*]+")
+
+Candidate = Tuple[str, str, str, str]
+
+
+def tokenize(query: str) -> List[str]:
+    """Split a query on whitespace and ``*`` wildcards into lower-case tokens."""
+    return [token for token in _SEPARATORS.split(query.lower()) if token]
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def score(tokens: List[str], text: str) -> float:
+    """Score a lower-cased name containing every token (0 if one is missing).
+
+    Exact matches score 1; otherwise prefix, word-start and inner matches
+    score lower, and names mostly made of the tokens score higher.
+    """
+    if not text:
+        return 0.0
+    position_score = 0.0
+    for token in tokens:
+        position = text.find(token)
+        if position < 0:
+            return 0.0
+        if position == 0:
+            position_score += 1.0
+        elif not text[position - 1].isalnum():
+            position_score += 0.8
+        else:
+            position_score += 0.6
+    coverage = min(1.0, sum(len(token) for token in tokens) / len(text))
+    return round(0.7 * position_score / len(tokens) + 0.3 * coverage, 4)
+
+
+def rank(query: str, candidates: Iterable[Candidate], limit: int) -> List[Dict[str, Any]]:
+    """Rank (type, id, field, name) candidates against a query.
+
+    Used for results fetched from the API so they are ordered like index results.
+    """
+    tokens = tokenize(query)
+    best: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for object_type, objectid, field, text in candidates:
+        value = score(tokens, text.lower()) if tokens else 0.0
+        key = (object_type, objectid)
+        if value > 0 and (key not in best or value > best[key]["score"]):
+            best[key] = {"type": object_type, "id": objectid, "field": field,
+                         "text": text, "score": value}
+    return sorted(best.values(), key=lambda r: (-r["score"], len(r["text"])))[:limit]
+
+
+class _Postings:
+    """One built index: distinct names, the objects carrying them and trigram postings."""
+
+    __slots__ = ("texts", "originals", "owners", "doc_types", "doc_ids", "doc_fields", "grams")
+
+    def __init__(self) -> None:
+        self.texts: List[str] = []
+        self.originals: List[str] = []
+        self.owners: List[array] = []
+        self.doc_types = array("B")
+        self.doc_ids: List[str] = []
+        self.doc_fields = array("B")
+        self.grams: Dict[str, array] = {}
+
+
+_FIELDS = sorted({field for fields in SEARCH_FIELDS.values() for field in fields})
+
+
+class SearchIndex:
+    """Trigram index over the names in a topology index.
+
+    Args:
+        max_age: Seconds after which the topology is too old to search and
+            queries go to the API instead.
+    """
+
+    def __init__(self, max_age: float = 900) -> None:
+        self.max_age = max_age
+        self._postings = _Postings()
+        self.built_from = -1
+        self.documents = 0
+        self.last_build_seconds = 0.0
+        self.searches = 0
+        self.api_fallbacks = 0
+
+    def build(self, topology: TopologyIndex) -> None:
+        """Rebuild from the topology records (blocking; run in a thread)."""
+        start = time.perf_counter()
+        refreshes = topology.refreshes
+        postings = _Postings()
+        text_ids: Dict[str, int] = {}
+        for type_code, object_type in enumerate(TOPOLOGY_TARGETS):
+            fields = [(_FIELDS.index(field), field) for field in SEARCH_FIELDS[object_type]]
+            for objectid, node in topology.records(object_type).items():
+                for field_code, field in fields:
+                    original = getattr(node, field) or ""
+                    text = original.lower()
+                    if not text:
+                        continue
+                    text_id = text_ids.get(text)
+                    if text_id is None:
+                        text_id = text_ids[text] = len(postings.texts)
+                        postings.texts.append(text)
+                        postings.originals.append(original)
+                        postings.owners.append(array("I"))
+                        for gram in _trigrams(text):
+                            postings.grams.setdefault(gram, array("I")).append(text_id)
+                    postings.owners[text_id].append(len(postings.doc_ids))
+                    postings.doc_types.append(type_code)
+                    postings.doc_ids.append(objectid)
+                    postings.doc_fields.append(field_code)
+        self._postings = postings
+        self.built_from = refreshes
+        self.documents = len(postings.doc_ids)
+        self.last_build_seconds = time.perf_counter() - start
+
+    def usable(self, topology: TopologyIndex) -> bool:
+        """Return whether the topology is recent enough to answer searches from."""
+        return (topology.loaded_at is not None
+                and time.monotonic() - topology.loaded_at <= self.max_age)
+
+    async def sync(self, topology: TopologyIndex) -> None:
+        """Rebuild if the topology has been refreshed since the last build."""
+        if self.built_from != topology.refreshes:
+            await asyncio.to_thread(self.build, topology)
+
+    def _matching_texts(self, postings: _Postings, tokens: List[str]) -> Iterable[int]:
+        """IDs of names containing every token."""
+        grams = sorted({gram for token in tokens if len(token) >= 3 for gram in _trigrams(token)},
+                       key=lambda g: len(postings.grams.get(g, ())))
+        if not grams:
+            candidates: Iterable[int] = range(len(postings.texts))
+        else:
+            found = set(postings.grams.get(grams[0], ()))
+            for gram in grams[1:]:
+                if not found:
+                    break
+                found.intersection_update(postings.grams.get(gram, ()))
+            candidates = found
+        return [i for i in candidates if all(token in postings.texts[i] for token in tokens)]
+
+    def _fuzzy_texts(self, postings: _Postings, query: str, exclude: Set[int]) -> Dict[int, float]:
+        """Names sharing at least the threshold share of the query's trigrams."""
+        grams = _trigrams(query)
+        if not grams:
+            return {}
+        counts: Counter = Counter()
+        for gram in grams:
+            counts.update(postings.grams.get(gram, ()))
+        needed = _FUZZY_THRESHOLD * len(grams)
+        return {text_id: round(0.5 * shared / len(grams), 4)
+                for text_id, shared in counts.items()
+                if shared >= needed and text_id not in exclude}
+
+    def search(self, query: str, types: Optional[List[str]] = None,
+               limit: int = 20) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` objects whose names match the query, best first.
+
+        Args:
+            query: Search text; whitespace and ``*`` separate tokens
+            types: Object types to return (default: all of ``SEARCH_FIELDS``)
+            limit: Maximum number of results
+
+        Returns:
+            Dicts with type, id, matched field, name and score
+
+        Raises:
+            ValueError: If a type is unknown
+        """
+        wanted = validate_types(types)
+        self.searches += 1
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        postings = self._postings
+        scored = {i: score(tokens, postings.texts[i]) for i in self._matching_texts(postings, tokens)}
+        if len(scored) < limit:
+            scored.update(self._fuzzy_texts(postings, " ".join(tokens), set(scored)))
+
+        best: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        for text_id in sorted(scored, key=lambda i: (-scored[i], len(postings.texts[i]))):
+            for doc in postings.owners[text_id]:
+                object_type = TOPOLOGY_TARGETS[postings.doc_types[doc]]
+                key = (postings.doc_types[doc], postings.doc_ids[doc])
+                if object_type not in wanted or key in best:
+                    continue
+                best[key] = {"type": object_type, "id": postings.doc_ids[doc],
+                             "field": _FIELDS[postings.doc_fields[doc]],
+                             "text": postings.originals[text_id], "score": scored[text_id]}
+            if len(best) >= limit:
+                break
+        return list(best.values())[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index size, build time and search counters."""
+        postings = self._postings
+        return {
+            "built": self.built_from >= 0,
+            "names": len(postings.texts),
+            "documents": self.documents,
+            "trigrams": len(postings.grams),
+            "last_build_seconds": round(self.last_build_seconds, 6),
+            "searches": self.searches,
+            "api_fallbacks": self.api_fallbacks,
+        }
+
+
+def validate_types(types: Optional[List[str]]) -> Set[str]:
+    """Check search object types, return them as a set (all types when None).
+
+    Raises:
+        ValueError: If a type is unknown
+    """
+    if types is None:
+        return set(SEARCH_FIELDS)
+    for object_type in types:
+        if object_type not in SEARCH_FIELDS:
+            raise ValueError(f"Invalid search type: {object_type} "
+                             f"(expected one of {', '.join(SEARCH_FIELDS)})")
+    return set(types)
+
+
+_search_index: Optional[SearchIndex] = None
+
+
+def get_search_index() -> SearchIndex:
+    """Get or create the search index from environment settings.
+
+    The index is rebuilt from the topology index whenever that has been refreshed.
+    """
+    global _search_index
+
+    if _search_index is None:
+        _search_index = SearchIndex(max_age=float(os.getenv("ZABBIX_SEARCH_MAX_AGE", "900")))
+    return _search_index
@@ -0,0 +1,64 @@
+"""
+History/trend source selection for long time-series reads.
+
+Zabbix keeps raw history for an item's ``history`` retention and hourly
+trends for its ``trends`` retention. A window reaching further back than
+the history retention is split at the first full hour still covered by
+history: the older part is read from trends, the recent part from history,
+and the two are stitched into one series.
+"""
+
+import re
+from typing import Optional, Tuple
+
+TimeRange = Tuple[int, int]
+
+# History value types that have trends (float, unsigned)
+TREND_VALUE_TYPES = (0, 3)
+
+_PERIOD = re.compile(r"^(\d+)([smhdw]?)$")
+_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_period(value: Optional[str]) -> Optional[int]:
+    """Convert a Zabbix retention period ("90d", "1w", "3600", "0") to seconds.
+
+    Returns:
+        Seconds, or None if the period is a user macro or otherwise unknown
+    """
+    if value is None:
+        return None
+    match = _PERIOD.match(str(value).strip())
+    if not match:
+        return None
+    return int(match.group(1)) * _UNITS[match.group(2)]
+
+
+def split_window(time_from: int, time_till: int, history_retention: Optional[int],
+                 trend_retention: Optional[int], now: int, value_type: int
+                 ) -> Tuple[Optional[TimeRange], Optional[TimeRange]]:
+    """Decide which part of a window comes from trends and which from history.
+
+    Windows are read entirely from history when the item has no trends
+    (non-numeric or trends disabled) or its history retention is unknown.
+
+    Args:
+        time_from: Window start (Unix timestamp)
+        time_till: Window end (Unix timestamp)
+        history_retention: History retention in seconds, None if unknown
+        trend_retention: Trend retention in seconds, None if unknown
+        now: Current time (Unix timestamp)
+        value_type: Item value type
+
+    Returns:
+        (trend range, history range); either may be None
+    """
+    if value_type not in TREND_VALUE_TYPES or history_retention is None or trend_retention == 0:
+        return None, (time_from, time_till)
+    cutoff = now - history_retention
+    boundary = cutoff + (-cutoff % 3600)
+    if time_from >= boundary:
+        return None, (time_from, time_till)
+    if time_till < boundary:
+        return (time_from, time_till), None
+    return (time_from, boundary - 1), (boundary, time_till)
@@ -0,0 +1,194 @@
+"""
+Slow-call log for upstream Zabbix API requests.
+
+Every request made by the registry's ``_call_api`` that takes longer than
+the configured threshold is logged and aggregated by a normalized
+fingerprint of its parameters: which parameters were set, the length of
+each ID list, the span of the time range and the number of output fields.
+Calls that differ only in the IDs or timestamps they ask for share a
+fingerprint, so the aggregate shows which query shapes load the Zabbix
+backend most.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the time range span buckets, in seconds
+SPAN_BUCKETS = ((3600, "1h"), (6 * 3600, "6h"), (86400, "1d"), (7 * 86400, "7d"),
+                (30 * 86400, "30d"), (365 * 86400, "365d"))
+
+SORT_KEYS = ("total", "max", "calls")
+
+# Rows of a list result encoded to estimate its size
+SIZE_SAMPLE_ROWS = 10
+
+
+def _count_bucket(count: int) -> str:
+    """Bucket an ID-list length by order of magnitude ("1", "<=10", "<=100", ...)."""
+    if count <= 1:
+        return str(count)
+    bound = 10
+    while count > bound:
+        bound *= 10
+    return f"<={bound}"
+
+
+def _span_bucket(seconds: float) -> str:
+    for bound, label in SPAN_BUCKETS:
+        if seconds <= bound:
+            return f"<={label}"
+    return f">{SPAN_BUCKETS[-1][1]}"
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_size(result: Any) -> int:
+    """Estimate the compact JSON size of an API result.
+
+    Encoding a large result in full would block the event loop on the very
+    calls that are already slow, so a list is estimated from up to
+    ``SIZE_SAMPLE_ROWS`` evenly spaced rows scaled to its length.
+    """
+    if isinstance(result, list) and len(result) > SIZE_SAMPLE_ROWS:
+        sample = result[::len(result) // SIZE_SAMPLE_ROWS][:SIZE_SAMPLE_ROWS]
+        return round(len(json.dumps(sample, separators=(",", ":"), default=str))
+                     / len(sample) * len(result))
+    return len(json.dumps(result, separators=(",", ":"), default=str))
+
+
+def fingerprint(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize API call parameters to the shape of the query.
+
+    Values are dropped except for what determines the cost of the call:
+    ID lists become length buckets, ``time_from``/``time_till`` the bucketed
+    span (an open end counts up to now) and ``output`` its field count.
+    ``filter`` and ``search`` keep their field names.
+
+    Returns:
+        dict: ``params`` (sorted names) plus ``ids``, ``span``, ``output``,
+        ``filter`` and ``search`` where present
+    """
+    result: Dict[str, Any] = {"params": sorted(params)}
+    ids = {name: _count_bucket(len(value) if isinstance(value, (list, tuple, dict)) else 1)
+           for name, value in params.items() if name.endswith("ids") and value is not None}
+    if ids:
+        result["ids"] = ids
+    time_from = _timestamp(params.get("time_from"))
+    if time_from is not None:
+        time_till = _timestamp(params.get("time_till"))
+        result["span"] = _span_bucket((time_till if time_till is not None else time.time()) - time_from)
+    if "output" in params:
+        output = params["output"]
+        result["output"] = len(output) if isinstance(output, (list, tuple)) else output
+    for name in ("filter", "search"):
+        if isinstance(params.get(name), dict):
+            result[name] = sorted(params[name])
+    return result
+
+
+class SlowCallLog:
+    """Aggregate of slow upstream calls by object, method and fingerprint."""
+
+    def __init__(self, threshold: float, max_fingerprints: int = 1000) -> None:
+        """
+        Args:
+            threshold: Seconds from which a call is recorded
+            max_fingerprints: Distinct fingerprints kept; the least recently
+                seen is dropped beyond that
+        """
+        self.threshold = threshold
+        self.max_fingerprints = max_fingerprints
+        self.recorded = 0
+        self._entries: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+
+    def record(self, api_object: str, api_method: str, params: Dict[str, Any], seconds: float,
+               rows: int, size: int, error: bool = False) -> None:
+        """Log a slow call and add it to the aggregate of its fingerprint.
+
+        ``size`` is the response size in bytes, see ``estimate_size``.
+        """
+        shape = fingerprint(params)
+        key = (api_object, api_method, json.dumps(shape, sort_keys=True))
+        logger.warning(f"Slow Zabbix call {api_object}.{api_method} took {seconds:.2f}s "
+                       f"({'failed' if error else f'{rows} rows, ~{size} bytes'}): {key[2]}")
+        self.recorded += 1
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {
+                "object": api_object, "method": api_method, "fingerprint": shape,
+                "calls": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+                "max_rows": 0, "max_bytes": 0, "last_seen": 0.0,
+            }
+            while len(self._entries) > self.max_fingerprints:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        entry["calls"] += 1
+        entry["errors"] += error
+        entry["total_seconds"] += seconds
+        entry["max_seconds"] = max(entry["max_seconds"], seconds)
+        entry["max_rows"] = max(entry["max_rows"], rows)
+        entry["max_bytes"] = max(entry["max_bytes"], size)
+        entry["last_seen"] = time.time()
+
+    def top(self, limit: int = 20, sort_by: str = "total") -> List[Dict[str, Any]]:
+        """Return the worst fingerprints first.
+
+        Args:
+            limit: Number of fingerprints to return
+            sort_by: ``total`` (summed time), ``max`` (slowest call) or ``calls``
+
+        Raises:
+            ValueError: If ``sort_by`` is unknown
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Invalid sort_by: {sort_by} (expected one of {', '.join(SORT_KEYS)})")
+        field = {"total": "total_seconds", "max": "max_seconds", "calls": "calls"}[sort_by]
+        entries = sorted(self._entries.values(), key=lambda entry: entry[field], reverse=True)
+        return [{**entry,
+                 "total_seconds": round(entry["total_seconds"], 3),
+                 "max_seconds": round(entry["max_seconds"], 3),
+                 "mean_seconds": round(entry["total_seconds"] / entry["calls"], 3)}
+                for entry in entries[:max(0, limit)]]
+
+    def stats(self, limit: int = 20, sort_by: str = "total") -> Dict[str, Any]:
+        return {"threshold_seconds": self.threshold, "recorded": self.recorded,
+                "fingerprints": len(self._entries), "top": self.top(limit, sort_by)}
+
+    def clear(self) -> None:
+        self.recorded = 0
+        self._entries.clear()
+
+
+_slow_call_log: Optional[SlowCallLog] = None
+
+
+def get_slow_call_log() -> Optional[SlowCallLog]:
+    """Get or create the slow-call log from environment settings.
+
+    Returns:
+        SlowCallLog, or None when ZABBIX_SLOW_CALL_THRESHOLD is 0
+    """
+    global _slow_call_log
+
+    threshold = float(os.getenv("ZABBIX_SLOW_CALL_THRESHOLD", "1.0"))
+    if threshold <= 0:
+        return None
+
+    if _slow_call_log is None:
+        _slow_call_log = SlowCallLog(
+            threshold=threshold,
+            max_fingerprints=int(os.getenv("ZABBIX_SLOW_CALL_MAX_FINGERPRINTS", "1000")),
+        )
+    return _slow_call_log
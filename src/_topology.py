@@ -0,0 +1,464 @@
+"""
+In-memory index of the host/item/trigger topology.
+
+Host groups, templates, hosts, items and triggers are loaded into compact
+id-keyed records with reverse adjacency maps, so relationship questions
+("triggers on hosts in group X that are linked to template Y") are answered
+locally in one call instead of a chain of ``*_get`` requests.
+
+Refreshes are incremental: groups, templates and hosts are re-read (they
+are small), items and triggers are diffed by ID so only new ones are
+fetched, and trigger states are updated through ``lastChangeSince``.
+Edits to existing items and triggers are picked up by a full reload every
+``ZABBIX_TOPOLOGY_FULL_REFRESH`` seconds. Item and trigger records are
+always fetched by ID in bounded pages after listing the IDs, so no single
+request returns every item of the installation. Only host-level items and
+triggers are indexed; objects defined on templates are not.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+TOPOLOGY_TARGETS = ("hostgroup", "host", "template", "item", "trigger")
+
+Fetch = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+Version = Callable[[], Awaitable[str]]
+
+_ITEM_OUTPUT = ["itemid", "hostid", "key_", "name", "value_type", "status", "templateid"]
+_TRIGGER_OUTPUT = ["triggerid", "description", "priority", "status", "value",
+                   "lastchange", "templateid"]
+
+
+class _Node:
+    """Base for index records; subclasses list their fields in ``__slots__``."""
+
+    __slots__ = ()
+
+    def as_dict(self) -> Dict[str, Any]:
+        result = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            result[name] = list(value) if isinstance(value, tuple) else value
+        return result
+
+
+class GroupNode(_Node):
+    __slots__ = ("groupid", "name")
+
+    def __init__(self, row: Dict[str, Any]) -> None:
+        self.groupid = row["groupid"]
+        self.name = row.get("name", "")
+
+
+class TemplateNode(_Node):
+    __slots__ = ("templateid", "host", "name", "templateids")
+
+    def __init__(self, row: Dict[str, Any]) -> None:
+        self.templateid = row["templateid"]
+        self.host = row.get("host", "")
+        self.name = row.get("name", "")
+        self.templateids = _ids(row.get("parentTemplates"), "templateid")
+
+
+class HostNode(_Node):
+    __slots__ = ("hostid", "host", "name", "status", "groupids", "templateids")
+
+    def __init__(self, row: Dict[str, Any]) -> None:
+        self.hostid = row["hostid"]
+        self.host = row.get("host", "")
+        self.name = row.get("name", "")
+        self.status = row.get("status")
+        self.groupids = _ids(row.get("hostgroups", row.get("groups")), "groupid")
+        self.templateids = _ids(row.get("parentTemplates"), "templateid")
+
+
+class ItemNode(_Node):
+    __slots__ = ("itemid", "hostid", "key_", "name", "value_type", "status", "templateid")
+
+    def __init__(self, row: Dict[str, Any]) -> None:
+        self.itemid = row["itemid"]
+        self.hostid = row.get("hostid")
+        self.key_ = row.get("key_", "")
+        self.name = row.get("name", "")
+        self.value_type = row.get("value_type")
+        self.status = row.get("status")
+        self.templateid = row.get("templateid")
+
+
+class TriggerNode(_Node):
+    __slots__ = ("triggerid", "description", "priority", "status", "value", "lastchange",
+                 "templateid", "hostids", "itemids", "dependencies")
+
+    def __init__(self, row: Dict[str, Any]) -> None:
+        self.triggerid = row["triggerid"]
+        self.description = row.get("description", "")
+        self.priority = row.get("priority")
+        self.status = row.get("status")
+        self.value = row.get("value")
+        self.lastchange = row.get("lastchange")
+        self.templateid = row.get("templateid")
+        self.hostids = _ids(row.get("hosts"), "hostid")
+        self.itemids = _ids(row.get("items"), "itemid")
+        self.dependencies = _ids(row.get("dependencies"), "triggerid")
+
+
+def _ids(rows: Optional[Iterable[Dict[str, Any]]], field: str) -> Tuple[str, ...]:
+    return tuple(row[field] for row in rows or ())
+
+
+def _id_key(objectid: str) -> Tuple[int, str]:
+    return (int(objectid), "") if objectid.isdigit() else (0, objectid)
+
+
+def _host_groups_param(api_version: Optional[str]) -> str:
+    """Return the host group select of ``host.get`` (``selectGroups`` before Zabbix 6.2)."""
+    try:
+        major, minor = (int(part) for part in (api_version or "").split(".")[:2])
+    except ValueError:
+        return "selectHostGroups"
+    return "selectHostGroups" if (major, minor) >= (6, 2) else "selectGroups"
+
+
+class TopologyIndex:
+    """Id-keyed records of the monitored topology plus reverse adjacency.
+
+    Args:
+        refresh: Seconds after which the index is considered stale.
+        full_refresh: Seconds between full reloads of items and triggers.
+        page_size: Items or triggers fetched per request; loads list the IDs
+            first and then fetch the records in ID order, a page at a time.
+    """
+
+    def __init__(self, refresh: float = 300, full_refresh: float = 3600,
+                 page_size: int = 10000):
+        self.refresh_interval = refresh
+        self.full_refresh = full_refresh
+        self.page_size = page_size
+        self.groups: Dict[str, GroupNode] = {}
+        self.templates: Dict[str, TemplateNode] = {}
+        self.hosts: Dict[str, HostNode] = {}
+        self.items: Dict[str, ItemNode] = {}
+        self.triggers: Dict[str, TriggerNode] = {}
+        self._group_hosts: Dict[str, Set[str]] = {}
+        self._template_children: Dict[str, Set[str]] = {}
+        self._host_items: Dict[str, Set[str]] = {}
+        self._host_triggers: Dict[str, Set[str]] = {}
+        self._item_triggers: Dict[str, Set[str]] = {}
+        self._lock = asyncio.Lock()
+        self.api_version: Optional[str] = None
+        self.loaded_at: Optional[float] = None
+        self._synced_at = 0
+        self._full_at = 0.0
+        self.refreshes = 0
+        self.full_refreshes = 0
+        self.last_refresh_seconds = 0.0
+
+    def records(self, target: str) -> Dict[str, Any]:
+        """Return the id-keyed records of one of ``TOPOLOGY_TARGETS``."""
+        return {"hostgroup": self.groups, "host": self.hosts, "template": self.templates,
+                "item": self.items, "trigger": self.triggers}[target]
+
+    def is_stale(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.refresh_interval
+
+    async def refresh(self, fetch: Fetch, full: bool = False,
+                      version: Optional[Version] = None) -> None:
+        """Bring the index up to date; concurrent callers share one refresh.
+
+        ``version`` returns the Zabbix API version; it is read once and picks
+        the host group select of ``host.get``.
+        """
+        started = time.monotonic()
+        async with self._lock:
+            if self.loaded_at is not None and self.loaded_at >= started:
+                return
+            if self.api_version is None and version is not None:
+                self.api_version = await version()
+            await self._refresh(fetch, full)
+
+    async def _refresh(self, fetch: Fetch, full: bool) -> None:
+        start = time.perf_counter()
+        now = int(time.time())
+        full = full or self.loaded_at is None or time.monotonic() - self._full_at > self.full_refresh
+
+        groups, templates, hosts, items, triggers = await asyncio.gather(
+            fetch("hostgroup", {"output": ["groupid", "name"]}),
+            fetch("template", {"output": ["templateid", "host", "name"],
+                               "selectParentTemplates": ["templateid"]}),
+            fetch("host", {"output": ["hostid", "host", "name", "status"],
+                           _host_groups_param(self.api_version): ["groupid"],
+                           "selectParentTemplates": ["templateid"]}),
+            self._sync_items(fetch, full),
+            self._sync_triggers(fetch, full))
+
+        self.groups = {row["groupid"]: GroupNode(row) for row in groups}
+        self.templates = {row["templateid"]: TemplateNode(row) for row in templates}
+        self.hosts = {row["hostid"]: HostNode(row) for row in hosts}
+        self.items = items
+        self.triggers = triggers
+        self._rebuild()
+
+        self._synced_at = now
+        self.loaded_at = time.monotonic()
+        if full:
+            self._full_at = self.loaded_at
+            self.full_refreshes += 1
+        self.refreshes += 1
+        self.last_refresh_seconds = time.perf_counter() - start
+        logger.debug(f"Topology {'full' if full else 'incremental'} refresh took "
+                     f"{self.last_refresh_seconds:.3f}s")
+
+    async def _fetch_by_ids(self, fetch: Fetch, api_object: str, ids: Iterable[str],
+                            params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fetch objects by ID in slices of ``page_size``, one request at a time."""
+        ids = sorted(ids, key=_id_key)
+        rows: List[Dict[str, Any]] = []
+        for pos in range(0, len(ids), self.page_size):
+            rows.extend(await fetch(api_object, dict(
+                params, **{f"{api_object}ids": ids[pos:pos + self.page_size]})))
+        return rows
+
+    async def _sync_items(self, fetch: Fetch, full: bool) -> Dict[str, ItemNode]:
+        current = {row["itemid"] for row in await fetch(
+            "item", {"output": ["itemid"], "templated": False})}
+        items = {} if full else {itemid: node for itemid, node in self.items.items()
+                                 if itemid in current}
+        for row in await self._fetch_by_ids(fetch, "item", current - items.keys(),
+                                            {"output": _ITEM_OUTPUT}):
+            items[row["itemid"]] = ItemNode(row)
+        return items
+
+    async def _sync_triggers(self, fetch: Fetch, full: bool) -> Dict[str, TriggerNode]:
+        details = {"output": _TRIGGER_OUTPUT, "selectHosts": ["hostid"],
+                   "selectItems": ["itemid"], "selectDependencies": ["triggerid"]}
+        listing = fetch("trigger", {"output": ["triggerid"], "templated": False})
+        if full:
+            current, changed = await listing, []
+        else:
+            current, changed = await asyncio.gather(
+                listing,
+                fetch("trigger", {"output": ["triggerid", "value", "lastchange"],
+                                  "templated": False, "lastChangeSince": self._synced_at}))
+        current = {row["triggerid"] for row in current}
+        triggers = {} if full else {triggerid: node for triggerid, node in self.triggers.items()
+                                    if triggerid in current}
+        for row in changed:
+            node = triggers.get(row["triggerid"])
+            if node is not None:
+                node.value = row.get("value", node.value)
+                node.lastchange = row.get("lastchange", node.lastchange)
+        for row in await self._fetch_by_ids(fetch, "trigger", current - triggers.keys(), details):
+            triggers[row["triggerid"]] = TriggerNode(row)
+        return triggers
+
+    def _rebuild(self) -> None:
+        """Recompute the reverse adjacency maps from the records."""
+        group_hosts: Dict[str, Set[str]] = {}
+        children: Dict[str, Set[str]] = {}
+        for host in self.hosts.values():
+            for groupid in host.groupids:
+                group_hosts.setdefault(groupid, set()).add(host.hostid)
+            for templateid in host.templateids:
+                children.setdefault(templateid, set()).add(host.hostid)
+        for template in self.templates.values():
+            for templateid in template.templateids:
+                children.setdefault(templateid, set()).add(template.templateid)
+        host_items: Dict[str, Set[str]] = {}
+        for item in self.items.values():
+            host_items.setdefault(item.hostid, set()).add(item.itemid)
+        host_triggers: Dict[str, Set[str]] = {}
+        item_triggers: Dict[str, Set[str]] = {}
+        for trigger in self.triggers.values():
+            for hostid in trigger.hostids:
+                host_triggers.setdefault(hostid, set()).add(trigger.triggerid)
+            for itemid in trigger.itemids:
+                item_triggers.setdefault(itemid, set()).add(trigger.triggerid)
+        self._group_hosts = group_hosts
+        self._template_children = children
+        self._host_items = host_items
+        self._host_triggers = host_triggers
+        self._item_triggers = item_triggers
+
+    @staticmethod
+    def _match(records: Dict[str, Any], wanted: List[str], *fields: str) -> Set[str]:
+        """Resolve IDs or names (any of ``fields``) to record IDs."""
+        wanted_set = set(wanted)
+        found = {objectid for objectid in wanted_set if objectid in records}
+        for objectid, node in records.items():
+            if any(getattr(node, field) in wanted_set for field in fields):
+                found.add(objectid)
+        return found
+
+    def _linked_hosts(self, templateids: Set[str]) -> Set[str]:
+        """Hosts linked to any of the templates, directly or through nested templates."""
+        hosts: Set[str] = set()
+        seen: Set[str] = set()
+        pending = list(templateids)
+        while pending:
+            templateid = pending.pop()
+            if templateid in seen:
+                continue
+            seen.add(templateid)
+            for child in self._template_children.get(templateid, ()):
+                if child in self.hosts:
+                    hosts.add(child)
+                else:
+                    pending.append(child)
+        return hosts
+
+    def _linked_templates(self, hostids: Iterable[str]) -> Set[str]:
+        """Templates linked to any of the hosts, including nested parents."""
+        templates: Set[str] = set()
+        pending = [t for hostid in hostids for t in self.hosts[hostid].templateids]
+        while pending:
+            templateid = pending.pop()
+            if templateid in templates:
+                continue
+            templates.add(templateid)
+            template = self.templates.get(templateid)
+            if template is not None:
+                pending.extend(template.templateids)
+        return templates
+
+    def query(self, target: str, hostgroups: Optional[List[str]] = None,
+              hosts: Optional[List[str]] = None, templates: Optional[List[str]] = None,
+              itemids: Optional[List[str]] = None, triggerids: Optional[List[str]] = None,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return ``target`` objects related to every given filter.
+
+        Group, host and template filters select a set of hosts (hosts in the
+        groups, hosts linked to the templates directly or through nested
+        templates, the hosts themselves); item and trigger filters select
+        their own hosts too and additionally restrict item/trigger results.
+
+        Args:
+            target: One of ``TOPOLOGY_TARGETS``
+            hostgroups: Host group IDs or names
+            hosts: Host IDs, technical names or visible names
+            templates: Template IDs, technical names or visible names
+            itemids: Item IDs
+            triggerids: Trigger IDs
+            limit: Maximum number of results
+
+        Returns:
+            Matching records sorted by ID
+
+        Raises:
+            ValueError: If the target is unknown
+        """
+        if target not in TOPOLOGY_TARGETS:
+            raise ValueError(f"Invalid topology target: {target} "
+                             f"(expected one of {', '.join(TOPOLOGY_TARGETS)})")
+
+        selected: Optional[Set[str]] = None
+
+        def narrow(hostids: Set[str]) -> None:
+            nonlocal selected
+            selected = hostids if selected is None else selected & hostids
+
+        if hostgroups is not None:
+            groupids = self._match(self.groups, hostgroups, "name")
+            narrow({h for g in groupids for h in self._group_hosts.get(g, ())})
+        if templates is not None:
+            narrow(self._linked_hosts(self._match(self.templates, templates, "host", "name")))
+        if hosts is not None:
+            narrow(self._match(self.hosts, hosts, "host", "name"))
+        items = None if itemids is None else {i for i in itemids if i in self.items}
+        if items is not None:
+            narrow({self.items[i].hostid for i in items} & self.hosts.keys())
+        triggers = None if triggerids is None else {t for t in triggerids if t in self.triggers}
+        if triggers is not None:
+            narrow({h for t in triggers for h in self.triggers[t].hostids} & self.hosts.keys())
+
+        if target == "host":
+            found = set(self.hosts) if selected is None else selected
+            records = self.hosts
+        elif target == "hostgroup":
+            found = set(self.groups) if selected is None else {
+                g for h in selected for g in self.hosts[h].groupids}
+            records = self.groups
+        elif target == "template":
+            found = set(self.templates) if selected is None else self._linked_templates(selected)
+            records = self.templates
+        elif target == "item":
+            found = set(self.items) if selected is None else {
+                i for h in selected for i in self._host_items.get(h, ())}
+            if items is not None:
+                found &= items
+            if triggers is not None:
+                found &= {i for t in triggers for i in self.triggers[t].itemids}
+            records = self.items
+        else:
+            found = set(self.triggers) if selected is None else {
+                t for h in selected for t in self._host_triggers.get(h, ())}
+            if triggers is not None:
+                found &= triggers
+            if items is not None:
+                found &= {t for i in items for t in self._item_triggers.get(i, ())}
+            records = self.triggers
+
+        ordered = sorted((objectid for objectid in found if objectid in records), key=_id_key)
+        if limit:
+            ordered = ordered[:limit]
+        return [records[objectid].as_dict() for objectid in ordered]
+
+    async def run(self, fetch: Fetch,
+                  after: Optional[Callable[[], Awaitable[None]]] = None,
+                  version: Optional[Version] = None) -> None:
+        """Refresh forever, calling ``after`` after each refresh; errors are logged and retried."""
+        while True:
+            try:
+                await self.refresh(fetch, version=version)
+                if after is not None:
+                    await after()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Topology refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return record counts, refresh counters and the index age."""
+        return {
+            "loaded": self.loaded_at is not None,
+            "age": None if self.loaded_at is None else round(time.monotonic() - self.loaded_at, 3),
+            "hostgroups": len(self.groups),
+            "templates": len(self.templates),
+            "hosts": len(self.hosts),
+            "items": len(self.items),
+            "triggers": len(self.triggers),
+            "refresh": self.refresh_interval,
+            "full_refresh": self.full_refresh,
+            "refreshes": self.refreshes,
+            "full_refreshes": self.full_refreshes,
+            "last_refresh_seconds": round(self.last_refresh_seconds, 6),
+        }
+
+
+_topology: Optional[TopologyIndex] = None
+
+
+def is_topology_preload_enabled() -> bool:
+    """Check whether the index is built at startup and refreshed in the background."""
+    return os.getenv("ZABBIX_TOPOLOGY_PRELOAD", "false").lower() in ("true", "1", "yes")
+
+
+def get_topology() -> TopologyIndex:
+    """Get or create the topology index from environment settings.
+
+    The index is empty until its first refresh, which happens at startup
+    with ZABBIX_TOPOLOGY_PRELOAD or otherwise on the first query.
+    """
+    global _topology
+
+    if _topology is None:
+        _topology = TopologyIndex(
+            refresh=float(os.getenv("ZABBIX_TOPOLOGY_REFRESH", "300")),
+            full_refresh=float(os.getenv("ZABBIX_TOPOLOGY_FULL_REFRESH", "3600")),
+        )
+    return _topology
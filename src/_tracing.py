@@ -0,0 +1,136 @@
+"""
+Optional OpenTelemetry tracing for Zabbix MCP Server.
+
+With ``ZABBIX_TRACING`` set, every MCP tool call gets a span, with child
+spans for each Zabbix API request made by the registry's ``_call_api`` and
+for JSON encoding in ``format_response``. Spans are exported to an OTLP
+collector (configured through the standard ``OTEL_EXPORTER_OTLP_*``
+variables) or written as JSON lines to a file for offline analysis.
+Requires the ``tracing`` extra; while tracing is off, ``span()`` is a no-op
+and no OpenTelemetry module is imported.
+"""
+
+import contextlib
+import json
+import logging
+import os
+from typing import Any, Dict, Iterator, Optional
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+logger = logging.getLogger(__name__)
+
+TRACING_EXPORTERS = ("off", "otlp", "file", "console")
+
+# Tracer of the configured provider, None while tracing is off
+_tracer: Optional[Any] = None
+
+
+def get_tracing_exporter() -> str:
+    """Return the configured span exporter (ZABBIX_TRACING, default: off).
+
+    Raises:
+        ValueError: If the exporter is unknown
+    """
+    exporter = os.getenv("ZABBIX_TRACING", "off").lower()
+    if exporter not in TRACING_EXPORTERS:
+        raise ValueError(f"Invalid ZABBIX_TRACING: {exporter} "
+                         f"(expected one of {', '.join(TRACING_EXPORTERS)})")
+    return exporter
+
+
+def _create_exporter(kind: str) -> Any:
+    """Create the span exporter for ``ZABBIX_TRACING``."""
+    if kind == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            raise ValueError("ZABBIX_TRACING=otlp but opentelemetry-exporter-otlp-proto-http "
+                             "is not installed (uv sync --extra tracing)")
+        return OTLPSpanExporter()
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+    if kind == "console":
+        return ConsoleSpanExporter()
+    path = os.getenv("ZABBIX_TRACING_FILE", "zabbix-mcp-traces.jsonl")
+    return ConsoleSpanExporter(out=open(path, "a", encoding="utf-8"),
+                               formatter=lambda span: span.to_json(indent=None) + "\n")
+
+
+def setup_tracing(exporter: Optional[Any] = None) -> bool:
+    """Install a tracer provider exporting spans as configured by ZABBIX_TRACING.
+
+    Args:
+        exporter: Span exporter to use instead of the configured one (tests)
+
+    Returns:
+        bool: Whether tracing is enabled
+
+    Raises:
+        ValueError: If tracing is requested but OpenTelemetry is not installed
+    """
+    global _tracer
+    kind = get_tracing_exporter()
+    if kind == "off" and exporter is None:
+        _tracer = None
+        return False
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+    except ImportError:
+        raise ValueError(f"ZABBIX_TRACING={kind} but opentelemetry-sdk is not installed "
+                         "(uv sync --extra tracing)")
+    provider = TracerProvider(resource=Resource.create(
+        {"service.name": os.getenv("OTEL_SERVICE_NAME", "zabbix-mcp-server")}))
+    if exporter is not None:
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    else:
+        provider.add_span_processor(BatchSpanProcessor(_create_exporter(kind)))
+        logger.info(f"Exporting traces via {kind}")
+    _tracer = provider.get_tracer("zabbix-mcp-server")
+    return True
+
+
+def is_tracing_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _tracer is not None
+
+
+@contextlib.contextmanager
+def span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Optional[Any]]:
+    """Record a span named ``name`` around the block, or nothing while tracing is off.
+
+    Yields:
+        The span, to add attributes known only at the end, or None
+    """
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
+
+
+def json_size(value: Any) -> int:
+    """Size of ``value`` encoded as compact JSON, for span attributes."""
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+
+def row_count(result: Any) -> int:
+    """Number of rows in an API result (1 for a single object or value)."""
+    return len(result) if isinstance(result, list) else 1
+
+
+class TracingMiddleware(Middleware):
+    """Record a span for every tool call while tracing is enabled."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        if _tracer is None:
+            return await call_next(context)
+        tool = context.message.name
+        attributes = {"mcp.tool.name": tool,
+                      "mcp.tool.arguments_size": json_size(context.message.arguments or {})}
+        with span(f"tool {tool}", attributes) as current:
+            result = await call_next(context)
+            current.set_attribute("mcp.tool.response_size",
+                                  sum(len(getattr(block, "text", "")) for block in result.content))
+            return result
@@ -1,72 +1,165 @@
 """
 Zabbix MCP Server tool modules.
 
-Importing this package registers all tool functions with the FastMCP instance.
-Each sub-module defines tools for a specific Zabbix API object type.
+Each sub-module defines tools for a specific Zabbix API object type and
+registers them with the FastMCP instance when imported. Importing this
+package does not import them: ``register_tools()`` either imports every
+module, or registers placeholders from the precomputed manifest so that a
+module is only imported when one of its tools is first called (see
+``src.tools._lazy``). A tool profile limits registration to the modules an
+agent needs, so the others are never imported or advertised. The
+``tools/list`` response is then cached (see ``src.tools._listing``).
+
+``src.zabbix_mcp_server`` calls ``register_tools()`` with the environment
+settings when it is imported, so its ``mcp`` comes with the tools
+registered; ``main()`` registers again once its options are applied.
 """
 
-from src.tools import (  # noqa: F401
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.tools._lazy import StartupProfile
+
+TOOL_MODULES = (
     # Phase 0/1: Original + completed object types
-    apiinfo,
-    configuration,
-    discoveryrule,
-    event,
-    graph,
-    history,
-    host,
-    hostgroup,
-    item,
-    itemprototype,
-    maintenance,
-    problem,
-    proxy,
-    template,
-    trend,
-    trigger,
-    user,
-    usermacro,
+    "apiinfo",
+    "configuration",
+    "discoveryrule",
+    "event",
+    "graph",
+    "history",
+    "host",
+    "hostgroup",
+    "item",
+    "itemprototype",
+    "maintenance",
+    "problem",
+    "proxy",
+    "template",
+    "trend",
+    "trigger",
+    "user",
+    "usermacro",
     # Phase 2: Core infrastructure
-    hostinterface,
-    templategroup,
-    action,
-    mediatype,
-    script,
-    dashboard,
-    service,
-    sla,
+    "hostinterface",
+    "templategroup",
+    "action",
+    "mediatype",
+    "script",
+    "dashboard",
+    "service",
+    "sla",
     # Phase 3: Discovery, prototypes, automation
-    triggerprototype,
-    graphprototype,
-    hostprototype,
-    drule,
-    dcheck,
-    dhost,
-    dservice,
-    httptest,
-    correlation,
-    valuemap,
-    graphitem,
-    map,
+    "triggerprototype",
+    "graphprototype",
+    "hostprototype",
+    "drule",
+    "dcheck",
+    "dhost",
+    "dservice",
+    "httptest",
+    "correlation",
+    "valuemap",
+    "graphitem",
+    "map",
     # Phase 4: User/RBAC and administration
-    usergroup,
-    userdirectory,
-    role,
-    token,
-    autoregistration,
-    authentication,
-    settings,
-    housekeeping,
-    auditlog,
+    "usergroup",
+    "userdirectory",
+    "role",
+    "token",
+    "autoregistration",
+    "authentication",
+    "settings",
+    "housekeeping",
+    "auditlog",
     # Phase 5: Remaining objects
-    templatedashboard,
-    report,
-    task,
-    hanode,
-    iconmap,
-    image,
-    regexp,
-    module,
-    connector,
-    proxygroup,
-    alert,
+    "templatedashboard",
+    "report",
+    "task",
+    "hanode",
+    "iconmap",
+    "image",
+    "regexp",
+    "module",
+    "connector",
+    "proxygroup",
+    "alert",
+    # Local indexes
+    "topology",
+    # Batched reads
+    "batch",
+    # Server introspection
+    "server",
 )
+
+
+# Named subsets of TOOL_MODULES selectable with --profile / ZABBIX_TOOL_PROFILE
+TOOL_PROFILES: Dict[str, Tuple[str, ...]] = {
+    "full": TOOL_MODULES,
+    "monitoring": ("problem", "event", "history", "trend", "host", "item", "trigger", "batch"),
+    "inventory": ("hostgroup", "host", "hostinterface", "template", "templategroup",
+                  "item", "trigger", "usermacro", "proxy", "topology", "batch"),
+    "admin": ("user", "usergroup", "userdirectory", "role", "token", "authentication",
+              "settings", "housekeeping", "auditlog", "mediatype", "action", "script"),
+}
+
+
+def profile_modules(spec: str) -> Tuple[str, ...]:
+    """Resolve a tool profile to the tool modules it registers.
+
+    Args:
+        spec: Comma-separated profile and module names, e.g. ``monitoring`` or
+            ``monitoring,maintenance,server``
+
+    Returns:
+        Selected modules in ``TOOL_MODULES`` order
+
+    Raises:
+        ValueError: If a name is neither a profile nor a tool module
+    """
+    selected = set()
+    for name in (part.strip().lower() for part in spec.split(",")):
+        if not name:
+            continue
+        if name in TOOL_PROFILES:
+            selected.update(TOOL_PROFILES[name])
+        elif name in TOOL_MODULES:
+            selected.add(name)
+        else:
+            raise ValueError(f"Unknown tool profile or module '{name}'. "
+                             f"Profiles: {', '.join(TOOL_PROFILES)}")
+    if not selected:
+        raise ValueError("Tool profile selects no modules")
+    return tuple(module for module in TOOL_MODULES if module in selected)
+
+
+# Modules and mode of the last register_tools() call
+_registration: Optional[Tuple[Tuple[str, ...], bool]] = None
+
+
+def register_tools(lazy: bool = False, profile: Optional["StartupProfile"] = None,
+                   tool_profile: str = "full") -> None:
+    """Register the tools of the modules selected by ``tool_profile``.
+
+    Tools registered by an earlier call are replaced. Calling again with the
+    same modules and mode and without ``profile`` does nothing.
+
+    Args:
+        lazy: Register placeholders from the manifest and import each module
+            on first use, instead of importing all modules now
+        profile: Collects per-module import and registration times when given
+        tool_profile: Profile and module names, see ``profile_modules``
+
+    Raises:
+        ValueError: If the tool profile is invalid
+    """
+    global _registration
+    from src.tools._lazy import register_modules, registered_modules, unregister_modules
+    from src.tools._listing import install_tool_list_cache, is_tool_list_cache_enabled
+    modules = profile_modules(tool_profile)
+    if profile is not None or _registration != (modules, lazy):
+        unregister_modules(tuple(registered_modules))
+        register_modules(modules, lazy, profile)
+        _registration = (modules, lazy)
+    if is_tool_list_cache_enabled():
+        install_tool_list_cache()
@@ -0,0 +1,269 @@
+"""
+Lazy registration of tool modules from a precomputed manifest.
+
+Importing every tool module builds the JSON schema of 200+ tools before the
+server can answer anything. ``_manifest.json`` (written by
+``scripts/build_tool_manifest.py``) records each module's tools as they are
+advertised to clients, together with a hash of the module source. At
+startup a ``LazyTool`` placeholder is registered for every tool whose
+module is unchanged since the manifest was built; the module itself is only
+imported, replacing its placeholders with the real tools, when one of them
+is first called. Modules missing from the manifest or edited since are
+imported up front.
+
+Placeholders live in FastMCP's private tool registry (``_tool_manager``),
+which the pinned FastMCP release range provides. Without it every module is
+imported up front instead.
+"""
+
+import contextvars
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from fastmcp.tools.tool import Tool, ToolResult
+
+from src._core import mcp
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).with_name("_manifest.json")
+MANIFEST_VERSION = 1
+
+# Tool fields stored in the manifest (everything a client sees in tools/list)
+_MANIFEST_FIELDS = {"name", "title", "description", "tags", "meta",
+                    "parameters", "output_schema", "annotations"}
+
+# Modules whose tools have been registered, eagerly or as placeholders
+registered_modules: Set[str] = set()
+
+# Tools of imported modules removed by unregister_modules, re-added when the
+# module is registered again (importing it a second time registers nothing)
+_unregistered: Dict[str, List[Tool]] = {}
+
+
+def tool_registry() -> Optional[Dict[str, Tool]]:
+    """Return FastMCP's registry of tools by key, or None if it is not available."""
+    tools = getattr(getattr(mcp, "_tool_manager", None), "_tools", None)
+    return tools if isinstance(tools, dict) else None
+
+
+def tool_module(tool: Tool) -> Optional[str]:
+    """Return the ``src.tools`` module a registered tool belongs to."""
+    if isinstance(tool, LazyTool):
+        return tool.module
+    package, _, module = getattr(getattr(tool, "fn", None), "__module__", "").rpartition(".")
+    return module if package == "src.tools" else None
+
+
+def module_hash(module: str) -> str:
+    """Return the hash of a tool module's source the manifest is checked against."""
+    source = Path(__file__).with_name(f"{module}.py").read_bytes().replace(b"\r\n", b"\n")
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def import_tool_module(module: str) -> None:
+    """Import a tool module, replacing any placeholders of its tools.
+
+    Runs outside the current request context so swapping placeholders for
+    the real tools does not send clients a tools/list_changed notification.
+    """
+    name = f"src.tools.{module}"
+    if name in sys.modules:
+        return
+
+    def load() -> None:
+        for key, tool in list((tool_registry() or {}).items()):
+            if isinstance(tool, LazyTool) and tool.module == module:
+                mcp.remove_tool(key)
+        importlib.import_module(name)
+
+    contextvars.Context().run(load)
+
+
+class LazyTool(Tool):
+    """Tool advertised from the manifest that imports its module on first call."""
+
+    module: str
+
+    async def run(self, arguments: Dict[str, Any]) -> ToolResult:
+        import_tool_module(self.module)
+        tool = await mcp.get_tool(self.key)
+        if isinstance(tool, LazyTool):
+            raise RuntimeError(f"Module src.tools.{self.module} did not register {self.key}")
+        return await tool.run(arguments)
+
+
+def load_manifest(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Read the manifest, or return an empty one if it is missing or unreadable."""
+    try:
+        manifest = json.loads((path or MANIFEST_PATH).read_text())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Tool manifest not loaded, importing all tool modules: {e}")
+        return {"modules": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        logger.warning(f"Tool manifest version {manifest.get('version')} not supported, "
+                       "importing all tool modules")
+        return {"modules": {}}
+    return manifest
+
+
+def build_manifest(modules: Tuple[str, ...]) -> Dict[str, Any]:
+    """Import every tool module and describe its registered tools.
+
+    Returns:
+        Manifest dict: module -> source hash and tool definitions
+    """
+    by_module: Dict[str, List[Dict[str, Any]]] = {module: [] for module in modules}
+    for module in modules:
+        importlib.import_module(f"src.tools.{module}")
+    for tool in mcp._tool_manager._tools.values():
+        module = tool.fn.__module__.rsplit(".", 1)[-1]
+        if module in by_module:
+            by_module[module].append(
+                tool.model_dump(mode="json", include=_MANIFEST_FIELDS, exclude_none=True))
+    return {
+        "version": MANIFEST_VERSION,
+        "modules": {module: {"hash": module_hash(module),
+                             "tools": sorted(tools, key=lambda t: t["name"])}
+                    for module, tools in by_module.items()},
+    }
+
+
+class StartupProfile:
+    """Import and registration times per tool module, reported by ``--profile-startup``."""
+
+    def __init__(self) -> None:
+        self.rows: List[Tuple[str, str, float, float, int]] = []
+        self.phases: List[Tuple[str, float]] = []
+
+    def phase(self, name: str, seconds: float) -> None:
+        self.phases.append((name, seconds))
+
+    def record(self, module: str, mode: str, import_seconds: float,
+               register_seconds: float, tools: int) -> None:
+        self.rows.append((module, mode, import_seconds, register_seconds, tools))
+
+    def report(self) -> str:
+        lines = [f"{'phase':<28}{'ms':>10}"]
+        lines += [f"{name:<28}{seconds * 1000:>10.1f}" for name, seconds in self.phases]
+        lines += ["", f"{'module':<20}{'mode':<8}{'import ms':>11}{'register ms':>13}{'tools':>7}"]
+        for module, mode, import_seconds, register_seconds, tools in sorted(
+                self.rows, key=lambda r: -(r[2] + r[3])):
+            lines.append(f"{module:<20}{mode:<8}{import_seconds * 1000:>11.2f}"
+                         f"{register_seconds * 1000:>13.2f}{tools:>7}")
+        total_import = sum(r[2] for r in self.rows)
+        total_register = sum(r[3] for r in self.rows)
+        lines.append(f"{'total':<28}{total_import * 1000:>11.2f}{total_register * 1000:>13.2f}"
+                     f"{sum(r[4] for r in self.rows):>7}")
+        return "\n".join(lines)
+
+
+def _import_timed(module: str, profile: Optional[StartupProfile]) -> None:
+    """Import a module eagerly, splitting the time spent in ``@mcp.tool()`` from the rest."""
+    if profile is None:
+        importlib.import_module(f"src.tools.{module}")
+        return
+    register = 0.0
+    before = len(tool_registry() or {})
+    original = mcp.tool
+
+    def timed_tool(*args: Any, **kwargs: Any) -> Any:
+        decorator = original(*args, **kwargs)
+
+        def wrapped(fn: Any) -> Any:
+            nonlocal register
+            start = time.perf_counter()
+            tool = decorator(fn)
+            register += time.perf_counter() - start
+            return tool
+        return wrapped
+
+    mcp.tool = timed_tool
+    start = time.perf_counter()
+    try:
+        importlib.import_module(f"src.tools.{module}")
+    finally:
+        del mcp.tool
+    total = time.perf_counter() - start
+    profile.record(module, "eager", total - register, register,
+                   len(tool_registry() or {}) - before)
+
+
+def register_modules(modules: Tuple[str, ...], lazy: bool,
+                     profile: Optional[StartupProfile] = None) -> None:
+    """Register the tools of ``modules``, from the manifest where possible.
+
+    Args:
+        modules: Tool module names under ``src.tools``
+        lazy: Register placeholders from the manifest instead of importing
+        profile: Collects per-module timings when given
+    """
+    if lazy and tool_registry() is None:
+        logger.warning("FastMCP tool registry not available, importing all tool modules")
+        lazy = False
+    start = time.perf_counter()
+    manifest = load_manifest() if lazy else {"modules": {}}
+    if profile is not None and lazy:
+        profile.phase("manifest", time.perf_counter() - start)
+
+    stale = []
+    registered_modules.update(modules)
+    for module in modules:
+        if module in _unregistered:
+            start = time.perf_counter()
+            tools = _unregistered.pop(module)
+            for tool in tools:
+                mcp.add_tool(tool)
+            if profile is not None:
+                profile.record(module, "reused", 0.0, time.perf_counter() - start, len(tools))
+            continue
+        entry = manifest["modules"].get(module)
+        if entry is None or f"src.tools.{module}" in sys.modules:
+            _import_timed(module, profile)
+            continue
+        start = time.perf_counter()
+        if entry["hash"] != module_hash(module):
+            stale.append(module)
+            _import_timed(module, profile)
+            continue
+        for definition in entry["tools"]:
+            mcp.add_tool(LazyTool(module=module, **definition))
+        if profile is not None:
+            profile.record(module, "lazy", 0.0, time.perf_counter() - start, len(entry["tools"]))
+    if stale:
+        logger.warning(f"Tool manifest is out of date for {', '.join(stale)}; "
+                       "run scripts/build_tool_manifest.py")
+
+
+def unregister_modules(modules: Tuple[str, ...]) -> None:
+    """Remove the tools of ``modules``, placeholders and imported tools alike.
+
+    Does nothing when FastMCP's tool registry is not available.
+    """
+    tools = tool_registry()
+    if tools is None:
+        return
+    for key, tool in list(tools.items()):
+        module = tool_module(tool)
+        if module in modules:
+            mcp.remove_tool(key)
+            if not isinstance(tool, LazyTool):
+                _unregistered.setdefault(module, []).append(tool)
+    registered_modules.difference_update(modules)
+
+
+def get_tool_profile() -> str:
+    """Return the tool profile to register (ZABBIX_TOOL_PROFILE, default: full)."""
+    return os.getenv("ZABBIX_TOOL_PROFILE", "full")
+
+
+def is_lazy_enabled() -> bool:
+    """Check whether tools are registered lazily from the manifest (ZABBIX_LAZY_TOOLS)."""
+    return os.getenv("ZABBIX_LAZY_TOOLS", "true").lower() in ("true", "1", "yes")
@@ -0,0 +1,120 @@
+"""
+Cached ``tools/list`` responses.
+
+Every MCP session starts with ``tools/list``. For 200+ tools FastMCP rebuilds
+the list on each request: it runs the middleware chain, converts every tool
+to its MCP definition and the session then dumps the result to a dict for the
+JSON-RPC response. ``ToolListCache`` replaces the low-level handler, builds
+the response once with the original handler and keeps it together with its
+dumped form until the set of registered tools changes.
+
+The handler table, the tool registry and the ``ServerResult`` subclass are
+internals of FastMCP and the mcp SDK; when a release does not provide them
+the stock handler is kept.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import mcp.types as types
+from fastmcp import FastMCP
+from pydantic import PrivateAttr
+
+from src._core import mcp
+
+logger = logging.getLogger(__name__)
+
+# Arguments ServerSession._send_response passes to model_dump
+_DUMP_KWARGS = {"by_alias": True, "mode": "json", "exclude_none": True}
+
+try:
+    class _DumpedResult(types.ServerResult):
+        """ServerResult that returns its precomputed dump to the session."""
+
+        _dumped: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+        def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+            if kwargs == _DUMP_KWARGS and self._dumped:
+                return self._dumped
+            return super().model_dump(**kwargs)
+except (AttributeError, TypeError) as e:
+    # ServerResult missing or not a pydantic root model in this mcp release
+    logger.debug(f"ServerResult cannot be subclassed: {e}")
+    _DumpedResult = None
+
+
+class ToolListCache:
+    """``tools/list`` handler that serves the last result until tools change.
+
+    The cached result is keyed by the identity and enabled state of every
+    registered tool, so adding or removing a tool, a lazy placeholder being
+    replaced by its real tool, or a tool being disabled rebuilds it on the
+    next request. Middleware sees ``tools/list`` only when it is rebuilt.
+    """
+
+    def __init__(self, server: FastMCP) -> None:
+        self.server = server
+        self.handler = server._mcp_server.request_handlers[types.ListToolsRequest]
+        self._fingerprint: Optional[Tuple[Any, ...]] = None
+        self._result: Optional[_DumpedResult] = None
+        self.hits = 0
+        self.builds = 0
+        self.build_seconds = 0.0
+
+    def fingerprint(self) -> Tuple[Any, ...]:
+        return tuple((key, id(tool), tool.enabled)
+                     for key, tool in self.server._tool_manager._tools.items())
+
+    async def __call__(self, request: types.ListToolsRequest) -> types.ServerResult:
+        fingerprint = self.fingerprint()
+        if self._result is not None and fingerprint == self._fingerprint:
+            self.hits += 1
+            return self._result
+        start = time.perf_counter()
+        result = await self.handler(request)
+        if not isinstance(result, types.ServerResult):
+            return result
+        cached = _DumpedResult(result.root)
+        cached._dumped = result.model_dump(**_DUMP_KWARGS)
+        self._fingerprint, self._result = fingerprint, cached
+        self.builds += 1
+        self.build_seconds = time.perf_counter() - start
+        return cached
+
+    def stats(self) -> Dict[str, Any]:
+        tools = len(self._result.root.tools) if self._result is not None else 0
+        return {"tools": tools, "hits": self.hits, "builds": self.builds,
+                "last_build_ms": round(self.build_seconds * 1000, 2)}
+
+
+def _supports_cache(server: FastMCP) -> bool:
+    """Check that the FastMCP and mcp internals the cache relies on are available."""
+    handlers = getattr(getattr(server, "_mcp_server", None), "request_handlers", None)
+    tools = getattr(getattr(server, "_tool_manager", None), "_tools", None)
+    return (_DumpedResult is not None and isinstance(handlers, dict) and isinstance(tools, dict)
+            and getattr(types, "ListToolsRequest", None) in handlers)
+
+
+def install_tool_list_cache(server: Optional[FastMCP] = None) -> Optional[ToolListCache]:
+    """Serve ``tools/list`` of ``server`` (default: the shared instance) from a cache.
+
+    Returns:
+        The installed cache (the existing one if already installed), or None
+        if this FastMCP or mcp release does not allow it and the stock
+        handler is kept
+    """
+    server = server or mcp
+    if not _supports_cache(server):
+        logger.warning("tools/list cache not supported by this FastMCP/mcp release, not installed")
+        return None
+    handlers = server._mcp_server.request_handlers
+    if not isinstance(handlers[types.ListToolsRequest], ToolListCache):
+        handlers[types.ListToolsRequest] = ToolListCache(server)
+    return handlers[types.ListToolsRequest]
+
+
+def is_tool_list_cache_enabled() -> bool:
+    """Check whether tools/list responses are cached (ZABBIX_TOOL_LIST_CACHE)."""
+    return os.getenv("ZABBIX_TOOL_LIST_CACHE", "true").lower() in ("true", "1", "yes")
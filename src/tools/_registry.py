@@ -2,12 +2,126 @@
 Registry helpers to reduce per-tool boilerplate.
 
 Provides utility functions for building API parameters and calling
-Zabbix API methods with proper read-only guards.
+Zabbix API methods with proper read-only guards. The call helpers are
+coroutines so that concurrent tool calls overlap their network waits
+instead of blocking the event loop. ``*.get`` responses are served from
+the read-through response cache while fresh, and writes evict the cached
+reads they affect. Identical reads issued concurrently share a single
+upstream request. Large ``*.get`` results can be read page by page with a
+resumable continuation cursor, and ``get`` calls with huge ID lists are
+split into concurrent chunks and merged. Independent reads can be sent as
+one batch that runs them concurrently. Long numeric history and trend
+ranges can be streamed and downsampled or aggregated server-side, and long
+windows can be read as one series stitched from trends and history.
+Bounded history/trend windows are served from the optional on-disk history
+store, which only fetches the part of a window it does not hold yet, and
+reads of tracked hot items are answered from their in-memory ring buffers.
+
+Read helpers accept a reserved ``response_format`` parameter (usually passed
+through a tool's ``extra_params``) that selects the JSON layout of the
+response; it is stripped before the call reaches Zabbix.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import base64
+import contextlib
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from src._aggregate import Samples, aggregate, validate_functions
+from src._cache import CacheKey, ResponseCache, get_response_cache
+from src._downsample import Series, downsample
+from src._series import TREND_VALUE_TYPES, parse_period, split_window
+from src._fanout import fan_out
+from src._metrics import UPSTREAM_ERRORS, UPSTREAM_SECONDS
+from src._tracing import json_size, row_count, span
+from src._history_store import HistoryStore, SyncPlan, get_history_store
+from src._hot_items import HotItems, get_hot_items
+from src._slowlog import estimate_size, get_slow_call_log
+from src._search import SEARCH_FIELDS, get_search_index, rank, tokenize, validate_types
+from src._topology import TopologyIndex, get_topology
+from src.tools import TOOL_MODULES
+from src._core import (
+    RESPONSE_FORMATS, get_response_format, get_zabbix_client, format_response, to_columnar,
+    validate_read_only,
+)
+
+logger = logging.getLogger(__name__)
+
+# Reserved read parameter selecting the response layout, never sent to Zabbix
+RESPONSE_FORMAT_PARAM = "response_format"
+
+# Set while refreshing the cache: reads skip the cache lookup but still store
+_refreshing: ContextVar[bool] = ContextVar("refreshing", default=False)
+
+# Reads currently awaiting Zabbix, keyed like the response cache
+_in_flight: Dict[CacheKey, "asyncio.Future[str]"] = {}
+coalesce_stats: Dict[str, int] = {"upstream": 0, "coalesced": 0}
+
+DEFAULT_PAGE_SIZE = 1000
+
+# Read methods zabbix_batch accepts, and its maximum number of entries
+BATCH_METHODS = ("get", "version", "export", "getsli", "getscriptsbyhosts", "getscriptsbyevents")
+MAX_BATCH_ENTRIES = 50
+
+# Rows per page when streaming history or trends for server-side reduction
+STREAM_PAGE_SIZE = 10000
+
+# History value types that can be downsampled (float, unsigned)
+NUMERIC_HISTORY_TYPES = (0, 3)
+
+# Writes that change history already held by the history store and hot item buffers
+HISTORY_WRITES = {("history", "clear"), ("history", "push"), ("item", "delete")}
 
-from src._core import get_zabbix_client, format_response, validate_read_only
+# Objects paged by scanning their IDs: API object -> (ID field, ID list param)
+ID_PAGED_OBJECTS: Dict[str, Tuple[str, str]] = {
+    "item": ("itemid", "itemids"),
+    "itemprototype": ("itemid", "itemids"),
+    "discoveryrule": ("itemid", "itemids"),
+    "host": ("hostid", "hostids"),
+    "hostinterface": ("interfaceid", "interfaceids"),
+    "hostgroup": ("groupid", "groupids"),
+    "template": ("templateid", "templateids"),
+    "trigger": ("triggerid", "triggerids"),
+    "triggerprototype": ("triggerid", "triggerids"),
+    "graph": ("graphid", "graphids"),
+    "httptest": ("httptestid", "httptestids"),
+    "alert": ("alertid", "alertids"),
+}
+
+# ID lists of running scans, referenced from cursors by scan key
+_MAX_SCANS = 32
+_scans: "OrderedDict[str, List[str]]" = OrderedDict()
+
+
+def _split_response_format(params: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Remove ``response_format`` from params, return (api params, format).
+
+    Raises:
+        ValueError: If the requested format is unknown
+    """
+    if RESPONSE_FORMAT_PARAM not in params:
+        return params, None
+    params = dict(params)
+    fmt = params.pop(RESPONSE_FORMAT_PARAM)
+    if fmt not in RESPONSE_FORMATS:
+        raise ValueError(f"Invalid response_format: {fmt} (expected one of {', '.join(RESPONSE_FORMATS)})")
+    return params, fmt
+
+
+@contextlib.contextmanager
+def refreshing():
+    """Make reads in this context fetch from Zabbix and replace their cached response."""
+    token = _refreshing.set(True)
+    try:
+        yield
+    finally:
+        _refreshing.reset(token)
 
 
 def build_params(required: Dict[str, Any], optional: Dict[str, Any],
@@ -31,25 +145,384 @@ def build_params(required: Dict[str, Any], optional: Dict[str, Any],
     return params
 
 
-def zabbix_get(api_object: str, api_method: str, params: Dict[str, Any]) -> str:
+async def _call_api(api_object: str, api_method: str, *args: Any, **params: Any) -> Any:
+    """Call a Zabbix API method on the shared client and return the raw result.
+
+    Every upstream request made by the helpers in this module goes through
+    here, and is timed for the ``/metrics`` endpoint, traced when tracing is
+    enabled and recorded in the slow-call log when it exceeds the threshold.
+    Objects without a tool module are labelled ``object="unknown"`` in the
+    metrics, since ``zabbix_batch`` passes client-supplied object names.
+    """
+    label = api_object if api_object in TOOL_MODULES else "unknown"
+    client = await get_zabbix_client()
+    method = getattr(getattr(client, api_object), api_method)
+    slow_log = get_slow_call_log()
+    start = time.perf_counter()
+    with span(f"zabbix {api_object}.{api_method}") as current:
+        if current is not None:
+            current.set_attributes({"zabbix.object": api_object, "zabbix.method": api_method,
+                                    "zabbix.params.size": json_size(params or list(args))})
+        result, failed = None, True
+        try:
+            result = await method(*args, **params)
+            failed = False
+        except Exception:
+            UPSTREAM_ERRORS.inc(label, api_method)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            UPSTREAM_SECONDS.observe(elapsed, label, api_method)
+            if slow_log is not None and elapsed >= slow_log.threshold:
+                slow_log.record(api_object, api_method, params or {"ids": list(args)}, elapsed,
+                                0 if failed else row_count(result),
+                                0 if failed else estimate_size(result), error=failed)
+        if current is not None:
+            current.set_attribute("zabbix.result.rows", row_count(result))
+        return result
+
+
+async def _call_get(api_object: str, params: Dict[str, Any]) -> Any:
+    """Call ``get``, from hot item buffers or the history store when they can answer the read."""
+    if api_object == "history":
+        hot = get_hot_items()
+        rows = hot.answer(params) if hot is not None else None
+        if rows is not None:
+            return rows
+    store = get_history_store()
+    if store is not None and store.supports(api_object, params):
+        return await _store_get(store, api_object, params)
+    return await _fan_out_get(api_object, params)
+
+
+async def _fan_out_get(api_object: str, params: Dict[str, Any]) -> Any:
+    """Call ``get``, fanning out over chunks when an ID list is too large."""
+    id_field = ID_PAGED_OBJECTS.get(api_object, (f"{api_object}id", None))[0]
+    return await fan_out(lambda chunk: _call_api(api_object, "get", **chunk),
+                         api_object, params, id_field)
+
+
+async def run_hot_items(hot: HotItems) -> None:
+    """Keep the hot item buffers fed from Zabbix until cancelled."""
+    await hot.run(_fan_out_get)
+
+
+async def api_version() -> str:
+    """Return the Zabbix API version (``apiinfo.version``)."""
+    return await _call_api("apiinfo", "version")
+
+
+async def refresh_topology(index: TopologyIndex, full: bool = False) -> None:
+    """Bring the topology index and the search index built from it up to date."""
+    await index.refresh(_fan_out_get, full, version=api_version)
+    await get_search_index().sync(index)
+
+
+async def run_topology(index: TopologyIndex) -> None:
+    """Keep the topology and search indexes refreshed from Zabbix until cancelled."""
+    await index.run(_fan_out_get, after=lambda: get_search_index().sync(index),
+                    version=api_version)
+
+
+_topology_refresh: Optional[asyncio.Task] = None
+
+
+def _refresh_topology_soon(index: TopologyIndex) -> None:
+    """Start a background topology refresh unless one is already running."""
+    global _topology_refresh
+
+    async def refresh() -> None:
+        try:
+            await refresh_topology(index)
+        except Exception as e:
+            logger.warning(f"Topology refresh failed: {e}")
+
+    if _topology_refresh is None or _topology_refresh.done():
+        _topology_refresh = asyncio.create_task(refresh())
+
+
+async def zabbix_search(query: str, types: Optional[List[str]] = None,
+                        limit: int = 20, fmt: Optional[str] = None) -> str:
+    """Search object names, from the search index or the API while the index is too old.
+
+    A stale index still answers (and is refreshed in the background) until it
+    is older than the search index's ``max_age``; then, and before the first
+    load, the ``*.get`` searches go to Zabbix and the results are ranked the
+    same way.
+
+    Returns:
+        JSON with ``source`` ("index" or "api") and the ranked ``results``
+
+    Raises:
+        ValueError: If a type or the format is unknown, or limit is below 1
+    """
+    wanted = validate_types(types)
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    topology = get_topology()
+    search = get_search_index()
+    if topology.is_stale():
+        _refresh_topology_soon(topology)
+    if search.usable(topology):
+        await search.sync(topology)
+        return _search_response("index", search.search(query, sorted(wanted), limit), fmt)
+
+    search.api_fallbacks += 1
+    tokens = tokenize(query)
+    if not tokens:
+        return _search_response("api", [], fmt)
+    pattern = "*" + "*".join(tokens) + "*"
+    object_types = [t for t in SEARCH_FIELDS if t in wanted]
+    id_fields = {t: ID_PAGED_OBJECTS[t][0] for t in object_types}
+    results = await asyncio.gather(*(
+        _fan_out_get(t, {"output": [id_fields[t], *SEARCH_FIELDS[t]],
+                         "search": {field: pattern for field in SEARCH_FIELDS[t]},
+                         "searchByAny": True, "searchWildcardsEnabled": True, "limit": limit,
+                         **({"templated": False} if t in ("item", "trigger") else {})})
+        for t in object_types))
+    candidates = ((t, row[id_fields[t]], field, row.get(field) or "")
+                  for t, rows in zip(object_types, results)
+                  for row in rows for field in SEARCH_FIELDS[t])
+    return _search_response("api", rank(query, candidates, limit), fmt)
+
+
+def _search_response(source: str, results: List[Dict[str, Any]], fmt: Optional[str]) -> str:
+    if (fmt or get_response_format()) == "columnar":
+        results = to_columnar(results)
+    return format_response({"source": source, "results": results}, fmt)
+
+
+async def _store_get(store: HistoryStore, api_object: str, params: Dict[str, Any]) -> Any:
+    """Sync the missing parts of a history/trend window into the store, then read it from disk.
+
+    A read with a ``limit`` over a window that is not fully stored goes to
+    Zabbix unchanged: Zabbix returns at most ``limit`` rows, where syncing
+    would copy the whole window.
+    """
+    now = int(time.time())
+    value_type = store.value_type(api_object, params)
+    time_from = int(params["time_from"])
+    time_till = int(params.get("time_till") or now)
+    plan = await asyncio.to_thread(store.plan, api_object, value_type, params["itemids"],
+                                   time_from, time_till, now)
+    if plan.fetch and params.get("limit") is not None:
+        return await _fan_out_get(api_object, params)
+    if plan.fetch:
+        await asyncio.to_thread(store.reset, api_object, value_type, plan)
+        await asyncio.gather(*(_sync_gap(store, plan, api_object, value_type, itemids, start, end)
+                               for (start, end), itemids in plan.fetch.items()))
+        await asyncio.to_thread(store.cover, api_object, value_type, plan, now)
+    return await asyncio.to_thread(store.query, api_object, value_type, params, time_till)
+
+
+async def _sync_gap(store: HistoryStore, plan: SyncPlan, api_object: str, value_type: int,
+                    itemids: List[str], start: int, end: int) -> None:
+    """Fetch one missing window into the store page by page, saving each page as it arrives.
+
+    Pages hold about ``STREAM_PAGE_SIZE`` rows, so a long gap is neither held
+    in memory nor requested from Zabbix at once. History is paged in clock
+    order with ``limit``; trends, which cannot be sorted, by hourly windows.
+    """
+    base: Dict[str, Any] = {"itemids": itemids, "output": "extend"}
+    if api_object == "history":
+        base.update(history=value_type, sortfield="clock", sortorder="ASC")
+    while start <= end:
+        if api_object == "trend":
+            till = min(start - start % 3600 + max(1, STREAM_PAGE_SIZE // len(itemids)) * 3600 - 1, end)
+            rows = await _fan_out_get(api_object, dict(base, time_from=start, time_till=till))
+            start = till + 1
+        else:
+            rows = await _fan_out_get(api_object, dict(base, time_from=start, time_till=end,
+                                                       limit=STREAM_PAGE_SIZE))
+            if len(rows) < STREAM_PAGE_SIZE:
+                start = end + 1
+            elif int(rows[0]["clock"]) == int(rows[-1]["clock"]):
+                # A whole page at one clock: read that second without a limit
+                clock = int(rows[0]["clock"])
+                rows = await _fan_out_get(api_object, dict(base, time_from=clock, time_till=clock))
+                start = clock + 1
+            else:
+                # Rows at the last clock may continue on the next page, which re-reads them
+                start = int(rows[-1]["clock"])
+                rows = [row for row in rows if int(row["clock"]) < start]
+        await asyncio.to_thread(store.save_rows, api_object, value_type, rows, plan)
+
+
+async def zabbix_get(api_object: str, api_method: str, params: Dict[str, Any]) -> str:
     """Call a read API method, return formatted JSON.
 
+    ``get`` calls are cached per API object TTL; cache hits return the
+    stored response without calling Zabbix or re-serializing. Concurrent
+    calls with identical parameters wait on one upstream request and share
+    its serialized result.
+
     Args:
         api_object: Zabbix API object name (e.g. "host").
         api_method: Method name (e.g. "get").
-        params: Parameters to pass.
+        params: Parameters to pass, optionally including ``response_format``.
 
     Returns:
         JSON formatted response string.
     """
-    client = get_zabbix_client()
-    obj = getattr(client, api_object)
-    method = getattr(obj, api_method)
-    result = method(**params)
-    return format_response(result)
+    _split_response_format(params)  # reject an unknown format before any work
+    key = ResponseCache.make_key(api_object, api_method, params)
+    cache = get_response_cache()
+    ttl = cache.ttl_for(api_object) if cache is not None and api_method == "get" else 0
+    if ttl > 0 and not _refreshing.get():
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    request = _in_flight.get(key)
+    if request is None:
+        request = asyncio.ensure_future(_fetch(api_object, api_method, params, key, ttl))
+        _in_flight[key] = request
+        request.add_done_callback(lambda done: _finish_in_flight(key, done))
+        coalesce_stats["upstream"] += 1
+    else:
+        coalesce_stats["coalesced"] += 1
+    # Shield so a cancelled caller does not cancel the request for the others
+    return await asyncio.shield(request)
+
+
+async def _fetch(api_object: str, api_method: str, params: Dict[str, Any],
+                 key: CacheKey, ttl: float) -> str:
+    """Perform a read against Zabbix and store the response in the cache."""
+    cache = get_response_cache() if ttl > 0 else None
+    generation = cache.generation(api_object) if cache is not None else None
+
+    params, fmt = _split_response_format(params)
+    if api_method == "get":
+        result = await _call_get(api_object, params)
+    else:
+        result = await _call_api(api_object, api_method, **params)
+    response = format_response(result, fmt)
 
+    if cache is not None:
+        cache.set(key, response, ttl, generation)
+    return response
 
-def zabbix_write(api_object: str, api_method: str, params: Dict[str, Any]) -> str:
+
+def _finish_in_flight(key: CacheKey, request: "asyncio.Future[str]") -> None:
+    """Forget a completed read so later calls start a fresh request."""
+    if _in_flight.get(key) is request:
+        del _in_flight[key]
+    if not request.cancelled():
+        # Mark the exception retrieved even if every caller was cancelled
+        request.exception()
+
+
+async def _batch_entry(entry: Any, fmt: Optional[str]) -> str:
+    """Run one batch entry through ``zabbix_get``, return its JSON object text."""
+    if not isinstance(entry, dict):
+        raise ValueError("Batch entry must be an object with 'object', 'method' and 'params'")
+    api_object, api_method = entry.get("object"), entry.get("method", "get")
+    params = entry.get("params") or {}
+    if not isinstance(api_object, str) or not api_object.isidentifier():
+        raise ValueError(f"Invalid API object: {api_object!r}")
+    if api_method not in BATCH_METHODS:
+        raise ValueError(f"Method {api_object}.{api_method} cannot be batched "
+                         f"(expected one of {', '.join(BATCH_METHODS)})")
+    if not isinstance(params, dict):
+        raise ValueError("Batch entry params must be an object")
+    if fmt is not None and RESPONSE_FORMAT_PARAM not in params:
+        params = {**params, RESPONSE_FORMAT_PARAM: fmt}
+    return await zabbix_get(api_object, api_method, params)
+
+
+async def zabbix_batch(entries: List[Dict[str, Any]], fmt: Optional[str] = None) -> str:
+    """Run independent read calls concurrently, return all results in one response.
+
+    Each entry goes through ``zabbix_get``, so it is served from the response
+    cache, shares in-flight requests and is chunked like a single read. A
+    failing entry reports its error without failing the others. The entry
+    results are embedded as returned by ``zabbix_get`` rather than decoded
+    and encoded again.
+
+    Args:
+        entries: Calls as ``{"object": ..., "method": ..., "params": {...}}``;
+            method defaults to ``get``
+        fmt: Response format for entries that do not set ``response_format``
+
+    Returns:
+        JSON with ``results``: per entry its ``object``, ``method`` and either
+        ``result`` or ``error``, in the order given
+
+    Raises:
+        ValueError: If there are no entries, too many, or the format is unknown
+    """
+    if not entries:
+        raise ValueError("At least one batch entry is required")
+    if len(entries) > MAX_BATCH_ENTRIES:
+        raise ValueError(f"At most {MAX_BATCH_ENTRIES} batch entries are allowed")
+    if fmt is not None:
+        _split_response_format({RESPONSE_FORMAT_PARAM: fmt})
+    results = await asyncio.gather(*(_batch_entry(entry, fmt) for entry in entries),
+                                   return_exceptions=True)
+    parts = []
+    for entry, result in zip(entries, results):
+        if isinstance(entry, dict):
+            call = {"object": entry.get("object"), "method": entry.get("method", "get")}
+        else:
+            call = {"object": None, "method": None}
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            parts.append(json.dumps({**call, "error": str(result)}))
+        else:
+            fields = json.dumps(call)[1:-1]
+            parts.append(f'{{{fields}, "result": {result}}}')
+    return '{"results": [' + ", ".join(parts) + "]}"
+
+
+def invalidate_cache(api_object: str) -> None:
+    """Evict cached reads affected by a write to ``api_object``.
+
+    Args:
+        api_object: Zabbix API object that was written to.
+    """
+    cache = get_response_cache()
+    if cache is not None:
+        cache.invalidate(api_object)
+
+
+def _written_itemids(api_object: str, api_method: str, params: Dict[str, Any],
+                     ids: List[str]) -> Optional[List[str]]:
+    """Return the items whose stored history a write changes, or None for all of them.
+
+    ``history.push`` entries addressed by host and key instead of ``itemid``
+    cannot be mapped to items here, so they drop everything.
+    """
+    if api_object == "item":
+        return ids
+    if api_method == "clear":
+        itemids = params.get("itemids")
+        return [itemids] if isinstance(itemids, (str, int)) else itemids
+    data = params.get("data")
+    entries = data if isinstance(data, list) else [data]
+    if all(isinstance(entry, dict) and entry.get("itemid") is not None for entry in entries):
+        return sorted({str(entry["itemid"]) for entry in entries})
+    return None
+
+
+async def invalidate_history(api_object: str, api_method: str, params: Dict[str, Any],
+                             ids: Optional[List[str]] = None) -> None:
+    """Drop history held by the history store and hot item buffers that a write changes.
+
+    Only ``HISTORY_WRITES`` change stored history; other writes are ignored.
+    """
+    if (api_object, api_method) not in HISTORY_WRITES:
+        return
+    itemids = _written_itemids(api_object, api_method, params, ids or [])
+    store = get_history_store()
+    if store is not None:
+        await asyncio.to_thread(store.forget, itemids)
+    hot = get_hot_items()
+    if hot is not None:
+        hot.forget(itemids)
+
+
+async def zabbix_write(api_object: str, api_method: str, params: Dict[str, Any]) -> str:
     """Guard read-only, call a write API method, return formatted JSON.
 
     Args:
@@ -61,25 +534,421 @@ def zabbix_write(api_object: str, api_method: str, params: Dict[str, Any]) -> st
         JSON formatted response string.
     """
     validate_read_only()
-    client = get_zabbix_client()
-    obj = getattr(client, api_object)
-    method = getattr(obj, api_method)
-    result = method(**params)
+    try:
+        result = await _call_api(api_object, api_method, **params)
+    finally:
+        invalidate_cache(api_object)
+        await invalidate_history(api_object, api_method, params)
     return format_response(result)
 
 
-def zabbix_delete(api_object: str, ids: List[str]) -> str:
+async def zabbix_delete(api_object: str, ids: List[str],
+                        api_method: str = "delete") -> str:
     """Guard read-only, call delete with unpacked IDs.
 
     Args:
         api_object: Zabbix API object name (e.g. "host").
         ids: List of IDs to delete.
+        api_method: Delete method name (e.g. "deleteglobal").
 
     Returns:
         JSON formatted response string.
     """
     validate_read_only()
-    client = get_zabbix_client()
-    obj = getattr(client, api_object)
-    result = obj.delete(*ids)
+    try:
+        result = await _call_api(api_object, api_method, *ids)
+    finally:
+        invalidate_cache(api_object)
+        await invalidate_history(api_object, api_method, {}, ids)
     return format_response(result)
+
+
+def _encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode pagination state as an opaque URL-safe token."""
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode()
+
+
+def _decode_cursor(cursor: str, api_object: str) -> Dict[str, Any]:
+    """Decode a token from ``_encode_cursor``.
+
+    Raises:
+        ValueError: If the token is malformed or belongs to another object
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise ValueError("Invalid pagination cursor")
+    if not isinstance(state, dict) or state.get("object") != api_object:
+        raise ValueError(f"Pagination cursor does not belong to {api_object}.get")
+    return state
+
+
+def _with_output_fields(params: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Make sure fields needed for paging are part of a list ``output``."""
+    output = params.get("output")
+    if isinstance(output, list):
+        params["output"] = output + [f for f in fields if f not in output]
+    return params
+
+
+async def _page_by_eventid(api_object: str, params: Dict[str, Any], want: int,
+                           state: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
+    """Page events/problems in eventid order using ``eventid_from``."""
+    page_params = dict(params, sortfield="eventid", sortorder="ASC", limit=want)
+    if "after" in state:
+        start = int(state["after"]) + 1
+        page_params["eventid_from"] = str(max(start, int(params.get("eventid_from", 0))))
+    rows = await _call_get(api_object, page_params)
+    if rows:
+        state["after"] = rows[-1]["eventid"]
+    return rows, len(rows) < want
+
+
+async def _page_by_clock(api_object: str, params: Dict[str, Any], want: int,
+                         state: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
+    """Page history in clock order, skipping rows already returned at the boundary clock."""
+    seen = set(state.get("seen", []))
+    page_params = dict(params, sortfield="clock", sortorder="ASC", limit=want + len(seen))
+    if "clock" in state:
+        page_params["time_from"] = state["clock"]
+    _with_output_fields(page_params, ("itemid", "clock", "ns"))
+    fetched = await _call_get(api_object, page_params)
+
+    def row_key(row: Dict[str, Any]) -> str:
+        return f"{row['itemid']}:{row.get('ns', 0)}"
+
+    boundary = state.get("clock")
+    rows = [r for r in fetched
+            if not (int(r["clock"]) == boundary and row_key(r) in seen)][:want]
+    if rows:
+        last_clock = int(rows[-1]["clock"])
+        last_keys = [row_key(r) for r in rows if int(r["clock"]) == last_clock]
+        if last_clock == boundary:
+            last_keys.extend(seen)
+        state["clock"] = last_clock
+        state["seen"] = last_keys
+    return rows, len(fetched) < want + len(seen)
+
+
+async def _page_by_window(api_object: str, params: Dict[str, Any], want: int,
+                          state: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
+    """Page hourly trends by time window sized to roughly ``want`` rows."""
+    if "clock" not in state and params.get("time_from") is None:
+        raise ValueError(f"time_from is required to page {api_object} data")
+    start = state.get("clock", int(params["time_from"]))
+    till = int(params.get("time_till") or time.time())
+    items = max(1, len(params.get("itemids") or []))
+    end = min(start - start % 3600 + max(1, want // items) * 3600 - 1, till)
+    rows = await _call_get(api_object, dict(params, time_from=start, time_till=end))
+    state["clock"] = end + 1
+    return rows, end >= till
+
+
+async def _page_by_ids(api_object: str, params: Dict[str, Any], want: int,
+                       state: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
+    """Page objects by scanning matching IDs once and fetching them in slices.
+
+    The ID list lives server-side under a scan key; if it has been dropped
+    (restart, eviction) the scan is repeated and resumes after the last ID.
+    """
+    id_field, ids_param = ID_PAGED_OBJECTS[api_object]
+    ids = _scans.get(state.get("scan", ""))
+    if ids is None:
+        scan_params = {k: v for k, v in params.items()
+                       if not k.startswith("select")
+                       and k not in ("output", "sortfield", "sortorder", "preservekeys")}
+        rows = await _call_get(api_object, dict(scan_params, output=[id_field]))
+        ids = sorted((row[id_field] for row in rows), key=int)
+        if "after" in state:
+            ids = [i for i in ids if int(i) > int(state["after"])]
+        state["scan"] = uuid.uuid4().hex
+        state["pos"] = 0
+        _scans[state["scan"]] = ids
+        while len(_scans) > _MAX_SCANS:
+            _scans.popitem(last=False)
+
+    pos = state["pos"]
+    page_ids = ids[pos:pos + want]
+    rows = []
+    if page_ids:
+        rows = await _call_get(api_object, dict(params, **{ids_param: page_ids}))
+        rows.sort(key=lambda row: int(row[id_field]))
+        state["after"] = page_ids[-1]
+    state["pos"] = pos + len(page_ids)
+    done = state["pos"] >= len(ids)
+    if done:
+        _scans.pop(state["scan"], None)
+    return rows, done
+
+
+def _pager_for(api_object: str):
+    if api_object in ("event", "problem"):
+        return _page_by_eventid
+    if api_object == "history":
+        return _page_by_clock
+    if api_object == "trend":
+        return _page_by_window
+    if api_object in ID_PAGED_OBJECTS:
+        return _page_by_ids
+    raise ValueError(f"Pagination is not supported for {api_object}.get")
+
+
+async def iter_pages(api_object: str, params: Dict[str, Any],
+                     page_size: int = DEFAULT_PAGE_SIZE,
+                     cursor: Optional[str] = None
+                     ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """Run a ``get`` call page by page, yielding ``(rows, next_cursor)``.
+
+    Only one page is held in memory at a time. ``limit`` in params caps the
+    total number of rows across all pages. Pages are ordered by ascending
+    ID (or clock for history and trends) regardless of ``sortorder``.
+
+    Args:
+        api_object: Zabbix API object name (e.g. "item").
+        params: Parameters to pass to ``get``.
+        page_size: Maximum rows per page (approximate for trends).
+        cursor: Continuation token from a previous page to resume from.
+
+    Yields:
+        Tuples of page rows and the cursor for the next page (None when done).
+
+    Raises:
+        ValueError: If the object cannot be paged or the cursor is invalid
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    pager = _pager_for(api_object)
+    if cursor:
+        state = _decode_cursor(cursor, api_object)
+    else:
+        limit = params.get("limit")
+        state = {"object": api_object, "remaining": int(limit) if limit else None}
+    params = {k: v for k, v in params.items() if k not in ("limit", "countOutput")}
+    while True:
+        remaining = state["remaining"]
+        want = page_size if remaining is None else min(page_size, remaining)
+        if want <= 0:
+            return
+        rows, done = await pager(api_object, params, want, state)
+        if remaining is not None:
+            state["remaining"] = remaining - len(rows)
+            done = done or state["remaining"] <= 0
+        if rows or done:
+            yield rows, None if done else _encode_cursor(state)
+        if done:
+            return
+
+
+async def zabbix_get_page(api_object: str, params: Dict[str, Any],
+                          page_size: Optional[int] = None,
+                          cursor: Optional[str] = None) -> str:
+    """Fetch one page of a ``get`` call, return formatted JSON.
+
+    Args:
+        api_object: Zabbix API object name (e.g. "item").
+        params: Parameters to pass to ``get``, optionally including ``response_format``.
+        page_size: Maximum rows per page (default ``DEFAULT_PAGE_SIZE``).
+        cursor: ``next_cursor`` from the previous page to resume from.
+
+    Returns:
+        JSON with ``result`` (the page rows) and ``next_cursor`` (None on the last page).
+    """
+    params, fmt = _split_response_format(params)
+    pages = iter_pages(api_object, params, page_size or DEFAULT_PAGE_SIZE, cursor)
+    try:
+        rows, next_cursor = await anext(pages, ([], None))
+    finally:
+        await pages.aclose()
+    if (fmt or get_response_format()) == "columnar":
+        rows = to_columnar(rows)
+    return format_response({"result": rows, "next_cursor": next_cursor}, fmt)
+
+
+def _check_numeric_history(params: Dict[str, Any]) -> None:
+    if int(params.get("history", 0)) not in NUMERIC_HISTORY_TYPES:
+        raise ValueError("Only numeric history (0=float, 3=unsigned) can be reduced server-side")
+
+
+async def zabbix_get_downsampled(params: Dict[str, Any], max_points: int,
+                                 method: str = "lttb") -> str:
+    """Stream numeric history page by page and downsample each item, return formatted JSON.
+
+    Raw rows are only held one page at a time; samples are accumulated per
+    item in compact arrays and reduced once the range has been read.
+
+    Args:
+        params: ``history.get`` parameters, optionally including ``response_format``.
+        max_points: Maximum points returned per item.
+        method: Downsampling method ("lttb", "minmax" or "avg").
+
+    Returns:
+        JSON with per-item ``points`` as ``[clock, value]`` pairs plus raw sample counts.
+
+    Raises:
+        ValueError: If the history type is not numeric or the method is invalid
+    """
+    params, fmt = _split_response_format(params)
+    _check_numeric_history(params)
+    downsample(Series(), max_points, method)  # reject bad arguments before any work
+
+    series: Dict[str, Series] = {itemid: Series() for itemid in params.get("itemids", [])}
+    params = dict(params, output=["itemid", "clock", "value"])
+    async for rows, _ in iter_pages("history", params, STREAM_PAGE_SIZE):
+        for row in rows:
+            series.setdefault(row["itemid"], Series()).append(int(row["clock"]), float(row["value"]))
+
+    items = [{
+        "itemid": itemid,
+        "raw_points": len(samples),
+        "points": downsample(samples, max_points, method),
+    } for itemid, samples in series.items()]
+    return format_response({"method": method, "max_points": max_points, "items": items}, fmt)
+
+
+async def zabbix_aggregate(api_object: str, params: Dict[str, Any], functions: List[str],
+                           bucket: Optional[int] = None) -> str:
+    """Stream history or trend pages and aggregate each item, return formatted JSON.
+
+    Args:
+        api_object: "history" for raw values or "trend" for hourly rollups.
+        params: ``get`` parameters, optionally including ``response_format``.
+        functions: Aggregation functions (see ``src._aggregate``).
+        bucket: Bucket width in seconds; None aggregates the whole range.
+
+    Returns:
+        JSON with one ``result`` row per item (and per bucket when bucketing).
+
+    Raises:
+        ValueError: If the source, functions, bucket or history type is invalid
+    """
+    params, fmt = _split_response_format(params)
+    if api_object not in ("history", "trend"):
+        raise ValueError(f"Cannot aggregate {api_object} data (expected history or trend)")
+    functions = validate_functions(functions)
+    if bucket is not None and bucket < 1:
+        raise ValueError("bucket must be at least 1 second")
+
+    rollup = api_object == "trend"
+    if rollup:
+        params = dict(params, output=["itemid", "clock", "num", "value_min", "value_avg", "value_max"])
+    else:
+        _check_numeric_history(params)
+        params = dict(params, output=["itemid", "clock", "value"])
+
+    samples: Dict[str, Samples] = {itemid: Samples(rollup) for itemid in params.get("itemids", [])}
+    async for rows, _ in iter_pages(api_object, params, STREAM_PAGE_SIZE):
+        for row in rows:
+            item = samples.setdefault(row["itemid"], Samples(rollup))
+            if rollup:
+                item.append_rollup(int(row["clock"]), float(row["value_avg"]), float(row["value_min"]),
+                                   float(row["value_max"]), float(row["num"]))
+            else:
+                item.append(int(row["clock"]), float(row["value"]))
+
+    result = [{"itemid": itemid, **row}
+              for itemid, item in samples.items() for row in aggregate(item, functions, bucket)]
+    return format_response({"source": api_object, "functions": functions, "bucket": bucket,
+                            "result": result}, fmt)
+
+
+async def _retention_overrides() -> Dict[str, Optional[int]]:
+    """Return global history/trend retention overrides from the housekeeping settings."""
+    try:
+        settings = json.loads(await zabbix_get("housekeeping", "get", {
+            "output": ["hk_history_global", "hk_history", "hk_trends_global", "hk_trends"]}))
+    except Exception:
+        # housekeeping.get needs Super admin; fall back to per-item retention
+        return {}
+    overrides = {}
+    for kind in ("history", "trends"):
+        if str(settings.get(f"hk_{kind}_global")) == "1":
+            overrides[kind] = parse_period(settings.get(f"hk_{kind}"))
+    return overrides
+
+
+async def zabbix_get_series(params: Dict[str, Any], max_points: Optional[int] = None,
+                            method: str = "lttb") -> str:
+    """Read a time window per item from trends and/or history and stitch one series.
+
+    Each item's window is split by its history retention (``item.get``
+    ``history``/``trends``, or the global housekeeping override): the part
+    older than the history retention comes from hourly trend averages, the
+    rest from raw history. Items sharing a split are read together.
+
+    Args:
+        params: ``itemids``, ``time_from`` and optional ``time_till``,
+            optionally including ``response_format``.
+        max_points: Downsample numeric series to at most this many points.
+        method: Downsampling method when ``max_points`` is set.
+
+    Returns:
+        JSON with per-item ``points`` as ``[clock, value]`` pairs and the
+        ``segments`` they were read from.
+    """
+    params, fmt = _split_response_format(params)
+    if max_points is not None:
+        downsample(Series(), max_points, method)  # reject bad arguments before any work
+    now = int(time.time())
+    time_from = int(params["time_from"])
+    time_till = int(params.get("time_till") or now)
+
+    items = await _call_get("item", {"itemids": params["itemids"],
+                                     "output": ["itemid", "value_type", "history", "trends"]})
+    overrides = await _retention_overrides()
+    plans: Dict[str, Tuple[int, Optional[Tuple[int, int]], Optional[Tuple[int, int]]]] = {}
+    groups: Dict[Tuple[Any, ...], List[str]] = {}
+    for item in items:
+        value_type = int(item["value_type"])
+        history_retention = overrides.get("history", parse_period(item.get("history")))
+        trend_retention = overrides.get("trends", parse_period(item.get("trends")))
+        trend_range, history_range = split_window(time_from, time_till, history_retention,
+                                                  trend_retention, now, value_type)
+        plans[item["itemid"]] = (value_type, trend_range, history_range)
+        groups.setdefault((value_type, trend_range, history_range), []).append(item["itemid"])
+
+    trend_points: Dict[str, List[Tuple[int, float]]] = {itemid: [] for itemid in plans}
+    history_points: Dict[str, List[Tuple[int, Any]]] = {itemid: [] for itemid in plans}
+
+    async def read_trends(itemids: List[str], window: Tuple[int, int]) -> None:
+        trend_params = {"itemids": itemids, "time_from": window[0], "time_till": window[1],
+                        "output": ["itemid", "clock", "value_avg"]}
+        async for rows, _ in iter_pages("trend", trend_params, STREAM_PAGE_SIZE):
+            for row in rows:
+                trend_points[row["itemid"]].append((int(row["clock"]), float(row["value_avg"])))
+
+    async def read_history(itemids: List[str], value_type: int, window: Tuple[int, int]) -> None:
+        numeric = value_type in TREND_VALUE_TYPES
+        history_params = {"itemids": itemids, "history": value_type, "time_from": window[0],
+                          "time_till": window[1], "output": ["itemid", "clock", "value"]}
+        async for rows, _ in iter_pages("history", history_params, STREAM_PAGE_SIZE):
+            for row in rows:
+                value = float(row["value"]) if numeric else row["value"]
+                history_points[row["itemid"]].append((int(row["clock"]), value))
+
+    reads = []
+    for (value_type, trend_range, history_range), itemids in groups.items():
+        if trend_range is not None:
+            reads.append(read_trends(itemids, trend_range))
+        if history_range is not None:
+            reads.append(read_history(itemids, value_type, history_range))
+    await asyncio.gather(*reads)
+
+    result = []
+    for itemid, (value_type, trend_range, history_range) in plans.items():
+        trends = sorted(trend_points[itemid])
+        points = trends + history_points[itemid]
+        segments = []
+        if trend_range is not None:
+            segments.append({"source": "trend", "time_from": trend_range[0],
+                             "time_till": trend_range[1], "points": len(trends)})
+        if history_range is not None:
+            segments.append({"source": "history", "time_from": history_range[0],
+                             "time_till": history_range[1], "points": len(history_points[itemid])})
+        if max_points is not None and value_type in TREND_VALUE_TYPES:
+            series = Series()
+            for clock, value in points:
+                series.append(clock, value)
+            points = downsample(series, max_points, method)
+        result.append({"itemid": itemid, "value_type": value_type,
+                       "segments": segments, "points": points})
+    return format_response({"time_from": time_from, "time_till": time_till, "items": result}, fmt)
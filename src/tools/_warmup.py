@@ -0,0 +1,132 @@
+"""
+Startup warm-up and background refresh of the response cache.
+
+With ``--warm-cache`` the server logs in, checks ``apiinfo.version`` and
+preloads the default ``*_get`` reads of the configured inventory objects
+(host groups and templates unless ``ZABBIX_WARM_CACHE_OBJECTS`` says
+otherwise) before serving; the cached responses are then refreshed shortly
+before their TTL runs out so they stay warm. With the response cache
+disabled there is nothing to keep, so only the login and version check run.
+The readiness state reported on ``/ready`` tracks the warm-up.
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+from src._cache import get_response_cache
+from src.tools._lazy import import_tool_module, registered_modules
+from src.tools._registry import api_version, refreshing
+
+logger = logging.getLogger(__name__)
+
+# Hosts are left out: with their live-state TTL a preload expires before use
+DEFAULT_WARM_OBJECTS = ("hostgroup", "template")
+
+# Fraction of an object's cache TTL after which its warmed read is refreshed
+_REFRESH_AT = 0.8
+
+# Objects refreshed more often than this (live state) are only warmed at startup
+_MIN_REFRESH_INTERVAL = 10.0
+
+readiness: Dict[str, Any] = {"ready": False, "version": None, "seconds": None, "objects": {}}
+
+
+def get_warm_objects() -> List[str]:
+    """Return the API objects to preload (ZABBIX_WARM_CACHE_OBJECTS, comma-separated)."""
+    value = os.getenv("ZABBIX_WARM_CACHE_OBJECTS")
+    if value is None:
+        return list(DEFAULT_WARM_OBJECTS)
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def is_warm_cache_enabled() -> bool:
+    """Check whether startup warm-up is enabled (ZABBIX_WARM_CACHE)."""
+    return os.getenv("ZABBIX_WARM_CACHE", "false").lower() in ("true", "1", "yes")
+
+
+def mark_ready() -> None:
+    """Report the server as ready without warming up."""
+    readiness["ready"] = True
+
+
+def _get_reader(api_object: str) -> Callable[[], Any]:
+    """Return the ``<object>_get`` tool function used to warm an object.
+
+    Raises:
+        ValueError: If there is no such tool or the tool profile leaves it out
+    """
+    if api_object not in registered_modules:
+        raise ValueError(f"No {api_object}_get tool in the tool profile")
+    try:
+        import_tool_module(api_object)
+        module = importlib.import_module(f"src.tools.{api_object}")
+        tool = getattr(module, f"{api_object}_get")
+    except (ImportError, AttributeError):
+        raise ValueError(f"No {api_object}_get tool to warm")
+    return getattr(tool, "fn", tool)
+
+
+async def _warm(api_object: str) -> float:
+    """Fetch an object's default read into the cache, return the seconds it took."""
+    reader = _get_reader(api_object)
+    start = time.perf_counter()
+    with refreshing():
+        await reader()
+    return time.perf_counter() - start
+
+
+async def warm_up(objects: List[str]) -> Dict[str, Any]:
+    """Log in, check the API version and preload ``objects`` concurrently.
+
+    Failures are recorded in the readiness state rather than raised, so a
+    slow or unreachable Zabbix does not keep the server from starting.
+
+    Args:
+        objects: API objects whose ``*_get`` tools to preload
+
+    Returns:
+        The readiness state
+    """
+    start = time.perf_counter()
+    try:
+        readiness["version"] = await api_version()
+        if get_response_cache() is None:
+            logger.info("Response cache disabled, skipping the preload")
+            objects = []
+        results = await asyncio.gather(*(_warm(name) for name in objects), return_exceptions=True)
+        for name, result in zip(objects, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Warm-up of {name} failed: {result}")
+                readiness["objects"][name] = {"error": str(result)}
+            else:
+                readiness["objects"][name] = {"seconds": round(result, 6)}
+    except Exception as e:
+        logger.warning(f"Warm-up failed: {e}")
+        readiness["error"] = str(e)
+    readiness["seconds"] = round(time.perf_counter() - start, 6)
+    readiness["ready"] = True
+    logger.info(f"Warm-up finished in {readiness['seconds']:.3f}s")
+    return readiness
+
+
+async def keep_warm(objects: List[str]) -> None:
+    """Refresh the warmed reads before their cache TTL expires, until cancelled."""
+    cache = get_response_cache()
+    if cache is None:
+        return
+
+    async def refresh(name: str, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await _warm(name)
+            except Exception as e:
+                logger.warning(f"Refresh of {name} failed: {e}")
+
+    loops = [refresh(name, cache.ttl_for(name) * _REFRESH_AT)
+             for name in objects if cache.ttl_for(name) * _REFRESH_AT >= _MIN_REFRESH_INTERVAL]
+    await asyncio.gather(*loops)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def action_get(actionids: Optional[List[str]] = None,
-               output: Union[str, List[str]] = "extend",
-               search: Optional[Dict[str, str]] = None,
-               filter: Optional[Dict[str, Any]] = None,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def action_get(actionids: Optional[List[str]] = None,
+                     output: Union[str, List[str]] = "extend",
+                     search: Optional[Dict[str, str]] = None,
+                     filter: Optional[Dict[str, Any]] = None,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get actions from Zabbix.
 
     Args:
@@ -29,15 +29,15 @@ def action_get(actionids: Optional[List[str]] = None,
         optional={"actionids": actionids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("action", "get", params)
+    return await zabbix_get("action", "get", params)
 
 
 @mcp.tool()
-def action_create(name: str, eventsource: int,
-                  esc_period: str = "1h",
-                  operations: Optional[List[Dict[str, Any]]] = None,
-                  filter_: Optional[Dict[str, Any]] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def action_create(name: str, eventsource: int,
+                        esc_period: str = "1h",
+                        operations: Optional[List[Dict[str, Any]]] = None,
+                        filter_: Optional[Dict[str, Any]] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new action in Zabbix.
 
     Args:
@@ -56,15 +56,15 @@ def action_create(name: str, eventsource: int,
         optional={"operations": operations, "filter": filter_},
         extra_params=extra_params,
     )
-    return zabbix_write("action", "create", params)
+    return await zabbix_write("action", "create", params)
 
 
 @mcp.tool()
-def action_update(actionid: str, name: Optional[str] = None,
-                  status: Optional[int] = None,
-                  esc_period: Optional[str] = None,
-                  operations: Optional[List[Dict[str, Any]]] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def action_update(actionid: str, name: Optional[str] = None,
+                        status: Optional[int] = None,
+                        esc_period: Optional[str] = None,
+                        operations: Optional[List[Dict[str, Any]]] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an action in Zabbix.
 
     Args:
@@ -84,11 +84,11 @@ def action_update(actionid: str, name: Optional[str] = None,
                   "operations": operations},
         extra_params=extra_params,
     )
-    return zabbix_write("action", "update", params)
+    return await zabbix_write("action", "update", params)
 
 
 @mcp.tool()
-def action_delete(actionids: List[str]) -> str:
+async def action_delete(actionids: List[str]) -> str:
     """Delete actions from Zabbix.
 
     Args:
@@ -97,4 +97,4 @@ def action_delete(actionids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("action", actionids)
+    return await zabbix_delete("action", actionids)
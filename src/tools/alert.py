@@ -7,15 +7,15 @@ from src.tools._registry import build_params, zabbix_get
 
 
 @mcp.tool()
-def alert_get(alertids: Optional[List[str]] = None,
-              actionids: Optional[List[str]] = None,
-              eventids: Optional[List[str]] = None,
-              output: Union[str, List[str]] = "extend",
-              time_from: Optional[int] = None,
-              time_till: Optional[int] = None,
-              filter: Optional[Dict[str, Any]] = None,
-              limit: Optional[int] = None,
-              extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def alert_get(alertids: Optional[List[str]] = None,
+                    actionids: Optional[List[str]] = None,
+                    eventids: Optional[List[str]] = None,
+                    output: Union[str, List[str]] = "extend",
+                    time_from: Optional[int] = None,
+                    time_till: Optional[int] = None,
+                    filter: Optional[Dict[str, Any]] = None,
+                    limit: Optional[int] = None,
+                    extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get alerts from Zabbix.
 
     Args:
@@ -36,4 +36,4 @@ def alert_get(alertids: Optional[List[str]] = None,
                   "filter": filter, "limit": limit},
         extra_params=extra_params,
     )
-    return zabbix_get("alert", "get", params)
+    return await zabbix_get("alert", "get", params)
@@ -4,12 +4,12 @@ from src._core import mcp, get_zabbix_client, format_response
 
 
 @mcp.tool()
-def apiinfo_version() -> str:
+async def apiinfo_version() -> str:
     """Get Zabbix API version information.
 
     Returns:
         str: JSON formatted API version info
     """
-    client = get_zabbix_client()
-    result = client.apiinfo.version()
+    client = await get_zabbix_client()
+    result = await client.apiinfo.version()
     return format_response(result)
@@ -7,13 +7,13 @@ from src.tools._registry import build_params, zabbix_get
 
 
 @mcp.tool()
-def auditlog_get(output: Union[str, List[str]] = "extend",
-                 time_from: Optional[int] = None,
-                 time_till: Optional[int] = None,
-                 userids: Optional[List[str]] = None,
-                 filter: Optional[Dict[str, Any]] = None,
-                 limit: Optional[int] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def auditlog_get(output: Union[str, List[str]] = "extend",
+                       time_from: Optional[int] = None,
+                       time_till: Optional[int] = None,
+                       userids: Optional[List[str]] = None,
+                       filter: Optional[Dict[str, Any]] = None,
+                       limit: Optional[int] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get audit log entries from Zabbix.
 
     Args:
@@ -31,4 +31,4 @@ def auditlog_get(output: Union[str, List[str]] = "extend",
                   "userids": userids, "filter": filter, "limit": limit},
         extra_params=extra_params,
     )
-    return zabbix_get("auditlog", "get", params)
+    return await zabbix_get("auditlog", "get", params)
@@ -7,8 +7,8 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write
 
 
 @mcp.tool()
-def authentication_get(output: str = "extend",
-                       extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def authentication_get(output: str = "extend",
+                             extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get authentication settings from Zabbix.
 
     Args:
@@ -20,12 +20,12 @@ def authentication_get(output: str = "extend",
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_get("authentication", "get", params)
+    return await zabbix_get("authentication", "get", params)
 
 
 @mcp.tool()
-def authentication_update(authentication_type: Optional[int] = None,
-                           extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def authentication_update(authentication_type: Optional[int] = None,
+                                 extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update authentication settings in Zabbix.
 
     Args:
@@ -37,4 +37,4 @@ def authentication_update(authentication_type: Optional[int] = None,
         optional={"authentication_type": authentication_type},
         extra_params=extra_params,
     )
-    return zabbix_write("authentication", "update", params)
+    return await zabbix_write("authentication", "update", params)
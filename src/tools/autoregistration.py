@@ -7,8 +7,8 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write
 
 
 @mcp.tool()
-def autoregistration_get(output: str = "extend",
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def autoregistration_get(output: str = "extend",
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get autoregistration configuration from Zabbix.
 
     Args:
@@ -20,14 +20,14 @@ def autoregistration_get(output: str = "extend",
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_get("autoregistration", "get", params)
+    return await zabbix_get("autoregistration", "get", params)
 
 
 @mcp.tool()
-def autoregistration_update(tls_accept: Optional[int] = None,
-                            tls_psk_identity: Optional[str] = None,
-                            tls_psk: Optional[str] = None,
-                            extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def autoregistration_update(tls_accept: Optional[int] = None,
+                                  tls_psk_identity: Optional[str] = None,
+                                  tls_psk: Optional[str] = None,
+                                  extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update autoregistration configuration in Zabbix.
 
     Args:
@@ -42,4 +42,4 @@ def autoregistration_update(tls_accept: Optional[int] = None,
                   "tls_psk": tls_psk},
         extra_params=extra_params,
     )
-    return zabbix_write("autoregistration", "update", params)
+    return await zabbix_write("autoregistration", "update", params)
@@ -0,0 +1,31 @@
+"""Batched read tools for Zabbix MCP Server."""
+
+from typing import Any, Dict, List, Optional
+
+from src._core import mcp
+from src.tools._registry import zabbix_batch
+
+
+@mcp.tool()
+async def batch_get(calls: List[Dict[str, Any]],
+                    response_format: Optional[str] = None) -> str:
+    """Run several independent read calls concurrently and return all results in one response.
+
+    Use instead of separate tool calls when several reads don't depend on
+    each other, e.g. hosts, current problems, triggers and items of a host
+    group. Each call is {"object": "host", "method": "get", "params": {...}}
+    with the same parameters as the Zabbix API method; method defaults to
+    "get" and may also be version, export, getsli, getscriptsbyhosts or
+    getscriptsbyevents. Up to 50 calls; a failing call returns an error
+    without affecting the others.
+
+    Args:
+        calls: Read calls to run, each with object, method and params
+        response_format: pretty, compact or columnar for calls that don't set
+            params.response_format (default: ZABBIX_MCP_RESPONSE_FORMAT)
+
+    Returns:
+        str: JSON formatted results in call order, each with object, method
+            and either result or error
+    """
+    return await zabbix_batch(calls, response_format)
@@ -7,9 +7,9 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write
 
 
 @mcp.tool()
-def configuration_export(format: str = "json",
-                         options: Optional[Dict[str, Any]] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def configuration_export(format: str = "json",
+                               options: Optional[Dict[str, Any]] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Export configuration from Zabbix.
 
     Args:
@@ -25,13 +25,13 @@ def configuration_export(format: str = "json",
         optional={"options": options},
         extra_params=extra_params,
     )
-    return zabbix_get("configuration", "export", params)
+    return await zabbix_get("configuration", "export", params)
 
 
 @mcp.tool()
-def configuration_import(format: str, source: str,
-                         rules: Dict[str, Any],
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def configuration_import(format: str, source: str,
+                               rules: Dict[str, Any],
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Import configuration to Zabbix.
 
     Args:
@@ -48,13 +48,13 @@ def configuration_import(format: str, source: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("configuration", "import_", params)
+    return await zabbix_write("configuration", "import_", params)
 
 
 @mcp.tool()
-def configuration_importcompare(format: str, source: str,
-                                rules: Dict[str, Any],
-                                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def configuration_importcompare(format: str, source: str,
+                                      rules: Dict[str, Any],
+                                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Compare import data with current configuration without applying changes.
 
     Args:
@@ -71,4 +71,4 @@ def configuration_importcompare(format: str, source: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_get("configuration", "importcompare", params)
+    return await zabbix_get("configuration", "importcompare", params)
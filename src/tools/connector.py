@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def connector_get(connectorids: Optional[List[str]] = None,
-                  output: Union[str, List[str]] = "extend",
-                  search: Optional[Dict[str, str]] = None,
-                  filter: Optional[Dict[str, Any]] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def connector_get(connectorids: Optional[List[str]] = None,
+                        output: Union[str, List[str]] = "extend",
+                        search: Optional[Dict[str, str]] = None,
+                        filter: Optional[Dict[str, Any]] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get connectors from Zabbix.
 
     Args:
@@ -26,13 +26,13 @@ def connector_get(connectorids: Optional[List[str]] = None,
         optional={"connectorids": connectorids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("connector", "get", params)
+    return await zabbix_get("connector", "get", params)
 
 
 @mcp.tool()
-def connector_create(name: str, url: str,
-                     data_type: int = 0,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def connector_create(name: str, url: str,
+                           data_type: int = 0,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a connector in Zabbix.
 
     Args:
@@ -46,14 +46,14 @@ def connector_create(name: str, url: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("connector", "create", params)
+    return await zabbix_write("connector", "create", params)
 
 
 @mcp.tool()
-def connector_update(connectorid: str, name: Optional[str] = None,
-                     url: Optional[str] = None,
-                     status: Optional[int] = None,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def connector_update(connectorid: str, name: Optional[str] = None,
+                           url: Optional[str] = None,
+                           status: Optional[int] = None,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a connector in Zabbix.
 
     Args:
@@ -68,14 +68,14 @@ def connector_update(connectorid: str, name: Optional[str] = None,
         optional={"name": name, "url": url, "status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("connector", "update", params)
+    return await zabbix_write("connector", "update", params)
 
 
 @mcp.tool()
-def connector_delete(connectorids: List[str]) -> str:
+async def connector_delete(connectorids: List[str]) -> str:
     """Delete connectors from Zabbix.
 
     Args:
         connectorids: List of connector IDs to delete
     """
-    return zabbix_delete("connector", connectorids)
+    return await zabbix_delete("connector", connectorids)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def correlation_get(correlationids: Optional[List[str]] = None,
-                    output: Union[str, List[str]] = "extend",
-                    search: Optional[Dict[str, str]] = None,
-                    filter: Optional[Dict[str, Any]] = None,
-                    extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def correlation_get(correlationids: Optional[List[str]] = None,
+                          output: Union[str, List[str]] = "extend",
+                          search: Optional[Dict[str, str]] = None,
+                          filter: Optional[Dict[str, Any]] = None,
+                          extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get correlations from Zabbix.
 
     Args:
@@ -26,15 +26,15 @@ def correlation_get(correlationids: Optional[List[str]] = None,
         optional={"correlationids": correlationids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("correlation", "get", params)
+    return await zabbix_get("correlation", "get", params)
 
 
 @mcp.tool()
-def correlation_create(name: str,
-                       filter_: Dict[str, Any],
-                       operations: List[Dict[str, Any]],
-                       description: Optional[str] = None,
-                       extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def correlation_create(name: str,
+                             filter_: Dict[str, Any],
+                             operations: List[Dict[str, Any]],
+                             description: Optional[str] = None,
+                             extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a correlation in Zabbix.
 
     Args:
@@ -49,14 +49,14 @@ def correlation_create(name: str,
         optional={"description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("correlation", "create", params)
+    return await zabbix_write("correlation", "create", params)
 
 
 @mcp.tool()
-def correlation_update(correlationid: str, name: Optional[str] = None,
-                       status: Optional[int] = None,
-                       description: Optional[str] = None,
-                       extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def correlation_update(correlationid: str, name: Optional[str] = None,
+                             status: Optional[int] = None,
+                             description: Optional[str] = None,
+                             extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a correlation in Zabbix.
 
     Args:
@@ -71,14 +71,14 @@ def correlation_update(correlationid: str, name: Optional[str] = None,
         optional={"name": name, "status": status, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("correlation", "update", params)
+    return await zabbix_write("correlation", "update", params)
 
 
 @mcp.tool()
-def correlation_delete(correlationids: List[str]) -> str:
+async def correlation_delete(correlationids: List[str]) -> str:
     """Delete correlations from Zabbix.
 
     Args:
         correlationids: List of correlation IDs to delete
     """
-    return zabbix_delete("correlation", correlationids)
+    return await zabbix_delete("correlation", correlationids)
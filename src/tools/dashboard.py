@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def dashboard_get(dashboardids: Optional[List[str]] = None,
-                  output: Union[str, List[str]] = "extend",
-                  search: Optional[Dict[str, str]] = None,
-                  filter: Optional[Dict[str, Any]] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def dashboard_get(dashboardids: Optional[List[str]] = None,
+                        output: Union[str, List[str]] = "extend",
+                        search: Optional[Dict[str, str]] = None,
+                        filter: Optional[Dict[str, Any]] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get dashboards from Zabbix.
 
     Args:
@@ -29,15 +29,15 @@ def dashboard_get(dashboardids: Optional[List[str]] = None,
         optional={"dashboardids": dashboardids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("dashboard", "get", params)
+    return await zabbix_get("dashboard", "get", params)
 
 
 @mcp.tool()
-def dashboard_create(name: str,
-                     pages: Optional[List[Dict[str, Any]]] = None,
-                     userid: Optional[str] = None,
-                     private_: Optional[int] = None,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def dashboard_create(name: str,
+                           pages: Optional[List[Dict[str, Any]]] = None,
+                           userid: Optional[str] = None,
+                           private_: Optional[int] = None,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new dashboard in Zabbix.
 
     Args:
@@ -55,13 +55,13 @@ def dashboard_create(name: str,
         optional={"pages": pages, "userid": userid, "private": private_},
         extra_params=extra_params,
     )
-    return zabbix_write("dashboard", "create", params)
+    return await zabbix_write("dashboard", "create", params)
 
 
 @mcp.tool()
-def dashboard_update(dashboardid: str, name: Optional[str] = None,
-                     pages: Optional[List[Dict[str, Any]]] = None,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def dashboard_update(dashboardid: str, name: Optional[str] = None,
+                           pages: Optional[List[Dict[str, Any]]] = None,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a dashboard in Zabbix.
 
     Args:
@@ -78,11 +78,11 @@ def dashboard_update(dashboardid: str, name: Optional[str] = None,
         optional={"name": name, "pages": pages},
         extra_params=extra_params,
     )
-    return zabbix_write("dashboard", "update", params)
+    return await zabbix_write("dashboard", "update", params)
 
 
 @mcp.tool()
-def dashboard_delete(dashboardids: List[str]) -> str:
+async def dashboard_delete(dashboardids: List[str]) -> str:
     """Delete dashboards from Zabbix.
 
     Args:
@@ -91,4 +91,4 @@ def dashboard_delete(dashboardids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("dashboard", dashboardids)
+    return await zabbix_delete("dashboard", dashboardids)
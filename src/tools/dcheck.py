@@ -7,10 +7,10 @@ from src.tools._registry import build_params, zabbix_get
 
 
 @mcp.tool()
-def dcheck_get(dcheckids: Optional[List[str]] = None,
-               druleids: Optional[List[str]] = None,
-               output: Union[str, List[str]] = "extend",
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def dcheck_get(dcheckids: Optional[List[str]] = None,
+                     druleids: Optional[List[str]] = None,
+                     output: Union[str, List[str]] = "extend",
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get discovery checks from Zabbix.
 
     Args:
@@ -24,4 +24,4 @@ def dcheck_get(dcheckids: Optional[List[str]] = None,
         optional={"dcheckids": dcheckids, "druleids": druleids},
         extra_params=extra_params,
     )
-    return zabbix_get("dcheck", "get", params)
+    return await zabbix_get("dcheck", "get", params)
@@ -7,10 +7,10 @@ from src.tools._registry import build_params, zabbix_get
 
 
 @mcp.tool()
-def dhost_get(dhostids: Optional[List[str]] = None,
-              druleids: Optional[List[str]] = None,
-              output: Union[str, List[str]] = "extend",
-              extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def dhost_get(dhostids: Optional[List[str]] = None,
+                    druleids: Optional[List[str]] = None,
+                    output: Union[str, List[str]] = "extend",
+                    extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get discovered hosts from Zabbix.
 
     Args:
@@ -24,4 +24,4 @@ def dhost_get(dhostids: Optional[List[str]] = None,
         optional={"dhostids": dhostids, "druleids": druleids},
         extra_params=extra_params,
     )
-    return zabbix_get("dhost", "get", params)
+    return await zabbix_get("dhost", "get", params)
@@ -7,13 +7,13 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def discoveryrule_get(itemids: Optional[List[str]] = None,
-                      hostids: Optional[List[str]] = None,
-                      templateids: Optional[List[str]] = None,
-                      output: Union[str, List[str]] = "extend",
-                      search: Optional[Dict[str, str]] = None,
-                      filter: Optional[Dict[str, Any]] = None,
-                      extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def discoveryrule_get(itemids: Optional[List[str]] = None,
+                            hostids: Optional[List[str]] = None,
+                            templateids: Optional[List[str]] = None,
+                            output: Union[str, List[str]] = "extend",
+                            search: Optional[Dict[str, str]] = None,
+                            filter: Optional[Dict[str, Any]] = None,
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get LLD rules from Zabbix with optional filtering.
 
     Args:
@@ -34,15 +34,15 @@ def discoveryrule_get(itemids: Optional[List[str]] = None,
                   "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("discoveryrule", "get", params)
+    return await zabbix_get("discoveryrule", "get", params)
 
 
 @mcp.tool()
-def discoveryrule_create(name: str, key_: str, hostid: str, type: int,
-                         delay: str = "1h",
-                         lifetime: Optional[str] = None,
-                         description: Optional[str] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def discoveryrule_create(name: str, key_: str, hostid: str, type: int,
+                               delay: str = "1h",
+                               lifetime: Optional[str] = None,
+                               description: Optional[str] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new LLD rule in Zabbix.
 
     Args:
@@ -64,15 +64,15 @@ def discoveryrule_create(name: str, key_: str, hostid: str, type: int,
         optional={"lifetime": lifetime, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("discoveryrule", "create", params)
+    return await zabbix_write("discoveryrule", "create", params)
 
 
 @mcp.tool()
-def discoveryrule_update(itemid: str, name: Optional[str] = None,
-                         key_: Optional[str] = None, delay: Optional[str] = None,
-                         status: Optional[int] = None,
-                         lifetime: Optional[str] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def discoveryrule_update(itemid: str, name: Optional[str] = None,
+                               key_: Optional[str] = None, delay: Optional[str] = None,
+                               status: Optional[int] = None,
+                               lifetime: Optional[str] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing LLD rule in Zabbix.
 
     Args:
@@ -93,11 +93,11 @@ def discoveryrule_update(itemid: str, name: Optional[str] = None,
                   "status": status, "lifetime": lifetime},
         extra_params=extra_params,
     )
-    return zabbix_write("discoveryrule", "update", params)
+    return await zabbix_write("discoveryrule", "update", params)
 
 
 @mcp.tool()
-def discoveryrule_delete(itemids: List[str]) -> str:
+async def discoveryrule_delete(itemids: List[str]) -> str:
     """Delete LLD rules from Zabbix.
 
     Args:
@@ -106,4 +106,4 @@ def discoveryrule_delete(itemids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("discoveryrule", itemids)
+    return await zabbix_delete("discoveryrule", itemids)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def drule_get(druleids: Optional[List[str]] = None,
-              output: Union[str, List[str]] = "extend",
-              search: Optional[Dict[str, str]] = None,
-              filter: Optional[Dict[str, Any]] = None,
-              extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def drule_get(druleids: Optional[List[str]] = None,
+                    output: Union[str, List[str]] = "extend",
+                    search: Optional[Dict[str, str]] = None,
+                    filter: Optional[Dict[str, Any]] = None,
+                    extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get network discovery rules from Zabbix.
 
     Args:
@@ -26,14 +26,14 @@ def drule_get(druleids: Optional[List[str]] = None,
         optional={"druleids": druleids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("drule", "get", params)
+    return await zabbix_get("drule", "get", params)
 
 
 @mcp.tool()
-def drule_create(name: str, iprange: str,
-                 dchecks: List[Dict[str, Any]],
-                 delay: str = "1h",
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def drule_create(name: str, iprange: str,
+                       dchecks: List[Dict[str, Any]],
+                       delay: str = "1h",
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a network discovery rule in Zabbix.
 
     Args:
@@ -48,15 +48,15 @@ def drule_create(name: str, iprange: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("drule", "create", params)
+    return await zabbix_write("drule", "create", params)
 
 
 @mcp.tool()
-def drule_update(druleid: str, name: Optional[str] = None,
-                 iprange: Optional[str] = None,
-                 delay: Optional[str] = None,
-                 status: Optional[int] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def drule_update(druleid: str, name: Optional[str] = None,
+                       iprange: Optional[str] = None,
+                       delay: Optional[str] = None,
+                       status: Optional[int] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a network discovery rule in Zabbix.
 
     Args:
@@ -72,14 +72,14 @@ def drule_update(druleid: str, name: Optional[str] = None,
         optional={"name": name, "iprange": iprange, "delay": delay, "status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("drule", "update", params)
+    return await zabbix_write("drule", "update", params)
 
 
 @mcp.tool()
-def drule_delete(druleids: List[str]) -> str:
+async def drule_delete(druleids: List[str]) -> str:
     """Delete network discovery rules from Zabbix.
 
     Args:
         druleids: List of discovery rule IDs to delete
     """
-    return zabbix_delete("drule", druleids)
+    return await zabbix_delete("drule", druleids)
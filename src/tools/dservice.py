@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get
 
 
 @mcp.tool()
-def dservice_get(dserviceids: Optional[List[str]] = None,
-                 dhostids: Optional[List[str]] = None,
-                 druleids: Optional[List[str]] = None,
-                 output: Union[str, List[str]] = "extend",
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def dservice_get(dserviceids: Optional[List[str]] = None,
+                       dhostids: Optional[List[str]] = None,
+                       druleids: Optional[List[str]] = None,
+                       output: Union[str, List[str]] = "extend",
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get discovered services from Zabbix.
 
     Args:
@@ -26,4 +26,4 @@ def dservice_get(dserviceids: Optional[List[str]] = None,
         optional={"dserviceids": dserviceids, "dhostids": dhostids, "druleids": druleids},
         extra_params=extra_params,
     )
-    return zabbix_get("dservice", "get", params)
+    return await zabbix_get("dservice", "get", params)
@@ -3,19 +3,21 @@
 from typing import Any, Dict, List, Optional, Union
 
 from src._core import mcp
-from src.tools._registry import build_params, zabbix_get, zabbix_write
+from src.tools._registry import build_params, zabbix_get, zabbix_get_page, zabbix_write
 
 
 @mcp.tool()
-def event_get(eventids: Optional[List[str]] = None,
-              groupids: Optional[List[str]] = None,
-              hostids: Optional[List[str]] = None,
-              objectids: Optional[List[str]] = None,
-              output: Union[str, List[str]] = "extend",
-              time_from: Optional[int] = None,
-              time_till: Optional[int] = None,
-              limit: Optional[int] = None,
-              extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def event_get(eventids: Optional[List[str]] = None,
+                    groupids: Optional[List[str]] = None,
+                    hostids: Optional[List[str]] = None,
+                    objectids: Optional[List[str]] = None,
+                    output: Union[str, List[str]] = "extend",
+                    time_from: Optional[int] = None,
+                    time_till: Optional[int] = None,
+                    limit: Optional[int] = None,
+                    page_size: Optional[int] = None,
+                    cursor: Optional[str] = None,
+                    extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get events from Zabbix with optional filtering.
 
     Args:
@@ -27,6 +29,8 @@ def event_get(eventids: Optional[List[str]] = None,
         time_from: Start time (Unix timestamp)
         time_till: End time (Unix timestamp)
         limit: Maximum number of results
+        page_size: Return results in pages of this many rows
+        cursor: next_cursor from a previous page to continue from
         extra_params: Additional Zabbix API parameters
 
     Returns:
@@ -39,13 +43,15 @@ def event_get(eventids: Optional[List[str]] = None,
                   "limit": limit},
         extra_params=extra_params,
     )
-    return zabbix_get("event", "get", params)
+    if page_size is not None or cursor is not None:
+        return await zabbix_get_page("event", params, page_size, cursor)
+    return await zabbix_get("event", "get", params)
 
 
 @mcp.tool()
-def event_acknowledge(eventids: List[str], action: int = 1,
-                      message: Optional[str] = None,
-                      extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def event_acknowledge(eventids: List[str], action: int = 1,
+                            message: Optional[str] = None,
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Acknowledge events in Zabbix.
 
     Args:
@@ -62,4 +68,4 @@ def event_acknowledge(eventids: List[str], action: int = 1,
         optional={"message": message},
         extra_params=extra_params,
     )
-    return zabbix_write("event", "acknowledge", params)
+    return await zabbix_write("event", "acknowledge", params)
@@ -7,13 +7,13 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def graph_get(graphids: Optional[List[str]] = None,
-              hostids: Optional[List[str]] = None,
-              templateids: Optional[List[str]] = None,
-              output: Union[str, List[str]] = "extend",
-              search: Optional[Dict[str, str]] = None,
-              filter: Optional[Dict[str, Any]] = None,
-              extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def graph_get(graphids: Optional[List[str]] = None,
+                    hostids: Optional[List[str]] = None,
+                    templateids: Optional[List[str]] = None,
+                    output: Union[str, List[str]] = "extend",
+                    search: Optional[Dict[str, str]] = None,
+                    filter: Optional[Dict[str, Any]] = None,
+                    extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get graphs from Zabbix with optional filtering.
 
     Args:
@@ -34,14 +34,14 @@ def graph_get(graphids: Optional[List[str]] = None,
                   "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("graph", "get", params)
+    return await zabbix_get("graph", "get", params)
 
 
 @mcp.tool()
-def graph_create(name: str, gitems: List[Dict[str, Any]],
-                 width: Optional[int] = None, height: Optional[int] = None,
-                 graphtype: Optional[int] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def graph_create(name: str, gitems: List[Dict[str, Any]],
+                       width: Optional[int] = None, height: Optional[int] = None,
+                       graphtype: Optional[int] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new graph in Zabbix.
 
     Args:
@@ -60,15 +60,15 @@ def graph_create(name: str, gitems: List[Dict[str, Any]],
         optional={"width": width, "height": height, "graphtype": graphtype},
         extra_params=extra_params,
     )
-    return zabbix_write("graph", "create", params)
+    return await zabbix_write("graph", "create", params)
 
 
 @mcp.tool()
-def graph_update(graphid: str, name: Optional[str] = None,
-                 gitems: Optional[List[Dict[str, Any]]] = None,
-                 width: Optional[int] = None, height: Optional[int] = None,
-                 graphtype: Optional[int] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def graph_update(graphid: str, name: Optional[str] = None,
+                       gitems: Optional[List[Dict[str, Any]]] = None,
+                       width: Optional[int] = None, height: Optional[int] = None,
+                       graphtype: Optional[int] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing graph in Zabbix.
 
     Args:
@@ -89,11 +89,11 @@ def graph_update(graphid: str, name: Optional[str] = None,
                   "height": height, "graphtype": graphtype},
         extra_params=extra_params,
     )
-    return zabbix_write("graph", "update", params)
+    return await zabbix_write("graph", "update", params)
 
 
 @mcp.tool()
-def graph_delete(graphids: List[str]) -> str:
+async def graph_delete(graphids: List[str]) -> str:
     """Delete graphs from Zabbix.
 
     Args:
@@ -102,4 +102,4 @@ def graph_delete(graphids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("graph", graphids)
+    return await zabbix_delete("graph", graphids)
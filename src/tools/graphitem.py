@@ -7,10 +7,10 @@ from src.tools._registry import build_params, zabbix_get
 
 
 @mcp.tool()
-def graphitem_get(graphids: Optional[List[str]] = None,
-                  itemids: Optional[List[str]] = None,
-                  output: Union[str, List[str]] = "extend",
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def graphitem_get(graphids: Optional[List[str]] = None,
+                        itemids: Optional[List[str]] = None,
+                        output: Union[str, List[str]] = "extend",
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get graph items from Zabbix.
 
     Args:
@@ -24,4 +24,4 @@ def graphitem_get(graphids: Optional[List[str]] = None,
         optional={"graphids": graphids, "itemids": itemids},
         extra_params=extra_params,
     )
-    return zabbix_get("graphitem", "get", params)
+    return await zabbix_get("graphitem", "get", params)
@@ -7,13 +7,13 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def graphprototype_get(graphids: Optional[List[str]] = None,
-                       discoveryids: Optional[List[str]] = None,
-                       hostids: Optional[List[str]] = None,
-                       output: Union[str, List[str]] = "extend",
-                       search: Optional[Dict[str, str]] = None,
-                       filter: Optional[Dict[str, Any]] = None,
-                       extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def graphprototype_get(graphids: Optional[List[str]] = None,
+                             discoveryids: Optional[List[str]] = None,
+                             hostids: Optional[List[str]] = None,
+                             output: Union[str, List[str]] = "extend",
+                             search: Optional[Dict[str, str]] = None,
+                             filter: Optional[Dict[str, Any]] = None,
+                             extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get graph prototypes from Zabbix.
 
     Args:
@@ -31,14 +31,14 @@ def graphprototype_get(graphids: Optional[List[str]] = None,
                   "hostids": hostids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("graphprototype", "get", params)
+    return await zabbix_get("graphprototype", "get", params)
 
 
 @mcp.tool()
-def graphprototype_create(name: str, gitems: List[Dict[str, Any]],
-                          width: Optional[int] = None, height: Optional[int] = None,
-                          graphtype: Optional[int] = None,
-                          extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def graphprototype_create(name: str, gitems: List[Dict[str, Any]],
+                                width: Optional[int] = None, height: Optional[int] = None,
+                                graphtype: Optional[int] = None,
+                                extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a graph prototype in Zabbix.
 
     Args:
@@ -54,13 +54,13 @@ def graphprototype_create(name: str, gitems: List[Dict[str, Any]],
         optional={"width": width, "height": height, "graphtype": graphtype},
         extra_params=extra_params,
     )
-    return zabbix_write("graphprototype", "create", params)
+    return await zabbix_write("graphprototype", "create", params)
 
 
 @mcp.tool()
-def graphprototype_update(graphid: str, name: Optional[str] = None,
-                          gitems: Optional[List[Dict[str, Any]]] = None,
-                          extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def graphprototype_update(graphid: str, name: Optional[str] = None,
+                                gitems: Optional[List[Dict[str, Any]]] = None,
+                                extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a graph prototype in Zabbix.
 
     Args:
@@ -74,14 +74,14 @@ def graphprototype_update(graphid: str, name: Optional[str] = None,
         optional={"name": name, "gitems": gitems},
         extra_params=extra_params,
     )
-    return zabbix_write("graphprototype", "update", params)
+    return await zabbix_write("graphprototype", "update", params)
 
 
 @mcp.tool()
-def graphprototype_delete(graphids: List[str]) -> str:
+async def graphprototype_delete(graphids: List[str]) -> str:
     """Delete graph prototypes from Zabbix.
 
     Args:
         graphids: List of graph prototype IDs to delete
     """
-    return zabbix_delete("graphprototype", graphids)
+    return await zabbix_delete("graphprototype", graphids)
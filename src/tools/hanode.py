@@ -7,10 +7,10 @@ from src.tools._registry import build_params, zabbix_get
 
 
 @mcp.tool()
-def hanode_get(ha_nodeids: Optional[List[str]] = None,
-               output: Union[str, List[str]] = "extend",
-               filter: Optional[Dict[str, Any]] = None,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hanode_get(ha_nodeids: Optional[List[str]] = None,
+                     output: Union[str, List[str]] = "extend",
+                     filter: Optional[Dict[str, Any]] = None,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get HA cluster nodes from Zabbix.
 
     Args:
@@ -24,4 +24,4 @@ def hanode_get(ha_nodeids: Optional[List[str]] = None,
         optional={"ha_nodeids": ha_nodeids, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("hanode", "get", params)
+    return await zabbix_get("hanode", "get", params)
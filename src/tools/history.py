@@ -3,17 +3,22 @@
 from typing import Any, Dict, List, Optional
 
 from src._core import mcp
-from src.tools._registry import build_params, zabbix_get, zabbix_write
+from src.tools._registry import (
+    build_params, zabbix_aggregate, zabbix_get, zabbix_get_downsampled, zabbix_get_page,
+    zabbix_get_series, zabbix_write,
+)
 
 
 @mcp.tool()
-def history_get(itemids: List[str], history: int = 0,
-                time_from: Optional[int] = None,
-                time_till: Optional[int] = None,
-                limit: Optional[int] = None,
-                sortfield: str = "clock",
-                sortorder: str = "DESC",
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def history_get(itemids: List[str], history: int = 0,
+                      time_from: Optional[int] = None,
+                      time_till: Optional[int] = None,
+                      limit: Optional[int] = None,
+                      sortfield: str = "clock",
+                      sortorder: str = "DESC",
+                      page_size: Optional[int] = None,
+                      cursor: Optional[str] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get history data from Zabbix.
 
     Args:
@@ -24,6 +29,8 @@ def history_get(itemids: List[str], history: int = 0,
         limit: Maximum number of results
         sortfield: Field to sort by
         sortorder: Sort order (ASC or DESC)
+        page_size: Return results in pages of this many rows (pages are returned oldest first)
+        cursor: next_cursor from a previous page to continue from
         extra_params: Additional Zabbix API parameters
 
     Returns:
@@ -35,12 +42,120 @@ def history_get(itemids: List[str], history: int = 0,
         optional={"time_from": time_from, "time_till": time_till, "limit": limit},
         extra_params=extra_params,
     )
-    return zabbix_get("history", "get", params)
+    if page_size is not None or cursor is not None:
+        return await zabbix_get_page("history", params, page_size, cursor)
+    return await zabbix_get("history", "get", params)
 
 
 @mcp.tool()
-def history_clear(itemids: List[str],
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def history_get_downsampled(itemids: List[str], history: int = 0,
+                                  time_from: Optional[int] = None,
+                                  time_till: Optional[int] = None,
+                                  max_points: int = 500,
+                                  method: str = "lttb",
+                                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+    """Get numeric history reduced to at most max_points points per item.
+
+    Use this instead of history_get for long time ranges: raw samples are read
+    and reduced on the server, so only the downsampled series is returned.
+
+    Args:
+        itemids: List of item IDs to get history for
+        history: History type (0=float, 3=unsigned)
+        time_from: Start time (Unix timestamp)
+        time_till: End time (Unix timestamp)
+        max_points: Maximum points to return per item
+        method: Downsampling method: lttb (keeps the shape of the series),
+            minmax (lowest and highest sample per time bucket, keeps spikes)
+            or avg (mean per time bucket)
+        extra_params: Additional Zabbix API parameters
+
+    Returns:
+        str: JSON formatted per-item points as [clock, value] pairs, oldest first
+    """
+    params = build_params(
+        required={"itemids": itemids, "history": history},
+        optional={"time_from": time_from, "time_till": time_till},
+        extra_params=extra_params,
+    )
+    return await zabbix_get_downsampled(params, max_points, method)
+
+
+@mcp.tool()
+async def history_get_series(itemids: List[str], time_from: int,
+                             time_till: Optional[int] = None,
+                             max_points: Optional[int] = None,
+                             method: str = "lttb",
+                             extra_params: Optional[Dict[str, Any]] = None) -> str:
+    """Get one time series per item, reading old data from trends and recent data from history.
+
+    Prefer this over history_get for windows longer than a few days: the part
+    of the window older than each item's history retention is served from
+    hourly trend averages instead of raw history.
+
+    Args:
+        itemids: List of item IDs to get the series for
+        time_from: Start time (Unix timestamp)
+        time_till: End time (Unix timestamp, default now)
+        max_points: Downsample numeric series to at most this many points per item
+        method: Downsampling method when max_points is set (lttb, minmax or avg)
+        extra_params: Additional parameters (e.g. response_format)
+
+    Returns:
+        str: JSON formatted per-item points as [clock, value] pairs, oldest first,
+        with the trend/history segments they were read from
+    """
+    params = build_params(
+        required={"itemids": itemids, "time_from": time_from},
+        optional={"time_till": time_till},
+        extra_params=extra_params,
+    )
+    return await zabbix_get_series(params, max_points, method)
+
+
+@mcp.tool()
+async def history_aggregate(itemids: List[str], time_from: int,
+                            time_till: Optional[int] = None,
+                            functions: Optional[List[str]] = None,
+                            bucket: Optional[int] = None,
+                            source: str = "history",
+                            history: int = 0,
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
+    """Compute statistics over history or trends on the server, one row per item.
+
+    Use this instead of history_get/trend_get when only summary values are
+    needed (e.g. p95 CPU over the last 24h): raw values never leave the server.
+
+    Args:
+        itemids: List of item IDs to aggregate
+        time_from: Start time (Unix timestamp)
+        time_till: End time (Unix timestamp, default now)
+        functions: Functions to compute: min, max, avg, count, stddev, rate
+            (change per second) and percentiles as pNN, e.g. p95
+            (default: min, max, avg)
+        bucket: Bucket width in seconds for one row per item per bucket
+            (e.g. 3600 for hourly); omit for one row per item
+        source: history (raw values) or trend (hourly rollups, for long ranges)
+        history: History type for source=history (0=float, 3=unsigned)
+        extra_params: Additional Zabbix API parameters
+
+    Returns:
+        str: JSON formatted rows with itemid, clock (bucket start, when bucketing) and one value per function
+    """
+    optional = {"time_till": time_till}
+    if source == "history":
+        optional["history"] = history
+    params = build_params(
+        required={"itemids": itemids, "time_from": time_from},
+        optional=optional,
+        extra_params=extra_params,
+    )
+    return await zabbix_aggregate(source, params, functions or ["min", "max", "avg"], bucket)
+
+
+@mcp.tool()
+async def history_clear(itemids: List[str],
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Clear history data for items.
 
     Args:
@@ -55,12 +170,12 @@ def history_clear(itemids: List[str],
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("history", "clear", params)
+    return await zabbix_write("history", "clear", params)
 
 
 @mcp.tool()
-def history_push(data: List[Dict[str, Any]],
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def history_push(data: List[Dict[str, Any]],
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Push history data to Zabbix.
 
     Args:
@@ -75,4 +190,4 @@ def history_push(data: List[Dict[str, Any]],
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("history", "push", params)
+    return await zabbix_write("history", "push", params)
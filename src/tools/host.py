@@ -7,14 +7,14 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def host_get(hostids: Optional[List[str]] = None,
-             groupids: Optional[List[str]] = None,
-             templateids: Optional[List[str]] = None,
-             output: Union[str, List[str]] = "extend",
-             search: Optional[Dict[str, str]] = None,
-             filter: Optional[Dict[str, Any]] = None,
-             limit: Optional[int] = None,
-             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def host_get(hostids: Optional[List[str]] = None,
+                   groupids: Optional[List[str]] = None,
+                   templateids: Optional[List[str]] = None,
+                   output: Union[str, List[str]] = "extend",
+                   search: Optional[Dict[str, str]] = None,
+                   filter: Optional[Dict[str, Any]] = None,
+                   limit: Optional[int] = None,
+                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get hosts from Zabbix with optional filtering.
 
     Args:
@@ -36,16 +36,16 @@ def host_get(hostids: Optional[List[str]] = None,
                   "search": search, "filter": filter, "limit": limit},
         extra_params=extra_params,
     )
-    return zabbix_get("host", "get", params)
+    return await zabbix_get("host", "get", params)
 
 
 @mcp.tool()
-def host_create(host: str, groups: List[Dict[str, str]],
-                interfaces: List[Dict[str, Any]],
-                templates: Optional[List[Dict[str, str]]] = None,
-                inventory_mode: int = -1,
-                status: int = 0,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def host_create(host: str, groups: List[Dict[str, str]],
+                      interfaces: List[Dict[str, Any]],
+                      templates: Optional[List[Dict[str, str]]] = None,
+                      inventory_mode: int = -1,
+                      status: int = 0,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new host in Zabbix.
 
     Args:
@@ -66,13 +66,13 @@ def host_create(host: str, groups: List[Dict[str, str]],
         optional={"templates": templates},
         extra_params=extra_params,
     )
-    return zabbix_write("host", "create", params)
+    return await zabbix_write("host", "create", params)
 
 
 @mcp.tool()
-def host_update(hostid: str, host: Optional[str] = None,
-                name: Optional[str] = None, status: Optional[int] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def host_update(hostid: str, host: Optional[str] = None,
+                      name: Optional[str] = None, status: Optional[int] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing host in Zabbix.
 
     Args:
@@ -90,11 +90,11 @@ def host_update(hostid: str, host: Optional[str] = None,
         optional={"host": host, "name": name, "status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("host", "update", params)
+    return await zabbix_write("host", "update", params)
 
 
 @mcp.tool()
-def host_delete(hostids: List[str]) -> str:
+async def host_delete(hostids: List[str]) -> str:
     """Delete hosts from Zabbix.
 
     Args:
@@ -103,16 +103,16 @@ def host_delete(hostids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("host", hostids)
+    return await zabbix_delete("host", hostids)
 
 
 @mcp.tool()
-def host_massadd(hosts: List[Dict[str, str]],
-                 groups: Optional[List[Dict[str, str]]] = None,
-                 interfaces: Optional[List[Dict[str, Any]]] = None,
-                 templates: Optional[List[Dict[str, str]]] = None,
-                 macros: Optional[List[Dict[str, str]]] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def host_massadd(hosts: List[Dict[str, str]],
+                       groups: Optional[List[Dict[str, str]]] = None,
+                       interfaces: Optional[List[Dict[str, Any]]] = None,
+                       templates: Optional[List[Dict[str, str]]] = None,
+                       macros: Optional[List[Dict[str, str]]] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass add host groups, templates, macros, or interfaces to hosts.
 
     Args:
@@ -132,16 +132,16 @@ def host_massadd(hosts: List[Dict[str, str]],
                   "templates": templates, "macros": macros},
         extra_params=extra_params,
     )
-    return zabbix_write("host", "massadd", params)
+    return await zabbix_write("host", "massadd", params)
 
 
 @mcp.tool()
-def host_massremove(hostids: List[str],
-                    groupids: Optional[List[str]] = None,
-                    templateids: Optional[List[str]] = None,
-                    templateids_clear: Optional[List[str]] = None,
-                    macros: Optional[List[str]] = None,
-                    extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def host_massremove(hostids: List[str],
+                          groupids: Optional[List[str]] = None,
+                          templateids: Optional[List[str]] = None,
+                          templateids_clear: Optional[List[str]] = None,
+                          macros: Optional[List[str]] = None,
+                          extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass remove host groups, templates, or macros from hosts.
 
     Args:
@@ -161,16 +161,16 @@ def host_massremove(hostids: List[str],
                   "templateids_clear": templateids_clear, "macros": macros},
         extra_params=extra_params,
     )
-    return zabbix_write("host", "massremove", params)
+    return await zabbix_write("host", "massremove", params)
 
 
 @mcp.tool()
-def host_massupdate(hosts: List[Dict[str, str]],
-                    groups: Optional[List[Dict[str, str]]] = None,
-                    templates: Optional[List[Dict[str, str]]] = None,
-                    status: Optional[int] = None,
-                    inventory_mode: Optional[int] = None,
-                    extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def host_massupdate(hosts: List[Dict[str, str]],
+                          groups: Optional[List[Dict[str, str]]] = None,
+                          templates: Optional[List[Dict[str, str]]] = None,
+                          status: Optional[int] = None,
+                          inventory_mode: Optional[int] = None,
+                          extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass update hosts with the same properties.
 
     Args:
@@ -190,4 +190,4 @@ def host_massupdate(hosts: List[Dict[str, str]],
                   "status": status, "inventory_mode": inventory_mode},
         extra_params=extra_params,
     )
-    return zabbix_write("host", "massupdate", params)
+    return await zabbix_write("host", "massupdate", params)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def hostgroup_get(groupids: Optional[List[str]] = None,
-                  output: Union[str, List[str]] = "extend",
-                  search: Optional[Dict[str, str]] = None,
-                  filter: Optional[Dict[str, Any]] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostgroup_get(groupids: Optional[List[str]] = None,
+                        output: Union[str, List[str]] = "extend",
+                        search: Optional[Dict[str, str]] = None,
+                        filter: Optional[Dict[str, Any]] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get host groups from Zabbix.
 
     Args:
@@ -29,12 +29,12 @@ def hostgroup_get(groupids: Optional[List[str]] = None,
         optional={"groupids": groupids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("hostgroup", "get", params)
+    return await zabbix_get("hostgroup", "get", params)
 
 
 @mcp.tool()
-def hostgroup_create(name: str,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostgroup_create(name: str,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new host group in Zabbix.
 
     Args:
@@ -49,12 +49,12 @@ def hostgroup_create(name: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("hostgroup", "create", params)
+    return await zabbix_write("hostgroup", "create", params)
 
 
 @mcp.tool()
-def hostgroup_update(groupid: str, name: str,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostgroup_update(groupid: str, name: str,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing host group in Zabbix.
 
     Args:
@@ -70,11 +70,11 @@ def hostgroup_update(groupid: str, name: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("hostgroup", "update", params)
+    return await zabbix_write("hostgroup", "update", params)
 
 
 @mcp.tool()
-def hostgroup_delete(groupids: List[str]) -> str:
+async def hostgroup_delete(groupids: List[str]) -> str:
     """Delete host groups from Zabbix.
 
     Args:
@@ -83,14 +83,14 @@ def hostgroup_delete(groupids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("hostgroup", groupids)
+    return await zabbix_delete("hostgroup", groupids)
 
 
 @mcp.tool()
-def hostgroup_massadd(groups: List[Dict[str, str]],
-                      hosts: Optional[List[Dict[str, str]]] = None,
-                      templates: Optional[List[Dict[str, str]]] = None,
-                      extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostgroup_massadd(groups: List[Dict[str, str]],
+                            hosts: Optional[List[Dict[str, str]]] = None,
+                            templates: Optional[List[Dict[str, str]]] = None,
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass add hosts or templates to host groups.
 
     Args:
@@ -107,14 +107,14 @@ def hostgroup_massadd(groups: List[Dict[str, str]],
         optional={"hosts": hosts, "templates": templates},
         extra_params=extra_params,
     )
-    return zabbix_write("hostgroup", "massadd", params)
+    return await zabbix_write("hostgroup", "massadd", params)
 
 
 @mcp.tool()
-def hostgroup_massremove(groupids: List[str],
-                         hostids: Optional[List[str]] = None,
-                         templateids: Optional[List[str]] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostgroup_massremove(groupids: List[str],
+                               hostids: Optional[List[str]] = None,
+                               templateids: Optional[List[str]] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass remove hosts or templates from host groups.
 
     Args:
@@ -131,14 +131,14 @@ def hostgroup_massremove(groupids: List[str],
         optional={"hostids": hostids, "templateids": templateids},
         extra_params=extra_params,
     )
-    return zabbix_write("hostgroup", "massremove", params)
+    return await zabbix_write("hostgroup", "massremove", params)
 
 
 @mcp.tool()
-def hostgroup_massupdate(groups: List[Dict[str, str]],
-                         hosts: Optional[List[Dict[str, str]]] = None,
-                         templates: Optional[List[Dict[str, str]]] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostgroup_massupdate(groups: List[Dict[str, str]],
+                               hosts: Optional[List[Dict[str, str]]] = None,
+                               templates: Optional[List[Dict[str, str]]] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass update host groups — replaces all hosts/templates in groups.
 
     Args:
@@ -155,14 +155,14 @@ def hostgroup_massupdate(groups: List[Dict[str, str]],
         optional={"hosts": hosts, "templates": templates},
         extra_params=extra_params,
     )
-    return zabbix_write("hostgroup", "massupdate", params)
+    return await zabbix_write("hostgroup", "massupdate", params)
 
 
 @mcp.tool()
-def hostgroup_propagate(groups: List[Dict[str, str]],
-                        permissions: bool = False,
-                        tag_filters: bool = False,
-                        extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostgroup_propagate(groups: List[Dict[str, str]],
+                              permissions: bool = False,
+                              tag_filters: bool = False,
+                              extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Propagate permissions and tag filters to child host groups.
 
     Args:
@@ -180,4 +180,4 @@ def hostgroup_propagate(groups: List[Dict[str, str]],
                   "tag_filters": tag_filters if tag_filters else None},
         extra_params=extra_params,
     )
-    return zabbix_write("hostgroup", "propagate", params)
+    return await zabbix_write("hostgroup", "propagate", params)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def hostinterface_get(interfaceids: Optional[List[str]] = None,
-                      hostids: Optional[List[str]] = None,
-                      output: Union[str, List[str]] = "extend",
-                      filter: Optional[Dict[str, Any]] = None,
-                      extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostinterface_get(interfaceids: Optional[List[str]] = None,
+                            hostids: Optional[List[str]] = None,
+                            output: Union[str, List[str]] = "extend",
+                            filter: Optional[Dict[str, Any]] = None,
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get host interfaces from Zabbix.
 
     Args:
@@ -29,13 +29,13 @@ def hostinterface_get(interfaceids: Optional[List[str]] = None,
         optional={"interfaceids": interfaceids, "hostids": hostids, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("hostinterface", "get", params)
+    return await zabbix_get("hostinterface", "get", params)
 
 
 @mcp.tool()
-def hostinterface_create(hostid: str, type: int, main: int, useip: int,
-                         ip: str = "", dns: str = "", port: str = "",
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostinterface_create(hostid: str, type: int, main: int, useip: int,
+                               ip: str = "", dns: str = "", port: str = "",
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new host interface in Zabbix.
 
     Args:
@@ -57,15 +57,15 @@ def hostinterface_create(hostid: str, type: int, main: int, useip: int,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("hostinterface", "create", params)
+    return await zabbix_write("hostinterface", "create", params)
 
 
 @mcp.tool()
-def hostinterface_update(interfaceid: str, type: Optional[int] = None,
-                         main: Optional[int] = None, useip: Optional[int] = None,
-                         ip: Optional[str] = None, dns: Optional[str] = None,
-                         port: Optional[str] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostinterface_update(interfaceid: str, type: Optional[int] = None,
+                               main: Optional[int] = None, useip: Optional[int] = None,
+                               ip: Optional[str] = None, dns: Optional[str] = None,
+                               port: Optional[str] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a host interface in Zabbix.
 
     Args:
@@ -87,11 +87,11 @@ def hostinterface_update(interfaceid: str, type: Optional[int] = None,
                   "ip": ip, "dns": dns, "port": port},
         extra_params=extra_params,
     )
-    return zabbix_write("hostinterface", "update", params)
+    return await zabbix_write("hostinterface", "update", params)
 
 
 @mcp.tool()
-def hostinterface_delete(interfaceids: List[str]) -> str:
+async def hostinterface_delete(interfaceids: List[str]) -> str:
     """Delete host interfaces from Zabbix.
 
     Args:
@@ -100,13 +100,13 @@ def hostinterface_delete(interfaceids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("hostinterface", interfaceids)
+    return await zabbix_delete("hostinterface", interfaceids)
 
 
 @mcp.tool()
-def hostinterface_massadd(hosts: List[Dict[str, str]],
-                          interfaces: List[Dict[str, Any]],
-                          extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostinterface_massadd(hosts: List[Dict[str, str]],
+                                interfaces: List[Dict[str, Any]],
+                                extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass add interfaces to hosts.
 
     Args:
@@ -122,13 +122,13 @@ def hostinterface_massadd(hosts: List[Dict[str, str]],
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("hostinterface", "massadd", params)
+    return await zabbix_write("hostinterface", "massadd", params)
 
 
 @mcp.tool()
-def hostinterface_massremove(hostids: List[str],
-                             interfaceids: List[str],
-                             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostinterface_massremove(hostids: List[str],
+                                   interfaceids: List[str],
+                                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass remove interfaces from hosts.
 
     Args:
@@ -144,13 +144,13 @@ def hostinterface_massremove(hostids: List[str],
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("hostinterface", "massremove", params)
+    return await zabbix_write("hostinterface", "massremove", params)
 
 
 @mcp.tool()
-def hostinterface_replacehostinterfaces(hostid: str,
-                                        interfaces: List[Dict[str, Any]],
-                                        extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostinterface_replacehostinterfaces(hostid: str,
+                                              interfaces: List[Dict[str, Any]],
+                                              extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Replace all interfaces on a host.
 
     Args:
@@ -166,4 +166,4 @@ def hostinterface_replacehostinterfaces(hostid: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("hostinterface", "replacehostinterfaces", params)
+    return await zabbix_write("hostinterface", "replacehostinterfaces", params)
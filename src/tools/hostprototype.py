@@ -7,12 +7,12 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def hostprototype_get(hostids: Optional[List[str]] = None,
-                      discoveryids: Optional[List[str]] = None,
-                      output: Union[str, List[str]] = "extend",
-                      search: Optional[Dict[str, str]] = None,
-                      filter: Optional[Dict[str, Any]] = None,
-                      extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostprototype_get(hostids: Optional[List[str]] = None,
+                            discoveryids: Optional[List[str]] = None,
+                            output: Union[str, List[str]] = "extend",
+                            search: Optional[Dict[str, str]] = None,
+                            filter: Optional[Dict[str, Any]] = None,
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get host prototypes from Zabbix.
 
     Args:
@@ -29,14 +29,14 @@ def hostprototype_get(hostids: Optional[List[str]] = None,
                   "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("hostprototype", "get", params)
+    return await zabbix_get("hostprototype", "get", params)
 
 
 @mcp.tool()
-def hostprototype_create(host: str, ruleid: str,
-                         groupLinks: List[Dict[str, str]],
-                         status: int = 0,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostprototype_create(host: str, ruleid: str,
+                               groupLinks: List[Dict[str, str]],
+                               status: int = 0,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a host prototype in Zabbix.
 
     Args:
@@ -51,13 +51,13 @@ def hostprototype_create(host: str, ruleid: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("hostprototype", "create", params)
+    return await zabbix_write("hostprototype", "create", params)
 
 
 @mcp.tool()
-def hostprototype_update(hostid: str, host: Optional[str] = None,
-                         status: Optional[int] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def hostprototype_update(hostid: str, host: Optional[str] = None,
+                               status: Optional[int] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a host prototype in Zabbix.
 
     Args:
@@ -71,14 +71,14 @@ def hostprototype_update(hostid: str, host: Optional[str] = None,
         optional={"host": host, "status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("hostprototype", "update", params)
+    return await zabbix_write("hostprototype", "update", params)
 
 
 @mcp.tool()
-def hostprototype_delete(hostids: List[str]) -> str:
+async def hostprototype_delete(hostids: List[str]) -> str:
     """Delete host prototypes from Zabbix.
 
     Args:
         hostids: List of host prototype IDs to delete
     """
-    return zabbix_delete("hostprototype", hostids)
+    return await zabbix_delete("hostprototype", hostids)
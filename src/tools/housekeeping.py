@@ -7,8 +7,8 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write
 
 
 @mcp.tool()
-def housekeeping_get(output: str = "extend",
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def housekeeping_get(output: str = "extend",
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get housekeeping settings from Zabbix.
 
     Args:
@@ -20,11 +20,11 @@ def housekeeping_get(output: str = "extend",
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_get("housekeeping", "get", params)
+    return await zabbix_get("housekeeping", "get", params)
 
 
 @mcp.tool()
-def housekeeping_update(extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def housekeeping_update(extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update housekeeping settings in Zabbix. Pass settings via extra_params.
 
     Args:
@@ -35,4 +35,4 @@ def housekeeping_update(extra_params: Optional[Dict[str, Any]] = None) -> str:
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("housekeeping", "update", params)
+    return await zabbix_write("housekeeping", "update", params)
@@ -7,12 +7,12 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def httptest_get(httptestids: Optional[List[str]] = None,
-                 hostids: Optional[List[str]] = None,
-                 output: Union[str, List[str]] = "extend",
-                 search: Optional[Dict[str, str]] = None,
-                 filter: Optional[Dict[str, Any]] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def httptest_get(httptestids: Optional[List[str]] = None,
+                       hostids: Optional[List[str]] = None,
+                       output: Union[str, List[str]] = "extend",
+                       search: Optional[Dict[str, str]] = None,
+                       filter: Optional[Dict[str, Any]] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get web scenarios from Zabbix.
 
     Args:
@@ -29,14 +29,14 @@ def httptest_get(httptestids: Optional[List[str]] = None,
                   "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("httptest", "get", params)
+    return await zabbix_get("httptest", "get", params)
 
 
 @mcp.tool()
-def httptest_create(name: str, hostid: str,
-                    steps: List[Dict[str, Any]],
-                    delay: str = "1m",
-                    extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def httptest_create(name: str, hostid: str,
+                          steps: List[Dict[str, Any]],
+                          delay: str = "1m",
+                          extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a web scenario in Zabbix.
 
     Args:
@@ -51,14 +51,14 @@ def httptest_create(name: str, hostid: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("httptest", "create", params)
+    return await zabbix_write("httptest", "create", params)
 
 
 @mcp.tool()
-def httptest_update(httptestid: str, name: Optional[str] = None,
-                    steps: Optional[List[Dict[str, Any]]] = None,
-                    status: Optional[int] = None,
-                    extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def httptest_update(httptestid: str, name: Optional[str] = None,
+                          steps: Optional[List[Dict[str, Any]]] = None,
+                          status: Optional[int] = None,
+                          extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a web scenario in Zabbix.
 
     Args:
@@ -73,14 +73,14 @@ def httptest_update(httptestid: str, name: Optional[str] = None,
         optional={"name": name, "steps": steps, "status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("httptest", "update", params)
+    return await zabbix_write("httptest", "update", params)
 
 
 @mcp.tool()
-def httptest_delete(httptestids: List[str]) -> str:
+async def httptest_delete(httptestids: List[str]) -> str:
     """Delete web scenarios from Zabbix.
 
     Args:
         httptestids: List of web scenario IDs to delete
     """
-    return zabbix_delete("httptest", httptestids)
+    return await zabbix_delete("httptest", httptestids)
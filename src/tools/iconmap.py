@@ -7,10 +7,10 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def iconmap_get(iconmapids: Optional[List[str]] = None,
-                output: Union[str, List[str]] = "extend",
-                search: Optional[Dict[str, str]] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def iconmap_get(iconmapids: Optional[List[str]] = None,
+                      output: Union[str, List[str]] = "extend",
+                      search: Optional[Dict[str, str]] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get icon maps from Zabbix.
 
     Args:
@@ -24,13 +24,13 @@ def iconmap_get(iconmapids: Optional[List[str]] = None,
         optional={"iconmapids": iconmapids, "search": search},
         extra_params=extra_params,
     )
-    return zabbix_get("iconmap", "get", params)
+    return await zabbix_get("iconmap", "get", params)
 
 
 @mcp.tool()
-def iconmap_create(name: str, default_iconid: str,
-                   mappings: List[Dict[str, Any]],
-                   extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def iconmap_create(name: str, default_iconid: str,
+                         mappings: List[Dict[str, Any]],
+                         extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create an icon map in Zabbix.
 
     Args:
@@ -44,13 +44,13 @@ def iconmap_create(name: str, default_iconid: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("iconmap", "create", params)
+    return await zabbix_write("iconmap", "create", params)
 
 
 @mcp.tool()
-def iconmap_update(iconmapid: str, name: Optional[str] = None,
-                   default_iconid: Optional[str] = None,
-                   extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def iconmap_update(iconmapid: str, name: Optional[str] = None,
+                         default_iconid: Optional[str] = None,
+                         extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an icon map in Zabbix.
 
     Args:
@@ -64,14 +64,14 @@ def iconmap_update(iconmapid: str, name: Optional[str] = None,
         optional={"name": name, "default_iconid": default_iconid},
         extra_params=extra_params,
     )
-    return zabbix_write("iconmap", "update", params)
+    return await zabbix_write("iconmap", "update", params)
 
 
 @mcp.tool()
-def iconmap_delete(iconmapids: List[str]) -> str:
+async def iconmap_delete(iconmapids: List[str]) -> str:
     """Delete icon maps from Zabbix.
 
     Args:
         iconmapids: List of icon map IDs to delete
     """
-    return zabbix_delete("iconmap", iconmapids)
+    return await zabbix_delete("iconmap", iconmapids)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def image_get(imageids: Optional[List[str]] = None,
-              output: Union[str, List[str]] = "extend",
-              search: Optional[Dict[str, str]] = None,
-              filter: Optional[Dict[str, Any]] = None,
-              extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def image_get(imageids: Optional[List[str]] = None,
+                    output: Union[str, List[str]] = "extend",
+                    search: Optional[Dict[str, str]] = None,
+                    filter: Optional[Dict[str, Any]] = None,
+                    extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get images from Zabbix.
 
     Args:
@@ -26,12 +26,12 @@ def image_get(imageids: Optional[List[str]] = None,
         optional={"imageids": imageids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("image", "get", params)
+    return await zabbix_get("image", "get", params)
 
 
 @mcp.tool()
-def image_create(name: str, imagetype: int, image: str,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def image_create(name: str, imagetype: int, image: str,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create an image in Zabbix.
 
     Args:
@@ -45,13 +45,13 @@ def image_create(name: str, imagetype: int, image: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("image", "create", params)
+    return await zabbix_write("image", "create", params)
 
 
 @mcp.tool()
-def image_update(imageid: str, name: Optional[str] = None,
-                 image: Optional[str] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def image_update(imageid: str, name: Optional[str] = None,
+                       image: Optional[str] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an image in Zabbix.
 
     Args:
@@ -65,14 +65,14 @@ def image_update(imageid: str, name: Optional[str] = None,
         optional={"name": name, "image": image},
         extra_params=extra_params,
     )
-    return zabbix_write("image", "update", params)
+    return await zabbix_write("image", "update", params)
 
 
 @mcp.tool()
-def image_delete(imageids: List[str]) -> str:
+async def image_delete(imageids: List[str]) -> str:
     """Delete images from Zabbix.
 
     Args:
         imageids: List of image IDs to delete
     """
-    return zabbix_delete("image", imageids)
+    return await zabbix_delete("image", imageids)
@@ -3,19 +3,21 @@
 from typing import Any, Dict, List, Optional, Union
 
 from src._core import mcp
-from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_delete
+from src.tools._registry import build_params, zabbix_get, zabbix_get_page, zabbix_write, zabbix_delete
 
 
 @mcp.tool()
-def item_get(itemids: Optional[List[str]] = None,
-             hostids: Optional[List[str]] = None,
-             groupids: Optional[List[str]] = None,
-             templateids: Optional[List[str]] = None,
-             output: Union[str, List[str]] = "extend",
-             search: Optional[Dict[str, str]] = None,
-             filter: Optional[Dict[str, Any]] = None,
-             limit: Optional[int] = None,
-             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def item_get(itemids: Optional[List[str]] = None,
+                   hostids: Optional[List[str]] = None,
+                   groupids: Optional[List[str]] = None,
+                   templateids: Optional[List[str]] = None,
+                   output: Union[str, List[str]] = "extend",
+                   search: Optional[Dict[str, str]] = None,
+                   filter: Optional[Dict[str, Any]] = None,
+                   limit: Optional[int] = None,
+                   page_size: Optional[int] = None,
+                   cursor: Optional[str] = None,
+                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get items from Zabbix with optional filtering.
 
     Args:
@@ -27,6 +29,8 @@ def item_get(itemids: Optional[List[str]] = None,
         search: Search criteria
         filter: Filter criteria
         limit: Maximum number of results
+        page_size: Return results in pages of this many rows
+        cursor: next_cursor from a previous page to continue from
         extra_params: Additional Zabbix API parameters
 
     Returns:
@@ -39,15 +43,17 @@ def item_get(itemids: Optional[List[str]] = None,
                   "limit": limit},
         extra_params=extra_params,
     )
-    return zabbix_get("item", "get", params)
+    if page_size is not None or cursor is not None:
+        return await zabbix_get_page("item", params, page_size, cursor)
+    return await zabbix_get("item", "get", params)
 
 
 @mcp.tool()
-def item_create(name: str, key_: str, hostid: str, type: int,
-                value_type: int, delay: str = "1m",
-                units: Optional[str] = None,
-                description: Optional[str] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def item_create(name: str, key_: str, hostid: str, type: int,
+                      value_type: int, delay: str = "1m",
+                      units: Optional[str] = None,
+                      description: Optional[str] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new item in Zabbix.
 
     Args:
@@ -70,14 +76,14 @@ def item_create(name: str, key_: str, hostid: str, type: int,
         optional={"units": units, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("item", "create", params)
+    return await zabbix_write("item", "create", params)
 
 
 @mcp.tool()
-def item_update(itemid: str, name: Optional[str] = None,
-                key_: Optional[str] = None, delay: Optional[str] = None,
-                status: Optional[int] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def item_update(itemid: str, name: Optional[str] = None,
+                      key_: Optional[str] = None, delay: Optional[str] = None,
+                      status: Optional[int] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing item in Zabbix.
 
     Args:
@@ -96,11 +102,11 @@ def item_update(itemid: str, name: Optional[str] = None,
         optional={"name": name, "key_": key_, "delay": delay, "status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("item", "update", params)
+    return await zabbix_write("item", "update", params)
 
 
 @mcp.tool()
-def item_delete(itemids: List[str]) -> str:
+async def item_delete(itemids: List[str]) -> str:
     """Delete items from Zabbix.
 
     Args:
@@ -109,4 +115,4 @@ def item_delete(itemids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("item", itemids)
+    return await zabbix_delete("item", itemids)
@@ -7,13 +7,13 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def itemprototype_get(itemids: Optional[List[str]] = None,
-                      discoveryids: Optional[List[str]] = None,
-                      hostids: Optional[List[str]] = None,
-                      output: Union[str, List[str]] = "extend",
-                      search: Optional[Dict[str, str]] = None,
-                      filter: Optional[Dict[str, Any]] = None,
-                      extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def itemprototype_get(itemids: Optional[List[str]] = None,
+                            discoveryids: Optional[List[str]] = None,
+                            hostids: Optional[List[str]] = None,
+                            output: Union[str, List[str]] = "extend",
+                            search: Optional[Dict[str, str]] = None,
+                            filter: Optional[Dict[str, Any]] = None,
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get item prototypes from Zabbix with optional filtering.
 
     Args:
@@ -34,15 +34,15 @@ def itemprototype_get(itemids: Optional[List[str]] = None,
                   "hostids": hostids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("itemprototype", "get", params)
+    return await zabbix_get("itemprototype", "get", params)
 
 
 @mcp.tool()
-def itemprototype_create(name: str, key_: str, hostid: str, ruleid: str,
-                         type: int, value_type: int, delay: str = "1m",
-                         units: Optional[str] = None,
-                         description: Optional[str] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def itemprototype_create(name: str, key_: str, hostid: str, ruleid: str,
+                               type: int, value_type: int, delay: str = "1m",
+                               units: Optional[str] = None,
+                               description: Optional[str] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new item prototype in Zabbix.
 
     Args:
@@ -66,14 +66,14 @@ def itemprototype_create(name: str, key_: str, hostid: str, ruleid: str,
         optional={"units": units, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("itemprototype", "create", params)
+    return await zabbix_write("itemprototype", "create", params)
 
 
 @mcp.tool()
-def itemprototype_update(itemid: str, name: Optional[str] = None,
-                         key_: Optional[str] = None, delay: Optional[str] = None,
-                         status: Optional[int] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def itemprototype_update(itemid: str, name: Optional[str] = None,
+                               key_: Optional[str] = None, delay: Optional[str] = None,
+                               status: Optional[int] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing item prototype in Zabbix.
 
     Args:
@@ -92,11 +92,11 @@ def itemprototype_update(itemid: str, name: Optional[str] = None,
         optional={"name": name, "key_": key_, "delay": delay, "status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("itemprototype", "update", params)
+    return await zabbix_write("itemprototype", "update", params)
 
 
 @mcp.tool()
-def itemprototype_delete(itemids: List[str]) -> str:
+async def itemprototype_delete(itemids: List[str]) -> str:
     """Delete item prototypes from Zabbix.
 
     Args:
@@ -105,4 +105,4 @@ def itemprototype_delete(itemids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("itemprototype", itemids)
+    return await zabbix_delete("itemprototype", itemids)
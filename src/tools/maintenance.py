@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def maintenance_get(maintenanceids: Optional[List[str]] = None,
-                    groupids: Optional[List[str]] = None,
-                    hostids: Optional[List[str]] = None,
-                    output: Union[str, List[str]] = "extend",
-                    extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def maintenance_get(maintenanceids: Optional[List[str]] = None,
+                          groupids: Optional[List[str]] = None,
+                          hostids: Optional[List[str]] = None,
+                          output: Union[str, List[str]] = "extend",
+                          extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get maintenance periods from Zabbix.
 
     Args:
@@ -30,16 +30,16 @@ def maintenance_get(maintenanceids: Optional[List[str]] = None,
                   "hostids": hostids},
         extra_params=extra_params,
     )
-    return zabbix_get("maintenance", "get", params)
+    return await zabbix_get("maintenance", "get", params)
 
 
 @mcp.tool()
-def maintenance_create(name: str, active_since: int, active_till: int,
-                       groupids: Optional[List[str]] = None,
-                       hostids: Optional[List[str]] = None,
-                       timeperiods: Optional[List[Dict[str, Any]]] = None,
-                       description: Optional[str] = None,
-                       extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def maintenance_create(name: str, active_since: int, active_till: int,
+                             groupids: Optional[List[str]] = None,
+                             hostids: Optional[List[str]] = None,
+                             timeperiods: Optional[List[Dict[str, Any]]] = None,
+                             description: Optional[str] = None,
+                             extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new maintenance period in Zabbix.
 
     Args:
@@ -61,14 +61,14 @@ def maintenance_create(name: str, active_since: int, active_till: int,
                   "timeperiods": timeperiods, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("maintenance", "create", params)
+    return await zabbix_write("maintenance", "create", params)
 
 
 @mcp.tool()
-def maintenance_update(maintenanceid: str, name: Optional[str] = None,
-                       active_since: Optional[int] = None, active_till: Optional[int] = None,
-                       description: Optional[str] = None,
-                       extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def maintenance_update(maintenanceid: str, name: Optional[str] = None,
+                             active_since: Optional[int] = None, active_till: Optional[int] = None,
+                             description: Optional[str] = None,
+                             extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing maintenance period in Zabbix.
 
     Args:
@@ -88,11 +88,11 @@ def maintenance_update(maintenanceid: str, name: Optional[str] = None,
                   "active_till": active_till, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("maintenance", "update", params)
+    return await zabbix_write("maintenance", "update", params)
 
 
 @mcp.tool()
-def maintenance_delete(maintenanceids: List[str]) -> str:
+async def maintenance_delete(maintenanceids: List[str]) -> str:
     """Delete maintenance periods from Zabbix.
 
     Args:
@@ -101,4 +101,4 @@ def maintenance_delete(maintenanceids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("maintenance", maintenanceids)
+    return await zabbix_delete("maintenance", maintenanceids)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def map_get(sysmapids: Optional[List[str]] = None,
-            output: Union[str, List[str]] = "extend",
-            search: Optional[Dict[str, str]] = None,
-            filter: Optional[Dict[str, Any]] = None,
-            extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def map_get(sysmapids: Optional[List[str]] = None,
+                  output: Union[str, List[str]] = "extend",
+                  search: Optional[Dict[str, str]] = None,
+                  filter: Optional[Dict[str, Any]] = None,
+                  extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get maps from Zabbix.
 
     Args:
@@ -26,12 +26,12 @@ def map_get(sysmapids: Optional[List[str]] = None,
         optional={"sysmapids": sysmapids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("map", "get", params)
+    return await zabbix_get("map", "get", params)
 
 
 @mcp.tool()
-def map_create(name: str, width: int = 800, height: int = 600,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def map_create(name: str, width: int = 800, height: int = 600,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a map in Zabbix.
 
     Args:
@@ -45,13 +45,13 @@ def map_create(name: str, width: int = 800, height: int = 600,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("map", "create", params)
+    return await zabbix_write("map", "create", params)
 
 
 @mcp.tool()
-def map_update(sysmapid: str, name: Optional[str] = None,
-               width: Optional[int] = None, height: Optional[int] = None,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def map_update(sysmapid: str, name: Optional[str] = None,
+                     width: Optional[int] = None, height: Optional[int] = None,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a map in Zabbix.
 
     Args:
@@ -66,14 +66,14 @@ def map_update(sysmapid: str, name: Optional[str] = None,
         optional={"name": name, "width": width, "height": height},
         extra_params=extra_params,
     )
-    return zabbix_write("map", "update", params)
+    return await zabbix_write("map", "update", params)
 
 
 @mcp.tool()
-def map_delete(sysmapids: List[str]) -> str:
+async def map_delete(sysmapids: List[str]) -> str:
     """Delete maps from Zabbix.
 
     Args:
         sysmapids: List of map IDs to delete
     """
-    return zabbix_delete("map", sysmapids)
+    return await zabbix_delete("map", sysmapids)
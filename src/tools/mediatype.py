@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def mediatype_get(mediatypeids: Optional[List[str]] = None,
-                  output: Union[str, List[str]] = "extend",
-                  search: Optional[Dict[str, str]] = None,
-                  filter: Optional[Dict[str, Any]] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def mediatype_get(mediatypeids: Optional[List[str]] = None,
+                        output: Union[str, List[str]] = "extend",
+                        search: Optional[Dict[str, str]] = None,
+                        filter: Optional[Dict[str, Any]] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get media types from Zabbix.
 
     Args:
@@ -29,13 +29,13 @@ def mediatype_get(mediatypeids: Optional[List[str]] = None,
         optional={"mediatypeids": mediatypeids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("mediatype", "get", params)
+    return await zabbix_get("mediatype", "get", params)
 
 
 @mcp.tool()
-def mediatype_create(name: str, type: int,
-                     description: Optional[str] = None,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def mediatype_create(name: str, type: int,
+                           description: Optional[str] = None,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new media type in Zabbix.
 
     Args:
@@ -52,15 +52,15 @@ def mediatype_create(name: str, type: int,
         optional={"description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("mediatype", "create", params)
+    return await zabbix_write("mediatype", "create", params)
 
 
 @mcp.tool()
-def mediatype_update(mediatypeid: str, name: Optional[str] = None,
-                     type: Optional[int] = None,
-                     status: Optional[int] = None,
-                     description: Optional[str] = None,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def mediatype_update(mediatypeid: str, name: Optional[str] = None,
+                           type: Optional[int] = None,
+                           status: Optional[int] = None,
+                           description: Optional[str] = None,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a media type in Zabbix.
 
     Args:
@@ -80,11 +80,11 @@ def mediatype_update(mediatypeid: str, name: Optional[str] = None,
                   "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("mediatype", "update", params)
+    return await zabbix_write("mediatype", "update", params)
 
 
 @mcp.tool()
-def mediatype_delete(mediatypeids: List[str]) -> str:
+async def mediatype_delete(mediatypeids: List[str]) -> str:
     """Delete media types from Zabbix.
 
     Args:
@@ -93,4 +93,4 @@ def mediatype_delete(mediatypeids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("mediatype", mediatypeids)
+    return await zabbix_delete("mediatype", mediatypeids)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def module_get(moduleids: Optional[List[str]] = None,
-               output: Union[str, List[str]] = "extend",
-               search: Optional[Dict[str, str]] = None,
-               filter: Optional[Dict[str, Any]] = None,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def module_get(moduleids: Optional[List[str]] = None,
+                     output: Union[str, List[str]] = "extend",
+                     search: Optional[Dict[str, str]] = None,
+                     filter: Optional[Dict[str, Any]] = None,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get modules from Zabbix.
 
     Args:
@@ -26,13 +26,13 @@ def module_get(moduleids: Optional[List[str]] = None,
         optional={"moduleids": moduleids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("module", "get", params)
+    return await zabbix_get("module", "get", params)
 
 
 @mcp.tool()
-def module_create(id: str, relative_path: str,
-                  status: int = 1,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def module_create(id: str, relative_path: str,
+                        status: int = 1,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a module in Zabbix.
 
     Args:
@@ -46,12 +46,12 @@ def module_create(id: str, relative_path: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("module", "create", params)
+    return await zabbix_write("module", "create", params)
 
 
 @mcp.tool()
-def module_update(moduleid: str, status: Optional[int] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def module_update(moduleid: str, status: Optional[int] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a module in Zabbix.
 
     Args:
@@ -64,14 +64,14 @@ def module_update(moduleid: str, status: Optional[int] = None,
         optional={"status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("module", "update", params)
+    return await zabbix_write("module", "update", params)
 
 
 @mcp.tool()
-def module_delete(moduleids: List[str]) -> str:
+async def module_delete(moduleids: List[str]) -> str:
     """Delete modules from Zabbix.
 
     Args:
         moduleids: List of module IDs to delete
     """
-    return zabbix_delete("module", moduleids)
+    return await zabbix_delete("module", moduleids)
@@ -7,17 +7,17 @@ from src.tools._registry import build_params, zabbix_get
 
 
 @mcp.tool()
-def problem_get(eventids: Optional[List[str]] = None,
-                groupids: Optional[List[str]] = None,
-                hostids: Optional[List[str]] = None,
-                objectids: Optional[List[str]] = None,
-                output: Union[str, List[str]] = "extend",
-                time_from: Optional[int] = None,
-                time_till: Optional[int] = None,
-                recent: bool = False,
-                severities: Optional[List[int]] = None,
-                limit: Optional[int] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def problem_get(eventids: Optional[List[str]] = None,
+                      groupids: Optional[List[str]] = None,
+                      hostids: Optional[List[str]] = None,
+                      objectids: Optional[List[str]] = None,
+                      output: Union[str, List[str]] = "extend",
+                      time_from: Optional[int] = None,
+                      time_till: Optional[int] = None,
+                      recent: bool = False,
+                      severities: Optional[List[int]] = None,
+                      limit: Optional[int] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get problems from Zabbix with optional filtering.
 
     Args:
@@ -44,4 +44,4 @@ def problem_get(eventids: Optional[List[str]] = None,
                   "limit": limit},
         extra_params=extra_params,
     )
-    return zabbix_get("problem", "get", params)
+    return await zabbix_get("problem", "get", params)
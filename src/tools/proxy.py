@@ -7,12 +7,12 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def proxy_get(proxyids: Optional[List[str]] = None,
-              output: str = "extend",
-              search: Optional[Dict[str, str]] = None,
-              filter: Optional[Dict[str, Any]] = None,
-              limit: Optional[int] = None,
-              extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def proxy_get(proxyids: Optional[List[str]] = None,
+                    output: str = "extend",
+                    search: Optional[Dict[str, str]] = None,
+                    filter: Optional[Dict[str, Any]] = None,
+                    limit: Optional[int] = None,
+                    extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get proxies from Zabbix with optional filtering.
 
     Args:
@@ -32,15 +32,15 @@ def proxy_get(proxyids: Optional[List[str]] = None,
                   "limit": limit},
         extra_params=extra_params,
     )
-    return zabbix_get("proxy", "get", params)
+    return await zabbix_get("proxy", "get", params)
 
 
 @mcp.tool()
-def proxy_create(host: str, status: int = 5,
-                 description: Optional[str] = None,
-                 tls_connect: int = 1,
-                 tls_accept: int = 1,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def proxy_create(host: str, status: int = 5,
+                       description: Optional[str] = None,
+                       tls_connect: int = 1,
+                       tls_accept: int = 1,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new proxy in Zabbix.
 
     Args:
@@ -60,16 +60,16 @@ def proxy_create(host: str, status: int = 5,
         optional={"description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("proxy", "create", params)
+    return await zabbix_write("proxy", "create", params)
 
 
 @mcp.tool()
-def proxy_update(proxyid: str, host: Optional[str] = None,
-                 status: Optional[int] = None,
-                 description: Optional[str] = None,
-                 tls_connect: Optional[int] = None,
-                 tls_accept: Optional[int] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def proxy_update(proxyid: str, host: Optional[str] = None,
+                       status: Optional[int] = None,
+                       description: Optional[str] = None,
+                       tls_connect: Optional[int] = None,
+                       tls_accept: Optional[int] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing proxy in Zabbix.
 
     Args:
@@ -90,11 +90,11 @@ def proxy_update(proxyid: str, host: Optional[str] = None,
                   "tls_connect": tls_connect, "tls_accept": tls_accept},
         extra_params=extra_params,
     )
-    return zabbix_write("proxy", "update", params)
+    return await zabbix_write("proxy", "update", params)
 
 
 @mcp.tool()
-def proxy_delete(proxyids: List[str]) -> str:
+async def proxy_delete(proxyids: List[str]) -> str:
     """Delete proxies from Zabbix.
 
     Args:
@@ -103,4 +103,4 @@ def proxy_delete(proxyids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("proxy", proxyids)
+    return await zabbix_delete("proxy", proxyids)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def proxygroup_get(proxy_groupids: Optional[List[str]] = None,
-                   output: Union[str, List[str]] = "extend",
-                   search: Optional[Dict[str, str]] = None,
-                   filter: Optional[Dict[str, Any]] = None,
-                   extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def proxygroup_get(proxy_groupids: Optional[List[str]] = None,
+                         output: Union[str, List[str]] = "extend",
+                         search: Optional[Dict[str, str]] = None,
+                         filter: Optional[Dict[str, Any]] = None,
+                         extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get proxy groups from Zabbix.
 
     Args:
@@ -26,13 +26,13 @@ def proxygroup_get(proxy_groupids: Optional[List[str]] = None,
         optional={"proxy_groupids": proxy_groupids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("proxygroup", "get", params)
+    return await zabbix_get("proxygroup", "get", params)
 
 
 @mcp.tool()
-def proxygroup_create(name: str, failover_delay: str = "1m",
-                      min_online: str = "1",
-                      extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def proxygroup_create(name: str, failover_delay: str = "1m",
+                            min_online: str = "1",
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a proxy group in Zabbix.
 
     Args:
@@ -46,14 +46,14 @@ def proxygroup_create(name: str, failover_delay: str = "1m",
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("proxygroup", "create", params)
+    return await zabbix_write("proxygroup", "create", params)
 
 
 @mcp.tool()
-def proxygroup_update(proxy_groupid: str, name: Optional[str] = None,
-                      failover_delay: Optional[str] = None,
-                      min_online: Optional[str] = None,
-                      extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def proxygroup_update(proxy_groupid: str, name: Optional[str] = None,
+                            failover_delay: Optional[str] = None,
+                            min_online: Optional[str] = None,
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a proxy group in Zabbix.
 
     Args:
@@ -68,14 +68,14 @@ def proxygroup_update(proxy_groupid: str, name: Optional[str] = None,
         optional={"name": name, "failover_delay": failover_delay, "min_online": min_online},
         extra_params=extra_params,
     )
-    return zabbix_write("proxygroup", "update", params)
+    return await zabbix_write("proxygroup", "update", params)
 
 
 @mcp.tool()
-def proxygroup_delete(proxy_groupids: List[str]) -> str:
+async def proxygroup_delete(proxy_groupids: List[str]) -> str:
     """Delete proxy groups from Zabbix.
 
     Args:
         proxy_groupids: List of proxy group IDs to delete
     """
-    return zabbix_delete("proxygroup", proxy_groupids)
+    return await zabbix_delete("proxygroup", proxy_groupids)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def regexp_get(regexpids: Optional[List[str]] = None,
-               output: Union[str, List[str]] = "extend",
-               search: Optional[Dict[str, str]] = None,
-               filter: Optional[Dict[str, Any]] = None,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def regexp_get(regexpids: Optional[List[str]] = None,
+                     output: Union[str, List[str]] = "extend",
+                     search: Optional[Dict[str, str]] = None,
+                     filter: Optional[Dict[str, Any]] = None,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get regular expressions from Zabbix.
 
     Args:
@@ -26,12 +26,12 @@ def regexp_get(regexpids: Optional[List[str]] = None,
         optional={"regexpids": regexpids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("regexp", "get", params)
+    return await zabbix_get("regexp", "get", params)
 
 
 @mcp.tool()
-def regexp_create(name: str, expressions: List[Dict[str, Any]],
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def regexp_create(name: str, expressions: List[Dict[str, Any]],
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a regular expression in Zabbix.
 
     Args:
@@ -44,13 +44,13 @@ def regexp_create(name: str, expressions: List[Dict[str, Any]],
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("regexp", "create", params)
+    return await zabbix_write("regexp", "create", params)
 
 
 @mcp.tool()
-def regexp_update(regexpid: str, name: Optional[str] = None,
-                  expressions: Optional[List[Dict[str, Any]]] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def regexp_update(regexpid: str, name: Optional[str] = None,
+                        expressions: Optional[List[Dict[str, Any]]] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a regular expression in Zabbix.
 
     Args:
@@ -64,14 +64,14 @@ def regexp_update(regexpid: str, name: Optional[str] = None,
         optional={"name": name, "expressions": expressions},
         extra_params=extra_params,
     )
-    return zabbix_write("regexp", "update", params)
+    return await zabbix_write("regexp", "update", params)
 
 
 @mcp.tool()
-def regexp_delete(regexpids: List[str]) -> str:
+async def regexp_delete(regexpids: List[str]) -> str:
     """Delete regular expressions from Zabbix.
 
     Args:
         regexpids: List of regular expression IDs to delete
     """
-    return zabbix_delete("regexp", regexpids)
+    return await zabbix_delete("regexp", regexpids)
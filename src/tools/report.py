@@ -7,10 +7,10 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def report_get(reportids: Optional[List[str]] = None,
-               output: Union[str, List[str]] = "extend",
-               filter: Optional[Dict[str, Any]] = None,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def report_get(reportids: Optional[List[str]] = None,
+                     output: Union[str, List[str]] = "extend",
+                     filter: Optional[Dict[str, Any]] = None,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get scheduled reports from Zabbix.
 
     Args:
@@ -24,14 +24,14 @@ def report_get(reportids: Optional[List[str]] = None,
         optional={"reportids": reportids, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("report", "get", params)
+    return await zabbix_get("report", "get", params)
 
 
 @mcp.tool()
-def report_create(name: str, dashboardid: str,
-                  period: int = 0,
-                  users: Optional[List[Dict[str, Any]]] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def report_create(name: str, dashboardid: str,
+                        period: int = 0,
+                        users: Optional[List[Dict[str, Any]]] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a scheduled report in Zabbix.
 
     Args:
@@ -46,13 +46,13 @@ def report_create(name: str, dashboardid: str,
         optional={"users": users},
         extra_params=extra_params,
     )
-    return zabbix_write("report", "create", params)
+    return await zabbix_write("report", "create", params)
 
 
 @mcp.tool()
-def report_update(reportid: str, name: Optional[str] = None,
-                  status: Optional[int] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def report_update(reportid: str, name: Optional[str] = None,
+                        status: Optional[int] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a scheduled report in Zabbix.
 
     Args:
@@ -66,14 +66,14 @@ def report_update(reportid: str, name: Optional[str] = None,
         optional={"name": name, "status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("report", "update", params)
+    return await zabbix_write("report", "update", params)
 
 
 @mcp.tool()
-def report_delete(reportids: List[str]) -> str:
+async def report_delete(reportids: List[str]) -> str:
     """Delete scheduled reports from Zabbix.
 
     Args:
         reportids: List of report IDs to delete
     """
-    return zabbix_delete("report", reportids)
+    return await zabbix_delete("report", reportids)
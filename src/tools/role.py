@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def role_get(roleids: Optional[List[str]] = None,
-             output: Union[str, List[str]] = "extend",
-             search: Optional[Dict[str, str]] = None,
-             filter: Optional[Dict[str, Any]] = None,
-             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def role_get(roleids: Optional[List[str]] = None,
+                   output: Union[str, List[str]] = "extend",
+                   search: Optional[Dict[str, str]] = None,
+                   filter: Optional[Dict[str, Any]] = None,
+                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get roles from Zabbix.
 
     Args:
@@ -26,13 +26,13 @@ def role_get(roleids: Optional[List[str]] = None,
         optional={"roleids": roleids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("role", "get", params)
+    return await zabbix_get("role", "get", params)
 
 
 @mcp.tool()
-def role_create(name: str, type: int,
-                rules: Optional[Dict[str, Any]] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def role_create(name: str, type: int,
+                      rules: Optional[Dict[str, Any]] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a role in Zabbix.
 
     Args:
@@ -46,14 +46,14 @@ def role_create(name: str, type: int,
         optional={"rules": rules},
         extra_params=extra_params,
     )
-    return zabbix_write("role", "create", params)
+    return await zabbix_write("role", "create", params)
 
 
 @mcp.tool()
-def role_update(roleid: str, name: Optional[str] = None,
-                type: Optional[int] = None,
-                rules: Optional[Dict[str, Any]] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def role_update(roleid: str, name: Optional[str] = None,
+                      type: Optional[int] = None,
+                      rules: Optional[Dict[str, Any]] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a role in Zabbix.
 
     Args:
@@ -68,14 +68,14 @@ def role_update(roleid: str, name: Optional[str] = None,
         optional={"name": name, "type": type, "rules": rules},
         extra_params=extra_params,
     )
-    return zabbix_write("role", "update", params)
+    return await zabbix_write("role", "update", params)
 
 
 @mcp.tool()
-def role_delete(roleids: List[str]) -> str:
+async def role_delete(roleids: List[str]) -> str:
     """Delete roles from Zabbix.
 
     Args:
         roleids: List of role IDs to delete
     """
-    return zabbix_delete("role", roleids)
+    return await zabbix_delete("role", roleids)
@@ -7,12 +7,12 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def script_get(scriptids: Optional[List[str]] = None,
-               hostids: Optional[List[str]] = None,
-               output: Union[str, List[str]] = "extend",
-               search: Optional[Dict[str, str]] = None,
-               filter: Optional[Dict[str, Any]] = None,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def script_get(scriptids: Optional[List[str]] = None,
+                     hostids: Optional[List[str]] = None,
+                     output: Union[str, List[str]] = "extend",
+                     search: Optional[Dict[str, str]] = None,
+                     filter: Optional[Dict[str, Any]] = None,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get scripts from Zabbix.
 
     Args:
@@ -32,16 +32,16 @@ def script_get(scriptids: Optional[List[str]] = None,
                   "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("script", "get", params)
+    return await zabbix_get("script", "get", params)
 
 
 @mcp.tool()
-def script_create(name: str, type: int, command: str,
-                  scope: int = 1,
-                  execute_on: Optional[int] = None,
-                  groupid: Optional[str] = None,
-                  description: Optional[str] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def script_create(name: str, type: int, command: str,
+                        scope: int = 1,
+                        execute_on: Optional[int] = None,
+                        groupid: Optional[str] = None,
+                        description: Optional[str] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new script in Zabbix.
 
     Args:
@@ -63,14 +63,14 @@ def script_create(name: str, type: int, command: str,
                   "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("script", "create", params)
+    return await zabbix_write("script", "create", params)
 
 
 @mcp.tool()
-def script_update(scriptid: str, name: Optional[str] = None,
-                  type: Optional[int] = None, command: Optional[str] = None,
-                  description: Optional[str] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def script_update(scriptid: str, name: Optional[str] = None,
+                        type: Optional[int] = None, command: Optional[str] = None,
+                        description: Optional[str] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a script in Zabbix.
 
     Args:
@@ -90,11 +90,11 @@ def script_update(scriptid: str, name: Optional[str] = None,
                   "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("script", "update", params)
+    return await zabbix_write("script", "update", params)
 
 
 @mcp.tool()
-def script_delete(scriptids: List[str]) -> str:
+async def script_delete(scriptids: List[str]) -> str:
     """Delete scripts from Zabbix.
 
     Args:
@@ -103,13 +103,13 @@ def script_delete(scriptids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("script", scriptids)
+    return await zabbix_delete("script", scriptids)
 
 
 @mcp.tool()
-def script_execute(scriptid: str, hostid: Optional[str] = None,
-                   eventid: Optional[str] = None,
-                   extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def script_execute(scriptid: str, hostid: Optional[str] = None,
+                         eventid: Optional[str] = None,
+                         extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Execute a script on a host or event.
 
     Args:
@@ -126,12 +126,12 @@ def script_execute(scriptid: str, hostid: Optional[str] = None,
         optional={"hostid": hostid, "eventid": eventid},
         extra_params=extra_params,
     )
-    return zabbix_write("script", "execute", params)
+    return await zabbix_write("script", "execute", params)
 
 
 @mcp.tool()
-def script_getscriptsbyhosts(hostids: List[str],
-                             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def script_getscriptsbyhosts(hostids: List[str],
+                                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get scripts available on hosts.
 
     Args:
@@ -146,12 +146,12 @@ def script_getscriptsbyhosts(hostids: List[str],
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_get("script", "getscriptsbyhosts", params)
+    return await zabbix_get("script", "getscriptsbyhosts", params)
 
 
 @mcp.tool()
-def script_getscriptsbyevents(eventids: List[str],
-                              extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def script_getscriptsbyevents(eventids: List[str],
+                                    extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get scripts available for events.
 
     Args:
@@ -166,4 +166,4 @@ def script_getscriptsbyevents(eventids: List[str],
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_get("script", "getscriptsbyevents", params)
+    return await zabbix_get("script", "getscriptsbyevents", params)
@@ -0,0 +1,132 @@
+"""Server introspection tools for Zabbix MCP Server."""
+
+from src._cache import get_response_cache
+from src._core import mcp, format_response
+from src._fanout import get_fanout_stats
+from src._history_store import get_history_store
+from src._hot_items import get_hot_items
+from src._pool import get_pool_stats
+from src._search import get_search_index
+from src._slowlog import get_slow_call_log
+from src._topology import get_topology
+from src.tools._registry import coalesce_stats
+
+
+@mcp.tool()
+async def server_pool_stats() -> str:
+    """Get connection pool statistics for the Zabbix API client.
+
+    Returns:
+        str: JSON formatted pool settings, request counts and connection reuse counters
+    """
+    return format_response(get_pool_stats())
+
+
+@mcp.tool()
+async def server_cache_stats() -> str:
+    """Get response cache statistics (hits, misses, evictions, size, TTL policies).
+
+    Also reports how many reads were coalesced onto an identical in-flight request.
+
+    Returns:
+        str: JSON formatted cache statistics
+    """
+    cache = get_response_cache()
+    if cache is None:
+        return format_response({"enabled": False, "coalescing": coalesce_stats})
+    return format_response({"enabled": True, **cache.stats(), "coalescing": coalesce_stats})
+
+
+@mcp.tool()
+async def server_cache_clear() -> str:
+    """Drop all cached API responses so the next reads go to Zabbix.
+
+    Returns:
+        str: JSON formatted result with the number of dropped entries
+    """
+    cache = get_response_cache()
+    if cache is None:
+        return format_response({"enabled": False, "cleared": 0})
+    return format_response({"enabled": True, "cleared": cache.clear()})
+
+
+@mcp.tool()
+async def server_fanout_stats() -> str:
+    """Get statistics for reads split into concurrent chunks because of huge ID lists.
+
+    Returns:
+        str: JSON formatted chunk settings, counters and per-chunk timings of recent calls
+    """
+    return format_response(get_fanout_stats())
+
+
+@mcp.tool()
+async def server_history_cache_stats() -> str:
+    """Get on-disk history cache statistics (stored rows, file size, hits and rows fetched).
+
+    Returns:
+        str: JSON formatted history cache statistics
+    """
+    store = get_history_store()
+    if store is None:
+        return format_response({"enabled": False})
+    return format_response({"enabled": True, **store.stats()})
+
+
+@mcp.tool()
+async def server_history_cache_clear() -> str:
+    """Drop all rows from the on-disk history cache so the next reads go to Zabbix.
+
+    Returns:
+        str: JSON formatted result
+    """
+    store = get_history_store()
+    if store is None:
+        return format_response({"enabled": False})
+    store.clear()
+    return format_response({"enabled": True, "cleared": True})
+
+
+@mcp.tool()
+async def server_hot_items_stats() -> str:
+    """Get hot item ring buffer statistics (tracked items, buffered samples, polls, hits).
+
+    Returns:
+        str: JSON formatted hot item statistics
+    """
+    hot = get_hot_items()
+    if hot is None:
+        return format_response({"enabled": False})
+    return format_response({"enabled": True, **hot.stats()})
+
+
+@mcp.tool()
+async def server_topology_stats() -> str:
+    """Get topology and search index statistics (record counts, age, refresh and build timings).
+
+    Returns:
+        str: JSON formatted topology index statistics with the search index under "search"
+    """
+    return format_response({**get_topology().stats(), "search": get_search_index().stats()})
+
+
+@mcp.tool()
+async def server_slow_calls(limit: int = 20, sort_by: str = "total") -> str:
+    """Get the Zabbix API calls slower than the slow-call threshold, aggregated by query shape.
+
+    Calls are grouped by object, method and a parameter fingerprint (parameter
+    names, ID-list length buckets, time range span, output field count), so
+    repeated queries of the same shape add up to one entry.
+
+    Args:
+        limit: Number of fingerprints to return (default: 20)
+        sort_by: "total" (summed time, default), "max" (slowest call) or "calls"
+
+    Returns:
+        str: JSON formatted threshold, number of slow calls and the top fingerprints
+        with call/error counts, total/mean/max seconds and max rows and bytes
+    """
+    slow_log = get_slow_call_log()
+    if slow_log is None:
+        return format_response({"enabled": False})
+    return format_response({"enabled": True, **slow_log.stats(limit, sort_by)})
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def service_get(serviceids: Optional[List[str]] = None,
-                output: Union[str, List[str]] = "extend",
-                search: Optional[Dict[str, str]] = None,
-                filter: Optional[Dict[str, Any]] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def service_get(serviceids: Optional[List[str]] = None,
+                      output: Union[str, List[str]] = "extend",
+                      search: Optional[Dict[str, str]] = None,
+                      filter: Optional[Dict[str, Any]] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get services from Zabbix.
 
     Args:
@@ -29,14 +29,14 @@ def service_get(serviceids: Optional[List[str]] = None,
         optional={"serviceids": serviceids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("service", "get", params)
+    return await zabbix_get("service", "get", params)
 
 
 @mcp.tool()
-def service_create(name: str, algorithm: int,
-                   sortorder: int = 0,
-                   description: Optional[str] = None,
-                   extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def service_create(name: str, algorithm: int,
+                         sortorder: int = 0,
+                         description: Optional[str] = None,
+                         extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new service in Zabbix.
 
     Args:
@@ -54,15 +54,15 @@ def service_create(name: str, algorithm: int,
         optional={"description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("service", "create", params)
+    return await zabbix_write("service", "create", params)
 
 
 @mcp.tool()
-def service_update(serviceid: str, name: Optional[str] = None,
-                   algorithm: Optional[int] = None,
-                   sortorder: Optional[int] = None,
-                   description: Optional[str] = None,
-                   extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def service_update(serviceid: str, name: Optional[str] = None,
+                         algorithm: Optional[int] = None,
+                         sortorder: Optional[int] = None,
+                         description: Optional[str] = None,
+                         extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a service in Zabbix.
 
     Args:
@@ -82,11 +82,11 @@ def service_update(serviceid: str, name: Optional[str] = None,
                   "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("service", "update", params)
+    return await zabbix_write("service", "update", params)
 
 
 @mcp.tool()
-def service_delete(serviceids: List[str]) -> str:
+async def service_delete(serviceids: List[str]) -> str:
     """Delete services from Zabbix.
 
     Args:
@@ -95,4 +95,4 @@ def service_delete(serviceids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("service", serviceids)
+    return await zabbix_delete("service", serviceids)
@@ -7,8 +7,8 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write
 
 
 @mcp.tool()
-def settings_get(output: str = "extend",
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def settings_get(output: str = "extend",
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get global settings from Zabbix.
 
     Args:
@@ -20,11 +20,11 @@ def settings_get(output: str = "extend",
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_get("settings", "get", params)
+    return await zabbix_get("settings", "get", params)
 
 
 @mcp.tool()
-def settings_update(extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def settings_update(extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update global settings in Zabbix. Pass settings via extra_params.
 
     Args:
@@ -35,4 +35,4 @@ def settings_update(extra_params: Optional[Dict[str, Any]] = None) -> str:
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("settings", "update", params)
+    return await zabbix_write("settings", "update", params)
@@ -7,12 +7,12 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def sla_get(slaids: Optional[List[str]] = None,
-            serviceids: Optional[List[str]] = None,
-            output: Union[str, List[str]] = "extend",
-            search: Optional[Dict[str, str]] = None,
-            filter: Optional[Dict[str, Any]] = None,
-            extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def sla_get(slaids: Optional[List[str]] = None,
+                  serviceids: Optional[List[str]] = None,
+                  output: Union[str, List[str]] = "extend",
+                  search: Optional[Dict[str, str]] = None,
+                  filter: Optional[Dict[str, Any]] = None,
+                  extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get SLAs from Zabbix.
 
     Args:
@@ -32,15 +32,15 @@ def sla_get(slaids: Optional[List[str]] = None,
                   "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("sla", "get", params)
+    return await zabbix_get("sla", "get", params)
 
 
 @mcp.tool()
-def sla_create(name: str, slo: float, period: int,
-               timezone: str = "UTC",
-               service_tags: Optional[List[Dict[str, str]]] = None,
-               description: Optional[str] = None,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def sla_create(name: str, slo: float, period: int,
+                     timezone: str = "UTC",
+                     service_tags: Optional[List[Dict[str, str]]] = None,
+                     description: Optional[str] = None,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new SLA in Zabbix.
 
     Args:
@@ -60,16 +60,16 @@ def sla_create(name: str, slo: float, period: int,
         optional={"service_tags": service_tags, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("sla", "create", params)
+    return await zabbix_write("sla", "create", params)
 
 
 @mcp.tool()
-def sla_update(slaid: str, name: Optional[str] = None,
-               slo: Optional[float] = None,
-               period: Optional[int] = None,
-               status: Optional[int] = None,
-               description: Optional[str] = None,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def sla_update(slaid: str, name: Optional[str] = None,
+                     slo: Optional[float] = None,
+                     period: Optional[int] = None,
+                     status: Optional[int] = None,
+                     description: Optional[str] = None,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an SLA in Zabbix.
 
     Args:
@@ -90,11 +90,11 @@ def sla_update(slaid: str, name: Optional[str] = None,
                   "status": status, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("sla", "update", params)
+    return await zabbix_write("sla", "update", params)
 
 
 @mcp.tool()
-def sla_delete(slaids: List[str]) -> str:
+async def sla_delete(slaids: List[str]) -> str:
     """Delete SLAs from Zabbix.
 
     Args:
@@ -103,15 +103,15 @@ def sla_delete(slaids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("sla", slaids)
+    return await zabbix_delete("sla", slaids)
 
 
 @mcp.tool()
-def sla_getsli(slaid: str, serviceids: Optional[List[str]] = None,
-               period_from: Optional[int] = None,
-               period_to: Optional[int] = None,
-               periods: Optional[int] = None,
-               extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def sla_getsli(slaid: str, serviceids: Optional[List[str]] = None,
+                     period_from: Optional[int] = None,
+                     period_to: Optional[int] = None,
+                     periods: Optional[int] = None,
+                     extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get SLI (Service Level Indicator) data for an SLA.
 
     Args:
@@ -131,4 +131,4 @@ def sla_getsli(slaid: str, serviceids: Optional[List[str]] = None,
                   "period_to": period_to, "periods": periods},
         extra_params=extra_params,
     )
-    return zabbix_get("sla", "getsli", params)
+    return await zabbix_get("sla", "getsli", params)
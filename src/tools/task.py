@@ -7,9 +7,9 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write
 
 
 @mcp.tool()
-def task_get(taskids: Optional[List[str]] = None,
-             output: Union[str, List[str]] = "extend",
-             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def task_get(taskids: Optional[List[str]] = None,
+                   output: Union[str, List[str]] = "extend",
+                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get tasks from Zabbix.
 
     Args:
@@ -22,12 +22,12 @@ def task_get(taskids: Optional[List[str]] = None,
         optional={"taskids": taskids},
         extra_params=extra_params,
     )
-    return zabbix_get("task", "get", params)
+    return await zabbix_get("task", "get", params)
 
 
 @mcp.tool()
-def task_create(type: int, request: Dict[str, Any],
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def task_create(type: int, request: Dict[str, Any],
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a task in Zabbix (e.g. check now, diagnostic info).
 
     Args:
@@ -40,4 +40,4 @@ def task_create(type: int, request: Dict[str, Any],
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("task", "create", params)
+    return await zabbix_write("task", "create", params)
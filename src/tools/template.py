@@ -7,13 +7,13 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def template_get(templateids: Optional[List[str]] = None,
-                 groupids: Optional[List[str]] = None,
-                 hostids: Optional[List[str]] = None,
-                 output: Union[str, List[str]] = "extend",
-                 search: Optional[Dict[str, str]] = None,
-                 filter: Optional[Dict[str, Any]] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def template_get(templateids: Optional[List[str]] = None,
+                       groupids: Optional[List[str]] = None,
+                       hostids: Optional[List[str]] = None,
+                       output: Union[str, List[str]] = "extend",
+                       search: Optional[Dict[str, str]] = None,
+                       filter: Optional[Dict[str, Any]] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get templates from Zabbix with optional filtering.
 
     Args:
@@ -34,13 +34,13 @@ def template_get(templateids: Optional[List[str]] = None,
                   "hostids": hostids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("template", "get", params)
+    return await zabbix_get("template", "get", params)
 
 
 @mcp.tool()
-def template_create(host: str, groups: List[Dict[str, str]],
-                    name: Optional[str] = None, description: Optional[str] = None,
-                    extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def template_create(host: str, groups: List[Dict[str, str]],
+                          name: Optional[str] = None, description: Optional[str] = None,
+                          extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new template in Zabbix.
 
     Args:
@@ -58,13 +58,13 @@ def template_create(host: str, groups: List[Dict[str, str]],
         optional={"name": name, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("template", "create", params)
+    return await zabbix_write("template", "create", params)
 
 
 @mcp.tool()
-def template_update(templateid: str, host: Optional[str] = None,
-                    name: Optional[str] = None, description: Optional[str] = None,
-                    extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def template_update(templateid: str, host: Optional[str] = None,
+                          name: Optional[str] = None, description: Optional[str] = None,
+                          extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing template in Zabbix.
 
     Args:
@@ -82,11 +82,11 @@ def template_update(templateid: str, host: Optional[str] = None,
         optional={"host": host, "name": name, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("template", "update", params)
+    return await zabbix_write("template", "update", params)
 
 
 @mcp.tool()
-def template_delete(templateids: List[str]) -> str:
+async def template_delete(templateids: List[str]) -> str:
     """Delete templates from Zabbix.
 
     Args:
@@ -95,15 +95,15 @@ def template_delete(templateids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("template", templateids)
+    return await zabbix_delete("template", templateids)
 
 
 @mcp.tool()
-def template_massadd(templates: List[Dict[str, str]],
-                     groups: Optional[List[Dict[str, str]]] = None,
-                     hosts: Optional[List[Dict[str, str]]] = None,
-                     macros: Optional[List[Dict[str, str]]] = None,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def template_massadd(templates: List[Dict[str, str]],
+                           groups: Optional[List[Dict[str, str]]] = None,
+                           hosts: Optional[List[Dict[str, str]]] = None,
+                           macros: Optional[List[Dict[str, str]]] = None,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass add groups, hosts, or macros to templates.
 
     Args:
@@ -121,15 +121,15 @@ def template_massadd(templates: List[Dict[str, str]],
         optional={"groups": groups, "hosts": hosts, "macros": macros},
         extra_params=extra_params,
     )
-    return zabbix_write("template", "massadd", params)
+    return await zabbix_write("template", "massadd", params)
 
 
 @mcp.tool()
-def template_massremove(templateids: List[str],
-                        groupids: Optional[List[str]] = None,
-                        hostids: Optional[List[str]] = None,
-                        macros: Optional[List[str]] = None,
-                        extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def template_massremove(templateids: List[str],
+                              groupids: Optional[List[str]] = None,
+                              hostids: Optional[List[str]] = None,
+                              macros: Optional[List[str]] = None,
+                              extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass remove groups, hosts, or macros from templates.
 
     Args:
@@ -147,15 +147,15 @@ def template_massremove(templateids: List[str],
         optional={"groupids": groupids, "hostids": hostids, "macros": macros},
         extra_params=extra_params,
     )
-    return zabbix_write("template", "massremove", params)
+    return await zabbix_write("template", "massremove", params)
 
 
 @mcp.tool()
-def template_massupdate(templates: List[Dict[str, str]],
-                        groups: Optional[List[Dict[str, str]]] = None,
-                        hosts: Optional[List[Dict[str, str]]] = None,
-                        macros: Optional[List[Dict[str, str]]] = None,
-                        extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def template_massupdate(templates: List[Dict[str, str]],
+                              groups: Optional[List[Dict[str, str]]] = None,
+                              hosts: Optional[List[Dict[str, str]]] = None,
+                              macros: Optional[List[Dict[str, str]]] = None,
+                              extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass update templates — replaces all groups/hosts/macros.
 
     Args:
@@ -173,4 +173,4 @@ def template_massupdate(templates: List[Dict[str, str]],
         optional={"groups": groups, "hosts": hosts, "macros": macros},
         extra_params=extra_params,
     )
-    return zabbix_write("template", "massupdate", params)
+    return await zabbix_write("template", "massupdate", params)
@@ -7,10 +7,10 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def templatedashboard_get(dashboardids: Optional[List[str]] = None,
-                          templateids: Optional[List[str]] = None,
-                          output: Union[str, List[str]] = "extend",
-                          extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def templatedashboard_get(dashboardids: Optional[List[str]] = None,
+                                templateids: Optional[List[str]] = None,
+                                output: Union[str, List[str]] = "extend",
+                                extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get template dashboards from Zabbix.
 
     Args:
@@ -24,13 +24,13 @@ def templatedashboard_get(dashboardids: Optional[List[str]] = None,
         optional={"dashboardids": dashboardids, "templateids": templateids},
         extra_params=extra_params,
     )
-    return zabbix_get("templatedashboard", "get", params)
+    return await zabbix_get("templatedashboard", "get", params)
 
 
 @mcp.tool()
-def templatedashboard_create(name: str, templateid: str,
-                             pages: Optional[List[Dict[str, Any]]] = None,
-                             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def templatedashboard_create(name: str, templateid: str,
+                                   pages: Optional[List[Dict[str, Any]]] = None,
+                                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a template dashboard in Zabbix.
 
     Args:
@@ -44,13 +44,13 @@ def templatedashboard_create(name: str, templateid: str,
         optional={"pages": pages},
         extra_params=extra_params,
     )
-    return zabbix_write("templatedashboard", "create", params)
+    return await zabbix_write("templatedashboard", "create", params)
 
 
 @mcp.tool()
-def templatedashboard_update(dashboardid: str, name: Optional[str] = None,
-                             pages: Optional[List[Dict[str, Any]]] = None,
-                             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def templatedashboard_update(dashboardid: str, name: Optional[str] = None,
+                                   pages: Optional[List[Dict[str, Any]]] = None,
+                                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a template dashboard in Zabbix.
 
     Args:
@@ -64,14 +64,14 @@ def templatedashboard_update(dashboardid: str, name: Optional[str] = None,
         optional={"name": name, "pages": pages},
         extra_params=extra_params,
     )
-    return zabbix_write("templatedashboard", "update", params)
+    return await zabbix_write("templatedashboard", "update", params)
 
 
 @mcp.tool()
-def templatedashboard_delete(dashboardids: List[str]) -> str:
+async def templatedashboard_delete(dashboardids: List[str]) -> str:
     """Delete template dashboards from Zabbix.
 
     Args:
         dashboardids: List of dashboard IDs to delete
     """
-    return zabbix_delete("templatedashboard", dashboardids)
+    return await zabbix_delete("templatedashboard", dashboardids)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def templategroup_get(groupids: Optional[List[str]] = None,
-                      output: Union[str, List[str]] = "extend",
-                      search: Optional[Dict[str, str]] = None,
-                      filter: Optional[Dict[str, Any]] = None,
-                      extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def templategroup_get(groupids: Optional[List[str]] = None,
+                            output: Union[str, List[str]] = "extend",
+                            search: Optional[Dict[str, str]] = None,
+                            filter: Optional[Dict[str, Any]] = None,
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get template groups from Zabbix.
 
     Args:
@@ -29,12 +29,12 @@ def templategroup_get(groupids: Optional[List[str]] = None,
         optional={"groupids": groupids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("templategroup", "get", params)
+    return await zabbix_get("templategroup", "get", params)
 
 
 @mcp.tool()
-def templategroup_create(name: str,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def templategroup_create(name: str,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new template group in Zabbix.
 
     Args:
@@ -49,12 +49,12 @@ def templategroup_create(name: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("templategroup", "create", params)
+    return await zabbix_write("templategroup", "create", params)
 
 
 @mcp.tool()
-def templategroup_update(groupid: str, name: str,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def templategroup_update(groupid: str, name: str,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a template group in Zabbix.
 
     Args:
@@ -70,11 +70,11 @@ def templategroup_update(groupid: str, name: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("templategroup", "update", params)
+    return await zabbix_write("templategroup", "update", params)
 
 
 @mcp.tool()
-def templategroup_delete(groupids: List[str]) -> str:
+async def templategroup_delete(groupids: List[str]) -> str:
     """Delete template groups from Zabbix.
 
     Args:
@@ -83,13 +83,13 @@ def templategroup_delete(groupids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("templategroup", groupids)
+    return await zabbix_delete("templategroup", groupids)
 
 
 @mcp.tool()
-def templategroup_massadd(groups: List[Dict[str, str]],
-                          templates: Optional[List[Dict[str, str]]] = None,
-                          extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def templategroup_massadd(groups: List[Dict[str, str]],
+                                templates: Optional[List[Dict[str, str]]] = None,
+                                extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass add templates to template groups.
 
     Args:
@@ -105,13 +105,13 @@ def templategroup_massadd(groups: List[Dict[str, str]],
         optional={"templates": templates},
         extra_params=extra_params,
     )
-    return zabbix_write("templategroup", "massadd", params)
+    return await zabbix_write("templategroup", "massadd", params)
 
 
 @mcp.tool()
-def templategroup_massremove(groupids: List[str],
-                             templateids: Optional[List[str]] = None,
-                             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def templategroup_massremove(groupids: List[str],
+                                   templateids: Optional[List[str]] = None,
+                                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass remove templates from template groups.
 
     Args:
@@ -127,13 +127,13 @@ def templategroup_massremove(groupids: List[str],
         optional={"templateids": templateids},
         extra_params=extra_params,
     )
-    return zabbix_write("templategroup", "massremove", params)
+    return await zabbix_write("templategroup", "massremove", params)
 
 
 @mcp.tool()
-def templategroup_massupdate(groups: List[Dict[str, str]],
-                             templates: Optional[List[Dict[str, str]]] = None,
-                             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def templategroup_massupdate(groups: List[Dict[str, str]],
+                                   templates: Optional[List[Dict[str, str]]] = None,
+                                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Mass update template groups — replaces all templates.
 
     Args:
@@ -149,14 +149,14 @@ def templategroup_massupdate(groups: List[Dict[str, str]],
         optional={"templates": templates},
         extra_params=extra_params,
     )
-    return zabbix_write("templategroup", "massupdate", params)
+    return await zabbix_write("templategroup", "massupdate", params)
 
 
 @mcp.tool()
-def templategroup_propagate(groups: List[Dict[str, str]],
-                            permissions: bool = False,
-                            tag_filters: bool = False,
-                            extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def templategroup_propagate(groups: List[Dict[str, str]],
+                                  permissions: bool = False,
+                                  tag_filters: bool = False,
+                                  extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Propagate permissions and tag filters to child template groups.
 
     Args:
@@ -174,4 +174,4 @@ def templategroup_propagate(groups: List[Dict[str, str]],
                   "tag_filters": tag_filters if tag_filters else None},
         extra_params=extra_params,
     )
-    return zabbix_write("templategroup", "propagate", params)
+    return await zabbix_write("templategroup", "propagate", params)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def token_get(tokenids: Optional[List[str]] = None,
-              output: Union[str, List[str]] = "extend",
-              search: Optional[Dict[str, str]] = None,
-              filter: Optional[Dict[str, Any]] = None,
-              extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def token_get(tokenids: Optional[List[str]] = None,
+                    output: Union[str, List[str]] = "extend",
+                    search: Optional[Dict[str, str]] = None,
+                    filter: Optional[Dict[str, Any]] = None,
+                    extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get API tokens from Zabbix.
 
     Args:
@@ -26,14 +26,14 @@ def token_get(tokenids: Optional[List[str]] = None,
         optional={"tokenids": tokenids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("token", "get", params)
+    return await zabbix_get("token", "get", params)
 
 
 @mcp.tool()
-def token_create(name: str, userid: str,
-                 expires_at: Optional[int] = None,
-                 description: Optional[str] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def token_create(name: str, userid: str,
+                       expires_at: Optional[int] = None,
+                       description: Optional[str] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create an API token in Zabbix.
 
     Args:
@@ -48,15 +48,15 @@ def token_create(name: str, userid: str,
         optional={"expires_at": expires_at, "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("token", "create", params)
+    return await zabbix_write("token", "create", params)
 
 
 @mcp.tool()
-def token_update(tokenid: str, name: Optional[str] = None,
-                 status: Optional[int] = None,
-                 expires_at: Optional[int] = None,
-                 description: Optional[str] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def token_update(tokenid: str, name: Optional[str] = None,
+                       status: Optional[int] = None,
+                       expires_at: Optional[int] = None,
+                       description: Optional[str] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an API token in Zabbix.
 
     Args:
@@ -73,22 +73,22 @@ def token_update(tokenid: str, name: Optional[str] = None,
                   "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("token", "update", params)
+    return await zabbix_write("token", "update", params)
 
 
 @mcp.tool()
-def token_delete(tokenids: List[str]) -> str:
+async def token_delete(tokenids: List[str]) -> str:
     """Delete API tokens from Zabbix.
 
     Args:
         tokenids: List of token IDs to delete
     """
-    return zabbix_delete("token", tokenids)
+    return await zabbix_delete("token", tokenids)
 
 
 @mcp.tool()
-def token_generate(tokenids: List[str],
-                   extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def token_generate(tokenids: List[str],
+                         extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Generate (regenerate) auth strings for API tokens.
 
     Args:
@@ -100,4 +100,4 @@ def token_generate(tokenids: List[str],
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("token", "generate", params)
+    return await zabbix_write("token", "generate", params)
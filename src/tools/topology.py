@@ -0,0 +1,92 @@
+"""Topology query tools for Zabbix MCP Server."""
+
+from typing import List, Optional
+
+from src._core import mcp, format_response
+from src._topology import get_topology
+from src.tools._registry import refresh_topology, zabbix_search
+
+
+@mcp.tool()
+async def topology_query(target: str,
+                         hostgroups: Optional[List[str]] = None,
+                         hosts: Optional[List[str]] = None,
+                         templates: Optional[List[str]] = None,
+                         itemids: Optional[List[str]] = None,
+                         triggerids: Optional[List[str]] = None,
+                         limit: Optional[int] = None,
+                         response_format: Optional[str] = None) -> str:
+    """Resolve relationships between host groups, hosts, templates, items and triggers in one call.
+
+    Answered from an in-memory index of the topology that is refreshed
+    incrementally when older than ZABBIX_TOPOLOGY_REFRESH seconds. Results
+    are the target objects related to every given filter, e.g. target
+    "trigger" with hostgroups=["Linux servers"] and templates=["Linux by
+    Zabbix agent"] returns the triggers on hosts in that group that are
+    linked to that template. Template links include nested templates. Only
+    host-level items and triggers are indexed.
+
+    Args:
+        target: Objects to return (hostgroup, host, template, item or trigger)
+        hostgroups: Host group IDs or names
+        hosts: Host IDs, technical names or visible names
+        templates: Template IDs, technical names or visible names
+        itemids: Item IDs
+        triggerids: Trigger IDs
+        limit: Maximum number of results
+        response_format: pretty, compact or columnar (default: ZABBIX_MCP_RESPONSE_FORMAT)
+
+    Returns:
+        str: JSON formatted list of matching objects sorted by ID
+    """
+    index = get_topology()
+    if index.is_stale():
+        await refresh_topology(index)
+    return format_response(index.query(target, hostgroups=hostgroups, hosts=hosts,
+                                       templates=templates, itemids=itemids,
+                                       triggerids=triggerids, limit=limit),
+                           response_format)
+
+
+@mcp.tool()
+async def topology_refresh(full: bool = False) -> str:
+    """Refresh the topology index now.
+
+    Args:
+        full: Reload all items and triggers instead of only fetching new ones
+            (picks up edits to existing items and triggers)
+
+    Returns:
+        str: JSON formatted index statistics after the refresh
+    """
+    index = get_topology()
+    await refresh_topology(index, full)
+    return format_response(index.stats())
+
+
+@mcp.tool()
+async def topology_search(query: str,
+                          types: Optional[List[str]] = None,
+                          limit: int = 20,
+                          response_format: Optional[str] = None) -> str:
+    """Find hosts, items, triggers, host groups and templates by name, ranked by relevance.
+
+    Faster than host_get/item_get with search patterns on large installations:
+    answered in-process from a trigram index over host names and visible
+    names, item keys and names, trigger descriptions, host group and
+    template names. Whitespace and * separate terms that must all appear;
+    close misspellings are returned as lower-scored fuzzy matches. Falls
+    back to searching through the Zabbix API while the index has not been
+    loaded or is older than ZABBIX_SEARCH_MAX_AGE seconds.
+
+    Args:
+        query: Text to search for, e.g. "web01" or "cpu util"
+        types: Object types to search (hostgroup, host, template, item, trigger; default: all)
+        limit: Maximum number of results
+        response_format: pretty, compact or columnar (default: ZABBIX_MCP_RESPONSE_FORMAT)
+
+    Returns:
+        str: JSON formatted source ("index" or "api") and results with type,
+            id, matched field, name and score
+    """
+    return await zabbix_search(query, types, limit, response_format)
@@ -3,14 +3,16 @@
 from typing import Any, Dict, List, Optional
 
 from src._core import mcp
-from src.tools._registry import build_params, zabbix_get
+from src.tools._registry import build_params, zabbix_get, zabbix_get_page
 
 
 @mcp.tool()
-def trend_get(itemids: List[str], time_from: Optional[int] = None,
-              time_till: Optional[int] = None,
-              limit: Optional[int] = None,
-              extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def trend_get(itemids: List[str], time_from: Optional[int] = None,
+                    time_till: Optional[int] = None,
+                    limit: Optional[int] = None,
+                    page_size: Optional[int] = None,
+                    cursor: Optional[str] = None,
+                    extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get trend data from Zabbix.
 
     Args:
@@ -18,6 +20,8 @@ def trend_get(itemids: List[str], time_from: Optional[int] = None,
         time_from: Start time (Unix timestamp)
         time_till: End time (Unix timestamp)
         limit: Maximum number of results
+        page_size: Return results in pages of this many rows (pages are returned oldest first)
+        cursor: next_cursor from a previous page to continue from
         extra_params: Additional Zabbix API parameters
 
     Returns:
@@ -28,4 +32,6 @@ def trend_get(itemids: List[str], time_from: Optional[int] = None,
         optional={"time_from": time_from, "time_till": time_till, "limit": limit},
         extra_params=extra_params,
     )
-    return zabbix_get("trend", "get", params)
+    if page_size is not None or cursor is not None:
+        return await zabbix_get_page("trend", params, page_size, cursor)
+    return await zabbix_get("trend", "get", params)
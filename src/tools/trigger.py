@@ -7,15 +7,15 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def trigger_get(triggerids: Optional[List[str]] = None,
-                hostids: Optional[List[str]] = None,
-                groupids: Optional[List[str]] = None,
-                templateids: Optional[List[str]] = None,
-                output: Union[str, List[str]] = "extend",
-                search: Optional[Dict[str, str]] = None,
-                filter: Optional[Dict[str, Any]] = None,
-                limit: Optional[int] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def trigger_get(triggerids: Optional[List[str]] = None,
+                      hostids: Optional[List[str]] = None,
+                      groupids: Optional[List[str]] = None,
+                      templateids: Optional[List[str]] = None,
+                      output: Union[str, List[str]] = "extend",
+                      search: Optional[Dict[str, str]] = None,
+                      filter: Optional[Dict[str, Any]] = None,
+                      limit: Optional[int] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get triggers from Zabbix with optional filtering.
 
     Args:
@@ -39,14 +39,14 @@ def trigger_get(triggerids: Optional[List[str]] = None,
                   "limit": limit},
         extra_params=extra_params,
     )
-    return zabbix_get("trigger", "get", params)
+    return await zabbix_get("trigger", "get", params)
 
 
 @mcp.tool()
-def trigger_create(description: str, expression: str,
-                   priority: int = 0, status: int = 0,
-                   comments: Optional[str] = None,
-                   extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def trigger_create(description: str, expression: str,
+                         priority: int = 0, status: int = 0,
+                         comments: Optional[str] = None,
+                         extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new trigger in Zabbix.
 
     Args:
@@ -66,14 +66,14 @@ def trigger_create(description: str, expression: str,
         optional={"comments": comments},
         extra_params=extra_params,
     )
-    return zabbix_write("trigger", "create", params)
+    return await zabbix_write("trigger", "create", params)
 
 
 @mcp.tool()
-def trigger_update(triggerid: str, description: Optional[str] = None,
-                   expression: Optional[str] = None, priority: Optional[int] = None,
-                   status: Optional[int] = None,
-                   extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def trigger_update(triggerid: str, description: Optional[str] = None,
+                         expression: Optional[str] = None, priority: Optional[int] = None,
+                         status: Optional[int] = None,
+                         extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing trigger in Zabbix.
 
     Args:
@@ -93,11 +93,11 @@ def trigger_update(triggerid: str, description: Optional[str] = None,
                   "priority": priority, "status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("trigger", "update", params)
+    return await zabbix_write("trigger", "update", params)
 
 
 @mcp.tool()
-def trigger_delete(triggerids: List[str]) -> str:
+async def trigger_delete(triggerids: List[str]) -> str:
     """Delete triggers from Zabbix.
 
     Args:
@@ -106,4 +106,4 @@ def trigger_delete(triggerids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("trigger", triggerids)
+    return await zabbix_delete("trigger", triggerids)
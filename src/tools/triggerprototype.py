@@ -7,13 +7,13 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def triggerprototype_get(triggerids: Optional[List[str]] = None,
-                         discoveryids: Optional[List[str]] = None,
-                         hostids: Optional[List[str]] = None,
-                         output: Union[str, List[str]] = "extend",
-                         search: Optional[Dict[str, str]] = None,
-                         filter: Optional[Dict[str, Any]] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def triggerprototype_get(triggerids: Optional[List[str]] = None,
+                               discoveryids: Optional[List[str]] = None,
+                               hostids: Optional[List[str]] = None,
+                               output: Union[str, List[str]] = "extend",
+                               search: Optional[Dict[str, str]] = None,
+                               filter: Optional[Dict[str, Any]] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get trigger prototypes from Zabbix.
 
     Args:
@@ -31,13 +31,13 @@ def triggerprototype_get(triggerids: Optional[List[str]] = None,
                   "hostids": hostids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("triggerprototype", "get", params)
+    return await zabbix_get("triggerprototype", "get", params)
 
 
 @mcp.tool()
-def triggerprototype_create(description: str, expression: str,
-                            priority: int = 0, status: int = 0,
-                            extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def triggerprototype_create(description: str, expression: str,
+                                  priority: int = 0, status: int = 0,
+                                  extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a trigger prototype in Zabbix.
 
     Args:
@@ -53,15 +53,15 @@ def triggerprototype_create(description: str, expression: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("triggerprototype", "create", params)
+    return await zabbix_write("triggerprototype", "create", params)
 
 
 @mcp.tool()
-def triggerprototype_update(triggerid: str, description: Optional[str] = None,
-                            expression: Optional[str] = None,
-                            priority: Optional[int] = None,
-                            status: Optional[int] = None,
-                            extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def triggerprototype_update(triggerid: str, description: Optional[str] = None,
+                                  expression: Optional[str] = None,
+                                  priority: Optional[int] = None,
+                                  status: Optional[int] = None,
+                                  extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a trigger prototype in Zabbix.
 
     Args:
@@ -78,14 +78,14 @@ def triggerprototype_update(triggerid: str, description: Optional[str] = None,
                   "priority": priority, "status": status},
         extra_params=extra_params,
     )
-    return zabbix_write("triggerprototype", "update", params)
+    return await zabbix_write("triggerprototype", "update", params)
 
 
 @mcp.tool()
-def triggerprototype_delete(triggerids: List[str]) -> str:
+async def triggerprototype_delete(triggerids: List[str]) -> str:
     """Delete trigger prototypes from Zabbix.
 
     Args:
         triggerids: List of trigger prototype IDs to delete
     """
-    return zabbix_delete("triggerprototype", triggerids)
+    return await zabbix_delete("triggerprototype", triggerids)
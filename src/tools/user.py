@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def user_get(userids: Optional[List[str]] = None,
-             output: Union[str, List[str]] = "extend",
-             search: Optional[Dict[str, str]] = None,
-             filter: Optional[Dict[str, Any]] = None,
-             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def user_get(userids: Optional[List[str]] = None,
+                   output: Union[str, List[str]] = "extend",
+                   search: Optional[Dict[str, str]] = None,
+                   filter: Optional[Dict[str, Any]] = None,
+                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get users from Zabbix with optional filtering.
 
     Args:
@@ -29,14 +29,14 @@ def user_get(userids: Optional[List[str]] = None,
         optional={"userids": userids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("user", "get", params)
+    return await zabbix_get("user", "get", params)
 
 
 @mcp.tool()
-def user_create(username: str, passwd: str, usrgrps: List[Dict[str, str]],
-                name: Optional[str] = None, surname: Optional[str] = None,
-                email: Optional[str] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def user_create(username: str, passwd: str, usrgrps: List[Dict[str, str]],
+                      name: Optional[str] = None, surname: Optional[str] = None,
+                      email: Optional[str] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new user in Zabbix.
 
     Args:
@@ -56,14 +56,14 @@ def user_create(username: str, passwd: str, usrgrps: List[Dict[str, str]],
         optional={"name": name, "surname": surname, "email": email},
         extra_params=extra_params,
     )
-    return zabbix_write("user", "create", params)
+    return await zabbix_write("user", "create", params)
 
 
 @mcp.tool()
-def user_update(userid: str, username: Optional[str] = None,
-                name: Optional[str] = None, surname: Optional[str] = None,
-                email: Optional[str] = None,
-                extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def user_update(userid: str, username: Optional[str] = None,
+                      name: Optional[str] = None, surname: Optional[str] = None,
+                      email: Optional[str] = None,
+                      extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update an existing user in Zabbix.
 
     Args:
@@ -82,11 +82,11 @@ def user_update(userid: str, username: Optional[str] = None,
         optional={"username": username, "name": name, "surname": surname, "email": email},
         extra_params=extra_params,
     )
-    return zabbix_write("user", "update", params)
+    return await zabbix_write("user", "update", params)
 
 
 @mcp.tool()
-def user_delete(userids: List[str]) -> str:
+async def user_delete(userids: List[str]) -> str:
     """Delete users from Zabbix.
 
     Args:
@@ -95,12 +95,12 @@ def user_delete(userids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("user", userids)
+    return await zabbix_delete("user", userids)
 
 
 @mcp.tool()
-def user_checkauthentication(token: Optional[str] = None,
-                             extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def user_checkauthentication(token: Optional[str] = None,
+                                   extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Check if the user is authenticated or validate a session.
 
     Args:
@@ -115,12 +115,12 @@ def user_checkauthentication(token: Optional[str] = None,
         optional={"token": token},
         extra_params=extra_params,
     )
-    return zabbix_get("user", "checkAuthentication", params)
+    return await zabbix_get("user", "checkAuthentication", params)
 
 
 @mcp.tool()
-def user_unblock(userids: List[str],
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def user_unblock(userids: List[str],
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Unblock users that have been blocked due to failed login attempts.
 
     Args:
@@ -135,4 +135,4 @@ def user_unblock(userids: List[str],
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("user", "unblock", params)
+    return await zabbix_write("user", "unblock", params)
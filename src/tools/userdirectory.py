@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def userdirectory_get(userdirectoryids: Optional[List[str]] = None,
-                      output: Union[str, List[str]] = "extend",
-                      search: Optional[Dict[str, str]] = None,
-                      filter: Optional[Dict[str, Any]] = None,
-                      extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def userdirectory_get(userdirectoryids: Optional[List[str]] = None,
+                            output: Union[str, List[str]] = "extend",
+                            search: Optional[Dict[str, str]] = None,
+                            filter: Optional[Dict[str, Any]] = None,
+                            extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get user directories from Zabbix.
 
     Args:
@@ -26,12 +26,12 @@ def userdirectory_get(userdirectoryids: Optional[List[str]] = None,
         optional={"userdirectoryids": userdirectoryids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("userdirectory", "get", params)
+    return await zabbix_get("userdirectory", "get", params)
 
 
 @mcp.tool()
-def userdirectory_create(name: str, idp_type: int,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def userdirectory_create(name: str, idp_type: int,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a user directory in Zabbix.
 
     Args:
@@ -44,12 +44,12 @@ def userdirectory_create(name: str, idp_type: int,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("userdirectory", "create", params)
+    return await zabbix_write("userdirectory", "create", params)
 
 
 @mcp.tool()
-def userdirectory_update(userdirectoryid: str, name: Optional[str] = None,
-                         extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def userdirectory_update(userdirectoryid: str, name: Optional[str] = None,
+                               extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a user directory in Zabbix.
 
     Args:
@@ -62,23 +62,23 @@ def userdirectory_update(userdirectoryid: str, name: Optional[str] = None,
         optional={"name": name},
         extra_params=extra_params,
     )
-    return zabbix_write("userdirectory", "update", params)
+    return await zabbix_write("userdirectory", "update", params)
 
 
 @mcp.tool()
-def userdirectory_delete(userdirectoryids: List[str]) -> str:
+async def userdirectory_delete(userdirectoryids: List[str]) -> str:
     """Delete user directories from Zabbix.
 
     Args:
         userdirectoryids: List of user directory IDs to delete
     """
-    return zabbix_delete("userdirectory", userdirectoryids)
+    return await zabbix_delete("userdirectory", userdirectoryids)
 
 
 @mcp.tool()
-def userdirectory_test(userdirectoryid: str,
-                       test_username: str, test_password: str,
-                       extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def userdirectory_test(userdirectoryid: str,
+                             test_username: str, test_password: str,
+                             extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Test a user directory configuration.
 
     Args:
@@ -93,4 +93,4 @@ def userdirectory_test(userdirectoryid: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("userdirectory", "test", params)
+    return await zabbix_write("userdirectory", "test", params)
@@ -7,11 +7,11 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def usergroup_get(usrgrpids: Optional[List[str]] = None,
-                  output: Union[str, List[str]] = "extend",
-                  search: Optional[Dict[str, str]] = None,
-                  filter: Optional[Dict[str, Any]] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def usergroup_get(usrgrpids: Optional[List[str]] = None,
+                        output: Union[str, List[str]] = "extend",
+                        search: Optional[Dict[str, str]] = None,
+                        filter: Optional[Dict[str, Any]] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get user groups from Zabbix.
 
     Args:
@@ -26,13 +26,13 @@ def usergroup_get(usrgrpids: Optional[List[str]] = None,
         optional={"usrgrpids": usrgrpids, "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("usergroup", "get", params)
+    return await zabbix_get("usergroup", "get", params)
 
 
 @mcp.tool()
-def usergroup_create(name: str, gui_access: int = 0,
-                     users_status: int = 0,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def usergroup_create(name: str, gui_access: int = 0,
+                           users_status: int = 0,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a user group in Zabbix.
 
     Args:
@@ -46,14 +46,14 @@ def usergroup_create(name: str, gui_access: int = 0,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("usergroup", "create", params)
+    return await zabbix_write("usergroup", "create", params)
 
 
 @mcp.tool()
-def usergroup_update(usrgrpid: str, name: Optional[str] = None,
-                     gui_access: Optional[int] = None,
-                     users_status: Optional[int] = None,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def usergroup_update(usrgrpid: str, name: Optional[str] = None,
+                           gui_access: Optional[int] = None,
+                           users_status: Optional[int] = None,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a user group in Zabbix.
 
     Args:
@@ -68,14 +68,14 @@ def usergroup_update(usrgrpid: str, name: Optional[str] = None,
         optional={"name": name, "gui_access": gui_access, "users_status": users_status},
         extra_params=extra_params,
     )
-    return zabbix_write("usergroup", "update", params)
+    return await zabbix_write("usergroup", "update", params)
 
 
 @mcp.tool()
-def usergroup_delete(usrgrpids: List[str]) -> str:
+async def usergroup_delete(usrgrpids: List[str]) -> str:
     """Delete user groups from Zabbix.
 
     Args:
         usrgrpids: List of user group IDs to delete
     """
-    return zabbix_delete("usergroup", usrgrpids)
+    return await zabbix_delete("usergroup", usrgrpids)
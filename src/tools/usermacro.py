@@ -7,12 +7,12 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def usermacro_get(globalmacroids: Optional[List[str]] = None,
-                  hostids: Optional[List[str]] = None,
-                  output: Union[str, List[str]] = "extend",
-                  search: Optional[Dict[str, str]] = None,
-                  filter: Optional[Dict[str, Any]] = None,
-                  extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def usermacro_get(globalmacroids: Optional[List[str]] = None,
+                        hostids: Optional[List[str]] = None,
+                        output: Union[str, List[str]] = "extend",
+                        search: Optional[Dict[str, str]] = None,
+                        filter: Optional[Dict[str, Any]] = None,
+                        extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get user macros from Zabbix with optional filtering.
 
     Args:
@@ -32,14 +32,14 @@ def usermacro_get(globalmacroids: Optional[List[str]] = None,
                   "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("usermacro", "get", params)
+    return await zabbix_get("usermacro", "get", params)
 
 
 @mcp.tool()
-def usermacro_create(hostid: str, macro: str, value: str,
-                     type: int = 0,
-                     description: Optional[str] = None,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def usermacro_create(hostid: str, macro: str, value: str,
+                           type: int = 0,
+                           description: Optional[str] = None,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new host macro in Zabbix.
 
     Args:
@@ -58,14 +58,14 @@ def usermacro_create(hostid: str, macro: str, value: str,
         optional={"description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("usermacro", "create", params)
+    return await zabbix_write("usermacro", "create", params)
 
 
 @mcp.tool()
-def usermacro_createglobal(macro: str, value: str,
-                           type: int = 0,
-                           description: Optional[str] = None,
-                           extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def usermacro_createglobal(macro: str, value: str,
+                                 type: int = 0,
+                                 description: Optional[str] = None,
+                                 extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a new global macro in Zabbix.
 
     Args:
@@ -83,14 +83,14 @@ def usermacro_createglobal(macro: str, value: str,
         optional={"description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("usermacro", "createglobal", params)
+    return await zabbix_write("usermacro", "createglobal", params)
 
 
 @mcp.tool()
-def usermacro_update(hostmacroid: str, macro: Optional[str] = None,
-                     value: Optional[str] = None, type: Optional[int] = None,
-                     description: Optional[str] = None,
-                     extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def usermacro_update(hostmacroid: str, macro: Optional[str] = None,
+                           value: Optional[str] = None, type: Optional[int] = None,
+                           description: Optional[str] = None,
+                           extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a host macro in Zabbix.
 
     Args:
@@ -110,14 +110,14 @@ def usermacro_update(hostmacroid: str, macro: Optional[str] = None,
                   "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("usermacro", "update", params)
+    return await zabbix_write("usermacro", "update", params)
 
 
 @mcp.tool()
-def usermacro_updateglobal(globalmacroid: str, macro: Optional[str] = None,
-                           value: Optional[str] = None, type: Optional[int] = None,
-                           description: Optional[str] = None,
-                           extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def usermacro_updateglobal(globalmacroid: str, macro: Optional[str] = None,
+                                 value: Optional[str] = None, type: Optional[int] = None,
+                                 description: Optional[str] = None,
+                                 extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a global macro in Zabbix.
 
     Args:
@@ -137,11 +137,11 @@ def usermacro_updateglobal(globalmacroid: str, macro: Optional[str] = None,
                   "description": description},
         extra_params=extra_params,
     )
-    return zabbix_write("usermacro", "updateglobal", params)
+    return await zabbix_write("usermacro", "updateglobal", params)
 
 
 @mcp.tool()
-def usermacro_delete(hostmacroids: List[str]) -> str:
+async def usermacro_delete(hostmacroids: List[str]) -> str:
     """Delete host macros from Zabbix.
 
     Args:
@@ -150,11 +150,11 @@ def usermacro_delete(hostmacroids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    return zabbix_delete("usermacro", hostmacroids)
+    return await zabbix_delete("usermacro", hostmacroids)
 
 
 @mcp.tool()
-def usermacro_deleteglobal(globalmacroids: List[str]) -> str:
+async def usermacro_deleteglobal(globalmacroids: List[str]) -> str:
     """Delete global macros from Zabbix.
 
     Args:
@@ -163,8 +163,4 @@ def usermacro_deleteglobal(globalmacroids: List[str]) -> str:
     Returns:
         str: JSON formatted deletion result
     """
-    from src._core import validate_read_only, get_zabbix_client, format_response
-    validate_read_only()
-    client = get_zabbix_client()
-    result = client.usermacro.deleteglobal(*globalmacroids)
-    return format_response(result)
+    return await zabbix_delete("usermacro", globalmacroids, api_method="deleteglobal")
@@ -7,12 +7,12 @@ from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_d
 
 
 @mcp.tool()
-def valuemap_get(valuemapids: Optional[List[str]] = None,
-                 hostids: Optional[List[str]] = None,
-                 output: Union[str, List[str]] = "extend",
-                 search: Optional[Dict[str, str]] = None,
-                 filter: Optional[Dict[str, Any]] = None,
-                 extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def valuemap_get(valuemapids: Optional[List[str]] = None,
+                       hostids: Optional[List[str]] = None,
+                       output: Union[str, List[str]] = "extend",
+                       search: Optional[Dict[str, str]] = None,
+                       filter: Optional[Dict[str, Any]] = None,
+                       extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Get value maps from Zabbix.
 
     Args:
@@ -29,13 +29,13 @@ def valuemap_get(valuemapids: Optional[List[str]] = None,
                   "search": search, "filter": filter},
         extra_params=extra_params,
     )
-    return zabbix_get("valuemap", "get", params)
+    return await zabbix_get("valuemap", "get", params)
 
 
 @mcp.tool()
-def valuemap_create(name: str, hostid: str,
-                    mappings: List[Dict[str, str]],
-                    extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def valuemap_create(name: str, hostid: str,
+                          mappings: List[Dict[str, str]],
+                          extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Create a value map in Zabbix.
 
     Args:
@@ -49,13 +49,13 @@ def valuemap_create(name: str, hostid: str,
         optional={},
         extra_params=extra_params,
     )
-    return zabbix_write("valuemap", "create", params)
+    return await zabbix_write("valuemap", "create", params)
 
 
 @mcp.tool()
-def valuemap_update(valuemapid: str, name: Optional[str] = None,
-                    mappings: Optional[List[Dict[str, str]]] = None,
-                    extra_params: Optional[Dict[str, Any]] = None) -> str:
+async def valuemap_update(valuemapid: str, name: Optional[str] = None,
+                          mappings: Optional[List[Dict[str, str]]] = None,
+                          extra_params: Optional[Dict[str, Any]] = None) -> str:
     """Update a value map in Zabbix.
 
     Args:
@@ -69,14 +69,14 @@ def valuemap_update(valuemapid: str, name: Optional[str] = None,
         optional={"name": name, "mappings": mappings},
         extra_params=extra_params,
     )
-    return zabbix_write("valuemap", "update", params)
+    return await zabbix_write("valuemap", "update", params)
 
 
 @mcp.tool()
-def valuemap_delete(valuemapids: List[str]) -> str:
+async def valuemap_delete(valuemapids: List[str]) -> str:
     """Delete value maps from Zabbix.
 
     Args:
         valuemapids: List of value map IDs to delete
     """
-    return zabbix_delete("valuemap", valuemapids)
+    return await zabbix_delete("valuemap", valuemapids)
@@ -10,26 +10,105 @@ Author: Zabbix MCP Server Contributors
 License: MIT
 """
 
-import logging
-import os
+import time
 
-import click
+_import_start = time.perf_counter()
+
+import asyncio  # noqa: E402
+import contextlib  # noqa: E402
+import logging  # noqa: E402
+import os  # noqa: E402
+
+import click  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import JSONResponse, Response  # noqa: E402
 
 # Re-export core objects for backward compatibility (scripts, tests, etc.)
-from src._core import (  # noqa: F401
+from src._core import (  # noqa: F401,E402
     mcp,
     get_zabbix_client,
+    close_zabbix_client,
     format_response,
     validate_read_only,
     is_read_only,
     set_read_only,
 )
 
-# Import all tool modules to register tools with the mcp instance
-import src.tools  # noqa: F401
+from src._core import get_transport_config  # noqa: E402
+
+from src._hot_items import get_hot_items  # noqa: E402
+from src._metrics import CONTENT_TYPE, render as render_metrics  # noqa: E402
+from src._topology import get_topology, is_topology_preload_enabled  # noqa: E402
+from src._tracing import TRACING_EXPORTERS, setup_tracing  # noqa: E402
+from src.tools import register_tools  # noqa: E402
+from src.tools._lazy import StartupProfile, get_tool_profile, is_lazy_enabled  # noqa: E402
+from src.tools._registry import run_hot_items, run_topology  # noqa: E402
+from src.tools._warmup import (  # noqa: E402
+    get_warm_objects, is_warm_cache_enabled, keep_warm, mark_ready, readiness, warm_up,
+)
+
+# Seconds spent importing the modules above, reported by --profile-startup
+_import_seconds = time.perf_counter() - _import_start
 
 logger = logging.getLogger(__name__)
 
+# Register the tools selected by the environment, so importing ``mcp`` from
+# here gives a complete server; main() re-registers when its options differ
+_register_start = time.perf_counter()
+try:
+    register_tools(lazy=is_lazy_enabled(), tool_profile=get_tool_profile())
+except ValueError as e:
+    logger.error(f"Tools not registered: {e}")
+_register_seconds = time.perf_counter() - _register_start
+
+
+@mcp.custom_route("/ready", methods=["GET"])
+async def ready(request: Request) -> JSONResponse:
+    """Readiness probe for the HTTP transport: 503 until the warm-up has finished."""
+    return JSONResponse(readiness, status_code=200 if readiness["ready"] else 503)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Prometheus metrics for the HTTP transport: tool and upstream latency, cache counters."""
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
+
+
+async def serve(**transport_kwargs):
+    """Run the MCP server together with its background tasks.
+
+    With cache warm-up enabled, stdio waits for the warm-up before serving;
+    HTTP starts serving at once and reports readiness on ``/ready``.
+
+    Args:
+        **transport_kwargs: Arguments for ``mcp.run_async``, as returned by ``get_transport_config``
+    """
+    tasks = []
+    if is_warm_cache_enabled():
+        objects = get_warm_objects()
+        logger.info(f"Warming up the response cache: {', '.join(objects)}")
+        if transport_kwargs.get("transport", "stdio") == "stdio":
+            await warm_up(objects)
+        else:
+            tasks.append(asyncio.create_task(warm_up(objects)))
+        tasks.append(asyncio.create_task(keep_warm(objects)))
+    else:
+        mark_ready()
+    hot = get_hot_items()
+    if hot is not None:
+        logger.info(f"Tracking hot items in {hot.directory}")
+        tasks.append(asyncio.create_task(run_hot_items(hot)))
+    if is_topology_preload_enabled():
+        tasks.append(asyncio.create_task(run_topology(get_topology())))
+    try:
+        await mcp.run_async(**transport_kwargs)
+    finally:
+        for task in tasks:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await close_zabbix_client()
+
 
 @click.command()
 @click.option(
@@ -61,33 +140,156 @@ logger = logging.getLogger(__name__)
     default=None,
     help="Enable or disable SSL certificate verification.",
 )
-def main(mode, transport, host, port, verify_ssl):
+@click.option(
+    "--pool-size",
+    type=int,
+    default=None,
+    help="Maximum open connections to the Zabbix API (0 = unlimited).",
+)
+@click.option(
+    "--pool-max-per-host",
+    type=int,
+    default=None,
+    help="Maximum open connections per Zabbix host (0 = unlimited).",
+)
+@click.option(
+    "--pool-keepalive",
+    type=float,
+    default=None,
+    help="Seconds to keep idle Zabbix API connections open for reuse.",
+)
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=None,
+    help="Maximum IDs per request before a *.get call is split into chunks (0 = never split).",
+)
+@click.option(
+    "--chunk-concurrency",
+    type=int,
+    default=None,
+    help="Maximum chunks of a split *.get call in flight at once.",
+)
+@click.option(
+    "--history-cache",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="SQLite file for the on-disk history/trend cache (disabled when unset).",
+)
+@click.option(
+    "--warm-cache/--no-warm-cache",
+    default=None,
+    help="Log in and preload inventory objects into the response cache at startup.",
+)
+@click.option(
+    "--lazy-tools/--eager-tools",
+    default=None,
+    help="Register tools from the precomputed manifest and import each module on first use.",
+)
+@click.option(
+    "--profile",
+    "tool_profile",
+    type=str,
+    default=None,
+    help="Tool profile(s) and/or modules to register, comma-separated (full, monitoring, "
+         "inventory, admin).",
+)
+@click.option(
+    "--profile-startup",
+    is_flag=True,
+    default=False,
+    help="Report import and registration time per tool module on stderr, then exit.",
+)
+@click.option(
+    "--tracing",
+    type=click.Choice(TRACING_EXPORTERS, case_sensitive=False),
+    default=None,
+    help="Export OpenTelemetry spans of tool calls and Zabbix API requests.",
+)
+@click.option(
+    "--slow-call-threshold",
+    type=float,
+    default=None,
+    help="Seconds from which a Zabbix API call is recorded in the slow-call log (0 = disabled).",
+)
+@click.option(
+    "--response-format",
+    type=click.Choice(["pretty", "compact", "columnar"], case_sensitive=False),
+    default=None,
+    help="Default JSON layout of tool responses.",
+)
+def main(mode, transport, host, port, verify_ssl, pool_size, pool_max_per_host,
+         pool_keepalive, chunk_size, chunk_concurrency, history_cache, warm_cache,
+         lazy_tools, tool_profile, profile_startup, tracing, slow_call_threshold, response_format):
     """Zabbix MCP Server."""
     # CLI flags override env vars
     if mode is not None:
         set_read_only(mode == "read-only")
+    if transport is not None:
+        os.environ["ZABBIX_MCP_TRANSPORT"] = transport.lower()
+    if host is not None:
+        os.environ["ZABBIX_MCP_HOST"] = host
+    if port is not None:
+        os.environ["ZABBIX_MCP_PORT"] = str(port)
     if verify_ssl is not None:
         os.environ["VERIFY_SSL"] = str(verify_ssl).lower()
+    if pool_size is not None:
+        os.environ["ZABBIX_POOL_SIZE"] = str(pool_size)
+    if pool_max_per_host is not None:
+        os.environ["ZABBIX_POOL_MAX_PER_HOST"] = str(pool_max_per_host)
+    if pool_keepalive is not None:
+        os.environ["ZABBIX_POOL_KEEPALIVE"] = str(pool_keepalive)
+    if chunk_size is not None:
+        os.environ["ZABBIX_CHUNK_SIZE"] = str(chunk_size)
+    if chunk_concurrency is not None:
+        os.environ["ZABBIX_CHUNK_CONCURRENCY"] = str(chunk_concurrency)
+    if history_cache is not None:
+        os.environ["ZABBIX_HISTORY_CACHE_PATH"] = history_cache
+    if warm_cache is not None:
+        os.environ["ZABBIX_WARM_CACHE"] = str(warm_cache).lower()
+    if response_format is not None:
+        os.environ["ZABBIX_MCP_RESPONSE_FORMAT"] = response_format.lower()
+    if lazy_tools is not None:
+        os.environ["ZABBIX_LAZY_TOOLS"] = str(lazy_tools).lower()
+    if tool_profile is not None:
+        os.environ["ZABBIX_TOOL_PROFILE"] = tool_profile
+    if tracing is not None:
+        os.environ["ZABBIX_TRACING"] = tracing.lower()
+    if slow_call_threshold is not None:
+        os.environ["ZABBIX_SLOW_CALL_THRESHOLD"] = str(slow_call_threshold)
+
+    try:
+        setup_tracing()
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'--tracing' / ZABBIX_TRACING")
 
-    transport = transport or os.getenv("ZABBIX_MCP_TRANSPORT", "stdio")
-    transport = transport.lower()
-    host = host or os.getenv("ZABBIX_MCP_HOST", "0.0.0.0")
-    port = port or int(os.getenv("ZABBIX_MCP_PORT", "8002"))
+    profile = StartupProfile() if profile_startup else None
+    if profile is not None:
+        profile.phase("core imports", _import_seconds)
+        profile.phase("tool registration on import", _register_seconds)
+    start = time.perf_counter()
+    try:
+        register_tools(lazy=is_lazy_enabled(), profile=profile, tool_profile=get_tool_profile())
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'--profile' / ZABBIX_TOOL_PROFILE")
+    if profile is not None:
+        profile.phase("tool registration", time.perf_counter() - start)
+        click.echo(profile.report(), err=True)
+        return
+
+    try:
+        transport_config = get_transport_config()
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="'--transport' / ZABBIX_MCP_TRANSPORT")
 
     logger.info("Starting Zabbix MCP Server")
-    logger.info(f"Transport: {transport}")
+    logger.info(f"Transport: {transport_config['transport']}")
     logger.info(f"Read-only mode: {is_read_only()}")
+    logger.info(f"Tool profile: {get_tool_profile()}")
     logger.info(f"Zabbix URL: {os.getenv('ZABBIX_URL', 'Not configured')}")
 
     try:
-        if transport == "stdio":
-            mcp.run()
-        else:  # streamable-http
-            mcp.run(
-                transport="streamable-http",
-                host=host,
-                port=port,
-            )
+        asyncio.run(serve(**transport_config))
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
@@ -2,7 +2,14 @@
 
 import os
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
+
+
+@pytest.fixture(autouse=True, scope="session")
+def registered_tools():
+    """Register every tool module, as the server does at startup."""
+    from src.tools import register_tools
+    register_tools()
 
 
 @pytest.fixture(autouse=True)
@@ -14,6 +21,16 @@ def mock_env(monkeypatch):
     monkeypatch.setenv("VERIFY_SSL", "true")
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with an empty response cache."""
+    from src._cache import get_response_cache
+    cache = get_response_cache()
+    if cache is not None:
+        cache.clear()
+    yield
+
+
 @pytest.fixture
 def read_only_env(monkeypatch):
     """Switch to read-only mode."""
@@ -22,12 +39,12 @@ def read_only_env(monkeypatch):
 
 @pytest.fixture
 def mock_zabbix_client():
-    """Provide a mocked ZabbixAPI client.
+    """Provide a mocked AsyncZabbixAPI client.
 
-    Patches get_zabbix_client to return a MagicMock, then yields
+    Patches get_zabbix_client to return an AsyncMock, then yields
     the mock so tests can inspect calls.
     """
-    mock_client = MagicMock()
+    mock_client = AsyncMock()
     with patch("src._core.get_zabbix_client", return_value=mock_client) as _:
         # Also patch in the registry since it imports from _core
         with patch("src.tools._registry.get_zabbix_client", return_value=mock_client):
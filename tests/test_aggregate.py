@@ -0,0 +1,75 @@
+"""Tests for _aggregate module."""
+
+import pytest
+
+import src._aggregate
+from src._aggregate import Samples, aggregate, validate_functions
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run each test with the pure-Python and (when installed) NumPy implementations."""
+    if request.param == "python":
+        monkeypatch.setattr(src._aggregate, "np", None)
+    elif src._aggregate.np is None:
+        pytest.skip("numpy not installed")
+    return request.param
+
+
+def history(values, step=60, start=3600):
+    samples = Samples()
+    for i, value in enumerate(values):
+        samples.append(start + i * step, float(value))
+    return samples
+
+
+class TestValidateFunctions:
+    def test_known_and_percentiles(self):
+        assert validate_functions(["min", "p95", "p99.9"]) == ["min", "p95", "p99.9"]
+
+    def test_unknown(self):
+        with pytest.raises(ValueError, match="Invalid aggregation function: median"):
+            validate_functions(["median"])
+
+    def test_out_of_range_percentile(self):
+        with pytest.raises(ValueError):
+            validate_functions(["p101"])
+
+    def test_empty(self):
+        with pytest.raises(ValueError, match="At least one"):
+            validate_functions([])
+
+
+class TestAggregate:
+    def test_overall(self, backend):
+        rows = aggregate(history([1, 2, 3, 4]), ["min", "max", "avg", "count", "p50", "stddev"])
+        assert rows == [{"min": 1.0, "max": 4.0, "avg": 2.5, "count": 4, "p50": 2.5,
+                         "stddev": pytest.approx(1.118034, rel=1e-6)}]
+
+    def test_percentile_interpolates(self, backend):
+        rows = aggregate(history(range(101)), ["p95", "p100"])
+        assert rows == [{"p95": 95.0, "p100": 100.0}]
+
+    def test_rate_per_second(self, backend):
+        assert aggregate(history([0, 60, 120]), ["rate"]) == [{"rate": 1.0}]
+
+    def test_rate_single_sample(self, backend):
+        assert aggregate(history([5]), ["rate"]) == [{"rate": None}]
+
+    def test_buckets_aligned_to_epoch(self, backend):
+        samples = history([1, 2, 3, 4], step=1800, start=3600 + 900)
+        rows = aggregate(samples, ["avg", "count"], bucket=3600)
+        assert rows == [{"clock": 3600, "avg": 1.5, "count": 2},
+                        {"clock": 7200, "avg": 3.5, "count": 2}]
+
+    def test_trend_rollups_weighted(self, backend):
+        samples = Samples(rollup=True)
+        samples.append_rollup(7200, 4.0, 1.0, 9.0, 3)
+        samples.append_rollup(3600, 2.0, 0.5, 3.0, 1)
+        rows = aggregate(samples, ["min", "max", "avg", "count", "rate"])
+        assert rows == [{"min": 0.5, "max": 9.0, "avg": 3.5, "count": 4,
+                         "rate": pytest.approx(2.0 / 3600)}]
+
+    def test_empty(self, backend):
+        assert aggregate(Samples(), ["count", "avg"]) == [{"count": 0, "avg": None}]
+        assert aggregate(Samples(), ["count"], bucket=60) == []
@@ -0,0 +1,113 @@
+"""Tests for _cache module."""
+
+from unittest.mock import patch
+
+from src._cache import ResponseCache, _parse_ttls, invalidated_objects
+
+
+class TestResponseCache:
+    def test_make_key_canonicalizes_params(self):
+        key_a = ResponseCache.make_key("host", "get", {"output": "extend", "hostids": ["1"]})
+        key_b = ResponseCache.make_key("host", "get", {"hostids": ["1"], "output": "extend"})
+        assert key_a == key_b
+
+    def test_hit_and_miss_counters(self):
+        cache = ResponseCache()
+        key = cache.make_key("host", "get", {})
+        assert cache.get(key) is None
+        cache.set(key, "[]", ttl=60)
+        assert cache.get(key) == "[]"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_expired_entry_is_a_miss(self):
+        cache = ResponseCache()
+        key = cache.make_key("host", "get", {})
+        with patch("src._cache.time.monotonic", return_value=100.0):
+            cache.set(key, "[]", ttl=10)
+        with patch("src._cache.time.monotonic", return_value=111.0):
+            assert cache.get(key) is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_zero_ttl_not_stored(self):
+        cache = ResponseCache()
+        key = cache.make_key("problem", "get", {})
+        cache.set(key, "[]", ttl=0)
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_by_entries(self):
+        cache = ResponseCache(max_entries=2)
+        keys = [cache.make_key("host", "get", {"limit": i}) for i in range(3)]
+        cache.set(keys[0], "a", ttl=60)
+        cache.set(keys[1], "b", ttl=60)
+        cache.get(keys[0])
+        cache.set(keys[2], "c", ttl=60)
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == "a"
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        cache = ResponseCache(max_bytes=10)
+        first = cache.make_key("host", "get", {"limit": 1})
+        second = cache.make_key("host", "get", {"limit": 2})
+        cache.set(first, "x" * 6, ttl=60)
+        cache.set(second, "y" * 6, ttl=60)
+        assert cache.get(first) is None
+        assert cache.stats()["bytes"] == 6
+
+    def test_ttl_policies(self):
+        cache = ResponseCache(default_ttl=30)
+        assert cache.ttl_for("template") > cache.ttl_for("host")
+        assert cache.ttl_for("problem") < cache.ttl_for("proxygroup")
+        assert cache.ttl_for("item") == cache.ttl_for("trigger") == cache.ttl_for("host") == 2
+        assert cache.ttl_for("unknownobject") == 30
+
+
+class TestInvalidation:
+    def _filled_cache(self, *objects):
+        cache = ResponseCache()
+        for name in objects:
+            cache.set(cache.make_key(name, "get", {}), "[]", ttl=300)
+        return cache
+
+    def test_host_write_evicts_dependents(self):
+        cache = self._filled_cache("host", "hostinterface", "hostgroup", "valuemap")
+        assert cache.invalidate("host") == 3
+        assert cache.get(cache.make_key("valuemap", "get", {})) == "[]"
+
+    def test_template_write_evicts_hosts(self):
+        assert "host" in invalidated_objects("template")
+        assert invalidated_objects("template")[0] == "template"
+
+    def test_unmapped_object_evicts_itself(self):
+        assert invalidated_objects("regexp") == ("regexp",)
+
+    def test_configuration_import_clears_everything(self):
+        cache = self._filled_cache("host", "template", "valuemap")
+        assert cache.invalidate("configuration") == 3
+        assert cache.stats()["entries"] == 0
+
+    def test_stale_generation_not_stored(self):
+        cache = ResponseCache()
+        key = cache.make_key("host", "get", {})
+        generation = cache.generation("host")
+        cache.invalidate("hostgroup")
+        cache.set(key, "[]", ttl=300, generation=generation)
+        assert cache.get(key) is None
+
+    def test_unrelated_invalidation_keeps_generation(self):
+        cache = ResponseCache()
+        key = cache.make_key("host", "get", {})
+        generation = cache.generation("host")
+        cache.invalidate("regexp")
+        cache.set(key, "[]", ttl=300, generation=generation)
+        assert cache.get(key) == "[]"
+
+
+class TestParseTtls:
+    def test_pairs(self):
+        assert _parse_ttls("host=60, problem=0") == {"host": 60.0, "problem": 0.0}
+
+    def test_empty(self):
+        assert _parse_ttls("") == {}
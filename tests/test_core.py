@@ -1,11 +1,15 @@
 """Tests for _core module."""
 
+import asyncio
 import json
+import threading
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 from src._core import (
+    get_zabbix_client,
     format_response,
+    to_columnar,
     is_read_only,
     validate_read_only,
     get_transport_config,
@@ -31,6 +35,59 @@ class TestFormatResponse:
         result = format_response(data)
         assert json.loads(result) == data
 
+    def test_pretty_is_indented(self):
+        assert "\n  " in format_response({"key": "value"})
+
+    def test_compact_has_no_whitespace(self):
+        result = format_response({"hosts": [{"hostid": "1"}]}, "compact")
+        assert result == '{"hosts":[{"hostid":"1"}]}'
+
+    def test_global_compact(self, monkeypatch):
+        monkeypatch.setenv("ZABBIX_MCP_RESPONSE_FORMAT", "compact")
+        assert format_response([1, 2]) == "[1,2]"
+
+    def test_columnar(self):
+        data = [{"itemid": "1", "clock": "10"}, {"itemid": "2", "clock": "20"}]
+        assert json.loads(format_response(data, "columnar")) == {
+            "columns": ["itemid", "clock"], "rows": [["1", "10"], ["2", "20"]]}
+
+    def test_columnar_leaves_non_tables(self):
+        assert json.loads(format_response({"hostids": ["1"]}, "columnar")) == {"hostids": ["1"]}
+
+    def test_invalid_format(self):
+        with pytest.raises(ValueError, match="Invalid response format"):
+            format_response([], "yaml")
+
+    @pytest.mark.parametrize("backend", ["json", "auto"])
+    def test_backends_agree(self, monkeypatch, backend):
+        monkeypatch.setenv("ZABBIX_MCP_JSON_BACKEND", backend)
+        data = {"items": [{"itemid": "1", "lastvalue": 0.5}], 10: None}
+        assert json.loads(format_response(data, "compact")) == {
+            "items": [{"itemid": "1", "lastvalue": 0.5}], "10": None}
+
+    def test_wide_integers_fall_back(self):
+        assert json.loads(format_response({"n": 2 ** 70}, "compact")) == {"n": 2 ** 70}
+
+    def test_non_json_types_use_str(self):
+        from datetime import date
+        assert json.loads(format_response({"d": date(2024, 1, 2)})) == {"d": "2024-01-02"}
+
+
+class TestToColumnar:
+    def test_union_of_keys_in_first_seen_order(self):
+        data = [{"a": 1}, {"b": 2, "a": 3}]
+        assert to_columnar(data) == {"columns": ["a", "b"], "rows": [[1, None], [3, 2]]}
+
+    def test_nested_values_kept(self):
+        data = [{"hostid": "1", "interfaces": [{"ip": "127.0.0.1"}]}]
+        assert to_columnar(data)["rows"] == [["1", [{"ip": "127.0.0.1"}]]]
+
+    def test_empty_list(self):
+        assert to_columnar([]) == {"columns": [], "rows": []}
+
+    def test_mixed_list_unchanged(self):
+        assert to_columnar([{"a": 1}, 2]) == [{"a": 1}, 2]
+
 
 class TestIsReadOnly:
     def test_default_is_false_with_env(self, monkeypatch):
@@ -86,6 +143,105 @@ class TestGetTransportConfig:
         assert config["host"] == "0.0.0.0"
         assert config["port"] == 9090
 
+    def test_main_serves_with_transport_config(self, monkeypatch):
+        from click.testing import CliRunner
+        import src.zabbix_mcp_server as server
+
+        for name in ("ZABBIX_MCP_TRANSPORT", "ZABBIX_MCP_HOST", "ZABBIX_MCP_PORT"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("AUTH_TYPE", "no-auth")
+        serve = MagicMock()
+        monkeypatch.setattr(server, "serve", serve)
+        monkeypatch.setattr(server.asyncio, "run", MagicMock())
+        result = CliRunner().invoke(server.main, ["--transport", "streamable-http", "--port", "9090"])
+        assert result.exit_code == 0, result.output
+        serve.assert_called_once_with(transport="streamable-http", host="127.0.0.1", port=9090,
+                                      stateless_http=False)
+
+    def test_main_rejects_http_without_auth_type(self, monkeypatch):
+        from click.testing import CliRunner
+        import src.zabbix_mcp_server as server
+
+        monkeypatch.delenv("ZABBIX_MCP_TRANSPORT", raising=False)
+        monkeypatch.delenv("AUTH_TYPE", raising=False)
+        result = CliRunner().invoke(server.main, ["--transport", "streamable-http"])
+        assert result.exit_code == 2
+        assert "AUTH_TYPE" in result.output
+
+
+class TestGetZabbixClient:
+    def test_concurrent_callers_share_one_login(self, reset_zabbix_api):
+        fake_client = MagicMock()
+        fake_client.login = AsyncMock()
+        fake_client.client_session.closed = False
+
+        async def get_many():
+            return await asyncio.gather(*(get_zabbix_client() for _ in range(5)))
+
+        with patch("src._core.create_client_session"), \
+                patch("zabbix_utils.AsyncZabbixAPI", return_value=fake_client) as ctor:
+            clients = asyncio.run(get_many())
+        assert all(client is fake_client for client in clients)
+        ctor.assert_called_once()
+        fake_client.login.assert_awaited_once_with(token="test-token-123")
+
+    def test_uses_pooled_session(self, reset_zabbix_api):
+        fake_client = MagicMock()
+        fake_client.login = AsyncMock()
+        session = MagicMock()
+        with patch("src._core.create_client_session", return_value=session) as create, \
+                patch("zabbix_utils.AsyncZabbixAPI", return_value=fake_client) as ctor:
+            asyncio.run(get_zabbix_client())
+        create.assert_called_once_with(True)
+        assert ctor.call_args[1]["client_session"] is session
+
+    def test_client_built_off_the_event_loop(self, reset_zabbix_api):
+        fake_client = MagicMock()
+        fake_client.login = AsyncMock()
+        threads = []
+
+        def build(**kwargs):
+            threads.append(threading.get_ident())
+            return fake_client
+
+        with patch("src._core.create_client_session"), \
+                patch("zabbix_utils.AsyncZabbixAPI", side_effect=build):
+            asyncio.run(get_zabbix_client())
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_client_of_previous_loop_closed(self, reset_zabbix_api):
+        first, second = MagicMock(), MagicMock()
+        for client in (first, second):
+            client.login = AsyncMock()
+            client.client_session.closed = False
+            client.client_session.close = AsyncMock()
+        with patch("src._core.create_client_session"), \
+                patch("zabbix_utils.AsyncZabbixAPI", side_effect=[first, second]):
+            assert asyncio.run(get_zabbix_client()) is first
+            assert asyncio.run(get_zabbix_client()) is second
+        first.client_session.close.assert_awaited_once()
+        second.client_session.close.assert_not_awaited()
+
+    def test_client_with_closed_session_replaced(self, reset_zabbix_api):
+        first, second = MagicMock(), MagicMock()
+        for client in (first, second):
+            client.login = AsyncMock()
+            client.client_session.closed = False
+
+        async def get_twice():
+            client = await get_zabbix_client()
+            client.client_session.closed = True  # e.g. closed by zabbix_utils on an API error
+            return client, await get_zabbix_client()
+
+        with patch("src._core.create_client_session"), \
+                patch("zabbix_utils.AsyncZabbixAPI", side_effect=[first, second]):
+            assert asyncio.run(get_twice()) == (first, second)
+
+    def test_missing_url(self, monkeypatch, reset_zabbix_api):
+        monkeypatch.delenv("ZABBIX_URL")
+        with pytest.raises(ValueError, match="ZABBIX_URL"):
+            asyncio.run(get_zabbix_client())
+
 
 class TestMcpInstance:
     def test_mcp_name(self):
@@ -0,0 +1,70 @@
+"""Tests for _downsample module."""
+
+import math
+
+import pytest
+
+import src._downsample
+from src._downsample import Series, downsample
+
+
+def make_series(values, step=10, start=1000):
+    series = Series()
+    for i, value in enumerate(values):
+        series.append(start + i * step, float(value))
+    return series
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run each test with the pure-Python and (when installed) NumPy reducers."""
+    if request.param == "python":
+        monkeypatch.setattr(src._downsample, "np", None)
+    elif src._downsample.np is None:
+        pytest.skip("numpy not installed")
+    return request.param
+
+
+class TestDownsample:
+    def test_short_series_returned_unchanged(self, backend):
+        series = make_series([1, 2, 3])
+        assert downsample(series, 10) == [(1000, 1.0), (1010, 2.0), (1020, 3.0)]
+
+    def test_lttb_keeps_endpoints_and_size(self, backend):
+        series = make_series([math.sin(i / 10) for i in range(1000)])
+        points = downsample(series, 50, "lttb")
+        assert len(points) == 50
+        assert points[0] == (1000, 0.0)
+        assert points[-1][0] == 1000 + 999 * 10
+        assert [p[0] for p in points] == sorted(p[0] for p in points)
+
+    def test_lttb_keeps_spike(self, backend):
+        values = [0.0] * 1000
+        values[500] = 100.0
+        points = downsample(make_series(values), 20, "lttb")
+        assert (1000 + 5000, 100.0) in points
+
+    def test_minmax_keeps_extremes_per_bucket(self, backend):
+        values = [0.0] * 100
+        values[10] = -5.0
+        values[90] = 7.0
+        points = downsample(make_series(values), 4, "minmax")
+        assert len(points) <= 4
+        assert (1100, -5.0) in points
+        assert (1900, 7.0) in points
+
+    def test_avg_buckets(self, backend):
+        points = downsample(make_series([1, 3, 5, 7], step=10), 2, "avg")
+        assert points == [(1005, 2.0), (1025, 6.0)]
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError, match="Invalid downsampling method"):
+            downsample(Series(), 10, "median")
+
+    def test_invalid_max_points(self):
+        with pytest.raises(ValueError, match="max_points"):
+            downsample(Series(), 0)
+
+    def test_minmax_needs_two_points(self):
+        with pytest.raises(ValueError, match="at least 2 for minmax"):
+            downsample(Series(), 1, "minmax")
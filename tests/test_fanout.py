@@ -0,0 +1,90 @@
+"""Tests for _fanout module."""
+
+import asyncio
+
+from src._fanout import fan_out, get_fanout_settings, get_fanout_stats, merge_results, split_ids
+
+
+class TestGetFanoutSettings:
+    def test_defaults(self, monkeypatch):
+        monkeypatch.delenv("ZABBIX_CHUNK_SIZE", raising=False)
+        monkeypatch.delenv("ZABBIX_CHUNK_CONCURRENCY", raising=False)
+        assert get_fanout_settings() == {"chunk_size": 1000, "concurrency": 4}
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("ZABBIX_CHUNK_SIZE", "50")
+        monkeypatch.setenv("ZABBIX_CHUNK_CONCURRENCY", "0")
+        assert get_fanout_settings() == {"chunk_size": 50, "concurrency": 1}
+
+
+class TestSplitIds:
+    def test_short_list_not_split(self):
+        assert split_ids({"itemids": ["1", "2"]}, 2) is None
+
+    def test_longest_list_split(self):
+        params = {"hostids": ["1", "2", "3"], "itemids": ["1", "2", "3", "4", "5"]}
+        assert split_ids(params, 2) == ("itemids", [["1", "2"], ["3", "4"], ["5"]])
+
+    def test_disabled(self):
+        assert split_ids({"itemids": ["1", "2", "3"]}, 0) is None
+
+    def test_group_count_not_split(self):
+        assert split_ids({"itemids": ["1", "2", "3"], "groupCount": True}, 1) is None
+
+    def test_count_output_not_split(self):
+        # A host in groups of different chunks would be counted twice
+        assert split_ids({"groupids": ["1", "2", "3"], "countOutput": True}, 1) is None
+
+
+class TestMergeResults:
+    def test_sorted_numerically_and_limited(self):
+        results = [[{"clock": "9"}, {"clock": "20"}], [{"clock": "10"}]]
+        params = {"sortfield": "clock", "sortorder": "DESC", "limit": 2}
+        assert merge_results(results, params, None) == [{"clock": "20"}, {"clock": "10"}]
+
+    def test_multiple_sort_fields(self):
+        results = [[{"name": "b", "itemid": "1"}], [{"name": "a", "itemid": "3"}, {"name": "a", "itemid": "2"}]]
+        params = {"sortfield": ["name", "itemid"], "sortorder": ["ASC", "DESC"]}
+        assert [r["itemid"] for r in merge_results(results, params, "itemid")] == ["3", "2", "1"]
+
+    def test_duplicates_dropped(self):
+        results = [[{"hostid": "1"}], [{"hostid": "1"}, {"hostid": "2"}]]
+        assert merge_results(results, {}, "hostid") == [{"hostid": "1"}, {"hostid": "2"}]
+
+    def test_preservekeys(self):
+        results = [{"2": {"itemid": "2"}}, {"1": {"itemid": "1"}}]
+        params = {"preservekeys": True, "sortfield": "itemid"}
+        assert list(merge_results(results, params, "itemid")) == ["1", "2"]
+
+
+class TestFanOut:
+    def test_small_call_not_split(self):
+        calls = []
+
+        async def call(params):
+            calls.append(params)
+            return []
+
+        asyncio.run(fan_out(call, "item", {"itemids": ["1"]}))
+        assert calls == [{"itemids": ["1"]}]
+
+    def test_chunks_bounded_and_merged(self, monkeypatch):
+        monkeypatch.setenv("ZABBIX_CHUNK_SIZE", "2")
+        monkeypatch.setenv("ZABBIX_CHUNK_CONCURRENCY", "2")
+        running = peak = 0
+
+        async def call(params):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [{"itemid": i} for i in params["itemids"]]
+
+        ids = [str(i) for i in range(7)]
+        result = asyncio.run(fan_out(call, "item", {"itemids": ids, "sortfield": "itemid"}, "itemid"))
+        assert [r["itemid"] for r in result] == ids
+        assert peak == 2
+        recent = get_fanout_stats()["recent"][-1]
+        assert recent["ids"] == 7
+        assert [c["ids"] for c in recent["chunks"]] == [2, 2, 2, 1]
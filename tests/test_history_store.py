@@ -0,0 +1,103 @@
+"""Tests for _history_store module."""
+
+from src._history_store import HistoryStore, get_history_store
+
+NOW = 100000
+
+
+def rows(itemid, clocks, value="1.5"):
+    return [{"itemid": itemid, "clock": str(c), "value": value, "ns": "0"} for c in clocks]
+
+
+class TestSupports:
+    def test_bounded_window(self):
+        assert HistoryStore.supports("history", {"itemids": ["1"], "time_from": 1, "sortfield": "clock"})
+
+    def test_unbounded_or_unsupported(self):
+        assert not HistoryStore.supports("history", {"itemids": ["1"]})
+        assert not HistoryStore.supports("history", {"itemids": ["1"], "time_from": 1, "filter": {}})
+        assert not HistoryStore.supports("item", {"itemids": ["1"], "time_from": 1})
+
+
+class TestHistoryStore:
+    def test_miss_then_hit(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.sqlite"), lag=60)
+        plan = store.plan("history", 0, ["1"], 1000, 2000, NOW)
+        assert plan.fetch == {(1000, 2000): ["1"]}
+        store.save("history", 0, rows("1", [1000, 1500]), plan, NOW)
+
+        plan = store.plan("history", 0, ["1"], 1200, 2000, NOW)
+        assert plan.fetch == {}
+        params = {"itemids": ["1"], "time_from": 1200, "sortorder": "DESC"}
+        assert store.query("history", 0, params, 2000) == rows("1", [1500])
+        assert (store.hits, store.misses) == (1, 1)
+
+    def test_only_tail_fetched(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.sqlite"))
+        store.save("history", 0, [], store.plan("history", 0, ["1"], 1000, 2000, NOW), NOW)
+        plan = store.plan("history", 0, ["1"], 1500, 3000, NOW)
+        assert plan.fetch == {(2001, 3000): ["1"]}
+        assert plan.coverage["1"] == (1000, 3000)
+        assert store.partial_hits == 1
+
+    def test_unsettled_tail_not_covered(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.sqlite"), lag=60)
+        plan = store.plan("history", 0, ["1"], NOW - 600, NOW, NOW)
+        store.save("history", 0, rows("1", [NOW - 30]), plan, NOW)
+        plan = store.plan("history", 0, ["1"], NOW - 600, NOW, NOW)
+        assert plan.fetch == {(NOW - 59, NOW): ["1"]}
+
+    def test_disjoint_window_resets_item(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.sqlite"))
+        plan = store.plan("history", 0, ["1"], 1000, 2000, NOW)
+        store.save("history", 0, rows("1", [1500]), plan, NOW)
+        plan = store.plan("history", 0, ["1"], 5000, 6000, NOW)
+        assert plan.reset == ["1"]
+        store.save("history", 0, rows("1", [5500]), plan, NOW)
+        assert store.query("history", 0, {"itemids": ["1"], "time_from": 0}, NOW) == rows("1", [5500])
+
+    def test_value_types_and_output(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.sqlite"))
+        store.save("history", 3, rows("1", [1000], "7"), store.plan("history", 3, ["1"], 0, 2000, NOW), NOW)
+        assert store.query("history", 0, {"itemids": ["1"], "time_from": 0}, 2000) == []
+        params = {"itemids": ["1"], "time_from": 0, "output": ["clock", "value"]}
+        assert store.query("history", 3, params, 2000) == [{"clock": "1000", "value": "7"}]
+
+    def test_trends(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.sqlite"))
+        trend = {"itemid": "1", "clock": "3600", "num": "60", "value_min": "1",
+                 "value_avg": "2", "value_max": "3"}
+        plan = store.plan("trend", 0, ["1"], 0, 7200, 4 * 3600)
+        store.save("trend", 0, [trend], plan, 4 * 3600)
+        assert store.query("trend", 0, {"itemids": ["1"], "time_from": 0, "limit": 1}, 7200) == [trend]
+        assert store.stats()["trend_rows"] == 1
+
+    def test_forget_items(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.sqlite"))
+        for itemid in ("1", "2"):
+            store.save("history", 0, rows(itemid, [1000]), store.plan("history", 0, [itemid], 0, 2000, NOW), NOW)
+        store.forget(["1"])
+        assert store.query("history", 0, {"itemids": ["1", "2"], "time_from": 0}, 2000) == rows("2", [1000])
+        assert store.plan("history", 0, ["1", "2"], 0, 2000, NOW).fetch == {(0, 2000): ["1"]}
+
+    def test_sync_started_before_forget_not_saved(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.sqlite"))
+        plan = store.plan("history", 0, ["1"], 0, 2000, NOW)
+        store.forget()
+        store.save("history", 0, rows("1", [1000]), plan, NOW)
+        assert store.stats()["history_rows"] == 0
+        assert store.plan("history", 0, ["1"], 0, 2000, NOW).fetch == {(0, 2000): ["1"]}
+
+    def test_more_items_than_sql_variables(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "h.sqlite"))
+        itemids = [str(i) for i in range(40000)]
+        store.save("history", 0, rows("39999", [1000]),
+                   store.plan("history", 0, itemids, 0, 2000, NOW), NOW)
+        assert store.plan("history", 0, itemids, 0, 2000, NOW).fetch == {}
+        assert store.query("history", 0, {"itemids": itemids, "time_from": 0}, 2000) == rows("39999", [1000])
+        store.forget(itemids)
+        assert store.stats()["history_rows"] == 0
+
+    def test_disabled_without_path(self, monkeypatch):
+        monkeypatch.delenv("ZABBIX_HISTORY_CACHE_PATH", raising=False)
+        assert get_history_store() is None
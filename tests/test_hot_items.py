@@ -0,0 +1,171 @@
+"""Tests for _hot_items module."""
+
+import asyncio
+
+from src._hot_items import HotItems, RingBuffer, get_hot_items
+
+
+class TestRingBuffer:
+    def test_wraps_and_keeps_latest(self, tmp_path):
+        ring = RingBuffer(str(tmp_path / "1.ring"), capacity=3, value_type=0)
+        for clock in range(1, 6):
+            ring.append(float(clock), clock * 10.0)
+        assert len(ring) == 3
+        assert ring.range() == [(3.0, 30.0), (4.0, 40.0), (5.0, 50.0)]
+        assert ring.range(4, 4) == [(4.0, 40.0)]
+        assert ring.last_clock == 5.0
+
+    def test_survives_reopen(self, tmp_path):
+        path = str(tmp_path / "1.ring")
+        ring = RingBuffer(path, capacity=4, value_type=3)
+        ring.append(100.5, 7)
+        ring.restart_coverage(90)
+        ring.mark_synced(101.0)
+        ring.close()
+        ring = RingBuffer(path, capacity=4, value_type=3)
+        assert ring.range() == [(100.5, 7.0)]
+        assert (ring.covered_from, ring.synced_at) == (90, 101.0)
+
+    def test_reset_on_capacity_change(self, tmp_path):
+        path = str(tmp_path / "1.ring")
+        ring = RingBuffer(path, capacity=4, value_type=0)
+        ring.append(1.0, 1.0)
+        ring.close()
+        assert len(RingBuffer(path, capacity=8, value_type=0)) == 0
+
+    def test_covered_from_moves_when_wrapped(self, tmp_path):
+        ring = RingBuffer(str(tmp_path / "1.ring"), capacity=2, value_type=0)
+        ring.restart_coverage(1)
+        for clock in (10.0, 20.0, 30.0):
+            ring.append(clock, 0.0)
+        assert ring.covered_from == 20.0
+
+    def test_unsigned_values_exact(self, tmp_path):
+        ring = RingBuffer(str(tmp_path / "1.ring"), capacity=2, value_type=3)
+        ring.append(1.0, 2**64 - 1)
+        ring.append(2.0, 2**53 + 1)
+        assert ring.range() == [(1.0, 2**64 - 1), (2.0, 2**53 + 1)]
+
+    def test_truncate_after_wrap(self, tmp_path):
+        ring = RingBuffer(str(tmp_path / "1.ring"), capacity=3, value_type=0)
+        for clock in range(1, 6):
+            ring.append(float(clock), clock * 10.0)
+        ring.truncate(4.0)
+        assert ring.range() == [(3.0, 30.0)]
+        assert ring.covered_from == 3.0
+        ring.append(4.5, 45.0)
+        assert ring.range() == [(3.0, 30.0), (4.5, 45.0)]
+
+
+def make_fetch(history_rows):
+    calls = []
+
+    async def fetch(api_object, params):
+        calls.append((api_object, params))
+        if api_object == "item":
+            return [{"itemid": "1", "value_type": "0"}, {"itemid": "2", "value_type": "4"}]
+        return [r for r in history_rows if int(r["clock"]) >= params["time_from"]]
+
+    return fetch, calls
+
+
+class TestHotItems:
+    def poll(self, hot, rows, now, monkeypatch):
+        fetch, calls = make_fetch(rows)
+
+        async def run():
+            await hot.resolve(fetch)
+            await hot.poll(fetch)
+
+        monkeypatch.setattr("src._hot_items.time.time", lambda: now)
+        asyncio.run(run())
+        return calls
+
+    def test_tracks_numeric_items_only(self, tmp_path, monkeypatch):
+        hot = HotItems(str(tmp_path), itemids=["1", "2"])
+        self.poll(hot, [], 10000, monkeypatch)
+        assert list(hot.buffers) == ["1"]
+
+    def test_poll_and_answer(self, tmp_path, monkeypatch):
+        hot = HotItems(str(tmp_path), itemids=["1"], backfill=3600)
+        rows = [{"itemid": "1", "clock": str(c), "ns": "500000000", "value": str(c / 100)}
+                for c in (7000, 8000, 9000)]
+        calls = self.poll(hot, rows, 10000, monkeypatch)
+        assert calls[-1][1]["time_from"] == 10000 - 3600
+
+        result = hot.answer({"itemids": ["1"], "history": 0, "time_from": 7500,
+                             "sortfield": "clock", "sortorder": "DESC"})
+        assert result == [
+            {"itemid": "1", "clock": "9000", "value": "90.0", "ns": "500000000"},
+            {"itemid": "1", "clock": "8000", "value": "80.0", "ns": "500000000"},
+        ]
+        latest = hot.answer({"itemids": ["1"], "history": 0, "limit": 1, "sortorder": "DESC",
+                             "output": ["clock", "value"]})
+        assert latest == [{"clock": "9000", "value": "90.0"}]
+        assert hot.hits == 2
+
+    def test_unsigned_answer_exact(self, tmp_path, monkeypatch):
+        hot = HotItems(str(tmp_path), itemids=["1"], backfill=3600)
+
+        async def fetch(api_object, params):
+            if api_object == "item":
+                return [{"itemid": "1", "value_type": "3"}]
+            return [{"itemid": "1", "clock": "9000", "ns": "0", "value": "18446744073709551615"}]
+
+        async def run():
+            await hot.resolve(fetch)
+            await hot.poll(fetch)
+
+        monkeypatch.setattr("src._hot_items.time.time", lambda: 10000)
+        asyncio.run(run())
+        result = hot.answer({"itemids": ["1"], "history": 3, "time_from": 9000})
+        assert [r["value"] for r in result] == ["18446744073709551615"]
+
+    def test_late_values_added_by_next_poll(self, tmp_path, monkeypatch):
+        hot = HotItems(str(tmp_path), itemids=["1"], backfill=3600, lag=60)
+        rows = [{"itemid": "1", "clock": str(c), "ns": "0", "value": "1"} for c in (9000, 9990)]
+        self.poll(hot, rows, 10000, monkeypatch)
+        # A proxy delivers a value for 9980 after the first poll
+        rows.insert(1, {"itemid": "1", "clock": "9980", "ns": "0", "value": "2"})
+        calls = self.poll(hot, rows + [{"itemid": "1", "clock": "10020", "ns": "0", "value": "3"}],
+                          10030, monkeypatch)
+        assert calls[-1][1]["time_from"] == 10000 - 60
+        result = hot.answer({"itemids": ["1"], "history": 0, "time_from": 9000})
+        assert [r["clock"] for r in result] == ["9000", "9980", "9990", "10020"]
+
+    def test_unanswerable_reads(self, tmp_path, monkeypatch):
+        hot = HotItems(str(tmp_path), itemids=["1"], backfill=3600)
+        self.poll(hot, [{"itemid": "1", "clock": "9000", "ns": "0", "value": "1"}], 10000, monkeypatch)
+        assert hot.answer({"itemids": ["1"], "history": 0, "time_from": 100}) is None  # before coverage
+        assert hot.answer({"itemids": ["1", "3"], "history": 0, "time_from": 9000}) is None  # untracked
+        assert hot.answer({"itemids": ["1"], "history": 3, "time_from": 9000}) is None  # other type
+        assert hot.answer({"itemids": ["1"], "history": 0, "limit": 5,
+                           "sortorder": "DESC"}) is None  # too few samples
+        # Oldest samples of all history, not of the buffer
+        assert hot.answer({"itemids": ["1"], "history": 0, "limit": 1}) is None
+        assert hot.answer({"itemids": ["1"], "history": 0, "limit": 1, "sortorder": "ASC"}) is None
+        assert hot.answer({"itemids": ["1"], "history": 0, "time_from": 9000, "filter": {}}) is None
+
+    def test_forget_resets_buffer(self, tmp_path, monkeypatch):
+        hot = HotItems(str(tmp_path), itemids=["1"], backfill=3600)
+        self.poll(hot, [{"itemid": "1", "clock": "9000", "ns": "0", "value": "1"}], 10000, monkeypatch)
+        hot.forget(["1"])
+        assert len(hot.buffers["1"]) == 0
+        assert hot.answer({"itemids": ["1"], "history": 0, "time_from": 9000}) is None
+
+    def test_poll_started_before_forget_dropped(self, tmp_path, monkeypatch):
+        hot = HotItems(str(tmp_path), itemids=["1"], backfill=3600)
+        self.poll(hot, [], 10000, monkeypatch)
+
+        async def fetch(api_object, params):
+            hot.forget()  # e.g. history_clear while the poll awaits Zabbix
+            return [{"itemid": "1", "clock": "9000", "ns": "0", "value": "1"}]
+
+        asyncio.run(hot.poll(fetch))
+        assert len(hot.buffers["1"]) == 0
+        assert not hot.buffers["1"].synced_at
+
+    def test_disabled_without_config(self, monkeypatch):
+        monkeypatch.delenv("ZABBIX_HOT_ITEMIDS", raising=False)
+        monkeypatch.delenv("ZABBIX_HOT_ITEMS_FILTER", raising=False)
+        assert get_hot_items() is None
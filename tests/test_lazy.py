@@ -0,0 +1,154 @@
+"""Tests for lazy tool registration from the manifest."""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from fastmcp import FastMCP
+from fastmcp.tools.tool import FunctionTool
+
+import src._core
+import src.tools
+from src.tools import TOOL_MODULES, TOOL_PROFILES, profile_modules, register_tools
+from src.tools import _lazy
+from src.tools._lazy import (
+    LazyTool, StartupProfile, build_manifest, load_manifest, register_modules,
+    unregister_modules,
+)
+
+
+@pytest.fixture
+def fresh_mcp(monkeypatch):
+    """A separate FastMCP instance with src.tools.apiinfo not yet imported."""
+    server = FastMCP("test")
+    monkeypatch.setattr(src._core, "mcp", server)
+    monkeypatch.setattr(_lazy, "mcp", server)
+    monkeypatch.delitem(sys.modules, "src.tools.apiinfo")
+    monkeypatch.setattr(_lazy, "registered_modules", set())
+    monkeypatch.setattr(_lazy, "_unregistered", {})
+    monkeypatch.setattr(src.tools, "_registration", None)
+    return server
+
+
+class TestManifest:
+    def test_manifest_up_to_date(self):
+        # Fails when a tool module changed without running scripts/build_tool_manifest.py
+        assert load_manifest() == json.loads(json.dumps(build_manifest(TOOL_MODULES)))
+
+    def test_missing_manifest(self, tmp_path):
+        assert load_manifest(tmp_path / "missing.json") == {"modules": {}}
+
+    def test_unsupported_version(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps({"version": 0, "modules": {"host": {}}}))
+        assert load_manifest(path) == {"modules": {}}
+
+
+class TestLazyRegistration:
+    def test_placeholders_until_first_call(self, fresh_mcp, mock_zabbix_client):
+        register_modules(("apiinfo",), lazy=True)
+        placeholder = fresh_mcp._tool_manager._tools["apiinfo_version"]
+        assert isinstance(placeholder, LazyTool)
+        assert placeholder.parameters == load_manifest()["modules"]["apiinfo"]["tools"][0]["parameters"]
+        assert "src.tools.apiinfo" not in sys.modules
+
+        mock_zabbix_client.apiinfo.version.return_value = "7.0.0"
+        result = asyncio.run(placeholder.run({}))
+        assert "7.0.0" in result.content[0].text
+        assert "src.tools.apiinfo" in sys.modules
+        assert isinstance(fresh_mcp._tool_manager._tools["apiinfo_version"], FunctionTool)
+
+    def test_stale_module_imported_eagerly(self, fresh_mcp, monkeypatch):
+        manifest = load_manifest()
+        manifest["modules"]["apiinfo"]["hash"] = "0" * 16
+        monkeypatch.setattr(_lazy, "load_manifest", lambda: manifest)
+        register_modules(("apiinfo",), lazy=True)
+        assert isinstance(fresh_mcp._tool_manager._tools["apiinfo_version"], FunctionTool)
+
+    def test_eager_registration(self, fresh_mcp):
+        register_modules(("apiinfo",), lazy=False)
+        assert isinstance(fresh_mcp._tool_manager._tools["apiinfo_version"], FunctionTool)
+
+    def test_eager_without_tool_registry(self, fresh_mcp, monkeypatch):
+        monkeypatch.setattr(_lazy, "tool_registry", lambda: None)
+        register_modules(("apiinfo",), lazy=True)
+        assert "src.tools.apiinfo" in sys.modules
+
+    def test_unregistered_tools_readded(self, fresh_mcp):
+        register_modules(("apiinfo",), lazy=False)
+        tool = fresh_mcp._tool_manager._tools["apiinfo_version"]
+        unregister_modules(("apiinfo",))
+        assert "apiinfo_version" not in fresh_mcp._tool_manager._tools
+        assert "apiinfo" not in _lazy.registered_modules
+        register_modules(("apiinfo",), lazy=True)
+        assert fresh_mcp._tool_manager._tools["apiinfo_version"] is tool
+
+    def test_entrypoint_import_registers_tools(self):
+        code = ("import asyncio; from src.zabbix_mcp_server import mcp; "
+                "print(len(asyncio.run(mcp.get_tools())))")
+        env = {**os.environ, "ZABBIX_TOOL_PROFILE": "full"}
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                             env=env, cwd=Path(__file__).parent.parent, check=True).stdout
+        assert int(out.split()[-1]) == sum(
+            len(entry["tools"]) for entry in load_manifest()["modules"].values())
+
+
+class TestStartupProfile:
+    def test_eager_import_split_from_registration(self, fresh_mcp):
+        profile = StartupProfile()
+        register_modules(("apiinfo",), lazy=False, profile=profile)
+        module, mode, import_seconds, register_seconds, tools = profile.rows[0]
+        assert (module, mode, tools) == ("apiinfo", "eager", 1)
+        assert register_seconds > 0
+        assert "apiinfo" in profile.report()
+
+    def test_lazy_rows(self, fresh_mcp):
+        profile = StartupProfile()
+        register_modules(("apiinfo",), lazy=True, profile=profile)
+        assert profile.rows[0][:2] == ("apiinfo", "lazy")
+        assert profile.phases[0][0] == "manifest"
+
+
+class TestToolProfiles:
+    def test_profiles_name_tool_modules(self):
+        for modules in TOOL_PROFILES.values():
+            assert set(modules) <= set(TOOL_MODULES)
+
+    def test_profiles_and_modules_combined(self):
+        assert profile_modules("monitoring, maintenance,server") == (
+            "event", "history", "host", "item", "maintenance", "problem", "trend",
+            "trigger", "batch", "server")
+
+    def test_full_profile(self):
+        assert profile_modules("full") == TOOL_MODULES
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError, match="Unknown tool profile or module 'hosts'"):
+            profile_modules("monitoring,hosts")
+
+    def test_empty(self):
+        with pytest.raises(ValueError, match="selects no modules"):
+            profile_modules(" , ")
+
+    def test_only_profile_modules_registered(self, fresh_mcp, monkeypatch):
+        for module in TOOL_MODULES:
+            monkeypatch.delitem(sys.modules, f"src.tools.{module}", raising=False)
+        register_tools(lazy=True, tool_profile="monitoring")
+        names = set(fresh_mcp._tool_manager._tools)
+        assert {"problem_get", "history_get", "host_get"} <= names
+        assert "user_get" not in names
+        assert len(names) == sum(len(load_manifest()["modules"][m]["tools"])
+                                 for m in TOOL_PROFILES["monitoring"])
+
+    def test_registration_replaced(self, fresh_mcp, monkeypatch):
+        for module in TOOL_MODULES:
+            monkeypatch.delitem(sys.modules, f"src.tools.{module}", raising=False)
+        register_tools(lazy=True, tool_profile="monitoring")
+        register_tools(lazy=True, tool_profile="admin")
+        names = set(fresh_mcp._tool_manager._tools)
+        assert "user_get" in names
+        assert "problem_get" not in names
+        assert _lazy.registered_modules == set(TOOL_PROFILES["admin"])
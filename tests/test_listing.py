@@ -0,0 +1,72 @@
+"""Tests for the cached tools/list response."""
+
+import asyncio
+import mcp.types as types
+import pytest
+from fastmcp import Client, FastMCP
+
+from src.tools import _listing
+from src.tools._listing import ToolListCache, install_tool_list_cache
+
+REQUEST = types.ListToolsRequest(method="tools/list")
+
+
+@pytest.fixture
+def server():
+    server = FastMCP("test")
+
+    @server.tool()
+    def first(value: int) -> int:
+        """First tool."""
+        return value
+
+    return server
+
+
+def list_names(server):
+    async def run():
+        async with Client(server) as client:
+            return [tool.name for tool in await client.list_tools()]
+    return asyncio.run(run())
+
+
+class TestToolListCache:
+    def test_built_once_across_sessions(self, server):
+        cache = install_tool_list_cache(server)
+        assert list_names(server) == ["first"]
+        assert list_names(server) == ["first"]
+        assert (cache.builds, cache.hits, cache.stats()["tools"]) == (1, 1, 1)
+
+    def test_install_is_idempotent(self, server):
+        assert install_tool_list_cache(server) is install_tool_list_cache(server)
+        assert isinstance(server._mcp_server.request_handlers[types.ListToolsRequest],
+                          ToolListCache)
+
+    def test_rebuilt_when_tools_change(self, server):
+        cache = install_tool_list_cache(server)
+        list_names(server)
+
+        @server.tool()
+        def second() -> str:
+            """Second tool."""
+            return "x"
+
+        assert list_names(server) == ["first", "second"]
+        server._tool_manager._tools["first"].enabled = False
+        assert list_names(server) == ["second"]
+        assert cache.builds == 3
+
+    def test_dump_matches_uncached(self, server):
+        cache = install_tool_list_cache(server)
+        cached = asyncio.run(cache(REQUEST))
+        fresh = asyncio.run(cache.handler(REQUEST))
+        kwargs = {"by_alias": True, "mode": "json", "exclude_none": True}
+        assert cached.model_dump(**kwargs) == fresh.model_dump(**kwargs)
+        assert cached.model_dump() == fresh.model_dump()
+
+    def test_stock_handler_kept_when_unsupported(self, server, monkeypatch):
+        monkeypatch.setattr(_listing, "_DumpedResult", None)
+        handler = server._mcp_server.request_handlers[types.ListToolsRequest]
+        assert install_tool_list_cache(server) is None
+        assert server._mcp_server.request_handlers[types.ListToolsRequest] is handler
+        assert list_names(server) == ["first"]
@@ -0,0 +1,122 @@
+"""Tests for the Prometheus metrics."""
+
+import asyncio
+import pytest
+from fastmcp import Client
+
+from src import _metrics
+from src._core import format_response, mcp
+from src._metrics import (
+    TOOL_ERRORS, TOOL_RESPONSE_BYTES, TOOL_SECONDS, UPSTREAM_ERRORS, UPSTREAM_SECONDS,
+    Counter, Histogram, render,
+)
+from src.tools._registry import zabbix_get
+
+
+@pytest.fixture
+def scratch_metrics(monkeypatch):
+    """Metrics created in a test are not kept in the global list."""
+    monkeypatch.setattr(_metrics, "_metrics", [])
+
+
+def call(name, arguments=None):
+    async def run():
+        async with Client(mcp) as client:
+            return await client.call_tool(name, arguments or {}, raise_on_error=False)
+    return asyncio.run(run())
+
+
+class TestExposition:
+    def test_histogram_buckets_cumulative(self, scratch_metrics):
+        histogram = Histogram("test_seconds", "Test.", ("op",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, "read")
+        histogram.observe(0.5, "read")
+        histogram.observe(5, "read")
+        assert histogram.render() == [
+            "# HELP test_seconds Test.",
+            "# TYPE test_seconds histogram",
+            'test_seconds_bucket{op="read",le="0.1"} 1',
+            'test_seconds_bucket{op="read",le="1"} 2',
+            'test_seconds_bucket{op="read",le="+Inf"} 3',
+            'test_seconds_sum{op="read"} 5.55',
+            'test_seconds_count{op="read"} 3',
+        ]
+
+    def test_counter_labels_escaped(self, scratch_metrics):
+        counter = Counter("test_total", "Test.", ("name",))
+        counter.inc('a "b"\n', amount=2)
+        assert counter.render()[-1] == 'test_total{name="a \\"b\\"\\n"} 2'
+
+    def test_unlabelled(self, scratch_metrics):
+        counter = Counter("plain_total", "Test.")
+        counter.inc()
+        assert render().splitlines()[-1] == "plain_total 1"
+
+    def test_render_includes_collected_metrics(self):
+        text = render()
+        assert "# TYPE zabbix_mcp_cache_hit_ratio gauge" in text
+        assert 'zabbix_mcp_read_requests_total{result="upstream"}' in text
+        assert "zabbix_mcp_pool_requests_total " in text
+
+
+class TestRecording:
+    def test_tool_calls_timed(self, mock_zabbix_client):
+        mock_zabbix_client.hostgroup.get.return_value = [{"groupid": "1"}]
+        before = TOOL_SECONDS.count("hostgroup_get"), TOOL_RESPONSE_BYTES.count("hostgroup_get")
+        assert not call("hostgroup_get").is_error
+        after = TOOL_SECONDS.count("hostgroup_get"), TOOL_RESPONSE_BYTES.count("hostgroup_get")
+        assert after == (before[0] + 1, before[1] + 1)
+
+    def test_tool_errors_counted(self, mock_zabbix_client):
+        mock_zabbix_client.hostgroup.get.side_effect = Exception("down")
+        before = TOOL_ERRORS.value("hostgroup_get")
+        assert call("hostgroup_get").is_error
+        assert TOOL_ERRORS.value("hostgroup_get") == before + 1
+
+    def test_unknown_tools_share_a_label(self):
+        before = TOOL_ERRORS.value("unknown")
+        assert call("no_such_tool").is_error
+        assert call("another_missing_tool").is_error
+        assert TOOL_ERRORS.value("unknown") == before + 2
+        assert "no_such_tool" not in render()
+
+    def test_tool_name_looked_up_without_building_the_tool_map(self, mock_zabbix_client,
+                                                               monkeypatch):
+        async def get_tools():
+            raise AssertionError("get_tools called")
+        monkeypatch.setattr(mcp, "get_tools", get_tools)
+        mock_zabbix_client.hostgroup.get.return_value = []
+        before = TOOL_SECONDS.count("hostgroup_get")
+        assert not call("hostgroup_get").is_error
+        assert TOOL_SECONDS.count("hostgroup_get") == before + 1
+
+    def test_upstream_calls_timed(self, mock_zabbix_client):
+        mock_zabbix_client.maintenance.get.return_value = []
+        before = UPSTREAM_SECONDS.count("maintenance", "get")
+        asyncio.run(zabbix_get("maintenance", "get", {}))
+        assert UPSTREAM_SECONDS.count("maintenance", "get") == before + 1
+
+    def test_upstream_errors_counted(self, mock_zabbix_client):
+        mock_zabbix_client.proxy.get.side_effect = Exception("timeout")
+        before = UPSTREAM_ERRORS.value("proxy", "get")
+        with pytest.raises(Exception, match="timeout"):
+            asyncio.run(zabbix_get("proxy", "get", {}))
+        assert UPSTREAM_ERRORS.value("proxy", "get") == before + 1
+
+    def test_unknown_upstream_objects_share_a_label(self, mock_zabbix_client):
+        mock_zabbix_client.nosuchobject.get.return_value = []
+        before = UPSTREAM_SECONDS.count("unknown", "get")
+        asyncio.run(zabbix_get("nosuchobject", "get", {}))
+        assert UPSTREAM_SECONDS.count("unknown", "get") == before + 1
+        assert UPSTREAM_SECONDS.count("nosuchobject", "get") == 0
+
+    def test_serialization_timed_by_format(self):
+        before = _metrics.SERIALIZATION_SECONDS.count("columnar")
+        format_response([{"a": 1}], "columnar")
+        assert _metrics.SERIALIZATION_SECONDS.count("columnar") == before + 1
+
+    def test_metrics_route(self):
+        from src.zabbix_mcp_server import metrics
+        response = asyncio.run(metrics(None))
+        assert response.media_type.startswith("text/plain; version=0.0.4")
+        assert b"zabbix_mcp_tool_duration_seconds" in response.body
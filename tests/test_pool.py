@@ -0,0 +1,36 @@
+"""Tests for _pool module."""
+
+from src._pool import PoolStats, get_pool_settings, get_pool_stats, pool_stats
+
+
+class TestGetPoolSettings:
+    def test_defaults(self, monkeypatch):
+        monkeypatch.delenv("ZABBIX_POOL_SIZE", raising=False)
+        monkeypatch.delenv("ZABBIX_POOL_MAX_PER_HOST", raising=False)
+        monkeypatch.delenv("ZABBIX_POOL_KEEPALIVE", raising=False)
+        settings = get_pool_settings()
+        assert settings == {"pool_size": 100, "max_per_host": 0, "keepalive_timeout": 30.0}
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("ZABBIX_POOL_SIZE", "8")
+        monkeypatch.setenv("ZABBIX_POOL_MAX_PER_HOST", "4")
+        monkeypatch.setenv("ZABBIX_POOL_KEEPALIVE", "120")
+        settings = get_pool_settings()
+        assert settings == {"pool_size": 8, "max_per_host": 4, "keepalive_timeout": 120.0}
+
+
+class TestPoolStats:
+    def test_reuse_ratio(self):
+        stats = PoolStats()
+        stats.connections_created = 1
+        stats.connections_reused = 3
+        assert stats.as_dict()["reuse_ratio"] == 0.75
+
+    def test_reuse_ratio_without_connections(self):
+        assert PoolStats().as_dict()["reuse_ratio"] == 0.0
+
+    def test_get_pool_stats_includes_settings(self):
+        pool_stats.reset()
+        stats = get_pool_stats()
+        assert stats["settings"]["pool_size"] == get_pool_settings()["pool_size"]
+        assert stats["requests"] == 0
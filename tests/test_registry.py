@@ -1,10 +1,14 @@
 """Tests for _registry module."""
 
+import asyncio
 import json
 import pytest
 from unittest.mock import MagicMock, patch
 
-from src.tools._registry import build_params, zabbix_get, zabbix_write, zabbix_delete
+from src.tools._registry import (
+    build_params, zabbix_aggregate, zabbix_batch, zabbix_get, zabbix_get_downsampled, zabbix_get_page,
+    zabbix_get_series, zabbix_search, zabbix_write, zabbix_delete,
+)
 
 
 class TestBuildParams:
@@ -32,30 +36,619 @@ class TestBuildParams:
 class TestZabbixGet:
     def test_calls_correct_method(self, mock_zabbix_client):
         mock_zabbix_client.host.get.return_value = [{"hostid": "1"}]
-        result = zabbix_get("host", "get", {"output": "extend"})
+        result = asyncio.run(zabbix_get("host", "get", {"output": "extend"}))
         mock_zabbix_client.host.get.assert_called_once_with(output="extend")
         assert json.loads(result) == [{"hostid": "1"}]
 
+    def test_repeated_get_served_from_cache(self, mock_zabbix_client):
+        mock_zabbix_client.hostgroup.get.return_value = [{"groupid": "1"}]
+        first = asyncio.run(zabbix_get("hostgroup", "get", {"output": "extend"}))
+        second = asyncio.run(zabbix_get("hostgroup", "get", {"output": "extend"}))
+        assert first == second
+        mock_zabbix_client.hostgroup.get.assert_called_once()
+
+    def test_different_params_not_shared(self, mock_zabbix_client):
+        mock_zabbix_client.hostgroup.get.return_value = []
+        asyncio.run(zabbix_get("hostgroup", "get", {"groupids": ["1"]}))
+        asyncio.run(zabbix_get("hostgroup", "get", {"groupids": ["2"]}))
+        assert mock_zabbix_client.hostgroup.get.call_count == 2
+
+    def test_cache_disabled(self, mock_zabbix_client, monkeypatch):
+        monkeypatch.setenv("ZABBIX_CACHE_ENABLED", "false")
+        mock_zabbix_client.hostgroup.get.return_value = []
+        asyncio.run(zabbix_get("hostgroup", "get", {}))
+        asyncio.run(zabbix_get("hostgroup", "get", {}))
+        assert mock_zabbix_client.hostgroup.get.call_count == 2
+
+    def test_non_get_method_not_cached(self, mock_zabbix_client):
+        mock_zabbix_client.user.checkAuthentication.return_value = {}
+        asyncio.run(zabbix_get("user", "checkAuthentication", {"token": "t"}))
+        asyncio.run(zabbix_get("user", "checkAuthentication", {"token": "t"}))
+        assert mock_zabbix_client.user.checkAuthentication.call_count == 2
+
+
+    def test_huge_id_list_split_into_chunks(self, mock_zabbix_client, monkeypatch):
+        monkeypatch.setenv("ZABBIX_CHUNK_SIZE", "2")
+        mock_zabbix_client.item.get.side_effect = lambda **p: [{"itemid": i} for i in p["itemids"]]
+        result = json.loads(asyncio.run(zabbix_get("item", "get", {"itemids": ["3", "1", "2"],
+                                                                    "sortfield": "itemid"})))
+        assert [r["itemid"] for r in result] == ["1", "2", "3"]
+        assert mock_zabbix_client.item.get.call_count == 2
+
+
+class TestResponseFormat:
+    def test_compact_format_stripped_from_api_params(self, mock_zabbix_client):
+        mock_zabbix_client.host.get.return_value = [{"hostid": "1"}]
+        result = asyncio.run(zabbix_get("host", "get", {"output": "extend",
+                                                        "response_format": "compact"}))
+        mock_zabbix_client.host.get.assert_called_once_with(output="extend")
+        assert result == '[{"hostid":"1"}]'
+
+    def test_formats_cached_separately(self, mock_zabbix_client):
+        mock_zabbix_client.host.get.return_value = [{"hostid": "1"}]
+        pretty = asyncio.run(zabbix_get("host", "get", {}))
+        compact = asyncio.run(zabbix_get("host", "get", {"response_format": "compact"}))
+        assert pretty != compact
+        assert json.loads(pretty) == json.loads(compact)
+
+    def test_columnar_format(self, mock_zabbix_client):
+        mock_zabbix_client.item.get.return_value = [{"itemid": "1", "name": "a"},
+                                                     {"itemid": "2", "name": "b"}]
+        result = json.loads(asyncio.run(zabbix_get("item", "get", {"response_format": "columnar"})))
+        assert result == {"columns": ["itemid", "name"], "rows": [["1", "a"], ["2", "b"]]}
+
+    def test_columnar_page(self, mock_zabbix_client):
+        mock_zabbix_client.event.get.return_value = [{"eventid": "1"}]
+        page = json.loads(asyncio.run(zabbix_get_page(
+            "event", {"response_format": "columnar"}, 10)))
+        assert page["result"] == {"columns": ["eventid"], "rows": [["1"]]}
+        assert page["next_cursor"] is None
+
+    def test_unknown_format_rejected_before_call(self, mock_zabbix_client):
+        with pytest.raises(ValueError, match="response_format"):
+            asyncio.run(zabbix_get("host", "get", {"response_format": "yaml"}))
+        mock_zabbix_client.host.get.assert_not_called()
+
+
+class TestZabbixGetCoalescing:
+    @pytest.fixture(autouse=True)
+    def no_cache(self, monkeypatch):
+        monkeypatch.setenv("ZABBIX_CACHE_ENABLED", "false")
+
+    def _slow(self, result):
+        async def slow_call(**kwargs):
+            await asyncio.sleep(0.01)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return slow_call
+
+    def test_concurrent_identical_reads_share_one_request(self, mock_zabbix_client):
+        mock_zabbix_client.problem.get.side_effect = self._slow([{"eventid": "1"}])
+
+        async def run():
+            return await asyncio.gather(
+                *(zabbix_get("problem", "get", {"severities": [4, 5]}) for _ in range(5)))
+
+        results = asyncio.run(run())
+        assert len(set(results)) == 1
+        mock_zabbix_client.problem.get.assert_called_once()
+
+    def test_different_params_not_coalesced(self, mock_zabbix_client):
+        mock_zabbix_client.problem.get.side_effect = self._slow([])
+
+        async def run():
+            await asyncio.gather(zabbix_get("problem", "get", {"severities": [4]}),
+                                 zabbix_get("problem", "get", {"severities": [5]}))
+
+        asyncio.run(run())
+        assert mock_zabbix_client.problem.get.call_count == 2
+
+    def test_sequential_reads_not_coalesced(self, mock_zabbix_client):
+        mock_zabbix_client.problem.get.return_value = []
+        asyncio.run(zabbix_get("problem", "get", {}))
+        asyncio.run(zabbix_get("problem", "get", {}))
+        assert mock_zabbix_client.problem.get.call_count == 2
+
+    def test_error_propagates_to_all_callers(self, mock_zabbix_client):
+        mock_zabbix_client.problem.get.side_effect = self._slow(RuntimeError("boom"))
+
+        async def run():
+            return await asyncio.gather(
+                *(zabbix_get("problem", "get", {}) for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        mock_zabbix_client.problem.get.assert_called_once()
+
+
+class TestZabbixBatch:
+    def test_results_in_order(self, mock_zabbix_client):
+        mock_zabbix_client.host.get.return_value = [{"hostid": "1"}]
+        mock_zabbix_client.problem.get.return_value = [{"eventid": "7"}]
+        result = json.loads(asyncio.run(zabbix_batch([
+            {"object": "host", "params": {"output": ["hostid"]}},
+            {"object": "problem", "method": "get", "params": {"recent": True}},
+        ])))
+        assert result["results"] == [
+            {"object": "host", "method": "get", "result": [{"hostid": "1"}]},
+            {"object": "problem", "method": "get", "result": [{"eventid": "7"}]},
+        ]
+        mock_zabbix_client.problem.get.assert_called_once_with(recent=True)
+
+    def test_per_entry_errors(self, mock_zabbix_client):
+        mock_zabbix_client.host.get.return_value = []
+        mock_zabbix_client.item.get.side_effect = Exception("No permissions")
+        result = json.loads(asyncio.run(zabbix_batch([
+            {"object": "host"},
+            {"object": "item"},
+            {"object": "host", "method": "delete", "params": {}},
+            "host.get",
+        ])))["results"]
+        assert result[0]["result"] == []
+        assert result[1] == {"object": "item", "method": "get", "error": "No permissions"}
+        assert "cannot be batched" in result[2]["error"]
+        assert result[3]["object"] is None and "must be an object" in result[3]["error"]
+        mock_zabbix_client.host.delete.assert_not_called()
+
+    def test_entries_run_concurrently(self, mock_zabbix_client):
+        in_flight = []
+
+        async def slow_get(**params):
+            in_flight.append(params["hostids"])
+            await asyncio.sleep(0.01)
+            return [{"seen": len(in_flight)}]
+
+        mock_zabbix_client.host.get.side_effect = slow_get
+        result = json.loads(asyncio.run(zabbix_batch(
+            [{"object": "host", "params": {"hostids": [str(i)]}} for i in range(3)])))
+        assert [r["result"] for r in result["results"]] == [[{"seen": 3}]] * 3
+
+    def test_shares_response_cache(self, mock_zabbix_client):
+        mock_zabbix_client.hostgroup.get.return_value = [{"groupid": "1"}]
+        asyncio.run(zabbix_get("hostgroup", "get", {}))
+        asyncio.run(zabbix_batch([{"object": "hostgroup"}]))
+        mock_zabbix_client.hostgroup.get.assert_called_once()
+
+    def test_format_applied_to_entries(self, mock_zabbix_client):
+        mock_zabbix_client.item.get.return_value = [{"itemid": "1", "name": "CPU"}]
+        result = json.loads(asyncio.run(zabbix_batch([{"object": "item"}], fmt="columnar")))
+        assert result["results"][0]["result"] == {"columns": ["itemid", "name"],
+                                                  "rows": [["1", "CPU"]]}
+
+    def test_limits(self, mock_zabbix_client):
+        with pytest.raises(ValueError, match="At least one"):
+            asyncio.run(zabbix_batch([]))
+        with pytest.raises(ValueError, match="At most 50"):
+            asyncio.run(zabbix_batch([{"object": "host"}] * 51))
+        with pytest.raises(ValueError, match="Invalid response_format"):
+            asyncio.run(zabbix_batch([{"object": "host"}], fmt="xml"))
+
 
 class TestZabbixWrite:
     def test_calls_correct_method(self, mock_zabbix_client):
         mock_zabbix_client.host.create.return_value = {"hostids": ["10"]}
-        result = zabbix_write("host", "create", {"host": "test"})
+        result = asyncio.run(zabbix_write("host", "create", {"host": "test"}))
         mock_zabbix_client.host.create.assert_called_once_with(host="test")
         assert json.loads(result) == {"hostids": ["10"]}
 
     def test_blocked_in_read_only(self, mock_zabbix_client, read_only_env):
         with pytest.raises(ValueError, match="read-only mode"):
-            zabbix_write("host", "create", {"host": "test"})
+            asyncio.run(zabbix_write("host", "create", {"host": "test"}))
+
+
+    def test_write_evicts_cached_reads(self, mock_zabbix_client):
+        mock_zabbix_client.hostgroup.get.return_value = [{"groupid": "1"}]
+        mock_zabbix_client.host.massupdate.return_value = {"hostids": ["1"]}
+        asyncio.run(zabbix_get("hostgroup", "get", {}))
+        asyncio.run(zabbix_write("host", "massupdate", {"hosts": [{"hostid": "1"}]}))
+        asyncio.run(zabbix_get("hostgroup", "get", {}))
+        assert mock_zabbix_client.hostgroup.get.call_count == 2
 
 
 class TestZabbixDelete:
     def test_calls_delete_unpacked(self, mock_zabbix_client):
         mock_zabbix_client.host.delete.return_value = {"hostids": ["1", "2"]}
-        result = zabbix_delete("host", ["1", "2"])
+        result = asyncio.run(zabbix_delete("host", ["1", "2"]))
         mock_zabbix_client.host.delete.assert_called_once_with("1", "2")
         assert json.loads(result) == {"hostids": ["1", "2"]}
 
     def test_blocked_in_read_only(self, mock_zabbix_client, read_only_env):
         with pytest.raises(ValueError, match="read-only mode"):
-            zabbix_delete("host", ["1"])
+            asyncio.run(zabbix_delete("host", ["1"]))
+
+    def test_custom_delete_method(self, mock_zabbix_client):
+        mock_zabbix_client.usermacro.deleteglobal.return_value = {"globalmacroids": ["1"]}
+        asyncio.run(zabbix_delete("usermacro", ["1"], api_method="deleteglobal"))
+        mock_zabbix_client.usermacro.deleteglobal.assert_called_once_with("1")
+
+    def test_delete_evicts_cached_reads(self, mock_zabbix_client):
+        mock_zabbix_client.template.get.return_value = []
+        mock_zabbix_client.host.delete.return_value = {"hostids": ["1"]}
+        asyncio.run(zabbix_get("template", "get", {}))
+        asyncio.run(zabbix_delete("host", ["1"]))
+        asyncio.run(zabbix_get("template", "get", {}))
+        assert mock_zabbix_client.template.get.call_count == 2
+
+
+def collect_pages(api_object, params, page_size, cursor=None):
+    """Fetch every page via zabbix_get_page, return (rows, number of pages)."""
+    rows, pages = [], 0
+    while True:
+        page = json.loads(asyncio.run(zabbix_get_page(api_object, params, page_size, cursor)))
+        rows.extend(page["result"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return rows, pages
+
+
+class TestZabbixGetPage:
+    def test_events_paged_by_eventid(self, mock_zabbix_client):
+        events = [{"eventid": str(i)} for i in range(1, 6)]
+
+        async def event_get(**params):
+            start = int(params.get("eventid_from", 0))
+            return [e for e in events if int(e["eventid"]) >= start][:params["limit"]]
+
+        mock_zabbix_client.event.get.side_effect = event_get
+        rows, pages = collect_pages("event", {"output": "extend"}, 2)
+        assert rows == events
+        assert pages == 3
+
+    def test_history_boundary_rows_not_repeated(self, mock_zabbix_client):
+        history = [{"itemid": "1", "clock": "100", "ns": "0", "value": "a"},
+                   {"itemid": "2", "clock": "100", "ns": "0", "value": "b"},
+                   {"itemid": "3", "clock": "100", "ns": "0", "value": "c"},
+                   {"itemid": "1", "clock": "101", "ns": "0", "value": "d"}]
+
+        async def history_get(**params):
+            start = int(params.get("time_from", 0))
+            return [h for h in history if int(h["clock"]) >= start][:params["limit"]]
+
+        mock_zabbix_client.history.get.side_effect = history_get
+        rows, _ = collect_pages("history", {"itemids": ["1", "2", "3"], "sortorder": "DESC"}, 2)
+        assert [r["value"] for r in rows] == ["a", "b", "c", "d"]
+
+    def test_ids_scanned_then_fetched_in_slices(self, mock_zabbix_client):
+        items = [{"itemid": str(i), "name": f"item {i}"} for i in (5, 3, 11, 7, 1)]
+
+        async def item_get(**params):
+            if params.get("output") == ["itemid"]:
+                return [{"itemid": i["itemid"]} for i in items]
+            return [i for i in items if i["itemid"] in params["itemids"]]
+
+        mock_zabbix_client.item.get.side_effect = item_get
+        rows, pages = collect_pages("item", {"output": "extend", "hostids": ["1"]}, 2)
+        assert [r["itemid"] for r in rows] == ["1", "3", "5", "7", "11"]
+        assert pages == 3
+
+    def test_id_scan_resumes_after_scan_dropped(self, mock_zabbix_client):
+        from src.tools import _registry
+        items = [{"itemid": str(i)} for i in range(1, 6)]
+
+        async def item_get(**params):
+            if "itemids" in params:
+                return [i for i in items if i["itemid"] in params["itemids"]]
+            return items
+
+        mock_zabbix_client.item.get.side_effect = item_get
+        first = json.loads(asyncio.run(zabbix_get_page("item", {}, 2)))
+        _registry._scans.clear()
+        rest, _ = collect_pages("item", {}, 2, first["next_cursor"])
+        assert [r["itemid"] for r in first["result"] + rest] == ["1", "2", "3", "4", "5"]
+
+    def test_limit_caps_total_rows(self, mock_zabbix_client):
+        events = [{"eventid": str(i)} for i in range(1, 10)]
+
+        async def event_get(**params):
+            start = int(params.get("eventid_from", 0))
+            return [e for e in events if int(e["eventid"]) >= start][:params["limit"]]
+
+        mock_zabbix_client.event.get.side_effect = event_get
+        rows, _ = collect_pages("event", {"limit": 5}, 2)
+        assert len(rows) == 5
+
+    def test_trend_requires_time_from(self, mock_zabbix_client):
+        with pytest.raises(ValueError, match="time_from"):
+            asyncio.run(zabbix_get_page("trend", {"itemids": ["1"]}, 10))
+
+    def test_trend_paged_by_window(self, mock_zabbix_client):
+        async def trend_get(**params):
+            return [{"itemid": "1", "clock": str(c)}
+                    for c in range(0, 10 * 3600, 3600)
+                    if params["time_from"] <= c <= params["time_till"]]
+
+        mock_zabbix_client.trend.get.side_effect = trend_get
+        rows, pages = collect_pages(
+            "trend", {"itemids": ["1"], "time_from": 0, "time_till": 10 * 3600 - 1}, 4)
+        assert [int(r["clock"]) for r in rows] == list(range(0, 10 * 3600, 3600))
+        assert pages == 3
+
+    def test_invalid_cursor(self, mock_zabbix_client):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            asyncio.run(zabbix_get_page("event", {}, 10, "not-a-cursor"))
+
+    def test_cursor_for_other_object(self, mock_zabbix_client):
+        from src.tools._registry import _encode_cursor
+        cursor = _encode_cursor({"object": "item", "remaining": None})
+        with pytest.raises(ValueError, match="does not belong"):
+            asyncio.run(zabbix_get_page("event", {}, 10, cursor))
+
+    def test_unsupported_object(self, mock_zabbix_client):
+        with pytest.raises(ValueError, match="not supported"):
+            asyncio.run(zabbix_get_page("settings", {}, 10))
+
+
+class TestZabbixGetDownsampled:
+    def test_streams_pages_and_downsamples_per_item(self, mock_zabbix_client):
+        rows = [{"itemid": itemid, "clock": str(1000 + i), "ns": "0", "value": str(i)}
+                for i in range(10) for itemid in ("1", "2")]
+        mock_zabbix_client.history.get.return_value = rows
+        result = json.loads(asyncio.run(zabbix_get_downsampled(
+            {"itemids": ["1", "2"], "history": 0}, 4, "lttb")))
+        assert result["method"] == "lttb"
+        assert [item["itemid"] for item in result["items"]] == ["1", "2"]
+        assert result["items"][0]["raw_points"] == 10
+        assert len(result["items"][0]["points"]) == 4
+        assert result["items"][0]["points"][0] == [1000, 0.0]
+        call = mock_zabbix_client.history.get.call_args.kwargs
+        assert call["output"] == ["itemid", "clock", "value", "ns"]
+        assert call["sortorder"] == "ASC"
+
+    def test_text_history_rejected(self, mock_zabbix_client):
+        with pytest.raises(ValueError, match="numeric"):
+            asyncio.run(zabbix_get_downsampled({"itemids": ["1"], "history": 4}, 10))
+        mock_zabbix_client.history.get.assert_not_called()
+
+    def test_invalid_method_rejected(self, mock_zabbix_client):
+        with pytest.raises(ValueError, match="Invalid downsampling method"):
+            asyncio.run(zabbix_get_downsampled({"itemids": ["1"]}, 10, "median"))
+        mock_zabbix_client.history.get.assert_not_called()
+
+
+class TestZabbixAggregate:
+    def test_history_per_item(self, mock_zabbix_client):
+        mock_zabbix_client.history.get.return_value = [
+            {"itemid": "1", "clock": "100", "ns": "0", "value": "1"},
+            {"itemid": "2", "clock": "100", "ns": "0", "value": "10"},
+            {"itemid": "1", "clock": "160", "ns": "0", "value": "3"},
+        ]
+        result = json.loads(asyncio.run(zabbix_aggregate(
+            "history", {"itemids": ["1", "2", "3"], "history": 0, "time_from": 0}, ["avg", "count"])))
+        assert result["result"] == [
+            {"itemid": "1", "avg": 2.0, "count": 2},
+            {"itemid": "2", "avg": 10.0, "count": 1},
+            {"itemid": "3", "avg": None, "count": 0},
+        ]
+
+    def test_trend_rollups(self, mock_zabbix_client):
+        mock_zabbix_client.trend.get.return_value = [
+            {"itemid": "1", "clock": "3600", "num": "2", "value_min": "1", "value_avg": "2", "value_max": "5"},
+        ]
+        result = json.loads(asyncio.run(zabbix_aggregate(
+            "trend", {"itemids": ["1"], "time_from": 3600, "time_till": 7199}, ["max", "count"], 3600)))
+        assert result["result"] == [{"itemid": "1", "clock": 3600, "max": 5.0, "count": 2}]
+        assert "value_avg" in mock_zabbix_client.trend.get.call_args.kwargs["output"]
+
+    def test_invalid_function_rejected(self, mock_zabbix_client):
+        with pytest.raises(ValueError, match="Invalid aggregation function"):
+            asyncio.run(zabbix_aggregate("history", {"itemids": ["1"]}, ["mode"]))
+        mock_zabbix_client.history.get.assert_not_called()
+
+    def test_unsupported_source(self, mock_zabbix_client):
+        with pytest.raises(ValueError, match="Cannot aggregate"):
+            asyncio.run(zabbix_aggregate("item", {}, ["avg"]))
+
+
+class TestZabbixGetSeries:
+    def test_stitches_trends_and_history(self, mock_zabbix_client):
+        now = 10 * 86400
+        mock_zabbix_client.item.get.return_value = [
+            {"itemid": "1", "value_type": "0", "history": "1d", "trends": "365d"},
+        ]
+        mock_zabbix_client.housekeeping.get.return_value = {"hk_history_global": "0", "hk_trends_global": "0"}
+        mock_zabbix_client.trend.get.return_value = [
+            {"itemid": "1", "clock": str(now - 2 * 86400 + 3600), "value_avg": "2"},
+            {"itemid": "1", "clock": str(now - 2 * 86400), "value_avg": "1"},
+        ]
+        mock_zabbix_client.history.get.return_value = [
+            {"itemid": "1", "clock": str(now - 60), "ns": "0", "value": "3"},
+        ]
+        with patch("src.tools._registry.time.time", return_value=now):
+            result = json.loads(asyncio.run(zabbix_get_series(
+                {"itemids": ["1"], "time_from": now - 2 * 86400, "time_till": now - 1})))
+        item = result["items"][0]
+        assert item["points"] == [[now - 2 * 86400, 1.0], [now - 2 * 86400 + 3600, 2.0], [now - 60, 3.0]]
+        assert [s["source"] for s in item["segments"]] == ["trend", "history"]
+        assert item["segments"][1]["time_from"] == now - 86400
+        assert mock_zabbix_client.history.get.call_args.kwargs["time_from"] == now - 86400
+
+    def test_global_retention_override(self, mock_zabbix_client):
+        mock_zabbix_client.item.get.return_value = [
+            {"itemid": "1", "value_type": "0", "history": "{$KEEP}", "trends": "365d"},
+        ]
+        mock_zabbix_client.housekeeping.get.return_value = {
+            "hk_history_global": "1", "hk_history": "1h", "hk_trends_global": "0", "hk_trends": "365d"}
+        mock_zabbix_client.trend.get.return_value = []
+        mock_zabbix_client.history.get.return_value = []
+        result = json.loads(asyncio.run(zabbix_get_series(
+            {"itemids": ["1"], "time_from": 0, "time_till": 3600})))
+        assert [s["source"] for s in result["items"][0]["segments"]] == ["trend"]
+
+    def test_unknown_retention_reads_history(self, mock_zabbix_client):
+        mock_zabbix_client.item.get.return_value = [
+            {"itemid": "1", "value_type": "3", "history": "{$KEEP}", "trends": "365d"},
+        ]
+        mock_zabbix_client.housekeeping.get.side_effect = Exception("No permissions")
+        mock_zabbix_client.history.get.return_value = []
+        result = json.loads(asyncio.run(zabbix_get_series({"itemids": ["1"], "time_from": 0})))
+        assert [s["source"] for s in result["items"][0]["segments"]] == ["history"]
+        mock_zabbix_client.trend.get.assert_not_called()
+
+
+class TestHistoryStoreReads:
+    def test_overlapping_windows_fetch_only_the_tail(self, mock_zabbix_client, monkeypatch, tmp_path):
+        monkeypatch.setenv("ZABBIX_HISTORY_CACHE_PATH", str(tmp_path / "history.sqlite"))
+        monkeypatch.setenv("ZABBIX_CACHE_ENABLED", "false")
+        mock_zabbix_client.history.get.side_effect = lambda **p: [
+            {"itemid": "1", "clock": str(c), "value": "1", "ns": "0"}
+            for c in (1000, 2500) if p["time_from"] <= c <= p["time_till"]]
+        params = {"itemids": ["1"], "history": 0, "time_from": 1000, "time_till": 2000,
+                  "sortfield": "clock", "sortorder": "ASC"}
+        with patch("src.tools._registry.time.time", return_value=100000):
+            first = json.loads(asyncio.run(zabbix_get("history", "get", params)))
+            second = json.loads(asyncio.run(zabbix_get("history", "get", dict(params, time_till=3000))))
+        assert [r["clock"] for r in first] == ["1000"]
+        assert [r["clock"] for r in second] == ["1000", "2500"]
+        calls = [c.kwargs for c in mock_zabbix_client.history.get.call_args_list]
+        assert [(c["time_from"], c["time_till"]) for c in calls] == [(1000, 2000), (2001, 3000)]
+
+    def test_gap_fetched_in_pages(self, mock_zabbix_client, monkeypatch, tmp_path):
+        monkeypatch.setenv("ZABBIX_HISTORY_CACHE_PATH", str(tmp_path / "history.sqlite"))
+        monkeypatch.setenv("ZABBIX_CACHE_ENABLED", "false")
+        monkeypatch.setattr("src.tools._registry.STREAM_PAGE_SIZE", 2)
+        stored = [{"itemid": "1", "clock": str(c), "value": "1", "ns": str(ns)}
+                  for c, ns in ((1000, 0), (1000, 1), (1000, 2), (1500, 0), (1600, 0), (1600, 1),
+                                (1900, 0))]
+        mock_zabbix_client.history.get.side_effect = lambda **p: [
+            r for r in stored if p["time_from"] <= int(r["clock"]) <= p["time_till"]][:p.get("limit")]
+        params = {"itemids": ["1"], "history": 0, "time_from": 1000, "time_till": 2000}
+        with patch("src.tools._registry.time.time", return_value=100000):
+            result = json.loads(asyncio.run(zabbix_get("history", "get", params)))
+        assert result == stored
+        calls = [c.kwargs for c in mock_zabbix_client.history.get.call_args_list]
+        assert [(c["time_from"], c["time_till"], c.get("limit")) for c in calls] == [
+            (1000, 2000, 2), (1000, 1000, None), (1001, 2000, 2), (1600, 2000, 2),
+            (1600, 1600, None), (1601, 2000, 2)]
+
+    def test_limited_read_of_uncovered_window_not_synced(self, mock_zabbix_client, monkeypatch,
+                                                         tmp_path):
+        monkeypatch.setenv("ZABBIX_HISTORY_CACHE_PATH", str(tmp_path / "history.sqlite"))
+        monkeypatch.setenv("ZABBIX_CACHE_ENABLED", "false")
+        mock_zabbix_client.history.get.return_value = [
+            {"itemid": "1", "clock": "90000", "value": "1", "ns": "0"}]
+        params = {"itemids": ["1"], "history": 0, "time_from": 0, "time_till": 90000,
+                  "sortfield": "clock", "sortorder": "DESC", "limit": 1}
+        with patch("src.tools._registry.time.time", return_value=100000):
+            result = json.loads(asyncio.run(zabbix_get("history", "get", params)))
+        assert [r["clock"] for r in result] == ["90000"]
+        mock_zabbix_client.history.get.assert_called_once_with(**params)
+
+    def test_limited_read_of_covered_window_from_store(self, mock_zabbix_client, monkeypatch,
+                                                       tmp_path):
+        monkeypatch.setenv("ZABBIX_HISTORY_CACHE_PATH", str(tmp_path / "history.sqlite"))
+        monkeypatch.setenv("ZABBIX_CACHE_ENABLED", "false")
+        mock_zabbix_client.history.get.return_value = [
+            {"itemid": "1", "clock": str(c), "value": "1", "ns": "0"} for c in (1000, 1500)]
+        params = {"itemids": ["1"], "history": 0, "time_from": 1000, "time_till": 2000}
+        with patch("src.tools._registry.time.time", return_value=100000):
+            asyncio.run(zabbix_get("history", "get", params))
+            result = json.loads(asyncio.run(zabbix_get("history", "get", dict(
+                params, sortfield="clock", sortorder="DESC", limit=1))))
+        assert [r["clock"] for r in result] == ["1500"]
+        assert mock_zabbix_client.history.get.call_count == 1
+
+    def test_trend_gap_fetched_in_hourly_windows(self, mock_zabbix_client, monkeypatch, tmp_path):
+        monkeypatch.setenv("ZABBIX_HISTORY_CACHE_PATH", str(tmp_path / "history.sqlite"))
+        monkeypatch.setenv("ZABBIX_CACHE_ENABLED", "false")
+        monkeypatch.setattr("src.tools._registry.STREAM_PAGE_SIZE", 4)
+        mock_zabbix_client.trend.get.return_value = []
+        params = {"itemids": ["1", "2"], "time_from": 0, "time_till": 5 * 3600 - 1}
+        with patch("src.tools._registry.time.time", return_value=100 * 3600):
+            asyncio.run(zabbix_get("trend", "get", params))
+        calls = [c.kwargs for c in mock_zabbix_client.trend.get.call_args_list]
+        assert [(c["time_from"], c["time_till"]) for c in calls] == [
+            (0, 7199), (7200, 14399), (14400, 17999)]
+        assert all("sortfield" not in c for c in calls)
+
+
+class TestHistoryInvalidation:
+    @pytest.fixture
+    def stores(self, monkeypatch):
+        """History store and hot items, as mocks."""
+        store, hot = MagicMock(), MagicMock()
+        monkeypatch.setattr("src.tools._registry.get_history_store", lambda: store)
+        monkeypatch.setattr("src.tools._registry.get_hot_items", lambda: hot)
+        return store, hot
+
+    def test_history_clear(self, stores, mock_zabbix_client):
+        mock_zabbix_client.history.clear.return_value = {"itemids": ["1"]}
+        asyncio.run(zabbix_write("history", "clear", {"itemids": ["1", "2"]}))
+        for target in stores:
+            target.forget.assert_called_once_with(["1", "2"])
+
+    def test_history_push(self, stores, mock_zabbix_client):
+        mock_zabbix_client.history.push.return_value = {}
+        asyncio.run(zabbix_write("history", "push", {"data": [{"itemid": 5, "value": 1}]}))
+        stores[0].forget.assert_called_once_with(["5"])
+        asyncio.run(zabbix_write("history", "push", {"data": [{"host": "h", "key": "k", "value": 1}]}))
+        stores[1].forget.assert_called_with(None)
+
+    def test_item_delete(self, stores, mock_zabbix_client):
+        mock_zabbix_client.item.delete.return_value = {"itemids": ["3"]}
+        asyncio.run(zabbix_delete("item", ["3"]))
+        for target in stores:
+            target.forget.assert_called_once_with(["3"])
+
+    def test_other_writes_ignored(self, stores, mock_zabbix_client):
+        mock_zabbix_client.host.update.return_value = {}
+        asyncio.run(zabbix_write("host", "update", {"hostid": "1"}))
+        for target in stores:
+            target.forget.assert_not_called()
+
+
+class TestHotItemReads:
+    def test_tracked_items_answered_without_zabbix(self, mock_zabbix_client, monkeypatch, tmp_path):
+        import src._hot_items
+        from src._hot_items import HotItems
+        hot = HotItems(str(tmp_path), itemids=["1"])
+        ring = hot.buffers["1"] = src._hot_items.RingBuffer(str(tmp_path / "1.ring"), 16, 0)
+        ring.append(1000.0, 2.5)
+        ring.restart_coverage(900)
+        ring.mark_synced(1001.0)
+        monkeypatch.setattr(src._hot_items, "_hot_items", hot)
+        monkeypatch.setenv("ZABBIX_HOT_ITEMIDS", "1")
+        result = json.loads(asyncio.run(zabbix_get("history", "get", {
+            "itemids": ["1"], "history": 0, "time_from": 900, "sortfield": "clock"})))
+        assert result == [{"itemid": "1", "clock": "1000", "value": "2.5", "ns": "0"}]
+        mock_zabbix_client.history.get.assert_not_called()
+
+
+class TestZabbixSearch:
+    @pytest.fixture(autouse=True)
+    def fresh_indexes(self, monkeypatch):
+        import src._search
+        import src._topology
+        import src.tools._registry
+        monkeypatch.setattr(src._topology, "_topology", None)
+        monkeypatch.setattr(src._search, "_search_index", None)
+        self.refreshes = []
+        monkeypatch.setattr(src.tools._registry, "_refresh_topology_soon", self.refreshes.append)
+
+    def test_falls_back_to_api_before_first_load(self, mock_zabbix_client):
+        mock_zabbix_client.host.get.return_value = [
+            {"hostid": "2", "host": "web10", "name": "Web 10"},
+            {"hostid": "1", "host": "web1", "name": "Web 1"}]
+        result = json.loads(asyncio.run(zabbix_search("web1", ["host"])))
+        assert result["source"] == "api"
+        assert [r["id"] for r in result["results"]] == ["1", "2"]
+        kwargs = mock_zabbix_client.host.get.call_args.kwargs
+        assert kwargs["search"] == {"host": "*web1*", "name": "*web1*"}
+        assert kwargs["searchWildcardsEnabled"] is True
+        assert len(self.refreshes) == 1
+
+    def test_answered_from_index_once_loaded(self, mock_zabbix_client):
+        from src._topology import get_topology
+        from tests.test_topology import FakeZabbix
+        asyncio.run(get_topology().refresh(FakeZabbix().fetch))
+        result = json.loads(asyncio.run(zabbix_search("mysql", ["trigger"], fmt="columnar")))
+        assert result["source"] == "index"
+        assert result["results"]["columns"][:2] == ["type", "id"]
+        assert result["results"]["rows"][0][1] == "5001"
+        mock_zabbix_client.host.get.assert_not_called()
+        assert self.refreshes == []
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError, match="limit"):
+            asyncio.run(zabbix_search("web", limit=0))
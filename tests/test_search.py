@@ -0,0 +1,85 @@
+"""Tests for the trigram name search index."""
+
+import asyncio
+import pytest
+
+from src._search import SearchIndex, rank, score, tokenize
+from src._topology import TopologyIndex
+from tests.test_topology import FakeZabbix
+
+
+@pytest.fixture
+def topology():
+    zabbix = FakeZabbix()
+    zabbix.hosts.append({"hostid": "102", "host": "web10", "name": "Web 10", "status": "0",
+                         "hostgroups": [{"groupid": "1"}], "parentTemplates": []})
+    zabbix.items.append({"itemid": "1002", "hostid": "101", "key_": "system.cpu.util",
+                         "name": "CPU", "value_type": "0", "status": "0", "templateid": "0"})
+    index = TopologyIndex()
+    asyncio.run(index.refresh(zabbix.fetch))
+    return index
+
+
+@pytest.fixture
+def search(topology):
+    search = SearchIndex()
+    search.build(topology)
+    return search
+
+
+def found(results):
+    return [(r["type"], r["id"]) for r in results]
+
+
+class TestScoring:
+    def test_tokenize_splits_wildcards(self):
+        assert tokenize("*Web*01  cpu") == ["web", "01", "cpu"]
+
+    def test_exact_beats_prefix_beats_inner(self):
+        assert score(["web1"], "web1") == 1.0
+        assert score(["web1"], "web10") > score(["web1"], "old-web1") > score(["web1"], "oldweb1")
+
+    def test_missing_token_scores_zero(self):
+        assert score(["web", "db"], "web1") == 0.0
+
+    def test_rank_keeps_best_field(self):
+        results = rank("web 1", [("host", "1", "host", "web1"), ("host", "1", "name", "Web 1 (old)")], 10)
+        assert len(results) == 1
+        assert results[0]["field"] == "host"
+        assert results[0]["text"] == "web1"
+
+
+class TestSearch:
+    def test_ranked_by_relevance(self, search):
+        results = search.search("web1", types=["host"])
+        assert found(results) == [("host", "100"), ("host", "102")]
+        assert results[0]["field"] == "host"
+
+    def test_all_tokens_required(self, search):
+        assert found(search.search("mysql down")) == [("trigger", "5001")]
+
+    def test_shared_names_indexed_once(self, search):
+        results = search.search("system.cpu.util", types=["item"])
+        assert sorted(found(results)) == [("item", "1000"), ("item", "1002")]
+        assert search.stats()["names"] < search.stats()["documents"]
+
+    def test_fuzzy_match_on_typo(self, search):
+        results = search.search("Templte OS Linux", types=["template"])
+        assert found(results) == [("template", "10")]
+        assert results[0]["score"] < 0.5
+
+    def test_short_tokens_scan(self, search):
+        assert found(search.search("db")) == [("host", "101"), ("template", "12")]
+
+    def test_limit(self, search):
+        assert len(search.search("e", limit=2)) == 2
+
+    def test_invalid_type(self, search):
+        with pytest.raises(ValueError, match="Invalid search type"):
+            search.search("web", types=["graph"])
+
+    def test_rebuilt_after_refresh(self, topology):
+        search = SearchIndex()
+        asyncio.run(search.sync(topology))
+        assert search.built_from == topology.refreshes
+        assert search.search("web1")
@@ -0,0 +1,41 @@
+"""Tests for _series module."""
+
+from src._series import parse_period, split_window
+
+NOW = 100 * 86400 + 1800  # half past the hour
+
+
+class TestParsePeriod:
+    def test_units(self):
+        assert parse_period("90d") == 90 * 86400
+        assert parse_period("1w") == 604800
+        assert parse_period("12h") == 43200
+        assert parse_period("3600") == 3600
+        assert parse_period("0") == 0
+
+    def test_macro_unknown(self):
+        assert parse_period("{$HISTORY.RETENTION}") is None
+        assert parse_period(None) is None
+
+
+class TestSplitWindow:
+    def test_recent_window_history_only(self):
+        assert split_window(NOW - 3600, NOW, 7 * 86400, 365 * 86400, NOW, 0) == (None, (NOW - 3600, NOW))
+
+    def test_long_window_split_on_full_hour(self):
+        trend, history = split_window(NOW - 30 * 86400, NOW, 7 * 86400, 365 * 86400, NOW, 0)
+        boundary = NOW - 7 * 86400 + 1800
+        assert boundary % 3600 == 0
+        assert trend == (NOW - 30 * 86400, boundary - 1)
+        assert history == (boundary, NOW)
+
+    def test_old_window_trends_only(self):
+        window = (NOW - 30 * 86400, NOW - 20 * 86400)
+        assert split_window(*window, 7 * 86400, 365 * 86400, NOW, 3) == (window, None)
+
+    def test_text_items_history_only(self):
+        assert split_window(0, NOW, 7 * 86400, 365 * 86400, NOW, 4) == (None, (0, NOW))
+
+    def test_trends_disabled_or_unknown_retention(self):
+        assert split_window(0, NOW, 7 * 86400, 0, NOW, 0) == (None, (0, NOW))
+        assert split_window(0, NOW, None, 365 * 86400, NOW, 0) == (None, (0, NOW))
@@ -0,0 +1,105 @@
+"""Tests for the slow-call log."""
+
+import asyncio
+import pytest
+
+from src import _slowlog
+from src._slowlog import SlowCallLog, estimate_size, fingerprint, get_slow_call_log
+from src.tools._registry import zabbix_get
+
+
+@pytest.fixture
+def slow_log(monkeypatch):
+    """Record every upstream call in a fresh log."""
+    log = SlowCallLog(threshold=0.0)
+    monkeypatch.setattr(_slowlog, "_slow_call_log", log)
+    return log
+
+
+class TestFingerprint:
+    def test_values_normalized(self):
+        first = fingerprint({"itemids": ["1", "2", "3"], "time_from": 1000, "time_till": 4000,
+                             "output": ["itemid", "clock", "value"], "filter": {"status": 0}})
+        second = fingerprint({"itemids": ["7", "8", "9", "10"], "time_from": "5000",
+                              "time_till": "8600", "output": ["itemid", "clock", "value"],
+                              "filter": {"status": 1}})
+        assert first == second == {
+            "params": ["filter", "itemids", "output", "time_from", "time_till"],
+            "ids": {"itemids": "<=10"}, "span": "<=1h", "output": 3, "filter": ["status"],
+        }
+
+    def test_buckets(self):
+        assert fingerprint({"hostids": "5"})["ids"] == {"hostids": "1"}
+        assert fingerprint({"hostids": list(range(101))})["ids"] == {"hostids": "<=1000"}
+        assert fingerprint({"time_from": 0, "time_till": 400 * 86400})["span"] == ">365d"
+        assert fingerprint({"output": "extend"})["output"] == "extend"
+
+    def test_open_time_range_counts_to_now(self, monkeypatch):
+        monkeypatch.setattr(_slowlog.time, "time", lambda: 100000)
+        assert fingerprint({"time_from": 100000 - 2 * 86400})["span"] == "<=7d"
+
+
+class TestSlowCallLog:
+    def test_aggregates_by_fingerprint(self):
+        log = SlowCallLog(threshold=1.0)
+        log.record("item", "get", {"hostids": ["1"]}, 2.0, rows=10, size=500)
+        log.record("item", "get", {"hostids": ["2"]}, 4.0, rows=30, size=900)
+        log.record("item", "get", {"itemids": ["1"]}, 5.0, rows=1, size=50)
+        log.record("item", "get", {"hostids": ["3"]}, 1.5, rows=0, size=0, error=True)
+        top = log.top()
+        assert [entry["calls"] for entry in top] == [3, 1]
+        assert top[0]["total_seconds"] == 7.5
+        assert top[0]["mean_seconds"] == 2.5
+        assert top[0]["max_seconds"] == 4.0
+        assert (top[0]["errors"], top[0]["max_rows"], top[0]["max_bytes"]) == (1, 30, 900)
+        assert log.top(sort_by="max")[0]["fingerprint"]["params"] == ["itemids"]
+        assert log.stats()["recorded"] == 4
+
+    def test_least_recent_fingerprint_dropped(self):
+        log = SlowCallLog(threshold=1.0, max_fingerprints=2)
+        log.record("host", "get", {}, 2.0, rows=1, size=1)
+        log.record("item", "get", {}, 2.0, rows=1, size=1)
+        log.record("host", "get", {}, 2.0, rows=1, size=1)
+        log.record("trigger", "get", {}, 2.0, rows=1, size=1)
+        assert {entry["object"] for entry in log.top()} == {"host", "trigger"}
+
+    def test_invalid_sort(self):
+        with pytest.raises(ValueError, match="Invalid sort_by"):
+            SlowCallLog(threshold=1.0).top(sort_by="rows")
+
+    def test_size_estimated_from_sample(self):
+        rows = [{"itemid": str(100000 + i), "value": "1.5"} for i in range(5000)]
+        exact = len('[{"itemid":"100000","value":"1.5"}') * 5000 + 1
+        assert abs(estimate_size(rows) - exact) / exact < 0.01
+        assert estimate_size(rows[:3]) == len('[{"itemid":"100000","value":"1.5"},'
+                                              '{"itemid":"100001","value":"1.5"},'
+                                              '{"itemid":"100002","value":"1.5"}]')
+
+    def test_disabled_by_zero_threshold(self, monkeypatch):
+        monkeypatch.setenv("ZABBIX_SLOW_CALL_THRESHOLD", "0")
+        assert get_slow_call_log() is None
+
+
+class TestRecording:
+    def test_upstream_call_recorded(self, slow_log, mock_zabbix_client, caplog):
+        mock_zabbix_client.problem.get.return_value = [{"eventid": "1"}, {"eventid": "2"}]
+        asyncio.run(zabbix_get("problem", "get", {"hostids": ["1", "2"], "response_format": "compact"}))
+        entry = slow_log.top()[0]
+        assert (entry["object"], entry["method"]) == ("problem", "get")
+        assert entry["fingerprint"] == {"params": ["hostids"], "ids": {"hostids": "<=10"}}
+        assert entry["max_rows"] == 2
+        assert entry["max_bytes"] == len('[{"eventid":"1"},{"eventid":"2"}]')
+        assert "Slow Zabbix call problem.get" in caplog.text
+
+    def test_failed_call_recorded(self, slow_log, mock_zabbix_client):
+        mock_zabbix_client.proxy.get.side_effect = Exception("timeout")
+        with pytest.raises(Exception, match="timeout"):
+            asyncio.run(zabbix_get("proxy", "get", {}))
+        assert slow_log.top()[0]["errors"] == 1
+
+    def test_fast_call_not_recorded(self, monkeypatch, mock_zabbix_client):
+        log = SlowCallLog(threshold=60.0)
+        monkeypatch.setattr(_slowlog, "_slow_call_log", log)
+        mock_zabbix_client.maintenance.get.return_value = []
+        asyncio.run(zabbix_get("maintenance", "get", {}))
+        assert log.recorded == 0
@@ -1,5 +1,6 @@
 """Meta-tests and tool-specific tests for all registered tools."""
 
+import asyncio
 import json
 import pytest
 from unittest.mock import MagicMock, patch
@@ -10,8 +11,8 @@ from src._core import mcp
 def call_tool(tool_func, **kwargs):
     """Call a tool function, handling FastMCP's FunctionTool wrapper."""
     if hasattr(tool_func, "fn"):
-        return tool_func.fn(**kwargs)
-    return tool_func(**kwargs)
+        tool_func = tool_func.fn
+    return asyncio.run(tool_func(**kwargs))
 
 
 class TestToolRegistration:
@@ -88,6 +89,12 @@ class TestItemTools:
         result = call_tool(item_get, hostids=["1"])
         assert json.loads(result)[0]["itemid"] == "100"
 
+    def test_item_get_paged(self, mock_zabbix_client):
+        mock_zabbix_client.item.get.return_value = [{"itemid": "100"}]
+        from src.tools.item import item_get
+        data = json.loads(call_tool(item_get, hostids=["1"], page_size=10))
+        assert data == {"result": [{"itemid": "100"}], "next_cursor": None}
+
     def test_item_create(self, mock_zabbix_client):
         mock_zabbix_client.item.create.return_value = {"itemids": ["200"]}
         from src.tools.item import item_create
@@ -200,3 +207,53 @@ class TestNewPhase5Tools:
         from src.tools.proxygroup import proxygroup_create
         result = call_tool(proxygroup_create, name="Test Group")
         mock_zabbix_client.proxygroup.create.assert_called_once()
+
+
+class TestBatchTools:
+    def test_batch_get(self, mock_zabbix_client):
+        mock_zabbix_client.host.get.return_value = [{"hostid": "1"}]
+        mock_zabbix_client.trigger.get.return_value = [{"triggerid": "2"}]
+        from src.tools.batch import batch_get
+        result = call_tool(batch_get, calls=[{"object": "host"},
+                                             {"object": "trigger", "params": {"only_true": True}}],
+                           response_format="compact")
+        assert result.startswith('{"results": [{"object": "host"')
+        results = json.loads(result)["results"]
+        assert [r["result"][0] for r in results] == [{"hostid": "1"}, {"triggerid": "2"}]
+
+
+class TestServerTools:
+    def test_server_pool_stats(self):
+        from src.tools.server import server_pool_stats
+        data = json.loads(call_tool(server_pool_stats))
+        assert "settings" in data
+        assert "connections_reused" in data
+
+    def test_server_cache_stats(self):
+        from src.tools.server import server_cache_stats
+        data = json.loads(call_tool(server_cache_stats))
+        assert data["enabled"] is True
+        assert "hit_ratio" in data
+
+    def test_server_topology_stats(self):
+        from src.tools.server import server_topology_stats
+        data = json.loads(call_tool(server_topology_stats))
+        assert "loaded" in data
+        assert "triggers" in data
+
+    def test_server_slow_calls(self, monkeypatch, mock_zabbix_client):
+        from src import _slowlog
+        from src.tools.server import server_slow_calls
+        monkeypatch.setattr(_slowlog, "_slow_call_log", _slowlog.SlowCallLog(threshold=0.0))
+        mock_zabbix_client.hostgroup.get.return_value = [{"groupid": "1"}]
+        from src.tools.hostgroup import hostgroup_get
+        call_tool(hostgroup_get)
+        data = json.loads(call_tool(server_slow_calls, limit=5, sort_by="calls"))
+        assert data["enabled"] is True
+        assert data["top"][0]["object"] == "hostgroup"
+        assert data["top"][0]["max_rows"] == 1
+
+    def test_server_slow_calls_disabled(self, monkeypatch):
+        from src.tools.server import server_slow_calls
+        monkeypatch.setenv("ZABBIX_SLOW_CALL_THRESHOLD", "0")
+        assert json.loads(call_tool(server_slow_calls)) == {"enabled": False}
@@ -0,0 +1,174 @@
+"""Tests for the in-memory topology index."""
+
+import asyncio
+import json
+import pytest
+
+from src._topology import TopologyIndex
+
+
+class FakeZabbix:
+    """Minimal item/trigger/host/template/hostgroup ``get`` backed by lists."""
+
+    def __init__(self):
+        self.groups = [{"groupid": "1", "name": "Linux servers"},
+                       {"groupid": "2", "name": "Databases"}]
+        self.templates = [
+            {"templateid": "10", "host": "Template OS Linux", "name": "Linux by agent",
+             "parentTemplates": [{"templateid": "11"}]},
+            {"templateid": "11", "host": "Template Module CPU", "name": "CPU",
+             "parentTemplates": []},
+            {"templateid": "12", "host": "Template DB", "name": "MySQL", "parentTemplates": []},
+        ]
+        self.hosts = [
+            {"hostid": "100", "host": "web1", "name": "Web 1", "status": "0",
+             "hostgroups": [{"groupid": "1"}], "parentTemplates": [{"templateid": "10"}]},
+            {"hostid": "101", "host": "db1", "name": "DB 1", "status": "0",
+             "hostgroups": [{"groupid": "1"}, {"groupid": "2"}],
+             "parentTemplates": [{"templateid": "12"}]},
+        ]
+        self.items = [
+            {"itemid": "1000", "hostid": "100", "key_": "system.cpu.util", "name": "CPU",
+             "value_type": "0", "status": "0", "templateid": "0"},
+            {"itemid": "1001", "hostid": "101", "key_": "mysql.ping", "name": "Ping",
+             "value_type": "3", "status": "0", "templateid": "0"},
+        ]
+        self.triggers = [
+            {"triggerid": "5000", "description": "High CPU", "priority": "3", "status": "0",
+             "value": "0", "lastchange": "0", "templateid": "0", "hosts": [{"hostid": "100"}],
+             "items": [{"itemid": "1000"}], "dependencies": []},
+            {"triggerid": "5001", "description": "MySQL down", "priority": "4", "status": "0",
+             "value": "0", "lastchange": "0", "templateid": "0", "hosts": [{"hostid": "101"}],
+             "items": [{"itemid": "1001"}], "dependencies": [{"triggerid": "5000"}]},
+        ]
+        self.calls = []
+
+    async def fetch(self, api_object, params):
+        self.calls.append((api_object, params))
+        rows = {"hostgroup": self.groups, "template": self.templates, "host": self.hosts,
+                "item": self.items, "trigger": self.triggers}[api_object]
+        ids = params.get(f"{api_object}ids")
+        if ids is not None:
+            rows = [r for r in rows if r[f"{api_object}id"] in ids]
+        if "lastChangeSince" in params:
+            rows = [r for r in rows if int(r["lastchange"]) >= params["lastChangeSince"]]
+        output = params.get("output")
+        if isinstance(output, list) and output == [f"{api_object}id"]:
+            rows = [{f"{api_object}id": r[f"{api_object}id"]} for r in rows]
+        return [dict(r) for r in rows]
+
+
+@pytest.fixture
+def zabbix():
+    return FakeZabbix()
+
+
+@pytest.fixture
+def index(zabbix):
+    index = TopologyIndex()
+    asyncio.run(index.refresh(zabbix.fetch))
+    return index
+
+
+def ids(rows, field):
+    return [row[field] for row in rows]
+
+
+class TestQuery:
+    def test_triggers_in_group_on_template(self, index):
+        rows = index.query("trigger", hostgroups=["Linux servers"], templates=["10"])
+        assert ids(rows, "triggerid") == ["5000"]
+
+    def test_nested_template_links(self, index):
+        rows = index.query("host", templates=["Template Module CPU"])
+        assert ids(rows, "hostid") == ["100"]
+        rows = index.query("template", hosts=["web1"])
+        assert ids(rows, "templateid") == ["10", "11"]
+
+    def test_groups_of_trigger_hosts(self, index):
+        rows = index.query("hostgroup", triggerids=["5001"])
+        assert ids(rows, "groupid") == ["1", "2"]
+
+    def test_items_restricted_by_trigger(self, index):
+        rows = index.query("item", hostgroups=["1"], triggerids=["5000"])
+        assert ids(rows, "itemid") == ["1000"]
+
+    def test_no_filters_returns_all(self, index):
+        assert ids(index.query("trigger"), "triggerid") == ["5000", "5001"]
+        assert len(index.query("trigger", limit=1)) == 1
+
+    def test_unknown_names_match_nothing(self, index):
+        assert index.query("host", hostgroups=["Nope"]) == []
+
+    def test_records_serialized(self, index):
+        row = index.query("trigger", triggerids=["5001"])[0]
+        assert row["hostids"] == ["101"]
+        assert row["dependencies"] == ["5000"]
+        json.dumps(row)
+
+    def test_invalid_target(self, index):
+        with pytest.raises(ValueError, match="Invalid topology target"):
+            index.query("graph")
+
+
+class TestRefresh:
+    def test_incremental_fetches_only_new_objects(self, index, zabbix):
+        zabbix.items.append({"itemid": "1002", "hostid": "101", "key_": "mysql.qps", "name": "QPS",
+                             "value_type": "0", "status": "0", "templateid": "0"})
+        del zabbix.triggers[0]
+        zabbix.calls.clear()
+        asyncio.run(index.refresh(zabbix.fetch))
+
+        item_calls = [p for obj, p in zabbix.calls if obj == "item"]
+        assert {"output": ["itemid"], "templated": False} in item_calls
+        assert any(p.get("itemids") == ["1002"] for p in item_calls)
+        assert "1002" in index.items
+        assert list(index.triggers) == ["5001"]
+        assert index.query("trigger", hosts=["web1"]) == []
+
+    def test_trigger_state_updated(self, index, zabbix):
+        zabbix.triggers[0]["value"] = "1"
+        zabbix.triggers[0]["lastchange"] = str(10 ** 10)
+        asyncio.run(index.refresh(zabbix.fetch))
+        assert index.triggers["5000"].value == "1"
+
+    def test_full_refresh_reloads_edits(self, index, zabbix):
+        zabbix.items[0]["name"] = "CPU utilization"
+        asyncio.run(index.refresh(zabbix.fetch))
+        assert index.items["1000"].name == "CPU"
+        asyncio.run(index.refresh(zabbix.fetch, full=True))
+        assert index.items["1000"].name == "CPU utilization"
+        assert index.stats()["full_refreshes"] == 2
+
+    def test_staleness(self, zabbix):
+        index = TopologyIndex(refresh=300)
+        assert index.is_stale()
+        asyncio.run(index.refresh(zabbix.fetch))
+        assert not index.is_stale()
+        index.loaded_at -= 301
+        assert index.is_stale()
+
+    def test_host_groups_select_follows_api_version(self, zabbix):
+        async def version():
+            return "6.0.25"
+
+        index = TopologyIndex()
+        asyncio.run(index.refresh(zabbix.fetch, version=version))
+        params = next(p for obj, p in zabbix.calls if obj == "host")
+        assert "selectGroups" in params and "selectHostGroups" not in params
+        assert index.api_version == "6.0.25"
+
+        zabbix.calls.clear()
+        asyncio.run(TopologyIndex().refresh(zabbix.fetch))
+        params = next(p for obj, p in zabbix.calls if obj == "host")
+        assert "selectHostGroups" in params
+
+    def test_full_load_pages_by_id(self, zabbix):
+        index = TopologyIndex(page_size=1)
+        asyncio.run(index.refresh(zabbix.fetch))
+        item_calls = [p for obj, p in zabbix.calls if obj == "item"]
+        assert item_calls[0]["output"] == ["itemid"]
+        assert [p["itemids"] for p in item_calls[1:]] == [["1000"], ["1001"]]
+        trigger_calls = [p for obj, p in zabbix.calls if obj == "trigger" and "triggerids" in p]
+        assert [p["triggerids"] for p in trigger_calls] == [["5000"], ["5001"]]
+        assert set(index.items) == {"1000", "1001"} and set(index.triggers) == {"5000", "5001"}
@@ -0,0 +1,80 @@
+"""Tests for the optional OpenTelemetry tracing."""
+
+import asyncio
+import json
+import pytest
+from fastmcp import Client
+
+from src import _tracing
+from src._core import mcp
+from src._tracing import get_tracing_exporter, setup_tracing, span
+
+pytest.importorskip("opentelemetry.sdk")
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    monkeypatch.setattr(_tracing, "_tracer", None)
+    exporter = InMemorySpanExporter()
+    setup_tracing(exporter)
+    return exporter
+
+
+def call(name, arguments=None):
+    async def run():
+        async with Client(mcp) as client:
+            return await client.call_tool(name, arguments or {}, raise_on_error=False)
+    return asyncio.run(run())
+
+
+class TestSettings:
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("ZABBIX_TRACING", raising=False)
+        monkeypatch.setattr(_tracing, "_tracer", None)
+        assert setup_tracing() is False
+        with span("noop") as current:
+            assert current is None
+
+    def test_invalid_exporter(self, monkeypatch):
+        monkeypatch.setenv("ZABBIX_TRACING", "jaeger")
+        with pytest.raises(ValueError, match="Invalid ZABBIX_TRACING"):
+            get_tracing_exporter()
+
+
+class TestSpans:
+    def test_tool_call_with_upstream_and_encoding_spans(self, exporter, mock_zabbix_client):
+        mock_zabbix_client.hostgroup.get.return_value = [{"groupid": "1"}, {"groupid": "2"}]
+        assert not call("hostgroup_get", {"output": ["groupid"]}).is_error
+        spans = {s.name: s for s in exporter.get_finished_spans()}
+        tool = spans["tool hostgroup_get"]
+        upstream = spans["zabbix hostgroup.get"]
+        encode = spans["format_response"]
+        assert upstream.parent.span_id == tool.context.span_id
+        assert encode.parent.span_id == tool.context.span_id
+        assert upstream.attributes["zabbix.object"] == "hostgroup"
+        assert upstream.attributes["zabbix.result.rows"] == 2
+        assert upstream.attributes["zabbix.params.size"] > 0
+        assert encode.attributes["response.rows"] == 2
+        assert tool.attributes["mcp.tool.response_size"] == encode.attributes["response.size"]
+
+    def test_upstream_error_recorded(self, exporter, mock_zabbix_client):
+        mock_zabbix_client.proxy.get.side_effect = Exception("timeout")
+        assert call("proxy_get").is_error
+        spans = {s.name: s for s in exporter.get_finished_spans()}
+        assert not spans["zabbix proxy.get"].status.is_ok
+        assert not spans["tool proxy_get"].status.is_ok
+
+    def test_file_exporter_writes_json_lines(self, monkeypatch, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        monkeypatch.setenv("ZABBIX_TRACING_FILE", str(path))
+        monkeypatch.setattr(_tracing, "_tracer", None)
+        file_exporter = _tracing._create_exporter("file")
+        setup_tracing(file_exporter)
+        with span("first"):
+            pass
+        with span("second"):
+            pass
+        file_exporter.out.close()
+        names = [json.loads(line)["name"] for line in path.read_text().splitlines()]
+        assert names == ["first", "second"]
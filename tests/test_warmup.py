@@ -0,0 +1,89 @@
+"""Tests for the startup cache warm-up."""
+
+import asyncio
+import pytest
+
+from src.tools import _warmup
+from src.tools._registry import refreshing, zabbix_get
+from src.tools._warmup import get_warm_objects, is_warm_cache_enabled, warm_up
+
+
+@pytest.fixture(autouse=True)
+def reset_readiness(monkeypatch):
+    monkeypatch.setattr(_warmup, "readiness",
+                        {"ready": False, "version": None, "seconds": None, "objects": {}})
+
+
+class TestSettings:
+    def test_default_objects(self, monkeypatch):
+        monkeypatch.delenv("ZABBIX_WARM_CACHE_OBJECTS", raising=False)
+        assert get_warm_objects() == ["hostgroup", "template"]
+
+    def test_objects_from_env(self, monkeypatch):
+        monkeypatch.setenv("ZABBIX_WARM_CACHE_OBJECTS", "host, item,")
+        assert get_warm_objects() == ["host", "item"]
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("ZABBIX_WARM_CACHE", raising=False)
+        assert is_warm_cache_enabled() is False
+
+
+class TestWarmUp:
+    def test_preloads_default_reads(self, mock_zabbix_client):
+        mock_zabbix_client.apiinfo.version.return_value = "7.0.0"
+        mock_zabbix_client.host.get.return_value = [{"hostid": "1"}]
+        state = asyncio.run(warm_up(["host"]))
+        assert state["ready"] is True
+        assert state["version"] == "7.0.0"
+        assert "seconds" in state["objects"]["host"]
+
+        # The default host_get read is now served from the cache
+        from src.tools.host import host_get
+        asyncio.run(getattr(host_get, "fn", host_get)())
+        mock_zabbix_client.host.get.assert_called_once()
+
+    def test_errors_recorded_not_raised(self, mock_zabbix_client):
+        mock_zabbix_client.apiinfo.version.return_value = "7.0.0"
+        mock_zabbix_client.host.get.side_effect = Exception("timeout")
+        state = asyncio.run(warm_up(["host", "nosuchobject"]))
+        assert state["ready"] is True
+        assert state["objects"]["host"] == {"error": "timeout"}
+        assert "No nosuchobject_get tool" in state["objects"]["nosuchobject"]["error"]
+
+    def test_object_outside_tool_profile(self, mock_zabbix_client, monkeypatch):
+        monkeypatch.setattr(_warmup, "registered_modules", {"problem", "event"})
+        mock_zabbix_client.apiinfo.version.return_value = "7.0.0"
+        state = asyncio.run(warm_up(["host"]))
+        assert state["objects"]["host"] == {"error": "No host_get tool in the tool profile"}
+        mock_zabbix_client.host.get.assert_not_called()
+
+    def test_no_preload_without_cache(self, mock_zabbix_client, monkeypatch):
+        monkeypatch.setenv("ZABBIX_CACHE_ENABLED", "false")
+        mock_zabbix_client.apiinfo.version.return_value = "7.0.0"
+        state = asyncio.run(warm_up(["host"]))
+        assert state["ready"] is True
+        assert state["version"] == "7.0.0"
+        assert state["objects"] == {}
+        mock_zabbix_client.host.get.assert_not_called()
+
+    def test_login_failure_still_ready(self, mock_zabbix_client):
+        mock_zabbix_client.apiinfo.version.side_effect = Exception("unreachable")
+        state = asyncio.run(warm_up(["host"]))
+        assert state["ready"] is True
+        assert state["error"] == "unreachable"
+
+
+class TestRefreshing:
+    def test_bypasses_cached_response(self, mock_zabbix_client):
+        mock_zabbix_client.host.get.return_value = [{"hostid": "1"}]
+        asyncio.run(zabbix_get("host", "get", {"output": "extend"}))
+
+        async def refresh():
+            with refreshing():
+                return await zabbix_get("host", "get", {"output": "extend"})
+
+        mock_zabbix_client.host.get.return_value = [{"hostid": "2"}]
+        assert '"2"' in asyncio.run(refresh())
+        # The refreshed response replaces the cached one
+        assert '"2"' in asyncio.run(zabbix_get("host", "get", {"output": "extend"}))
+        assert mock_zabbix_client.host.get.call_count == 2